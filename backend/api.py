@@ -7,7 +7,7 @@ Integrates orchestrator, config, and database operations
 import json
 import sqlite3
 from pathlib import Path
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
 from typing import Dict, Optional
 from dataclasses import asdict
 
@@ -55,6 +55,8 @@ except ImportError as e:
 
 # Setup comprehensive logging
 from logger_config import setup_logging, setup_api_logging, log_user_action
+from db_pool import get_connection, init_app as init_db_pool
+from portfolio_aggregates import PortfolioFilter, get_portfolio_aggregates, install_aggregate_triggers
 from extraction_service import extract_contract_metadata, find_related_contracts, check_dependencies, extract_text_from_docx
 
 logger = setup_logging(__name__, LOG_LEVEL)
@@ -68,6 +70,12 @@ app = Flask(__name__)
 app.config['MAX_CONTENT_LENGTH'] = MAX_FILE_SIZE_BYTES
 app.config['UPLOAD_FOLDER'] = str(UPLOAD_DIRECTORY)
 
+# Return pooled DB connections left open by a request
+init_db_pool(app)
+
+# Version triggers behind the cached portfolio aggregates (idempotent)
+install_aggregate_triggers(CONTRACTS_DB)
+
 # Enable CORS for frontend integration
 CORS(app, resources={
     r"/api/*": {
@@ -116,13 +124,9 @@ except Exception as e:
 # HELPER FUNCTIONS
 # ============================================================================
 
-def get_db_connection(db_path: Optional[str] = None):
-    """Get database connection"""
-    db_path = db_path or str(CONTRACTS_DB)
-    conn = sqlite3.connect(db_path)
-    conn.row_factory = sqlite3.Row
-    conn.execute("PRAGMA foreign_keys = ON")
-    return conn
+def get_db_connection(db_path: Optional[str] = None, read_only: bool = False):
+    """Get pooled database connection (close() returns it to the pool)"""
+    return get_connection(db_path or str(CONTRACTS_DB), read_only=read_only)
 
 
 def query_distinct(conn, table: str, column: str) -> list:
@@ -2362,8 +2366,7 @@ def get_statistics():
         conn.close()
 
         # Reports statistics
-        reports_conn = sqlite3.connect(str(REPORTS_DB))
-        reports_conn.row_factory = sqlite3.Row
+        reports_conn = get_db_connection(db_path=str(REPORTS_DB), read_only=True)
         reports_cursor = reports_conn.cursor()
 
         reports_cursor.execute("SELECT COUNT(*) as total FROM comparisons")
@@ -2398,6 +2401,16 @@ def get_statistics():
         return jsonify({'error': str(e)}), 500
 
 
+# Risk distribution display order (others last)
+DASHBOARD_RISK_ORDER = {
+    'Low': 1, 'LOW': 1,
+    'Moderate': 2, 'Medium': 2, 'MEDIUM': 2,
+    'High': 3, 'HIGH': 3,
+    'Critical': 4, 'CRITICAL': 4,
+    'Administrative': 5,
+}
+
+
 @app.route('/api/dashboard/stats', methods=['GET'])
 def get_dashboard_stats():
     """
@@ -2448,203 +2461,105 @@ def get_dashboard_stats():
 
         base_where = " AND ".join(where_clauses)
 
+        # Aggregates answer every count/sum below (same filters, archived excluded)
+        agg = get_portfolio_aggregates(CONTRACTS_DB)
+        portfolio_filter = PortfolioFilter(
+            contract_type=filter_type or None,
+            contract_role=filter_role or None,
+            status=filter_status or None,
+            risk_level=filter_risk or None,
+        )
+        # date('now') is UTC
+        today = datetime.now(timezone.utc).date()
+        today_str = today.isoformat()
+        d90 = (today + timedelta(days=90)).isoformat()
+
         # =====================================================================
         # KEY METRICS (filtered)
         # =====================================================================
 
+        totals = agg.totals(portfolio_filter)
+
         # Total Portfolio Value (filtered)
-        cursor.execute(f"SELECT COALESCE(SUM(contract_value), 0) as total FROM contracts WHERE {base_where}", params)
-        total_portfolio_value = cursor.fetchone()['total'] or 0
+        total_portfolio_value = totals['value'] or 0
 
         # Active Contracts (filtered + status=active)
-        active_where = where_clauses.copy()
-        active_params = params.copy()
-        if not filter_status:
-            active_where.append("status = 'active'")
-        cursor.execute(f"""
-            SELECT COUNT(*) as total FROM contracts
-            WHERE {" AND ".join(active_where)}
-        """, active_params)
-        active_contracts = cursor.fetchone()['total']
+        active_filter = portfolio_filter if filter_status else portfolio_filter.where(status='active')
+        active_contracts = agg.totals(active_filter)['count']
 
         # Total Contracts (filtered)
-        cursor.execute(f"SELECT COUNT(*) as total FROM contracts WHERE {base_where}", params)
-        total_contracts = cursor.fetchone()['total']
+        total_contracts = totals['count']
 
-        # Expiring in 90 Days (filtered)
-        expiring_where = where_clauses.copy()
-        expiring_params = params.copy()
-        expiring_where.append("expiration_date IS NOT NULL")
-        expiring_where.append("expiration_date <= date('now', '+90 days')")
-        expiring_where.append("expiration_date >= date('now')")
-        cursor.execute(f"""
-            SELECT COUNT(*) as total FROM contracts
-            WHERE {" AND ".join(expiring_where)}
-        """, expiring_params)
-        expiring_90_days = cursor.fetchone()['total']
-
-        # High-value contracts expiring (filtered)
-        hv_where = expiring_where.copy()
-        hv_params = expiring_params.copy()
-        hv_where.append("contract_value > 100000")
-        cursor.execute(f"""
-            SELECT COUNT(*) as total FROM contracts
-            WHERE {" AND ".join(hv_where)}
-        """, hv_params)
-        high_value_expiring = cursor.fetchone()['total']
+        # Expiring in 90 Days (filtered) and high-value contracts among them
+        expiring = agg.expiring(portfolio_filter, today_str, d90)
+        expiring_90_days = expiring['count']
+        high_value_expiring = expiring['high_value']
 
         # High-Risk Items (filtered by risk if specified, otherwise Critical+High)
         if filter_risk:
             # If filtering by specific risk, count those
-            cursor.execute(f"""
-                SELECT COUNT(*) as total FROM contracts
-                WHERE {base_where} AND risk_level IS NOT NULL
-            """, params)
+            risk_filter = portfolio_filter.where(risk_not_null=True)
         else:
             # Default: count Critical + High
-            risk_where = where_clauses.copy()
-            risk_params = params.copy()
-            risk_where.append("risk_level IN ('Critical', 'High', 'CRITICAL', 'HIGH')")
-            cursor.execute(f"""
-                SELECT COUNT(*) as total FROM contracts
-                WHERE {" AND ".join(risk_where)}
-            """, risk_params)
-        high_risk_items = cursor.fetchone()['total']
+            risk_filter = portfolio_filter.where(risk_in=('Critical', 'High', 'CRITICAL', 'HIGH'))
+        high_risk_items = agg.totals(risk_filter)['count']
 
         # =====================================================================
         # STATUS DISTRIBUTION (filtered)
         # =====================================================================
-        cursor.execute(f"""
-            SELECT
-                COALESCE(status, 'Unknown') as status,
-                COUNT(*) as count,
-                COALESCE(SUM(contract_value), 0) as value
-            FROM contracts
-            WHERE {base_where}
-            GROUP BY status
-            ORDER BY count DESC
-        """, params)
-        status_rows = cursor.fetchall()
+        status_groups = sorted(agg.group_by('status', portfolio_filter).items(), key=lambda item: -item[1]['count'])
         status_distribution = [
-            {'status': row['status'], 'count': row['count'], 'value': row['value']}
-            for row in status_rows
+            {'status': 'Unknown' if status is None else status, 'count': group['count'], 'value': group['value']}
+            for status, group in status_groups
         ]
 
         # =====================================================================
         # RISK DISTRIBUTION (filtered - from contracts.risk_level)
         # =====================================================================
-        cursor.execute(f"""
-            SELECT
-                COALESCE(risk_level, 'Unknown') as risk,
-                COUNT(*) as count
-            FROM contracts
-            WHERE {base_where} AND risk_level IS NOT NULL
-            GROUP BY risk_level
-            ORDER BY
-                CASE risk_level
-                    WHEN 'Low' THEN 1 WHEN 'LOW' THEN 1
-                    WHEN 'Moderate' THEN 2 WHEN 'Medium' THEN 2 WHEN 'MEDIUM' THEN 2
-                    WHEN 'High' THEN 3 WHEN 'HIGH' THEN 3
-                    WHEN 'Critical' THEN 4 WHEN 'CRITICAL' THEN 4
-                    WHEN 'Administrative' THEN 5
-                    ELSE 6
-                END
-        """, params)
-        risk_rows = cursor.fetchall()
+        risk_groups = sorted(
+            ((risk, group) for risk, group in agg.group_by('risk_level', portfolio_filter).items() if risk is not None),
+            key=lambda item: DASHBOARD_RISK_ORDER.get(item[0], 6)
+        )
         risk_distribution = [
-            {'risk': row['risk'], 'count': row['count']}
-            for row in risk_rows
+            {'risk': risk, 'count': group['count']}
+            for risk, group in risk_groups
         ]
 
         # =====================================================================
         # CONTRACT TYPE DISTRIBUTION (filtered)
         # =====================================================================
-        cursor.execute(f"""
-            SELECT
-                COALESCE(contract_type, 'Unknown') as type,
-                COUNT(*) as count,
-                COALESCE(AVG(contract_value), 0) as avg_value
-            FROM contracts
-            WHERE {base_where}
-            GROUP BY contract_type
-            ORDER BY count DESC
-            LIMIT 10
-        """, params)
-        type_rows = cursor.fetchall()
+        type_groups = sorted(agg.group_by('contract_type', portfolio_filter).items(), key=lambda item: -item[1]['count'])
         type_distribution = [
-            {'type': row['type'], 'count': row['count'], 'avg_value': row['avg_value']}
-            for row in type_rows
+            {'type': 'Unknown' if contract_type is None else contract_type, 'count': group['count'], 'avg_value': group['avg_value']}
+            for contract_type, group in type_groups[:10]
         ]
 
         # =====================================================================
         # TOP COUNTERPARTIES (filtered)
         # =====================================================================
-        counterparty_where = where_clauses.copy()
-        counterparty_params = params.copy()
-        counterparty_where.append("counterparty IS NOT NULL")
-        counterparty_where.append("counterparty != ''")
-        cursor.execute(f"""
-            SELECT
-                COALESCE(counterparty, 'Unknown') as name,
-                COUNT(*) as contracts,
-                COALESCE(SUM(contract_value), 0) as value
-            FROM contracts
-            WHERE {" AND ".join(counterparty_where)}
-            GROUP BY counterparty
-            ORDER BY value DESC
-            LIMIT 10
-        """, counterparty_params)
-        counterparty_rows = cursor.fetchall()
+        counterparty_groups = sorted(agg.counterparties(portfolio_filter).items(), key=lambda item: -item[1]['value'])
         top_counterparties = [
-            {'name': row['name'], 'contracts': row['contracts'], 'value': row['value']}
-            for row in counterparty_rows
+            {'name': name, 'contracts': group['count'], 'value': group['value']}
+            for name, group in counterparty_groups[:10]
         ]
 
         # =====================================================================
         # EXPIRATION CALENDAR (Next 90 days, filtered)
         # =====================================================================
-        exp_cal_where = where_clauses.copy()
-        exp_cal_params = params.copy()
-        exp_cal_where.append("expiration_date IS NOT NULL")
-        exp_cal_where.append("expiration_date >= date('now')")
-        exp_cal_where.append("expiration_date <= date('now', '+90 days')")
-        cursor.execute(f"""
-            SELECT
-                expiration_date as date,
-                COUNT(*) as count
-            FROM contracts
-            WHERE {" AND ".join(exp_cal_where)}
-            GROUP BY expiration_date
-            ORDER BY expiration_date
-        """, exp_cal_params)
-        expiration_rows = cursor.fetchall()
         expiration_calendar = [
-            {'date': row['date'], 'count': row['count']}
-            for row in expiration_rows
+            {'date': date, 'count': count}
+            for date, count in agg.expirations_by(portfolio_filter, today_str, d90).items()
         ]
 
         # =====================================================================
         # VALUE TREND (by upload month, filtered)
         # =====================================================================
-        trend_where = where_clauses.copy()
-        trend_params = params.copy()
-        trend_where.append("upload_date IS NOT NULL")
-        cursor.execute(f"""
-            SELECT
-                strftime('%Y-%m', upload_date) as month,
-                COUNT(*) as contracts,
-                COALESCE(SUM(contract_value), 0) as value
-            FROM contracts
-            WHERE {" AND ".join(trend_where)}
-            GROUP BY strftime('%Y-%m', upload_date)
-            ORDER BY month DESC
-            LIMIT 12
-        """, trend_params)
-        trend_rows = cursor.fetchall()
+        # Latest 12 months in chronological order (a NULL month sorts first)
+        trend_groups = list(agg.uploads_by_month(portfolio_filter).items())[-12:]
         value_trend = [
-            {'month': row['month'], 'contracts': row['contracts'], 'value': row['value']}
-            for row in trend_rows
-        ][::-1]  # Reverse to chronological order
+            {'month': month, 'contracts': group['count'], 'value': group['value']}
+            for month, group in trend_groups
+        ]
 
         # =====================================================================
         # RECENT ACTIVITY (last 10 contracts, filtered)
@@ -2806,31 +2721,23 @@ def get_portfolio_kpis():
     """Return KPI values based on current filters (always excludes archived)"""
     try:
         filters = request.json or {}
-        conn = get_db_connection()
 
-        # Build base WHERE clause (always exclude archived and incomplete intake)
-        where = "(archived = 0 OR archived IS NULL) AND status != 'intake'"
-        params = []
-        if filters.get('type'):
-            where += " AND contract_type = ?"
-            params.append(filters['type'])
-        if filters.get('status'):
-            where += " AND status = ?"
-            params.append(filters['status'])
-        if filters.get('risk'):
-            where += " AND risk_level = ?"
-            params.append(filters['risk'])
+        # Base filter (aggregates always exclude archived; also exclude incomplete intake)
+        where = PortfolioFilter(
+            contract_type=filters.get('type') or None,
+            status=filters.get('status') or None,
+            risk_level=filters.get('risk') or None,
+            status_not_in=('intake',),
+        )
+        agg = get_portfolio_aggregates(CONTRACTS_DB)
 
-        total = conn.execute(f"SELECT COALESCE(SUM(contract_value),0) FROM contracts WHERE {where}", params).fetchone()[0]
-        active = conn.execute(f"SELECT COUNT(*) FROM contracts WHERE {where} AND status='active'", params).fetchone()[0]
-        high_risk = conn.execute(f"SELECT COUNT(*) FROM contracts WHERE {where} AND risk_level IN ('Critical','High')", params).fetchone()[0]
+        total = agg.totals(where)['value']
+        active = agg.totals(where.where(status_in=('active',)))['count']
+        high_risk = agg.totals(where.where(risk_in=('Critical', 'High')))['count']
 
-        # Expiring in 90 days (handle null expiration_date gracefully)
-        expiring = conn.execute(f"""
-            SELECT COUNT(*) FROM contracts
-            WHERE {where} AND expiration_date IS NOT NULL
-            AND expiration_date BETWEEN date('now') AND date('now', '+90 days')
-        """, params).fetchone()[0]
+        # Expiring in 90 days (date('now') is UTC)
+        today = datetime.now(timezone.utc).date()
+        expiring = agg.expiring(where, today.isoformat(), (today + timedelta(days=90)).isoformat())['count']
 
         return jsonify({
             'total_value': total,
@@ -2970,8 +2877,7 @@ def redline_review():
         # log_user_action(logger, "redline_review_start", contract_id=contract_id)
 
         # Get contract from database
-        contracts_conn = sqlite3.connect(CONTRACTS_DB)
-        contracts_conn.row_factory = sqlite3.Row
+        contracts_conn = get_db_connection(read_only=True)
         cursor = contracts_conn.cursor()
 
         cursor.execute("""
@@ -3128,8 +3034,7 @@ def export_redlines():
         logger.info(f"[EXPORT] Starting redline export for contract {contract_id}")
 
         # Get contract info
-        contracts_conn = sqlite3.connect(CONTRACTS_DB)
-        contracts_conn.row_factory = sqlite3.Row
+        contracts_conn = get_db_connection(read_only=True)
         cursor = contracts_conn.cursor()
 
         cursor.execute("""
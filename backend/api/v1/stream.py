@@ -10,11 +10,13 @@ Endpoints:
 - GET /api/v1/stream/{session_id} — SSE event stream
 - GET /api/v1/stream/{session_id}/replay — Historical event retrieval
 - GET /api/v1/stream/{session_id}/status — Connection status
+- POST /api/v1/stream/{session_id}/compare — Start a streaming compare
 """
 
 import asyncio
 import json
 import logging
+import time
 import uuid
 from datetime import datetime, timezone
 from typing import Any, AsyncGenerator, Dict, Generator, Optional
@@ -30,11 +32,14 @@ from session_state import (
     SessionStateRepository,
     SSEConnectionInfo,
     SSEConnectionStatus,
+    KeepaliveBatcher,
+    get_keepalive_batcher,
     get_session_repository,
 )
 from event_log import (
     EventLogRepository,
     EventLogEntry,
+    EventSubscription,
     get_event_log_repository,
 )
 from shared.p7_streaming_contract import (
@@ -51,6 +56,7 @@ stream_bp = Blueprint("stream", __name__, url_prefix="/api/v1/stream")
 # Configuration
 SSE_KEEPALIVE_INTERVAL = P7_TIMING.KEEPALIVE_INTERVAL_MS / 1000  # 30 seconds
 MAX_CONNECTIONS_PER_SESSION = 5
+LIVE_EVENT_BATCH_SIZE = 100
 MIN_CLIENT_VERSION = "1.0.0"
 
 
@@ -67,6 +73,7 @@ class SSEStreamHandler:
         session_repo: SessionStateRepository,
         event_repo: EventLogRepository,
         last_event_id: Optional[int] = None,
+        keepalive_batcher: Optional[KeepaliveBatcher] = None,
     ):
         self.session_id = session_id
         self.connection_id = connection_id
@@ -76,14 +83,22 @@ class SSEStreamHandler:
         self.sequence = 0
         self.connected = False
         self.closed = False
+        self._keepalive_batcher = keepalive_batcher or get_keepalive_batcher(session_repo)
+        self._subscription: Optional[EventSubscription] = None
 
     def _format_sse_event(
         self,
         event_type: str,
         data: Dict[str, Any],
         event_id: Optional[str] = None,
+        sse_id: Optional[int] = None,
     ) -> str:
-        """Format data as SSE event."""
+        """
+        Format data as SSE event.
+
+        sse_id sets the frame id (the event log sequence for logged events),
+        which the client sends back as Last-Event-ID on reconnect.
+        """
         self.sequence += 1
         
         envelope = {
@@ -96,7 +111,9 @@ class SSEStreamHandler:
         }
         
         lines = []
-        if event_id:
+        if sse_id is not None:
+            lines.append(f"id: {sse_id}")
+        elif event_id:
             lines.append(f"id: {self.sequence}")
         lines.append(f"event: {event_type}")
         lines.append(f"data: {json.dumps(envelope)}")
@@ -163,8 +180,16 @@ class SSEStreamHandler:
         """
         Generate SSE event stream.
         Yields SSE-formatted events.
+
+        Between events the generator blocks on a subscription to the
+        session's appends, waking for new events or the next keepalive.
         """
+        # Subscribe before reading the log position so no append is missed
+        self._subscription = self.event_repo.subscribe(self.session_id)
         try:
+            # New connections only receive events logged after connect
+            next_sequence = (self.event_repo.get_latest_sequence(self.session_id) or 0) + 1
+
             # Send handshake
             yield self._handshake_event()
             self.connected = True
@@ -187,31 +212,43 @@ class SSEStreamHandler:
                         yield self._format_sse_event(
                             P7EventType.REPLAY_EVENT.value,
                             event.to_sse_data(),
+                            sse_id=event.sequence,
                         )
                     yield self._replay_end_event(len(replay_events))
+                    next_sequence = replay_events[-1].sequence + 1
+                else:
+                    next_sequence = self.last_event_id + 1
+
+            # Live loop: deliver new events, keepalive when idle
+            last_keepalive = time.monotonic()
 
-            # Keepalive loop
-            import time
-            last_keepalive = time.time()
-            
             while not self.closed:
-                # Check if keepalive needed
-                now = time.time()
-                if now - last_keepalive >= SSE_KEEPALIVE_INTERVAL:
+                new_events = self.event_repo.get_events_from_sequence(
+                    self.session_id,
+                    from_seq=next_sequence,
+                    max_events=LIVE_EVENT_BATCH_SIZE,
+                )
+                for event in new_events:
+                    yield self._format_sse_event(
+                        event.event_type,
+                        event.to_sse_data(),
+                        sse_id=event.sequence,
+                    )
+                    next_sequence = event.sequence + 1
+                if len(new_events) == LIVE_EVENT_BATCH_SIZE:
+                    continue  # More pending; drain before waiting
+
+                until_keepalive = last_keepalive + SSE_KEEPALIVE_INTERVAL - time.monotonic()
+                if until_keepalive <= 0:
                     yield self._keepalive_event()
-                    last_keepalive = now
-                    
-                    # Update connection status
-                    session = self.session_repo.get_session(self.session_id)
-                    if session:
-                        conn = session.get_connection(self.connection_id)
-                        if conn:
-                            conn.mark_keepalive()
-                            self.session_repo.save_session(session)
-
-                # Small sleep to prevent busy loop
-                time.sleep(0.1)
-                yield ""  # Keep connection alive
+                    last_keepalive = time.monotonic()
+                    self._keepalive_batcher.record(self.connection_id)
+                    continue
+
+                # Block until an append for this session or the next keepalive.
+                # The keepalive wakeup also picks up events appended by other
+                # processes, which the in-process notifier does not see.
+                self._subscription.wait(until_keepalive)
 
         except GeneratorExit:
             logger.info(f"SSE disconnected: session={self.session_id}")
@@ -219,8 +256,17 @@ class SSEStreamHandler:
             self.closed = True
             self._cleanup()
 
+    def close(self) -> None:
+        """Stop the stream; wakes the generator if it is waiting."""
+        self.closed = True
+        if self._subscription is not None:
+            self._subscription.close()
+
     def _cleanup(self):
         """Cleanup on disconnect."""
+        if self._subscription is not None:
+            self._subscription.close()
+        self._keepalive_batcher.discard(self.connection_id)
         try:
             self.session_repo.update_connection_status(
                 self.connection_id,
@@ -419,18 +465,17 @@ def publish_event(session_id: str):
     payload = data.get("payload", {})
 
     event_repo = get_event_log_repository()
-    
-    # Get next sequence
-    latest = event_repo.get_latest_sequence(session_id) or 0
-    
-    entry = EventLogEntry.create(
-        session_id=session_id,
-        sequence=latest + 1,
-        event_type=event_type,
-        payload=payload,
+
+    # Next sequence is allocated in the insert transaction
+    entry = event_repo.append_next_sequence(
+        session_id,
+        lambda sequence: EventLogEntry.create(
+            session_id=session_id,
+            sequence=sequence,
+            event_type=event_type,
+            payload=payload,
+        ),
     )
-    
-    event_repo.append(entry)
 
     return jsonify({
         "status": "published",
@@ -440,6 +485,65 @@ def publish_event(session_id: str):
     })
 
 
+@stream_bp.route("/<session_id>/compare", methods=["POST"])
+def start_compare(session_id: str):
+    """
+    Start a streaming compare v3 run for this session.
+
+    Stage start/complete events, BIRL narratives and the final _meta are
+    published to the session's event log and delivered on
+    GET /api/v1/stream/{session_id}.
+
+    Body:
+        v1_text, v2_text: Contract version texts
+        v1_contract_id, v2_contract_id: Optional contract IDs for clause lookup
+
+    Returns:
+        202 with compare_id and last_event_id; connect with
+        Last-Event-ID: <last_event_id> to receive every event of the run
+    """
+    data = request.get_json(silent=True)
+    if not data:
+        return jsonify({"error": "JSON body required"}), 400
+
+    v1_text = data.get("v1_text", "")
+    v2_text = data.get("v2_text", "")
+    if not v1_text or not v2_text:
+        return jsonify({
+            "error": "Both v1_text and v2_text required",
+            "error_message_key": "compare.payload_failure",
+        }), 400
+
+    try:
+        from compare_stream import start_streaming_compare
+    except ImportError as e:
+        logger.error(f"Streaming compare unavailable: {e}")
+        return jsonify({
+            "error": "Compare v3 engine not available",
+            "error_message_key": "compare.internal_failure",
+        }), 500
+
+    event_repo = get_event_log_repository()
+    last_event_id = event_repo.get_latest_sequence(session_id) or 0
+
+    compare_id = start_streaming_compare(
+        session_id,
+        v1_text,
+        v2_text,
+        data.get("v1_contract_id"),
+        data.get("v2_contract_id"),
+        event_repo=event_repo,
+    )
+
+    return jsonify({
+        "status": "started",
+        "compare_id": compare_id,
+        "session_id": session_id,
+        "stream_url": f"{stream_bp.url_prefix}/{session_id}",
+        "last_event_id": last_event_id,
+    }), 202
+
+
 @stream_bp.route("/health", methods=["GET"])
 def health_check():
     """
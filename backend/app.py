@@ -67,6 +67,7 @@ def create_app(config: dict = None) -> Flask:
         "SSE_MAX_CONNECTIONS": int(os.getenv("SSE_MAX_CONNECTIONS_PER_SESSION", "5")),
         "SSE_EVENT_TTL_HOURS": float(os.getenv("SSE_EVENT_TTL_HOURS", "1.0")),
         "SSE_MAX_EVENTS": int(os.getenv("SSE_MAX_EVENTS_PER_SESSION", "1000")),
+        "SSE_EVENT_LOG_WRITE_BEHIND": os.getenv("SSE_EVENT_LOG_WRITE_BEHIND", "false").lower() == "true",
     })
     
     # Apply overrides
@@ -132,6 +133,7 @@ def _init_repositories(app: Flask) -> None:
         db_path=app.config["EVENT_LOG_DB_PATH"],
         ttl_hours=app.config["SSE_EVENT_TTL_HOURS"],
         max_events=app.config["SSE_MAX_EVENTS"],
+        write_behind=app.config["SSE_EVENT_LOG_WRITE_BEHIND"],
     )
     logger.info(f"Event log repository: {app.config['EVENT_LOG_DB_PATH']}")
 
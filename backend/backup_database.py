@@ -4,11 +4,12 @@ Creates timestamped backups with retention policy
 """
 
 import sqlite3
-import shutil
 from pathlib import Path
 from datetime import datetime, timedelta
 from typing import Optional
 
+from sqlite_bulk import copy_database
+
 # Paths
 BASE_DIR = Path(__file__).parent.parent
 DATA_DIR = BASE_DIR / "data"
@@ -141,10 +142,10 @@ def restore_backup(backup_path: Path, target_db: str):
         print("[ERROR] Could not create safety backup - aborting restore")
         return False
 
-    # Restore from backup
+    # Restore from backup (checkpoints both files, drops the target's stale -wal/-shm)
     try:
         print(f"Restoring {target_db} from {backup_path.name}...")
-        shutil.copy2(backup_path, target_path)
+        copy_database(backup_path, target_path)
         print(f"[OK] Database restored successfully")
         return True
 
@@ -0,0 +1,222 @@
+"""
+Streaming Compare for Phase 5 Compare v3 Pipeline
+Publishes orchestrator progress as sequenced, replayable SSE events.
+
+Each compare run publishes to its session's event log:
+- compare_start
+- compare_stage_start / compare_stage_complete per stage, the latter with the
+  stage payload (SAE matches, ERCE results, BIRL narratives, FAR gaps)
+- compare_narrative for each BIRL narrative as it arrives
+- compare_complete (with _meta) or compare_error
+
+Clients read the events from GET /api/v1/stream/<session_id>. The SSE id of
+each frame is the event log sequence, so a client reconnecting with
+Last-Event-ID resumes right after the last event it saw.
+"""
+
+import logging
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Optional
+
+from event_log import EventLogEntry, EventLogRepository, get_event_log_repository
+from phase5_flags import get_config
+from sse.envelope import EventEnvelope, EventType
+
+logger = logging.getLogger(__name__)
+
+
+# Orchestrator on_event kinds -> SSE event types
+ORCHESTRATOR_EVENT_TYPES = {
+    "stage_start": EventType.COMPARE_STAGE_START,
+    "stage_complete": EventType.COMPARE_STAGE_COMPLETE,
+    "narrative": EventType.COMPARE_NARRATIVE,
+}
+
+# ============================================================================
+# EVENT PUBLISHER
+# ============================================================================
+
+class CompareEventPublisher:
+    """
+    Publishes the events of one compare run to a session's event log.
+
+    Thread-safe: BIRL narratives are published from the stage thread while
+    stage events come from the orchestrator thread.
+    """
+
+    def __init__(
+        self,
+        session_id: str,
+        compare_id: Optional[str] = None,
+        event_repo: Optional[EventLogRepository] = None,
+        ttl_hours: float = 1.0,
+    ):
+        """
+        Initialize publisher.
+
+        Args:
+            session_id: SSE session the client streams from
+            compare_id: Compare run identifier (generated if omitted)
+            event_repo: Event log repository (defaults to the singleton)
+            ttl_hours: Event time-to-live for replay
+        """
+        self.session_id = session_id
+        self.compare_id = compare_id or str(uuid.uuid4())
+        self.event_repo = event_repo or get_event_log_repository()
+        self.ttl_hours = ttl_hours
+        self.events_published = 0
+        self._count_lock = threading.Lock()
+
+    def publish(self, event_type: EventType, payload: Dict[str, Any]) -> EventLogEntry:
+        """
+        Append one compare event with the next session sequence.
+
+        Args:
+            event_type: Compare event type
+            payload: Event payload (compare_id is added)
+
+        Returns:
+            The stored EventLogEntry
+        """
+        def build(sequence: int) -> EventLogEntry:
+            envelope = EventEnvelope(
+                event_id=str(uuid.uuid4()),
+                sequence=sequence,
+                event_type=event_type,
+                payload={"compare_id": self.compare_id, **payload},
+                metadata={"compare_id": self.compare_id},
+                session_id=self.session_id,
+            )
+            return EventLogEntry.from_envelope(envelope, self.session_id, self.ttl_hours)
+
+        # Sequence allocation and insert share one transaction, so
+        # publishers in other processes cannot take the same sequence
+        entry = self.event_repo.append_next_sequence(self.session_id, build)
+        with self._count_lock:
+            self.events_published += 1
+
+        logger.debug(
+            f"Compare event published: seq={entry.sequence}, type={event_type.value}",
+            extra={"compare_id": self.compare_id, "session_id": self.session_id},
+        )
+        return entry
+
+    def on_orchestrator_event(self, kind: str, payload: Dict[str, Any]) -> None:
+        """on_event callback for run_compare_v3_orchestrator."""
+        event_type = ORCHESTRATOR_EVENT_TYPES.get(kind)
+        if event_type is None:
+            logger.debug(f"Ignoring orchestrator event kind: {kind}")
+            return
+        self.publish(event_type, payload)
+
+
+# ============================================================================
+# STREAMING COMPARE
+# ============================================================================
+
+def run_streaming_compare(
+    session_id: str,
+    v1_text: str,
+    v2_text: str,
+    v1_contract_id: Optional[int] = None,
+    v2_contract_id: Optional[int] = None,
+    compare_id: Optional[str] = None,
+    event_repo: Optional[EventLogRepository] = None,
+) -> Dict[str, Any]:
+    """
+    Run the compare v3 orchestrator, publishing progress as SSE events.
+
+    Args:
+        session_id: SSE session to publish to
+        v1_text: First contract version text
+        v2_text: Second contract version text
+        v1_contract_id: Optional contract ID for v1
+        v2_contract_id: Optional contract ID for v2
+        compare_id: Compare run identifier (generated if omitted)
+        event_repo: Event log repository (defaults to the singleton)
+
+    Returns:
+        Orchestrator result, or the compare_v3_api error shape on failure
+    """
+    from compare_v3_engine import run_compare_v3_orchestrator
+
+    publisher = CompareEventPublisher(session_id, compare_id, event_repo)
+    publisher.publish(EventType.COMPARE_START, {
+        "v1_contract_id": v1_contract_id,
+        "v2_contract_id": v2_contract_id,
+    })
+
+    try:
+        result = run_compare_v3_orchestrator(
+            v1_text, v2_text, v1_contract_id, v2_contract_id,
+            on_event=publisher.on_orchestrator_event,
+        )
+    except Exception as e:
+        logger.error(
+            f"Streaming compare failed: {e}",
+            extra={"compare_id": publisher.compare_id, "session_id": session_id},
+        )
+        error = {
+            "success": False,
+            "error_category": "compare",
+            "error_message_key": "compare.internal_failure",
+            "error_detail": str(e),
+            "retry_allowed": False,
+        }
+        publisher.publish(EventType.COMPARE_ERROR, error)
+        return error
+
+    publisher.publish(EventType.COMPARE_COMPLETE, {"_meta": result["_meta"]})
+    return result
+
+
+# Shared executor for background streaming compares (lazy)
+_stream_executor: Optional[ThreadPoolExecutor] = None
+_stream_executor_lock = threading.Lock()
+
+
+def get_stream_executor() -> ThreadPoolExecutor:
+    """Get the bounded executor that runs background streaming compares."""
+    global _stream_executor
+    if _stream_executor is None:
+        with _stream_executor_lock:
+            if _stream_executor is None:
+                _stream_executor = ThreadPoolExecutor(
+                    max_workers=get_config("compare_stream_max_workers", 4),
+                    thread_name_prefix="compare-stream",
+                )
+    return _stream_executor
+
+
+def start_streaming_compare(
+    session_id: str,
+    v1_text: str,
+    v2_text: str,
+    v1_contract_id: Optional[int] = None,
+    v2_contract_id: Optional[int] = None,
+    event_repo: Optional[EventLogRepository] = None,
+) -> str:
+    """
+    Start a streaming compare in the background.
+
+    Returns:
+        compare_id carried in every event of the run
+    """
+    compare_id = str(uuid.uuid4())
+    future = get_stream_executor().submit(
+        run_streaming_compare,
+        session_id, v1_text, v2_text, v1_contract_id, v2_contract_id,
+        compare_id, event_repo,
+    )
+
+    def log_failure(done) -> None:
+        if done.exception() is not None:
+            logger.error(
+                f"Streaming compare could not publish: {done.exception()}",
+                extra={"compare_id": compare_id, "session_id": session_id},
+            )
+
+    future.add_done_callback(log_failure)
+    return compare_id
@@ -10,13 +10,16 @@ Phase 4F: Real intelligence with fallback to placeholders.
 """
 
 from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple
 import uuid
 import logging
 import hashlib
 import json
 import os
-import sqlite3
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, as_completed, wait
+from concurrent.futures import TimeoutError as FutureTimeoutError
 from pathlib import Path
 
 logger = logging.getLogger(__name__)
@@ -25,13 +28,19 @@ logger = logging.getLogger(__name__)
 try:
     from phase5_flags import is_flag_enabled, get_config
     from embedding_cache import (
-        get_sae_embedding,
+        get_sae_embeddings,
         compute_cosine_similarity,
+        compute_similarity_matrix,
         truncate_for_embedding,
+        vectors_to_bytes,
+        bytes_to_vector,
         SAEEmbeddingResult,
+        NUMPY_AVAILABLE,
     )
     from pattern_cache import (
         get_erce_patterns,
+        get_pattern_cache,
+        get_pattern_index,
         match_patterns_for_erce,
         classify_erce_risk,
         ERCEMatchResult,
@@ -40,8 +49,13 @@ try:
     PHASE5_AVAILABLE = True
 except ImportError:
     PHASE5_AVAILABLE = False
+    NUMPY_AVAILABLE = False
     is_flag_enabled = lambda x: False
     get_config = lambda x, default=None: default
+    vectors_to_bytes = lambda v, model_version="", dtype=None: json.dumps(v).encode('utf-8')
+    bytes_to_vector = lambda data: json.loads(data)
+
+from db_pool import get_connection
 
 # Import models
 from compare_v3_models import (
@@ -68,6 +82,38 @@ except ImportError:
     call_claude_safe = None
     AIResult = None
 
+# BIRL narrative cache (optional)
+try:
+    from narrative_cache import NarrativeCache, get_narrative_cache
+    NARRATIVE_CACHE_AVAILABLE = True
+except ImportError:
+    NarrativeCache = None
+    get_narrative_cache = None
+    NARRATIVE_CACHE_AVAILABLE = False
+
+# Comparison result cache (optional)
+try:
+    from comparison_snapshot_cache import ComparisonSnapshotCache, get_snapshot_cache
+    SNAPSHOT_CACHE_AVAILABLE = True
+except ImportError:
+    ComparisonSnapshotCache = None
+    get_snapshot_cache = None
+    SNAPSHOT_CACHE_AVAILABLE = False
+
+# NumPy for matrix SAE alignment (optional)
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# SciPy assignment solver (optional, NumPy fallback below)
+try:
+    from scipy.optimize import linear_sum_assignment
+    SCIPY_AVAILABLE = True
+except ImportError:
+    linear_sum_assignment = None
+    SCIPY_AVAILABLE = False
+
 # OpenAI for embeddings
 try:
     from openai import OpenAI
@@ -86,6 +132,10 @@ SAE_HIGH_THRESHOLD = 0.90
 SAE_MEDIUM_THRESHOLD = 0.75
 SAE_LOW_THRESHOLD = 0.60
 
+# SAE alignment modes: "matrix" (global assignment) or "greedy" (legacy v1-order)
+SAE_ALIGNMENT_MATRIX = "matrix"
+SAE_ALIGNMENT_GREEDY = "greedy"
+
 # Embedding settings
 EMBEDDING_MODEL = "text-embedding-3-large"
 MAX_EMBEDDING_TOKENS = 512
@@ -122,6 +172,8 @@ class MonitorMetrics:
         self.cache_hits: int = 0
         self.cache_misses: int = 0
         self.stages_skipped: int = 0
+        self.embedding_batches: List[Dict[str, Any]] = []
+        self.stage_windows: Dict[str, Tuple[int, int]] = {}
         self.total_start_ms: Optional[int] = None
         self.total_end_ms: Optional[int] = None
 
@@ -190,6 +242,10 @@ class MonitorMetrics:
             "timestamp": datetime.now().isoformat(),
         })
 
+    def record_stage_window(self, stage: str, start_ms: int, end_ms: int) -> None:
+        """Record wall-clock start/end (epoch ms) for a stage to expose overlap."""
+        self.stage_windows[stage] = (start_ms, end_ms)
+
     def record_fallback(self) -> None:
         """Increment fallback counter."""
         self.fallback_count += 1
@@ -206,6 +262,10 @@ class MonitorMetrics:
         """Increment stages skipped counter."""
         self.stages_skipped += 1
 
+    def record_embedding_batch(self, batch: Dict[str, Any]) -> None:
+        """Record one SAE embeddings API request (inputs, est_tokens, latency_ms, status)."""
+        self.embedding_batches.append(dict(batch))
+
     def to_meta_monitor(self) -> Dict[str, Any]:
         """
         Convert metrics to _meta.monitor output contract.
@@ -213,6 +273,20 @@ class MonitorMetrics:
         Returns:
             Dict matching the required output contract
         """
+        # Stage windows relative to pipeline start; overlap = time saved vs serial
+        origin = self.total_start_ms or 0
+        stage_timeline = {
+            stage: {"start_ms": start - origin, "end_ms": end - origin}
+            for stage, (start, end) in self.stage_windows.items()
+        }
+        if self.stage_windows:
+            span_ms = (max(end for _, end in self.stage_windows.values())
+                       - min(start for start, _ in self.stage_windows.values()))
+            busy_ms = sum(end - start for start, end in self.stage_windows.values())
+            overlap_ms = max(0, busy_ms - span_ms)
+        else:
+            overlap_ms = 0
+
         return {
             "sae_ms": self.stage_latencies.get("SAE", 0),
             "erce_ms": self.stage_latencies.get("ERCE", 0),
@@ -224,6 +298,9 @@ class MonitorMetrics:
             "cache_hits": self.cache_hits,
             "cache_misses": self.cache_misses,
             "stages_skipped": self.stages_skipped,
+            "embedding_batches": self.embedding_batches,
+            "stage_timeline": stage_timeline,
+            "overlap_ms": overlap_ms,
             "events_count": len(self.events),
         }
 
@@ -299,10 +376,8 @@ def compute_payload_ref(data: Any) -> str:
 # ============================================================================
 
 def get_db_connection():
-    """Get database connection with FK enforcement."""
-    conn = sqlite3.connect(str(CONTRACTS_DB))
-    conn.execute("PRAGMA foreign_keys = ON")
-    return conn
+    """Get pooled database connection with FK enforcement (tuple rows)."""
+    return get_connection(CONTRACTS_DB, row_factory=None)
 
 
 def ensure_embedding_cache_table():
@@ -344,7 +419,7 @@ def get_cached_embedding(contract_id: int, clause_id: int, text_hash: str) -> Op
         conn.close()
 
         if row:
-            return json.loads(row[0])
+            return bytes_to_vector(row[0])
         return None
     except Exception as e:
         logger.warning(f"Cache lookup failed: {e}")
@@ -361,7 +436,7 @@ def cache_embedding(contract_id: int, clause_id: int, text_hash: str, embedding:
             INSERT OR REPLACE INTO clause_embeddings
             (contract_id, clause_id, text_hash, embedding, created_at, expires_at)
             VALUES (?, ?, ?, ?, ?, ?)
-        """, (contract_id, clause_id, text_hash, json.dumps(embedding),
+        """, (contract_id, clause_id, text_hash, vectors_to_bytes(embedding, EMBEDDING_MODEL),
               datetime.now().isoformat(), expires_at))
         conn.commit()
         conn.close()
@@ -389,47 +464,6 @@ def _get_openai_client() -> Optional[Any]:
         return None
 
 
-def _truncate_text(text: str, max_tokens: int = MAX_EMBEDDING_TOKENS) -> str:
-    """Truncate text to approximate token limit (4 chars ~ 1 token)."""
-    max_chars = max_tokens * 4
-    if len(text) > max_chars:
-        return text[:max_chars]
-    return text
-
-
-def _compute_text_hash(text: str) -> str:
-    """Compute hash of text for caching."""
-    return hashlib.sha256(text.encode()).hexdigest()[:16]
-
-
-def _get_embedding(client: Any, text: str, contract_id: int, clause_id: int) -> Optional[List[float]]:
-    """Get embedding for text, using cache if available."""
-    truncated = _truncate_text(text)
-    text_hash = _compute_text_hash(truncated)
-
-    # Check cache first
-    cached = get_cached_embedding(contract_id, clause_id, text_hash)
-    if cached:
-        logger.debug(f"Embedding cache hit: contract={contract_id}, clause={clause_id}")
-        return cached
-
-    # Call OpenAI
-    try:
-        response = client.embeddings.create(
-            model=EMBEDDING_MODEL,
-            input=truncated
-        )
-        embedding = response.data[0].embedding
-
-        # Cache it
-        cache_embedding(contract_id, clause_id, text_hash, embedding)
-
-        return embedding
-    except Exception as e:
-        logger.error(f"Embedding API call failed: {e}")
-        return None
-
-
 def _cosine_similarity(vec1: List[float], vec2: List[float]) -> float:
     """Compute cosine similarity between two vectors."""
     if not vec1 or not vec2 or len(vec1) != len(vec2):
@@ -462,7 +496,8 @@ def run_sae_real(
     v2_clauses: List[Dict[str, Any]],
     v1_contract_id: int,
     v2_contract_id: int,
-    request_id: str
+    request_id: str,
+    batch_log: Optional[List[Dict[str, Any]]] = None
 ) -> Tuple[List[Dict[str, Any]], Dict[str, int]]:
     """
     Run real SAE with embeddings.
@@ -471,6 +506,14 @@ def run_sae_real(
     - When False: Returns placeholder behavior (legacy)
     - When True: Uses Phase 5 cache + OpenAI API with fallback
 
+    Alignment follows the sae_alignment_mode config: "matrix" computes the
+    full similarity matrix and solves a global assignment (requires NumPy),
+    "greedy" keeps the legacy best-remaining-match loop.
+
+    Args:
+        batch_log: Optional list; one entry per embeddings request sent is
+            appended (see get_sae_embeddings)
+
     Returns:
         Tuple of (matches, stats)
     """
@@ -518,66 +561,54 @@ def run_sae_real(
         )
         return _generate_sae_placeholder(), {"matched_count": 3, "unmatched_v1": 0, "unmatched_v2": 0}
 
-    # Get embeddings for all clauses using Phase 5 infrastructure
+    # Get embeddings for all clauses using Phase 5 infrastructure, both
+    # versions in one batched cache lookup
     v1_embeddings = {}
     v2_embeddings = {}
 
-    for clause in v1_clauses:
-        clause_id = clause.get('id', 0)
-        text = clause.get('text', clause.get('title', ''))
-        if text:
-            # Use Phase 5 get_sae_embedding with semantic truncation
-            result = get_sae_embedding(
-                clause_text=text,
-                openai_client=client,
-                model=EMBEDDING_MODEL,
-                max_tokens=MAX_EMBEDDING_TOKENS
-            )
-            if result.vector:
-                v1_embeddings[clause_id] = (result.vector, clause)
-                if result.cached:
-                    stats["cache_hits"] += 1
-                else:
-                    stats["cache_misses"] += 1
-            elif result.error:
-                logger.warning(
-                    "SAE embedding failed for v1 clause",
-                    extra={
-                        "agent_role": "cip-severity",
-                        "stage": "SAE",
-                        "request_id": request_id,
-                        "clause_id": clause_id,
-                        "error": result.error,
-                    },
-                )
+    pending = []
+    for version, clauses, embeddings in (
+        ("v1", v1_clauses, v1_embeddings),
+        ("v2", v2_clauses, v2_embeddings),
+    ):
+        for clause in clauses:
+            text = clause.get('text', clause.get('title', ''))
+            if text:
+                pending.append((version, clause, embeddings, text))
+
+    # Use Phase 5 get_sae_embeddings with semantic truncation; cache misses
+    # from both versions go out as batched embeddings requests
+    if batch_log is None:
+        batch_log = []
+    batches_before = len(batch_log)
+    results = get_sae_embeddings(
+        clause_texts=[text for _, _, _, text in pending],
+        openai_client=client,
+        model=EMBEDDING_MODEL,
+        max_tokens=MAX_EMBEDDING_TOKENS,
+        batch_log=batch_log
+    )
+    stats["embedding_batches"] = len(batch_log) - batches_before
 
-    for clause in v2_clauses:
+    for (version, clause, embeddings, _), result in zip(pending, results):
         clause_id = clause.get('id', 0)
-        text = clause.get('text', clause.get('title', ''))
-        if text:
-            result = get_sae_embedding(
-                clause_text=text,
-                openai_client=client,
-                model=EMBEDDING_MODEL,
-                max_tokens=MAX_EMBEDDING_TOKENS
+        if result.vector:
+            embeddings[clause_id] = (result.vector, clause)
+            if result.cached:
+                stats["cache_hits"] += 1
+            else:
+                stats["cache_misses"] += 1
+        elif result.error:
+            logger.warning(
+                f"SAE embedding failed for {version} clause",
+                extra={
+                    "agent_role": "cip-severity",
+                    "stage": "SAE",
+                    "request_id": request_id,
+                    "clause_id": clause_id,
+                    "error": result.error,
+                },
             )
-            if result.vector:
-                v2_embeddings[clause_id] = (result.vector, clause)
-                if result.cached:
-                    stats["cache_hits"] += 1
-                else:
-                    stats["cache_misses"] += 1
-            elif result.error:
-                logger.warning(
-                    "SAE embedding failed for v2 clause",
-                    extra={
-                        "agent_role": "cip-severity",
-                        "stage": "SAE",
-                        "request_id": request_id,
-                        "clause_id": clause_id,
-                        "error": result.error,
-                    },
-                )
 
     # If no embeddings obtained, fall back to placeholder
     if not v1_embeddings or not v2_embeddings:
@@ -593,12 +624,79 @@ def run_sae_real(
         )
         return _generate_sae_placeholder(), {"matched_count": 3, "unmatched_v1": 0, "unmatched_v2": 0}
 
-    # Find best matches using Phase 5 cosine similarity
+    # Align clauses: global assignment over the similarity matrix when
+    # available, legacy greedy loop otherwise
+    alignment_mode = get_config("sae_alignment_mode", SAE_ALIGNMENT_MATRIX)
+    matches = None
+
+    if alignment_mode == SAE_ALIGNMENT_MATRIX and NUMPY_AVAILABLE:
+        try:
+            matches = _align_clauses_matrix(v1_embeddings, v2_embeddings)
+        except ValueError as e:
+            logger.warning(
+                "SAE matrix alignment failed, falling back to greedy",
+                extra={
+                    "agent_role": "cip-severity",
+                    "stage": "SAE",
+                    "request_id": request_id,
+                    "error": str(e),
+                },
+            )
+
+    if matches is None:
+        alignment_mode = SAE_ALIGNMENT_GREEDY
+        matches = _align_clauses_greedy(v1_embeddings, v2_embeddings)
+
+    stats["matched_count"] = len(matches)
+    stats["unmatched_v1"] = len(v1_embeddings) - len(matches)
+    stats["unmatched_v2"] = len(v2_embeddings) - len(matches)
+    stats["alignment_mode"] = alignment_mode
+
+    logger.info(
+        "SAE complete",
+        extra={
+            "agent_role": "cip-severity",
+            "stage": "SAE",
+            "request_id": request_id,
+            "matched_count": stats["matched_count"],
+            "unmatched_v1": stats["unmatched_v1"],
+            "unmatched_v2": stats["unmatched_v2"],
+            "cache_hits": stats["cache_hits"],
+            "cache_misses": stats["cache_misses"],
+            "alignment_mode": alignment_mode,
+        },
+    )
+    return matches, stats
+
+
+def _build_sae_match(v1_id: Any, v2_id: Any, score: float) -> Optional[Dict[str, Any]]:
+    """Build a ClauseMatch-shaped dict, or None if score is below LOW."""
+    confidence, threshold = _classify_match_confidence(score)
+    if not confidence:
+        return None
+    return {
+        "v1_clause_id": v1_id,
+        "v2_clause_id": v2_id,
+        "similarity_score": round(score, 4),
+        "threshold_used": threshold,
+        "match_confidence": confidence
+    }
+
+
+def _align_clauses_greedy(
+    v1_embeddings: Dict[Any, Tuple[List[float], Dict[str, Any]]],
+    v2_embeddings: Dict[Any, Tuple[List[float], Dict[str, Any]]]
+) -> List[Dict[str, Any]]:
+    """
+    Legacy SAE alignment: best remaining v2 clause for each v1 clause, in v1 order.
+
+    Returns:
+        List of match dicts (only pairs at or above SAE_LOW_THRESHOLD)
+    """
     matches = []
     matched_v2_ids = set()
 
     for v1_id, (v1_emb, v1_clause) in v1_embeddings.items():
-        best_match = None
         best_score = 0.0
         best_v2_id = None
 
@@ -606,46 +704,117 @@ def run_sae_real(
             if v2_id in matched_v2_ids:
                 continue
 
-            # Use Phase 5 cosine similarity
             score = compute_cosine_similarity(v1_emb, v2_emb)
             if score > best_score:
                 best_score = score
-                best_match = v2_clause
                 best_v2_id = v2_id
 
-        # Classify match
-        confidence, threshold = _classify_match_confidence(best_score)
-
-        if confidence:
-            matches.append({
-                "v1_clause_id": v1_id,
-                "v2_clause_id": best_v2_id,
-                "similarity_score": round(best_score, 4),
-                "threshold_used": threshold,
-                "match_confidence": confidence
-            })
+        match = _build_sae_match(v1_id, best_v2_id, best_score)
+        if match:
+            matches.append(match)
             matched_v2_ids.add(best_v2_id)
-            stats["matched_count"] += 1
-        else:
-            stats["unmatched_v1"] += 1
 
-    # Count unmatched V2
-    stats["unmatched_v2"] = len(v2_embeddings) - len(matched_v2_ids)
+    return matches
 
-    logger.info(
-        "SAE complete",
-        extra={
-            "agent_role": "cip-severity",
-            "stage": "SAE",
-            "request_id": request_id,
-            "matched_count": stats["matched_count"],
-            "unmatched_v1": stats["unmatched_v1"],
-            "unmatched_v2": stats["unmatched_v2"],
-            "cache_hits": stats["cache_hits"],
-            "cache_misses": stats["cache_misses"],
-        },
+
+def _linear_sum_assignment_np(cost: Any) -> Tuple[Any, Any]:
+    """
+    Minimum-cost rectangular assignment in NumPy.
+
+    Shortest augmenting path (Jonker-Volgenant / Hungarian) with the
+    column scan vectorized, O(n^2 * m). Used when SciPy is not installed;
+    returns (row_ind, col_ind) sorted by row like scipy's solver.
+    """
+    cost = np.asarray(cost, dtype=np.float64)
+    transposed = cost.shape[0] > cost.shape[1]
+    if transposed:
+        cost = cost.T
+
+    n, m = cost.shape
+    u = np.zeros(n + 1)
+    v = np.zeros(m + 1)
+    assigned_row = np.zeros(m + 1, dtype=np.int64)  # 1-based row per column, 0 = free
+    way = np.zeros(m + 1, dtype=np.int64)
+
+    for i in range(1, n + 1):
+        assigned_row[0] = i
+        j0 = 0
+        minv = np.full(m, np.inf)
+        used = np.zeros(m + 1, dtype=bool)
+
+        while True:
+            used[j0] = True
+            i0 = assigned_row[j0]
+            free = ~used[1:]
+
+            reduced = cost[i0 - 1] - u[i0] - v[1:]
+            improve = free & (reduced < minv)
+            minv[improve] = reduced[improve]
+            way[1:][improve] = j0
+
+            candidates = np.where(free, minv, np.inf)
+            j1 = int(np.argmin(candidates))
+            delta = candidates[j1]
+
+            used_cols = np.flatnonzero(used)
+            u[assigned_row[used_cols]] += delta
+            v[used_cols] -= delta
+            minv[free] -= delta
+
+            j0 = j1 + 1
+            if assigned_row[j0] == 0:
+                break
+
+        # Augment along the alternating path
+        while j0:
+            j1 = way[j0]
+            assigned_row[j0] = assigned_row[j1]
+            j0 = j1
+
+    cols = np.flatnonzero(assigned_row[1:])
+    rows = assigned_row[1:][cols] - 1
+
+    if transposed:
+        rows, cols = cols, rows
+    order = np.argsort(rows)
+    return rows[order], cols[order]
+
+
+def _align_clauses_matrix(
+    v1_embeddings: Dict[Any, Tuple[List[float], Dict[str, Any]]],
+    v2_embeddings: Dict[Any, Tuple[List[float], Dict[str, Any]]]
+) -> List[Dict[str, Any]]:
+    """
+    Matrix SAE alignment: one similarity matmul plus a global assignment.
+
+    Pairs below SAE_LOW_THRESHOLD are zeroed before solving so the
+    assignment maximizes total similarity over matchable pairs only.
+    Matches are returned in v1 order, same as the greedy path.
+
+    Raises:
+        ValueError: If embeddings have mismatched dimensions
+    """
+    v1_ids = list(v1_embeddings.keys())
+    v2_ids = list(v2_embeddings.keys())
+
+    similarity = compute_similarity_matrix(
+        [v1_embeddings[k][0] for k in v1_ids],
+        [v2_embeddings[k][0] for k in v2_ids],
     )
-    return matches, stats
+    gain = np.where(similarity >= SAE_LOW_THRESHOLD, similarity, 0.0)
+
+    if SCIPY_AVAILABLE:
+        rows, cols = linear_sum_assignment(gain, maximize=True)
+    else:
+        rows, cols = _linear_sum_assignment_np(-gain)
+
+    matches = []
+    for r, c in zip(rows, cols):
+        match = _build_sae_match(v1_ids[r], v2_ids[c], float(similarity[r, c]))
+        if match:
+            matches.append(match)
+
+    return matches
 
 
 def _generate_sae_placeholder() -> List[Dict[str, Any]]:
@@ -786,6 +955,7 @@ def run_erce_real(
     v2_lookup = {c.get('id'): c for c in v2_clauses}
 
     results = []
+    pattern_index = get_pattern_index(patterns)
 
     for idx, match in enumerate(sae_matches):
         v1_id = match.get('v1_clause_id')
@@ -800,7 +970,7 @@ def run_erce_real(
         combined_text = f"{v1_text} {v2_text}"
 
         # Match patterns using Phase 5 infrastructure
-        matched_patterns = match_patterns_for_erce(combined_text, patterns)
+        matched_patterns = match_patterns_for_erce(combined_text, patterns, pattern_index)
 
         # Classify risk
         classification = classify_erce_risk(matched_patterns, combined_text)
@@ -869,6 +1039,10 @@ OUTPUT FORMAT:
 Narrative: [2-4 sentence impact description]
 Dimensions: [comma-separated list of impacted dimensions]"""
 
+# Bump when BIRL_SYSTEM_PROMPT or the user prompt template changes;
+# part of the narrative cache key so stale narratives are never reused.
+BIRL_PROMPT_VERSION = "birl-5.4-1"
+
 # Legal advice phrases to detect and reject
 LEGAL_ADVICE_PHRASES = [
     "you should consult",
@@ -1037,7 +1211,8 @@ def run_birl_real(
     sae_matches: List[Dict[str, Any]],
     v1_clauses: List[Dict[str, Any]],
     v2_clauses: List[Dict[str, Any]],
-    request_id: str
+    request_id: str,
+    on_narrative: Optional[Callable[[Dict[str, Any]], None]] = None
 ) -> Tuple[List[Dict[str, Any]], Dict[str, int]]:
     """
     Run real BIRL with Claude.
@@ -1046,6 +1221,10 @@ def run_birl_real(
     - When False: Returns placeholder behavior (legacy)
     - When True: Uses Claude with hallucination shields
 
+    Args:
+        on_narrative: Optional callback invoked with each narrative entry as
+            soon as it is final (completion order, not pair order)
+
     Returns:
         Tuple of (narratives, stats)
     """
@@ -1055,6 +1234,8 @@ def run_birl_real(
         "hallucination_rejections": 0,
         "truncations": 0,
         "low_value_count": 0,
+        "cache_hits": 0,
+        "llm_calls": 0,
     }
 
     # Check Phase 5 feature flag
@@ -1104,17 +1285,13 @@ def run_birl_real(
     v1_lookup = {c.get('id'): c for c in v1_clauses}
     v2_lookup = {c.get('id'): c for c in v2_clauses}
 
-    narratives = []
-
     # Process up to max_narratives pairs
     pairs_to_process = list(zip(erce_results, sae_matches))[:max_narratives]
 
+    contexts = []
     for idx, (erce, sae) in enumerate(pairs_to_process):
-        v1_id = sae.get('v1_clause_id')
-        v2_id = sae.get('v2_clause_id')
-
-        v1_clause = v1_lookup.get(v1_id, {})
-        v2_clause = v2_lookup.get(v2_id, {})
+        v1_clause = v1_lookup.get(sae.get('v1_clause_id'), {})
+        v2_clause = v2_lookup.get(sae.get('v2_clause_id'), {})
 
         v1_title = v1_clause.get('title', 'Unknown clause')
         v2_title = v2_clause.get('title', 'Unknown clause')
@@ -1122,125 +1299,83 @@ def run_birl_real(
         v2_text = v2_clause.get('text', '')[:500]
         risk_category = erce.get('risk_category', 'ADMIN')
 
-        # Combined input text for hallucination validation
-        combined_input = f"{v1_title} {v1_text} {v2_title} {v2_text}"
-
-        # Prepare prompt
-        user_message = f"""Analyze this clause change:
-
-V1 Clause: {v1_title}
-V1 Text (excerpt): {v1_text}
-
-V2 Clause: {v2_title}
-V2 Text (excerpt): {v2_text}
-
-Risk Category: {risk_category}
-
-Provide a 2-4 sentence business impact narrative."""
-
-        # Call Claude
-        try:
-            result = call_claude_safe(
-                payload={
-                    'system': BIRL_SYSTEM_PROMPT,
-                    'messages': [{'role': 'user', 'content': user_message}],
-                    'max_tokens': BIRL_MAX_TOKENS
-                },
-                purpose="compare",
-                contract_id=None
-            )
-
-            if result.success:
-                response_text = result.data.get('response', '')
-
-                # Parse response
-                narrative = response_text.strip()
-                if "Narrative:" in narrative:
-                    narrative = narrative.split("Narrative:")[-1].split("Dimensions:")[0].strip()
-
-                # Hallucination shield validation
-                is_valid, rejection_reason = _validate_narrative_hallucination(
-                    narrative, combined_input, request_id
-                )
+        contexts.append({
+            "clause_pair_id": idx + 1,
+            "v1_text": v1_text,
+            "v2_text": v2_text,
+            "risk_category": risk_category,
+            # Combined input text for hallucination validation
+            "combined_input": f"{v1_title} {v1_text} {v2_title} {v2_text}",
+            "user_message": _build_birl_user_message(v1_title, v1_text, v2_title, v2_text, risk_category),
+            "cache_key": _birl_cache_key(v1_title, v1_text, v2_title, v2_text, risk_category),
+        })
 
-                if not is_valid:
-                    logger.warning(
-                        "BIRL narrative rejected by hallucination shield",
-                        extra={
-                            "agent_role": "cip-reasoning",
-                            "stage": "BIRL",
-                            "request_id": request_id,
-                            "clause_pair_id": idx + 1,
-                            "rejection_reason": rejection_reason,
-                        },
-                    )
-                    stats["hallucination_rejections"] += 1
-                    narratives.append({
-                        "clause_pair_id": idx + 1,
-                        "narrative": "Impact analysis unavailable.",
-                        "impact_dimensions": ["ADMIN"],
-                        "token_count": 0
-                    })
-                    stats["failures_count"] += 1
-                    continue
-
-                # Truncate to 4 sentences max
-                sentence_count = _count_sentences(narrative)
-                if sentence_count > 4:
-                    narrative = _truncate_to_sentences(narrative, 4)
-                    stats["truncations"] += 1
-
-                # Mark low-value if < 2 sentences
-                if sentence_count < 2:
-                    stats["low_value_count"] += 1
-
-                # Extract dimensions
-                dimensions = _extract_dimensions(f"{v1_text} {v2_text} {narrative}")
-
-                narratives.append({
-                    "clause_pair_id": idx + 1,
-                    "narrative": narrative[:500],  # Cap length
-                    "impact_dimensions": dimensions,
-                    "token_count": len(narrative.split())
-                })
-                stats["narratives_count"] += 1
-            else:
-                # Fallback on failure
+    # Cached narratives skip the LLM; the shield still runs on them below
+    cache = get_narrative_cache() if NARRATIVE_CACHE_AVAILABLE else None
+    cached = cache.get_many([ctx["cache_key"] for ctx in contexts]) if cache and contexts else {}
+    stats["cache_hits"] = sum(1 for ctx in contexts if ctx["cache_key"] in cached)
+
+    # Fan out uncached pairs (one request per distinct key) over a bounded pool
+    to_request: Dict[str, str] = {}
+    for ctx in contexts:
+        if ctx["cache_key"] not in cached:
+            to_request.setdefault(ctx["cache_key"], ctx["user_message"])
+    stats["llm_calls"] = len(to_request)
+
+    # Post-process each pair as soon as its narrative is available; the final
+    # list is returned in pair order so narratives and stats stay deterministic
+    finalized: Dict[int, Dict[str, Any]] = {}
+    to_cache = []
+
+    def finalize(ctx: Dict[str, Any], narrative: Optional[str], error: Optional[str], from_cache: bool) -> None:
+        clause_pair_id = ctx["clause_pair_id"]
+        result, accepted = _finalize_birl_narrative(ctx, narrative, error, from_cache, stats, request_id)
+        if accepted and not from_cache:
+            to_cache.append((ctx["cache_key"], narrative, ctx["risk_category"], BIRL_PROMPT_VERSION))
+        finalized[clause_pair_id] = result
+
+        if on_narrative is not None:
+            try:
+                on_narrative(result)
+            except Exception as e:
                 logger.warning(
-                    "BIRL Claude call failed",
+                    "BIRL narrative callback failed",
                     extra={
                         "agent_role": "cip-reasoning",
                         "stage": "BIRL",
                         "request_id": request_id,
-                        "clause_pair_id": idx + 1,
+                        "clause_pair_id": clause_pair_id,
+                        "error": str(e),
                     },
                 )
-                narratives.append({
-                    "clause_pair_id": idx + 1,
-                    "narrative": "Impact analysis unavailable.",
-                    "impact_dimensions": ["ADMIN"],
-                    "token_count": 0
-                })
-                stats["failures_count"] += 1
 
-        except Exception as e:
-            logger.error(
-                "BIRL exception",
-                extra={
-                    "agent_role": "cip-reasoning",
-                    "stage": "BIRL",
-                    "request_id": request_id,
-                    "clause_pair_id": idx + 1,
-                    "error": str(e),
-                },
-            )
-            narratives.append({
-                "clause_pair_id": idx + 1,
-                "narrative": "Impact analysis unavailable.",
-                "impact_dimensions": ["ADMIN"],
-                "token_count": 0
-            })
-            stats["failures_count"] += 1
+    pending_by_key: Dict[str, List[Dict[str, Any]]] = {}
+    for ctx in contexts:
+        if ctx["cache_key"] in cached:
+            finalize(ctx, cached[ctx["cache_key"]], None, True)
+        else:
+            pending_by_key.setdefault(ctx["cache_key"], []).append(ctx)
+
+    if to_request:
+        workers = max(1, min(get_config("birl_concurrency", 4), len(to_request)))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {
+                executor.submit(_request_birl_narrative, message): key
+                for key, message in to_request.items()
+            }
+            for future in as_completed(futures):
+                key = futures[future]
+                try:
+                    narrative, error = future.result(), None
+                except Exception as e:
+                    narrative, error = None, str(e)
+                for ctx in pending_by_key[key]:
+                    finalize(ctx, narrative, error, False)
+
+    narratives = [finalized[ctx["clause_pair_id"]] for ctx in contexts]
+
+    if cache and to_cache:
+        cache.put_many(list({item[0]: item for item in to_cache}.values()))
 
     logger.info(
         "BIRL complete",
@@ -1253,11 +1388,174 @@ Provide a 2-4 sentence business impact narrative."""
             "hallucination_rejections": stats["hallucination_rejections"],
             "truncations": stats["truncations"],
             "low_value_count": stats["low_value_count"],
+            "cache_hits": stats["cache_hits"],
+            "llm_calls": stats["llm_calls"],
         },
     )
     return narratives, stats
 
 
+def _finalize_birl_narrative(
+    ctx: Dict[str, Any],
+    narrative: Optional[str],
+    error: Optional[str],
+    from_cache: bool,
+    stats: Dict[str, Any],
+    request_id: str
+) -> Tuple[Dict[str, Any], bool]:
+    """
+    Validate and shape one BIRL narrative, updating stats in place.
+
+    Failed requests and narratives rejected by the hallucination shield
+    become the "Impact analysis unavailable." narrative.
+
+    Returns:
+        Tuple of (narrative entry, accepted by the shield)
+    """
+    clause_pair_id = ctx["clause_pair_id"]
+
+    if narrative is None:
+        if error:
+            logger.error(
+                "BIRL exception",
+                extra={
+                    "agent_role": "cip-reasoning",
+                    "stage": "BIRL",
+                    "request_id": request_id,
+                    "clause_pair_id": clause_pair_id,
+                    "error": error,
+                },
+            )
+        else:
+            # Fallback on failure
+            logger.warning(
+                "BIRL Claude call failed",
+                extra={
+                    "agent_role": "cip-reasoning",
+                    "stage": "BIRL",
+                    "request_id": request_id,
+                    "clause_pair_id": clause_pair_id,
+                },
+            )
+        stats["failures_count"] += 1
+        return _birl_unavailable_narrative(clause_pair_id), False
+
+    # Hallucination shield validation
+    is_valid, rejection_reason = _validate_narrative_hallucination(
+        narrative, ctx["combined_input"], request_id
+    )
+
+    if not is_valid:
+        logger.warning(
+            "BIRL narrative rejected by hallucination shield",
+            extra={
+                "agent_role": "cip-reasoning",
+                "stage": "BIRL",
+                "request_id": request_id,
+                "clause_pair_id": clause_pair_id,
+                "rejection_reason": rejection_reason,
+                "from_cache": from_cache,
+            },
+        )
+        stats["hallucination_rejections"] += 1
+        stats["failures_count"] += 1
+        return _birl_unavailable_narrative(clause_pair_id), False
+
+    # Truncate to 4 sentences max
+    sentence_count = _count_sentences(narrative)
+    if sentence_count > 4:
+        narrative = _truncate_to_sentences(narrative, 4)
+        stats["truncations"] += 1
+
+    # Mark low-value if < 2 sentences
+    if sentence_count < 2:
+        stats["low_value_count"] += 1
+
+    # Extract dimensions
+    dimensions = _extract_dimensions(f"{ctx['v1_text']} {ctx['v2_text']} {narrative}")
+
+    stats["narratives_count"] += 1
+    return {
+        "clause_pair_id": clause_pair_id,
+        "narrative": narrative[:500],  # Cap length
+        "impact_dimensions": dimensions,
+        "token_count": len(narrative.split())
+    }, True
+
+
+def _build_birl_user_message(
+    v1_title: str,
+    v1_text: str,
+    v2_title: str,
+    v2_text: str,
+    risk_category: str
+) -> str:
+    """Build the BIRL user prompt for one clause pair."""
+    return f"""Analyze this clause change:
+
+V1 Clause: {v1_title}
+V1 Text (excerpt): {v1_text}
+
+V2 Clause: {v2_title}
+V2 Text (excerpt): {v2_text}
+
+Risk Category: {risk_category}
+
+Provide a 2-4 sentence business impact narrative."""
+
+
+def _birl_cache_key(
+    v1_title: str,
+    v1_text: str,
+    v2_title: str,
+    v2_text: str,
+    risk_category: str
+) -> str:
+    """Narrative cache key over everything the prompt depends on."""
+    v1_excerpt = f"{v1_title}\n{v1_text}"
+    v2_excerpt = f"{v2_title}\n{v2_text}"
+    if NarrativeCache is None:
+        combined = "\x1f".join([BIRL_PROMPT_VERSION, risk_category or "", v1_excerpt, v2_excerpt])
+        return hashlib.sha256(combined.encode("utf-8")).hexdigest()
+    return NarrativeCache.compute_key(v1_excerpt, v2_excerpt, risk_category, BIRL_PROMPT_VERSION)
+
+
+def _request_birl_narrative(user_message: str) -> Optional[str]:
+    """
+    Request one narrative from Claude (runs on the BIRL worker pool).
+
+    Returns:
+        Parsed narrative text, or None if the call failed
+    """
+    result = call_claude_safe(
+        payload={
+            'system': BIRL_SYSTEM_PROMPT,
+            'messages': [{'role': 'user', 'content': user_message}],
+            'max_tokens': BIRL_MAX_TOKENS
+        },
+        purpose="compare",
+        contract_id=None
+    )
+    if not result.success:
+        return None
+
+    # Parse response
+    narrative = result.data.get('response', '').strip()
+    if "Narrative:" in narrative:
+        narrative = narrative.split("Narrative:")[-1].split("Dimensions:")[0].strip()
+    return narrative
+
+
+def _birl_unavailable_narrative(clause_pair_id: int) -> Dict[str, Any]:
+    """Narrative entry used when Claude fails or the shield rejects output."""
+    return {
+        "clause_pair_id": clause_pair_id,
+        "narrative": "Impact analysis unavailable.",
+        "impact_dimensions": ["ADMIN"],
+        "token_count": 0
+    }
+
+
 def _generate_birl_placeholder() -> List[Dict[str, Any]]:
     """BIRL placeholder fallback."""
     return [
@@ -1682,6 +1980,9 @@ def get_clauses_for_contract(contract_id: int) -> List[Dict[str, Any]]:
 # COMPARE V3 ORCHESTRATOR (PHASE 5 STEP 6)
 # ============================================================================
 
+# Orchestrator engine version (reported in _meta, part of result cache keys)
+COMPARE_V3_ENGINE_VERSION = "5.7"
+
 # Stage timeout configuration (seconds)
 ORCHESTRATOR_TIMEOUTS = {
     "global": 120,  # Global hard timeout
@@ -1700,6 +2001,191 @@ STAGE_AGENT_ROLES = {
 }
 
 
+# Stage DAG: stage -> upstream stages whose output it consumes.
+# FAR only reads the clause lists, so it runs alongside SAE -> ERCE -> BIRL.
+STAGE_DEPENDENCIES = {
+    "SAE": (),
+    "ERCE": ("SAE",),
+    "BIRL": ("SAE", "ERCE"),
+    "FAR": (),
+}
+
+# Canonical stage order (topological; used for submission and reporting)
+STAGE_ORDER = ("SAE", "ERCE", "BIRL", "FAR")
+
+# Shared long-lived stage executor (lazy)
+_stage_executor: Optional[ThreadPoolExecutor] = None
+_stage_executor_lock = threading.Lock()
+
+
+def get_stage_executor() -> ThreadPoolExecutor:
+    """
+    Get the shared executor used for orchestrator stages.
+
+    Reused across requests so stages do not pay thread start-up per call, and
+    a timed-out stage never blocks the request on executor shutdown.
+    """
+    global _stage_executor
+    if _stage_executor is None:
+        with _stage_executor_lock:
+            if _stage_executor is None:
+                _stage_executor = ThreadPoolExecutor(
+                    max_workers=get_config("orchestrator_max_workers", 16),
+                    thread_name_prefix="compare-v3-stage",
+                )
+    return _stage_executor
+
+
+def _stage_placeholder(stage_name: str) -> Tuple[Any, Dict[str, Any]]:
+    """Placeholder output and stats used when a stage fails or times out."""
+    if stage_name == "SAE":
+        return _generate_sae_placeholder(), {
+            "matched_count": 3, "unmatched_v1": 0, "unmatched_v2": 0, "status": "PLACEHOLDER"
+        }
+    if stage_name == "ERCE":
+        return _generate_erce_placeholder(), {
+            "risk_count": 3, "high_count": 1, "critical_count": 0, "status": "PLACEHOLDER"
+        }
+    if stage_name == "BIRL":
+        return _generate_birl_placeholder(), {
+            "narratives_count": 3, "failures_count": 0, "status": "PLACEHOLDER"
+        }
+    return _generate_far_placeholder(), {
+        "gaps_count": 0, "critical_count": 0, "high_count": 0, "status": "PLACEHOLDER"
+    }
+
+
+def _hash_cache_parts(parts: List[Any]) -> str:
+    """SHA-256 over a JSON list of key parts (non-JSON values via str)."""
+    encoded = json.dumps(parts, sort_keys=True, default=str, separators=(",", ":"))
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+def _compute_stage_cache_keys(
+    v1_hash: str,
+    v2_hash: str,
+    v1_clauses: List[Dict[str, Any]],
+    v2_clauses: List[Dict[str, Any]]
+) -> Dict[str, str]:
+    """
+    Compute content-addressed result cache keys for every stage.
+
+    Each key covers the comparison hash, the clause inputs, the engine
+    version, the stage's own flag and versions, and the keys of its upstream
+    stages. A change that only affects BIRL (e.g. BIRL_PROMPT_VERSION) leaves
+    the SAE, ERCE and FAR keys unchanged so those results can be reused.
+
+    Args:
+        v1_hash: ComparisonSnapshotCache.compute_text_hash of v1 text
+        v2_hash: ComparisonSnapshotCache.compute_text_hash of v2 text
+        v1_clauses: V1 clauses fed to the stages
+        v2_clauses: V2 clauses fed to the stages
+
+    Returns:
+        Dict of stage name -> stage key
+    """
+    base = _hash_cache_parts([
+        COMPARE_V3_ENGINE_VERSION,
+        ComparisonSnapshotCache.compute_comparison_hash(v1_hash, v2_hash),
+        v1_clauses,
+        v2_clauses,
+    ])
+
+    flags = {stage: is_flag_enabled(f"{stage.lower()}_intelligence_active") for stage in STAGE_ORDER}
+    versions = {
+        "SAE": [
+            EMBEDDING_MODEL, MAX_EMBEDDING_TOKENS,
+            get_config("sae_alignment_mode", SAE_ALIGNMENT_MATRIX),
+            SAE_HIGH_THRESHOLD, SAE_MEDIUM_THRESHOLD, SAE_LOW_THRESHOLD,
+        ],
+        "ERCE": [
+            get_pattern_cache().get_library_version() if flags["ERCE"] and PHASE5_AVAILABLE else None,
+        ],
+        "BIRL": [
+            BIRL_PROMPT_VERSION, BIRL_MAX_TOKENS, BIRL_TEMPERATURE,
+            get_config("birl_max_narratives", 5),
+        ],
+        "FAR": [
+            FLOWDOWN_CRITICAL_CATEGORIES, UPSTREAM_MANDATORY_KEYWORDS,
+            DOWNSTREAM_WEAK_KEYWORDS, CONFLICT_TERM_PAIRS,
+        ],
+    }
+
+    keys: Dict[str, str] = {}
+    for stage in STAGE_ORDER:
+        upstream_keys = [keys[dep] for dep in STAGE_DEPENDENCIES[stage]]
+        keys[stage] = _hash_cache_parts([stage, base, upstream_keys, flags[stage], versions[stage]])
+    return keys
+
+
+def _is_stage_result_reusable(stage_name: str, record: Dict[str, Any]) -> bool:
+    """
+    Check whether a freshly computed stage record is a stable result.
+
+    Failures, and placeholder fallbacks returned while the stage flag is on
+    (client unavailable, empty pattern library), are transient. BIRL runs
+    with failed narratives are transient too.
+    """
+    if record["status"] != "success":
+        return False
+    if is_flag_enabled(f"{stage_name.lower()}_intelligence_active"):
+        if record["output"] == _stage_placeholder(stage_name)[0]:
+            return False
+    if stage_name == "BIRL" and record["stats"].get("failures_count"):
+        return False
+    return True
+
+
+def _select_cacheable_stages(records: Dict[str, Dict[str, Any]]) -> List[str]:
+    """
+    Pick freshly computed stages to store in the result cache.
+
+    A stage key encodes its upstream keys, so a stage is stored only when
+    it is reusable and every upstream stage is cached or stored as well;
+    a stage that ran on an upstream placeholder is never stored.
+    """
+    valid = set()
+    selected = []
+    for stage in STAGE_ORDER:
+        record = records.get(stage)
+        if record is None:
+            continue
+        if not all(dep in valid for dep in STAGE_DEPENDENCIES[stage]):
+            continue
+        if record["cached"]:
+            valid.add(stage)
+        elif _is_stage_result_reusable(stage, record):
+            valid.add(stage)
+            selected.append(stage)
+    return selected
+
+
+def _log_stage_outcome(
+    stage_name: str,
+    request_id: str,
+    duration_ms: int,
+    error_key: Optional[str] = None,
+    **extra: Any
+) -> None:
+    """Log a stage completion, timeout or exception with the orchestrator fields."""
+    fields = {
+        "request_id": request_id,
+        "orchestrator_stage": stage_name,
+        "agent_role": STAGE_AGENT_ROLES.get(stage_name, "unknown"),
+        "duration_ms": duration_ms,
+        "status": "failure" if error_key else "success",
+        "error_key": error_key,
+    }
+    fields.update(extra)
+
+    if error_key is None:
+        logger.info(f"Orchestrator stage complete: {stage_name}", extra=fields)
+    elif error_key.endswith("timeout"):
+        logger.warning(f"Orchestrator stage timeout: {stage_name}", extra=fields)
+    else:
+        logger.error(f"Orchestrator stage exception: {stage_name}", extra=fields)
+
+
 def _execute_stage_with_timeout(
     stage_name: str,
     stage_func: callable,
@@ -1724,106 +2210,197 @@ def _execute_stage_with_timeout(
         - status: "success" or "failure"
         - error_key: Error key if failed, None otherwise
     """
-    import time
-    import concurrent.futures
-
-    agent_role = STAGE_AGENT_ROLES.get(stage_name, "unknown")
     start_time = time.time()
+    future = get_stage_executor().submit(stage_func, *stage_args)
 
     try:
-        # Execute with timeout using ThreadPoolExecutor
-        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
-            future = executor.submit(stage_func, *stage_args)
-            try:
-                result, stats = future.result(timeout=timeout_seconds)
-                duration_ms = int((time.time() - start_time) * 1000)
+        result, stats = future.result(timeout=timeout_seconds)
+    except FutureTimeoutError:
+        future.cancel()
+        error_key = f"{stage_name.lower()}.timeout"
+        _log_stage_outcome(
+            stage_name, request_id, int((time.time() - start_time) * 1000), error_key,
+            timeout_seconds=timeout_seconds,
+        )
+        return None, {}, "failure", error_key
+    except Exception as e:
+        error_key = f"{stage_name.lower()}.exception"
+        _log_stage_outcome(
+            stage_name, request_id, int((time.time() - start_time) * 1000), error_key,
+            error_detail=str(e),
+        )
+        return None, {}, "failure", error_key
 
-                logger.info(
-                    f"Orchestrator stage complete: {stage_name}",
-                    extra={
-                        "request_id": request_id,
-                        "orchestrator_stage": stage_name,
-                        "agent_role": agent_role,
-                        "duration_ms": duration_ms,
-                        "status": "success",
-                        "error_key": None,
-                    },
-                )
+    _log_stage_outcome(stage_name, request_id, int((time.time() - start_time) * 1000))
+    return result, stats, "success", None
 
-                return result, stats, "success", None
 
-            except concurrent.futures.TimeoutError:
-                duration_ms = int((time.time() - start_time) * 1000)
-                error_key = f"{stage_name.lower()}.timeout"
+def _run_stage_graph(
+    stage_calls: Dict[str, Callable[[Dict[str, Any]], Tuple[Any, Dict[str, Any]]]],
+    request_id: str,
+    deadline: float,
+    on_stage_start: Optional[Callable[[str], None]] = None,
+    on_stage_end: Optional[Callable[[str, Dict[str, Any]], None]] = None,
+    cached: Optional[Dict[str, Dict[str, Any]]] = None,
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Run orchestrator stages over STAGE_DEPENDENCIES on the shared executor.
 
-                logger.warning(
-                    f"Orchestrator stage timeout: {stage_name}",
-                    extra={
-                        "request_id": request_id,
-                        "orchestrator_stage": stage_name,
-                        "agent_role": agent_role,
-                        "duration_ms": duration_ms,
-                        "status": "failure",
-                        "error_key": error_key,
-                        "timeout_seconds": timeout_seconds,
-                    },
-                )
+    A stage is submitted as soon as its upstream stages finish and receives
+    their outputs (placeholders on failure, so errors never cascade). Each
+    stage's deadline is min(its ORCHESTRATOR_TIMEOUTS entry, global deadline);
+    stages that cannot start before the global deadline fail immediately.
+    Stages found in cached finish at once with the cached output, provided
+    every upstream stage was also served from the cache (otherwise the stage
+    reruns on the fresh upstream output); they never touch the executor.
+    Callbacks run on the calling thread, so monitor bookkeeping needs no locks.
 
-                return None, {}, "failure", error_key
+    Args:
+        stage_calls: stage -> callable(upstream_outputs) returning (result, stats)
+        request_id: Request ID for logging
+        deadline: Absolute time.time() after which no stage may run
+        on_stage_start: Called with the stage name when it is submitted
+        on_stage_end: Called with the stage name and its record when it finishes
+        cached: stage -> {"output": ..., "stats": {...}} from the result cache
 
-    except Exception as e:
-        duration_ms = int((time.time() - start_time) * 1000)
-        error_key = f"{stage_name.lower()}.exception"
+    Returns:
+        Dict of stage -> record with keys output, stats, status, error_key,
+        started_at, finished_at, duration_ms and cached
+    """
+    executor = get_stage_executor()
+    cached = cached or {}
+    records: Dict[str, Dict[str, Any]] = {}
+    pending = [stage for stage in STAGE_ORDER if stage in stage_calls]
+    running: Dict[Future, Tuple[str, float, float]] = {}
+
+    def finish(stage_name, started_at, result, stats, error_key, from_cache=False, **log_extra):
+        finished_at = time.time()
+        duration_ms = int((finished_at - started_at) * 1000)
+        if error_key:
+            result, stats = _stage_placeholder(stage_name)
+        _log_stage_outcome(
+            stage_name, request_id, duration_ms, error_key, cached=from_cache, **log_extra
+        )
 
-        logger.error(
-            f"Orchestrator stage exception: {stage_name}",
-            extra={
-                "request_id": request_id,
-                "orchestrator_stage": stage_name,
-                "agent_role": agent_role,
-                "duration_ms": duration_ms,
-                "status": "failure",
-                "error_key": error_key,
-                "error_detail": str(e),
-            },
+        record = {
+            "output": result,
+            "stats": stats,
+            "status": "failure" if error_key else "success",
+            "error_key": error_key,
+            "started_at": started_at,
+            "finished_at": finished_at,
+            "duration_ms": duration_ms,
+            "cached": from_cache,
+        }
+        records[stage_name] = record
+        if on_stage_end:
+            on_stage_end(stage_name, record)
+
+    while pending or running:
+        # Submit every stage whose upstream stages are done (pending is topological)
+        for stage_name in list(pending):
+            dependencies = STAGE_DEPENDENCIES.get(stage_name, ())
+            if not all(dep in records for dep in dependencies):
+                continue
+            pending.remove(stage_name)
+
+            started_at = time.time()
+            if on_stage_start:
+                on_stage_start(stage_name)
+            if started_at >= deadline:
+                finish(stage_name, started_at, None, {}, "orchestrator.global_timeout")
+                continue
+
+            hit = cached.get(stage_name)
+            if hit is not None and all(records[dep]["cached"] for dep in dependencies):
+                finish(stage_name, started_at, hit["output"], hit["stats"], None, from_cache=True)
+                continue
+
+            upstream = {dep: records[dep]["output"] for dep in dependencies}
+            future = executor.submit(stage_calls[stage_name], upstream)
+            stage_deadline = min(started_at + ORCHESTRATOR_TIMEOUTS[stage_name], deadline)
+            running[future] = (stage_name, started_at, stage_deadline)
+
+        if not running:
+            continue
+
+        next_deadline = min(entry[2] for entry in running.values())
+        done, _ = wait(
+            list(running),
+            timeout=max(0.0, next_deadline - time.time()),
+            return_when=FIRST_COMPLETED,
         )
 
-        return None, {}, "failure", error_key
+        for future in done:
+            stage_name, started_at, _ = running.pop(future)
+            try:
+                result, stats = future.result()
+            except Exception as e:
+                finish(
+                    stage_name, started_at, None, {}, f"{stage_name.lower()}.exception",
+                    error_detail=str(e),
+                )
+            else:
+                finish(stage_name, started_at, result, stats, None)
+
+        now = time.time()
+        for future, (stage_name, started_at, stage_deadline) in list(running.items()):
+            if now < stage_deadline:
+                continue
+            running.pop(future)
+            future.cancel()
+            if stage_deadline < deadline:
+                error_key = f"{stage_name.lower()}.timeout"
+            else:
+                error_key = "orchestrator.global_timeout"
+            finish(
+                stage_name, started_at, None, {}, error_key,
+                timeout_seconds=round(stage_deadline - started_at, 3),
+            )
+
+    return records
 
 
 def run_compare_v3_orchestrator(
     v1_text: str,
     v2_text: str,
     v1_contract_id: Optional[int] = None,
-    v2_contract_id: Optional[int] = None
+    v2_contract_id: Optional[int] = None,
+    on_event: Optional[Callable[[str, Dict[str, Any]], None]] = None
 ) -> Dict[str, Any]:
     """
     Phase 5 Step 6+7: Unified Compare v3 Orchestrator with Observability.
 
-    Executes SAE → ERCE → BIRL → FAR in sequence with:
-    - Per-stage timeout thresholds
+    Executes the stage DAG SAE → ERCE → BIRL, with FAR running concurrently
+    on the shared stage executor, with:
+    - Per-stage timeout thresholds bounded by the global hard timeout
     - Per-stage duration tracking in _meta.stats
     - Graceful degradation (no cascade failures)
     - Unified logging with orchestrator_stage, agent_role, duration_ms
     - Phase 5 Step 7: Full observability via _meta.monitor
+    - Content-addressed result cache: unchanged stages are reused
+      (_meta.cache_hit when every stage came from the cache)
 
     Feature Flags Respected:
     - sae_intelligence_active
     - erce_intelligence_active
     - birl_intelligence_active
     - far_intelligence_active
+    - comparison_snapshot_active (result cache)
 
     Args:
         v1_text: First contract version text
         v2_text: Second contract version text
         v1_contract_id: Optional contract ID for v1
         v2_contract_id: Optional contract ID for v2
+        on_event: Optional callback for streaming, called with
+            ("stage_start", {...}), ("stage_complete", {...}) as stages
+            start and finish, and ("narrative", {...}) for each BIRL
+            narrative as it arrives. Callback errors never fail the compare.
 
     Returns:
         Dict with all pipeline outputs, _meta, and _meta.monitor
     """
-    import time
-
     request_id = str(uuid.uuid4())
     orchestrator_start = time.time()
     orchestrator_start_ms = int(orchestrator_start * 1000)
@@ -1835,7 +2412,6 @@ def run_compare_v3_orchestrator(
     # Track stage statuses for _meta.pipeline_status
     stage_statuses = {}
     stage_durations = {}
-    pipeline_errors = []
 
     # Monitor: ORCH stage_start
     monitor_event(
@@ -1879,239 +2455,170 @@ def run_compare_v3_orchestrator(
         v2_clauses = [{'id': 1, 'text': v2_text[:2000], 'title': 'Full Contract', 'section_number': '1'}]
 
     # =========================================================================
-    # STAGE 1: SAE - Semantic Alignment Engine
+    # RESULT CACHE LOOKUP
     # =========================================================================
-    # Monitor: SAE stage_start
-    monitor_event(
-        metrics=metrics,
-        agent_role="cip-severity",
-        stage="SAE",
-        event_type="stage_start",
-        status_code="OK"
-    )
-
-    sae_start = time.time()
-    sae_result, sae_stats, sae_status, sae_error = _execute_stage_with_timeout(
-        stage_name="SAE",
-        stage_func=run_sae_real,
-        stage_args=(v1_clauses, v2_clauses, v1_contract_id or 0, v2_contract_id or 0, request_id),
-        timeout_seconds=ORCHESTRATOR_TIMEOUTS["SAE"],
-        request_id=request_id
-    )
-
-    sae_duration_ms = int((time.time() - sae_start) * 1000)
-    stage_durations["SAE"] = sae_duration_ms
-    stage_statuses["SAE"] = sae_status
-    metrics.record_stage_latency("SAE", sae_duration_ms)
-
-    if sae_status == "failure":
-        sae_matches = _generate_sae_placeholder()
-        sae_stats = {"matched_count": 3, "unmatched_v1": 0, "unmatched_v2": 0, "status": "PLACEHOLDER"}
-        pipeline_errors.append("SAE")
-        metrics.record_fallback()
-        metrics.record_error("SAE", sae_error or "sae.unknown", "Stage failed")
-        # Monitor: SAE stage_error
-        monitor_event(
-            metrics=metrics,
-            agent_role="cip-severity",
-            stage="SAE",
-            event_type="stage_error",
-            duration_ms=sae_duration_ms,
-            status_code="FAIL",
-            error_detail=sae_error
-        )
-    else:
-        sae_matches = sae_result
-        sae_stats["status"] = "REAL"
-        # Track cache hits/misses from SAE stats
-        if sae_stats.get("cache_hits"):
-            for _ in range(sae_stats["cache_hits"]):
-                metrics.record_cache_hit()
-        if sae_stats.get("cache_misses"):
-            for _ in range(sae_stats["cache_misses"]):
-                metrics.record_cache_miss()
-        # Monitor: SAE stage_end
-        payload_ref = compute_payload_ref(sae_matches)
-        monitor_event(
-            metrics=metrics,
-            agent_role="cip-severity",
-            stage="SAE",
-            event_type="stage_end",
-            duration_ms=sae_duration_ms,
-            payload_ref=payload_ref,
-            status_code="OK"
-        )
+    snapshot_cache = None
+    stage_cache_keys: Dict[str, str] = {}
+    cached_stages: Dict[str, Dict[str, Any]] = {}
+
+    if SNAPSHOT_CACHE_AVAILABLE and is_flag_enabled("comparison_snapshot_active"):
+        snapshot_cache = get_snapshot_cache()
+        v1_hash = ComparisonSnapshotCache.compute_text_hash(v1_text or "")
+        v2_hash = ComparisonSnapshotCache.compute_text_hash(v2_text or "")
+        try:
+            stage_cache_keys = _compute_stage_cache_keys(v1_hash, v2_hash, v1_clauses, v2_clauses)
+            cached_stages = snapshot_cache.get_stage_results(stage_cache_keys)
+        except Exception as e:
+            logger.warning(
+                "Orchestrator result cache lookup failed",
+                extra={
+                    "request_id": request_id,
+                    "orchestrator_stage": "CACHE",
+                    "agent_role": "orchestrator",
+                    "error_detail": str(e),
+                },
+            )
+            stage_cache_keys = {}
+            cached_stages = {}
 
     # =========================================================================
-    # STAGE 2: ERCE - Enterprise Risk Classification Engine
+    # STAGE DAG: SAE -> ERCE -> BIRL, with FAR running alongside
     # =========================================================================
-    # Monitor: ERCE stage_start
-    monitor_event(
-        metrics=metrics,
-        agent_role="cip-severity",
-        stage="ERCE",
-        event_type="stage_start",
-        status_code="OK"
-    )
+    def emit(kind: str, payload: Dict[str, Any]) -> None:
+        if on_event is None:
+            return
+        try:
+            on_event(kind, payload)
+        except Exception as e:
+            logger.warning(
+                "Orchestrator event callback failed",
+                extra={
+                    "request_id": request_id,
+                    "orchestrator_stage": payload.get("stage", "ORCH"),
+                    "agent_role": "orchestrator",
+                    "event_kind": kind,
+                    "error_detail": str(e),
+                },
+            )
 
-    erce_start = time.time()
-    erce_result, erce_stats, erce_status, erce_error = _execute_stage_with_timeout(
-        stage_name="ERCE",
-        stage_func=run_erce_real,
-        stage_args=(sae_matches, v1_clauses, v2_clauses, request_id),
-        timeout_seconds=ORCHESTRATOR_TIMEOUTS["ERCE"],
-        request_id=request_id
-    )
+    birl_kwargs = {}
+    if on_event is not None:
+        birl_kwargs["on_narrative"] = lambda narrative: emit(
+            "narrative", {"stage": "BIRL", "request_id": request_id, "narrative": narrative}
+        )
 
-    erce_duration_ms = int((time.time() - erce_start) * 1000)
-    stage_durations["ERCE"] = erce_duration_ms
-    stage_statuses["ERCE"] = erce_status
-    metrics.record_stage_latency("ERCE", erce_duration_ms)
+    sae_batch_log: List[Dict[str, Any]] = []
+
+    stage_calls = {
+        "SAE": lambda upstream: run_sae_real(
+            v1_clauses, v2_clauses, v1_contract_id or 0, v2_contract_id or 0, request_id, sae_batch_log
+        ),
+        "ERCE": lambda upstream: run_erce_real(
+            upstream["SAE"], v1_clauses, v2_clauses, request_id
+        ),
+        "BIRL": lambda upstream: run_birl_real(
+            upstream["ERCE"], upstream["SAE"], v1_clauses, v2_clauses, request_id, **birl_kwargs
+        ),
+        "FAR": lambda upstream: run_far_real(
+            v1_contract_id or 0, v2_contract_id or 0, v1_clauses, v2_clauses, request_id
+        ),
+    }
 
-    if erce_status == "failure":
-        erce_results = _generate_erce_placeholder()
-        erce_stats = {"risk_count": 3, "high_count": 1, "critical_count": 0, "status": "PLACEHOLDER"}
-        pipeline_errors.append("ERCE")
-        metrics.record_fallback()
-        metrics.record_error("ERCE", erce_error or "erce.unknown", "Stage failed")
-        # Monitor: ERCE stage_error
+    def on_stage_start(stage_name: str) -> None:
         monitor_event(
             metrics=metrics,
-            agent_role="cip-severity",
-            stage="ERCE",
-            event_type="stage_error",
-            duration_ms=erce_duration_ms,
-            status_code="FAIL",
-            error_detail=erce_error
-        )
-    else:
-        erce_results = erce_result
-        erce_stats["status"] = "REAL"
-        # Monitor: ERCE stage_end
-        payload_ref = compute_payload_ref(erce_results)
-        monitor_event(
-            metrics=metrics,
-            agent_role="cip-severity",
-            stage="ERCE",
-            event_type="stage_end",
-            duration_ms=erce_duration_ms,
-            payload_ref=payload_ref,
+            agent_role=STAGE_AGENT_ROLES[stage_name],
+            stage=stage_name,
+            event_type="stage_start",
             status_code="OK"
         )
+        emit("stage_start", {"stage": stage_name, "request_id": request_id})
 
-    # =========================================================================
-    # STAGE 3: BIRL - Business Impact & Risk Language
-    # =========================================================================
-    # Monitor: BIRL stage_start
-    monitor_event(
-        metrics=metrics,
-        agent_role="cip-reasoning",
-        stage="BIRL",
-        event_type="stage_start",
-        status_code="OK"
-    )
+    def emit_stage_complete(stage_name: str, record: Dict[str, Any]) -> None:
+        emit("stage_complete", {
+            "stage": stage_name,
+            "request_id": request_id,
+            "status": record["status"],
+            "error_key": record["error_key"],
+            "duration_ms": record["duration_ms"],
+            "cached": record["cached"],
+            "output": record["output"],
+            "stats": record["stats"],
+        })
 
-    birl_start = time.time()
-    birl_result, birl_stats, birl_status, birl_error = _execute_stage_with_timeout(
-        stage_name="BIRL",
-        stage_func=run_birl_real,
-        stage_args=(erce_results, sae_matches, v1_clauses, v2_clauses, request_id),
-        timeout_seconds=ORCHESTRATOR_TIMEOUTS["BIRL"],
-        request_id=request_id
-    )
+    def on_stage_end(stage_name: str, record: Dict[str, Any]) -> None:
+        duration_ms = record["duration_ms"]
+        stage_durations[stage_name] = duration_ms
+        stage_statuses[stage_name] = record["status"]
+        metrics.record_stage_latency(stage_name, duration_ms)
+        metrics.record_stage_window(
+            stage_name,
+            int(record["started_at"] * 1000),
+            int(record["finished_at"] * 1000),
+        )
 
-    birl_duration_ms = int((time.time() - birl_start) * 1000)
-    stage_durations["BIRL"] = birl_duration_ms
-    stage_statuses["BIRL"] = birl_status
-    metrics.record_stage_latency("BIRL", birl_duration_ms)
+        if record["status"] == "failure":
+            metrics.record_fallback()
+            metrics.record_error(stage_name, record["error_key"] or f"{stage_name.lower()}.unknown", "Stage failed")
+            monitor_event(
+                metrics=metrics,
+                agent_role=STAGE_AGENT_ROLES[stage_name],
+                stage=stage_name,
+                event_type="stage_error",
+                duration_ms=duration_ms,
+                status_code="FAIL",
+                error_detail=record["error_key"]
+            )
+            emit_stage_complete(stage_name, record)
+            return
+
+        stats = record["stats"]
+        stats["status"] = "REAL"
+        if stage_name == "SAE" and not record["cached"]:
+            # Track cache hits/misses from SAE stats
+            for _ in range(stats.get("cache_hits") or 0):
+                metrics.record_cache_hit()
+            for _ in range(stats.get("cache_misses") or 0):
+                metrics.record_cache_miss()
+            for batch in sae_batch_log:
+                metrics.record_embedding_batch(batch)
 
-    if birl_status == "failure":
-        birl_narratives = _generate_birl_placeholder()
-        birl_stats = {"narratives_count": 3, "failures_count": 0, "status": "PLACEHOLDER"}
-        pipeline_errors.append("BIRL")
-        metrics.record_fallback()
-        metrics.record_error("BIRL", birl_error or "birl.unknown", "Stage failed")
-        # Monitor: BIRL stage_error
-        monitor_event(
-            metrics=metrics,
-            agent_role="cip-reasoning",
-            stage="BIRL",
-            event_type="stage_error",
-            duration_ms=birl_duration_ms,
-            status_code="FAIL",
-            error_detail=birl_error
-        )
-    else:
-        birl_narratives = birl_result
-        birl_stats["status"] = "REAL"
-        # Monitor: BIRL stage_end
-        payload_ref = compute_payload_ref(birl_narratives)
         monitor_event(
             metrics=metrics,
-            agent_role="cip-reasoning",
-            stage="BIRL",
+            agent_role=STAGE_AGENT_ROLES[stage_name],
+            stage=stage_name,
             event_type="stage_end",
-            duration_ms=birl_duration_ms,
-            payload_ref=payload_ref,
+            duration_ms=duration_ms,
+            payload_ref=compute_payload_ref(record["output"]),
             status_code="OK"
         )
-
-    # =========================================================================
-    # STAGE 4: FAR - Flowdown Analysis & Requirements
-    # =========================================================================
-    # Monitor: FAR stage_start
-    monitor_event(
-        metrics=metrics,
-        agent_role="far",
-        stage="FAR",
-        event_type="stage_start",
-        status_code="OK"
+        emit_stage_complete(stage_name, record)
+
+    records = _run_stage_graph(
+        stage_calls,
+        request_id=request_id,
+        deadline=orchestrator_start + ORCHESTRATOR_TIMEOUTS["global"],
+        on_stage_start=on_stage_start,
+        on_stage_end=on_stage_end,
+        cached=cached_stages,
     )
 
-    far_start = time.time()
-    far_result, far_stats, far_status, far_error = _execute_stage_with_timeout(
-        stage_name="FAR",
-        stage_func=run_far_real,
-        stage_args=(v1_contract_id or 0, v2_contract_id or 0, v1_clauses, v2_clauses, request_id),
-        timeout_seconds=ORCHESTRATOR_TIMEOUTS["FAR"],
-        request_id=request_id
-    )
+    # Store freshly computed, reusable stage results
+    if stage_cache_keys:
+        fresh_results = {
+            stage: (stage_cache_keys[stage], records[stage]["output"], records[stage]["stats"])
+            for stage in _select_cacheable_stages(records)
+        }
+        if fresh_results:
+            snapshot_cache.put_stage_results(v1_hash, v2_hash, fresh_results)
 
-    far_duration_ms = int((time.time() - far_start) * 1000)
-    stage_durations["FAR"] = far_duration_ms
-    stage_statuses["FAR"] = far_status
-    metrics.record_stage_latency("FAR", far_duration_ms)
+    reused_stages = [stage for stage in STAGE_ORDER if records[stage]["cached"]]
 
-    if far_status == "failure":
-        flowdown_gaps = _generate_far_placeholder()
-        far_stats = {"gaps_count": 0, "critical_count": 0, "high_count": 0, "status": "PLACEHOLDER"}
-        pipeline_errors.append("FAR")
-        metrics.record_fallback()
-        metrics.record_error("FAR", far_error or "far.unknown", "Stage failed")
-        # Monitor: FAR stage_error
-        monitor_event(
-            metrics=metrics,
-            agent_role="far",
-            stage="FAR",
-            event_type="stage_error",
-            duration_ms=far_duration_ms,
-            status_code="FAIL",
-            error_detail=far_error
-        )
-    else:
-        flowdown_gaps = far_result
-        far_stats["status"] = "REAL"
-        # Monitor: FAR stage_end
-        payload_ref = compute_payload_ref(flowdown_gaps)
-        monitor_event(
-            metrics=metrics,
-            agent_role="far",
-            stage="FAR",
-            event_type="stage_end",
-            duration_ms=far_duration_ms,
-            payload_ref=payload_ref,
-            status_code="OK"
-        )
+    sae_matches, sae_stats = records["SAE"]["output"], records["SAE"]["stats"]
+    erce_results, erce_stats = records["ERCE"]["output"], records["ERCE"]["stats"]
+    birl_narratives, birl_stats = records["BIRL"]["output"], records["BIRL"]["stats"]
+    flowdown_gaps, far_stats = records["FAR"]["output"], records["FAR"]["stats"]
+    pipeline_errors = [stage for stage in STAGE_ORDER if stage_statuses.get(stage) == "failure"]
 
     # =========================================================================
     # BUILD UNIFIED RESULT
@@ -2171,6 +2678,7 @@ def run_compare_v3_orchestrator(
             "pipeline_status": pipeline_status,
             "stages_succeeded": 4 - len(pipeline_errors),
             "stages_failed": len(pipeline_errors),
+            "cached_stages": reused_stages,
         },
     )
 
@@ -2180,10 +2688,12 @@ def run_compare_v3_orchestrator(
         "birl_narratives": birl_narratives,
         "flowdown_gaps": flowdown_gaps,
         "_meta": {
-            "engine_version": "5.7",
+            "engine_version": COMPARE_V3_ENGINE_VERSION,
             "intelligence_active": intelligence_active,
             "intelligence_flags": intelligence_flags,
             "pipeline_status": pipeline_status,
+            "cache_hit": len(reused_stages) == len(STAGE_ORDER),
+            "cached_stages": reused_stages,
             "request_id": request_id,
             "generated_at": datetime.now().isoformat(),
             "total_duration_ms": total_duration_ms,
@@ -4,6 +4,9 @@ Stores full comparison results to avoid redundant pipeline runs.
 
 Phase 5 Step 1: Schema and metrics only.
 Actual snapshot storage/retrieval activated by comparison_snapshot_active flag.
+
+Per-stage results (comparison_stage_results) are keyed by content-addressed
+stage keys so the orchestrator can reuse any stage whose inputs are unchanged.
 """
 
 import hashlib
@@ -12,7 +15,7 @@ import os
 import sqlite3
 from dataclasses import dataclass
 from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from phase5_flags import is_flag_enabled, get_config
 
@@ -75,6 +78,8 @@ class ComparisonSnapshotCache:
             "writes": 0,
             "evictions": 0,
             "errors": 0,
+            "stage_hits": 0,
+            "stage_misses": 0,
         }
 
     def _ensure_directory(self) -> None:
@@ -127,6 +132,37 @@ class ComparisonSnapshotCache:
             ON comparison_snapshots(last_accessed_at)
         """)
 
+        # Create comparison_stage_results table (per-stage reuse)
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS comparison_stage_results (
+                stage_key TEXT PRIMARY KEY,
+                comparison_hash TEXT NOT NULL,
+                v1_hash TEXT NOT NULL,
+                v2_hash TEXT NOT NULL,
+                stage TEXT NOT NULL,
+                output JSON NOT NULL,
+                stats JSON NOT NULL,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                last_accessed_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                access_count INTEGER DEFAULT 0
+            )
+        """)
+
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_stage_v1_hash
+            ON comparison_stage_results(v1_hash)
+        """)
+
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_stage_v2_hash
+            ON comparison_stage_results(v2_hash)
+        """)
+
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_stage_last_accessed
+            ON comparison_stage_results(last_accessed_at)
+        """)
+
         # Create cache_metadata table for tracking
         cursor.execute("""
             CREATE TABLE IF NOT EXISTS snapshot_cache_metadata (
@@ -314,6 +350,172 @@ class ComparisonSnapshotCache:
             self._metrics["errors"] += 1
             return False
 
+    def get_stage_results(self, stage_keys: Dict[str, str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Get cached stage outputs for one comparison.
+
+        Each stage key already encodes the comparison hash, the stage's flag
+        and versions, and its upstream stage keys, so any subset of stages
+        can be reused on its own.
+
+        Args:
+            stage_keys: Dict of stage name -> stage key
+
+        Returns:
+            Dict of stage name -> {"output": ..., "stats": {...}} for stages
+            found (missing stages omitted)
+
+        Note: Only returns data if comparison_snapshot_active flag is True.
+        """
+        if not is_flag_enabled("comparison_snapshot_active") or not stage_keys:
+            self._metrics["misses"] += 1
+            self._metrics["stage_misses"] += len(stage_keys)
+            return {}
+
+        ttl_hours = get_config("comparison_snapshot_ttl_hours", 720)
+        cutoff = (datetime.utcnow() - timedelta(hours=ttl_hours)).strftime("%Y-%m-%d %H:%M:%S")
+        stage_by_key = {key: stage for stage, key in stage_keys.items()}
+        found: Dict[str, Dict[str, Any]] = {}
+
+        try:
+            conn = sqlite3.connect(self.db_path)
+            cursor = conn.cursor()
+
+            placeholders = ",".join("?" * len(stage_by_key))
+            cursor.execute(f"""
+                SELECT stage_key, output, stats
+                FROM comparison_stage_results
+                WHERE stage_key IN ({placeholders}) AND created_at >= ?
+            """, (*stage_by_key, cutoff))
+
+            for stage_key, output, stats in cursor.fetchall():
+                found[stage_by_key[stage_key]] = {
+                    "output": json.loads(output),
+                    "stats": json.loads(stats),
+                }
+
+            if found:
+                cursor.executemany("""
+                    UPDATE comparison_stage_results
+                    SET access_count = access_count + 1,
+                        last_accessed_at = CURRENT_TIMESTAMP
+                    WHERE stage_key = ?
+                """, [(stage_keys[stage],) for stage in found])
+                conn.commit()
+
+            conn.close()
+
+        except (sqlite3.Error, json.JSONDecodeError):
+            self._metrics["errors"] += 1
+            self._metrics["misses"] += 1
+            self._metrics["stage_misses"] += len(stage_keys)
+            return {}
+
+        self._metrics["stage_hits"] += len(found)
+        self._metrics["stage_misses"] += len(stage_keys) - len(found)
+        if len(found) == len(stage_keys):
+            self._metrics["hits"] += 1
+        else:
+            self._metrics["misses"] += 1
+        return found
+
+    def put_stage_results(
+        self,
+        v1_hash: str,
+        v2_hash: str,
+        entries: Dict[str, Tuple[str, Any, Dict[str, Any]]]
+    ) -> int:
+        """
+        Store stage outputs for one comparison.
+
+        Args:
+            v1_hash: Hash of first version (compute_text_hash)
+            v2_hash: Hash of second version (compute_text_hash)
+            entries: Dict of stage name -> (stage_key, output, stats)
+
+        Returns:
+            Number of stages stored
+
+        Note: Only stores data if comparison_snapshot_active flag is True.
+        """
+        if not is_flag_enabled("comparison_snapshot_active") or not entries:
+            return 0
+
+        comparison_hash = self.compute_comparison_hash(v1_hash, v2_hash)
+
+        try:
+            rows = [
+                (stage_key, comparison_hash, v1_hash, v2_hash, stage,
+                 json.dumps(output), json.dumps(stats))
+                for stage, (stage_key, output, stats) in entries.items()
+            ]
+        except (TypeError, ValueError):
+            self._metrics["errors"] += 1
+            return 0
+
+        try:
+            max_entries = get_config("comparison_stage_cache_max_entries", 4000)
+            if self._get_stage_entry_count() + len(rows) > max_entries:
+                self._evict_stage_lru(count=max(50, len(rows)))
+
+            conn = sqlite3.connect(self.db_path)
+            conn.executemany("""
+                INSERT OR REPLACE INTO comparison_stage_results
+                (stage_key, comparison_hash, v1_hash, v2_hash, stage, output, stats,
+                 created_at, last_accessed_at, access_count)
+                VALUES (?, ?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP, 0)
+            """, rows)
+            conn.commit()
+            conn.close()
+
+            self._metrics["writes"] += len(rows)
+            return len(rows)
+
+        except sqlite3.Error:
+            self._metrics["errors"] += 1
+            return 0
+
+    def _get_stage_entry_count(self) -> int:
+        """Get current number of cached stage results"""
+        try:
+            conn = sqlite3.connect(self.db_path)
+            count = conn.execute("SELECT COUNT(*) FROM comparison_stage_results").fetchone()[0]
+            conn.close()
+            return count
+        except sqlite3.Error:
+            return 0
+
+    def _evict_stage_lru(self, count: int = 50) -> int:
+        """
+        Evict least recently used stage results.
+
+        Args:
+            count: Number of entries to evict
+
+        Returns:
+            Number of entries evicted
+        """
+        try:
+            conn = sqlite3.connect(self.db_path)
+            cursor = conn.cursor()
+            cursor.execute("""
+                DELETE FROM comparison_stage_results
+                WHERE stage_key IN (
+                    SELECT stage_key FROM comparison_stage_results
+                    ORDER BY last_accessed_at ASC
+                    LIMIT ?
+                )
+            """, (count,))
+            evicted = cursor.rowcount
+            conn.commit()
+            conn.close()
+
+            self._metrics["evictions"] += evicted
+            return evicted
+
+        except sqlite3.Error:
+            return 0
+
     def _get_entry_count(self) -> int:
         """Get current number of cached entries"""
         try:
@@ -381,6 +583,13 @@ class ComparisonSnapshotCache:
             """, (version_hash, version_hash))
 
             deleted = cursor.rowcount
+
+            cursor.execute("""
+                DELETE FROM comparison_stage_results
+                WHERE v1_hash = ? OR v2_hash = ?
+            """, (version_hash, version_hash))
+
+            deleted += cursor.rowcount
             conn.commit()
             conn.close()
             return deleted
@@ -403,6 +612,8 @@ class ComparisonSnapshotCache:
             count = cursor.fetchone()[0]
 
             cursor.execute("DELETE FROM comparison_snapshots")
+            cursor.execute("DELETE FROM comparison_stage_results")
+            count += cursor.rowcount
             conn.commit()
             conn.close()
 
@@ -438,6 +649,10 @@ class ComparisonSnapshotCache:
             """)
             total_size = cursor.fetchone()[0] or 0
 
+            # Stage result count
+            cursor.execute("SELECT COUNT(*) FROM comparison_stage_results")
+            stage_entry_count = cursor.fetchone()[0]
+
             # Date range
             cursor.execute("""
                 SELECT MIN(created_at), MAX(created_at)
@@ -456,6 +671,7 @@ class ComparisonSnapshotCache:
 
             return {
                 "entry_count": entry_count,
+                "stage_entry_count": stage_entry_count,
                 "total_size_bytes": total_size,
                 "total_size_mb": total_size / (1024 * 1024),
                 "oldest_entry": date_range[0] if date_range else None,
@@ -480,7 +696,8 @@ class ComparisonSnapshotCache:
         Get cache metrics counters.
 
         Returns:
-            Dictionary with hits, misses, writes, evictions, errors
+            Dictionary with hits, misses, writes, evictions, errors,
+            stage_hits and stage_misses
         """
         return self._metrics.copy()
 
@@ -492,6 +709,8 @@ class ComparisonSnapshotCache:
             "writes": 0,
             "evictions": 0,
             "errors": 0,
+            "stage_hits": 0,
+            "stage_misses": 0,
         }
 
 
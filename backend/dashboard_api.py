@@ -6,16 +6,20 @@ Provides aggregated data for dashboard displays:
 - /api/dashboard/stats - Portfolio statistics
 - /api/dashboard/trends - Historical trends
 
-Optimized for the indexes created by optimize_db_indexes.py
+Counts and sums come from the materialized portfolio aggregates
+(portfolio_aggregates.py); row lists use the indexes created by
+optimize_db_indexes.py.
 """
 
-import sqlite3
 from pathlib import Path
 from datetime import datetime, timedelta
 from typing import Dict, List, Any
 
 from flask import Blueprint, request, jsonify
 
+from db_pool import get_connection
+from portfolio_aggregates import ALL_CONTRACTS, PortfolioFilter, get_portfolio_aggregates, install_aggregate_triggers
+
 # Create blueprint
 dashboard_bp = Blueprint('dashboard', __name__, url_prefix='/api/dashboard')
 
@@ -25,11 +29,12 @@ CONTRACTS_DB = CIP_ROOT / "data" / "contracts.db"
 
 
 def get_db_connection():
-    """Get database connection with row factory."""
-    conn = sqlite3.connect(str(CONTRACTS_DB))
-    conn.row_factory = sqlite3.Row
-    conn.execute("PRAGMA foreign_keys = ON")
-    return conn
+    """Get pooled read-only database connection with row factory."""
+    return get_connection(CONTRACTS_DB, read_only=True)
+
+
+# Display order for risk levels (others last)
+RISK_ORDER = {'CRITICAL': 1, 'HIGH': 2, 'MEDIUM': 3, 'LOW': 4}
 
 
 @dashboard_bp.route('/alerts', methods=['GET'])
@@ -55,69 +60,32 @@ def get_alerts():
     # Base filter: non-archived contracts
     base_where = "(archived = 0 OR archived IS NULL)"
 
-    # Summary counts
+    # Summary counts (non-archived contracts)
+    agg = get_portfolio_aggregates(CONTRACTS_DB)
+    open_contracts = PortfolioFilter(status_not_in=('expired', 'terminated', 'archived'))
     summary = {}
 
-    # Expiring in 30 days
-    cursor.execute(f"""
-        SELECT COUNT(*) FROM contracts
-        WHERE {base_where}
-        AND expiration_date BETWEEN ? AND ?
-        AND status NOT IN ('expired', 'terminated', 'archived')
-    """, (today_str, d30))
-    summary['expiring_30d'] = cursor.fetchone()[0]
-
-    # Expiring in 60 days
-    cursor.execute(f"""
-        SELECT COUNT(*) FROM contracts
-        WHERE {base_where}
-        AND expiration_date BETWEEN ? AND ?
-        AND status NOT IN ('expired', 'terminated', 'archived')
-    """, (today_str, d60))
-    summary['expiring_60d'] = cursor.fetchone()[0]
-
-    # Expiring in 90 days
-    cursor.execute(f"""
-        SELECT COUNT(*) FROM contracts
-        WHERE {base_where}
-        AND expiration_date BETWEEN ? AND ?
-        AND status NOT IN ('expired', 'terminated', 'archived')
-    """, (today_str, d90))
-    summary['expiring_90d'] = cursor.fetchone()[0]
+    # Expiring in 30 / 60 / 90 days
+    summary['expiring_30d'] = agg.expiring(open_contracts, today_str, d30)['count']
+    summary['expiring_60d'] = agg.expiring(open_contracts, today_str, d60)['count']
+    summary['expiring_90d'] = agg.expiring(open_contracts, today_str, d90)['count']
 
     # Pending review (intake, review, uploaded status)
-    cursor.execute(f"""
-        SELECT COUNT(*) FROM contracts
-        WHERE {base_where}
-        AND status IN ('intake', 'review', 'uploaded', 'pending_review')
-    """)
-    summary['pending_review'] = cursor.fetchone()[0]
+    summary['pending_review'] = agg.totals(
+        PortfolioFilter(status_in=('intake', 'review', 'uploaded', 'pending_review'))
+    )['count']
 
     # High risk active contracts
-    cursor.execute(f"""
-        SELECT COUNT(*) FROM contracts
-        WHERE {base_where}
-        AND risk_level IN ('CRITICAL', 'HIGH')
-        AND status IN ('active', 'negotiating', 'review')
-    """)
-    summary['high_risk_active'] = cursor.fetchone()[0]
+    summary['high_risk_active'] = agg.totals(
+        PortfolioFilter(risk_in=('CRITICAL', 'HIGH'), status_in=('active', 'negotiating', 'review'))
+    )['count']
 
     # Negotiating contracts
-    cursor.execute(f"""
-        SELECT COUNT(*) FROM contracts
-        WHERE {base_where}
-        AND status = 'negotiating'
-    """)
-    summary['negotiating'] = cursor.fetchone()[0]
+    summary['negotiating'] = agg.totals(PortfolioFilter(status='negotiating'))['count']
 
     # Recently expired (last 30 days)
     d30_ago = (today - timedelta(days=30)).isoformat()
-    cursor.execute(f"""
-        SELECT COUNT(*) FROM contracts
-        WHERE {base_where}
-        AND expiration_date BETWEEN ? AND ?
-    """, (d30_ago, today_str))
-    summary['recently_expired'] = cursor.fetchone()[0]
+    summary['recently_expired'] = agg.expiring(ALL_CONTRACTS, d30_ago, today_str)['count']
 
     # Action items - contracts needing attention
     cursor.execute(f"""
@@ -193,10 +161,7 @@ def get_stats():
             value_by_status: {status: value}
         }
     """
-    conn = get_db_connection()
-    cursor = conn.cursor()
-
-    base_where = "(archived = 0 OR archived IS NULL)"
+    agg = get_portfolio_aggregates(CONTRACTS_DB)
 
     stats = {
         'totals': {},
@@ -207,70 +172,30 @@ def get_stats():
     }
 
     # Total counts
-    cursor.execute(f"SELECT COUNT(*) FROM contracts WHERE {base_where}")
-    stats['totals']['contracts'] = cursor.fetchone()[0]
-
-    cursor.execute(f"SELECT COALESCE(SUM(contract_value), 0) FROM contracts WHERE {base_where}")
-    stats['totals']['value'] = cursor.fetchone()[0]
-
-    cursor.execute(f"SELECT COUNT(*) FROM contracts WHERE {base_where} AND status = 'active'")
-    stats['totals']['active'] = cursor.fetchone()[0]
-
-    cursor.execute(f"SELECT COUNT(*) FROM contracts WHERE {base_where} AND status = 'expired'")
-    stats['totals']['expired'] = cursor.fetchone()[0]
+    totals = agg.totals()
+    stats['totals']['contracts'] = totals['count']
+    stats['totals']['value'] = totals['value']
+    stats['totals']['active'] = agg.totals(PortfolioFilter(status='active'))['count']
+    stats['totals']['expired'] = agg.totals(PortfolioFilter(status='expired'))['count']
 
     # By status
-    cursor.execute(f"""
-        SELECT status, COUNT(*) as count
-        FROM contracts
-        WHERE {base_where} AND status IS NOT NULL
-        GROUP BY status
-        ORDER BY count DESC
-    """)
-    for row in cursor.fetchall():
-        stats['by_status'][row['status']] = row['count']
+    by_status = [(k, v) for k, v in agg.group_by('status').items() if k is not None]
+    for status, group in sorted(by_status, key=lambda item: -item[1]['count']):
+        stats['by_status'][status] = group['count']
 
     # By contract type
-    cursor.execute(f"""
-        SELECT contract_type, COUNT(*) as count
-        FROM contracts
-        WHERE {base_where} AND contract_type IS NOT NULL
-        GROUP BY contract_type
-        ORDER BY count DESC
-    """)
-    for row in cursor.fetchall():
-        stats['by_type'][row['contract_type']] = row['count']
+    by_type = [(k, v) for k, v in agg.group_by('contract_type').items() if k is not None]
+    for contract_type, group in sorted(by_type, key=lambda item: -item[1]['count']):
+        stats['by_type'][contract_type] = group['count']
 
     # By risk level
-    cursor.execute(f"""
-        SELECT risk_level, COUNT(*) as count
-        FROM contracts
-        WHERE {base_where} AND risk_level IS NOT NULL
-        GROUP BY risk_level
-        ORDER BY
-            CASE risk_level
-                WHEN 'CRITICAL' THEN 1
-                WHEN 'HIGH' THEN 2
-                WHEN 'MEDIUM' THEN 3
-                WHEN 'LOW' THEN 4
-                ELSE 5
-            END
-    """)
-    for row in cursor.fetchall():
-        stats['by_risk'][row['risk_level']] = row['count']
+    by_risk = [(k, v) for k, v in agg.group_by('risk_level').items() if k is not None]
+    for risk_level, group in sorted(by_risk, key=lambda item: RISK_ORDER.get(item[0], 5)):
+        stats['by_risk'][risk_level] = group['count']
 
     # Value by status
-    cursor.execute(f"""
-        SELECT status, COALESCE(SUM(contract_value), 0) as total_value
-        FROM contracts
-        WHERE {base_where} AND status IS NOT NULL
-        GROUP BY status
-        ORDER BY total_value DESC
-    """)
-    for row in cursor.fetchall():
-        stats['value_by_status'][row['status']] = row['total_value']
-
-    conn.close()
+    for status, group in sorted(by_status, key=lambda item: -item[1]['value']):
+        stats['value_by_status'][status] = group['value']
 
     return jsonify({
         **stats,
@@ -295,10 +220,7 @@ def get_trends():
     """
     months = min(int(request.args.get('months', 6)), 24)
 
-    conn = get_db_connection()
-    cursor = conn.cursor()
-
-    base_where = "(archived = 0 OR archived IS NULL)"
+    agg = get_portfolio_aggregates(CONTRACTS_DB)
 
     # Calculate date range
     today = datetime.now().date()
@@ -310,44 +232,25 @@ def get_trends():
     }
 
     # Uploads by month
-    cursor.execute(f"""
-        SELECT
-            strftime('%Y-%m', upload_date) as month,
-            COUNT(*) as count
-        FROM contracts
-        WHERE {base_where} AND upload_date >= ?
-        GROUP BY month
-        ORDER BY month
-    """, (start_date,))
-    for row in cursor.fetchall():
-        if row['month']:
+    for month, group in agg.uploads_by_month(since=start_date).items():
+        if month:
             trends['uploads_by_month'].append({
-                'month': row['month'],
-                'count': row['count']
+                'month': month,
+                'count': group['count']
             })
 
     # Expirations by month (next 12 months)
     future_date = (today + timedelta(days=365)).isoformat()
-    cursor.execute(f"""
-        SELECT
-            strftime('%Y-%m', expiration_date) as month,
-            COUNT(*) as count
-        FROM contracts
-        WHERE {base_where}
-        AND expiration_date BETWEEN ? AND ?
-        AND status NOT IN ('expired', 'terminated')
-        GROUP BY month
-        ORDER BY month
-    """, (today.isoformat(), future_date))
-    for row in cursor.fetchall():
-        if row['month']:
+    expirations = agg.expirations_by(
+        PortfolioFilter(status_not_in=('expired', 'terminated')), today.isoformat(), future_date, month=True
+    )
+    for month, count in expirations.items():
+        if month:
             trends['expirations_by_month'].append({
-                'month': row['month'],
-                'count': row['count']
+                'month': month,
+                'count': count
             })
 
-    conn.close()
-
     return jsonify({
         **trends,
         'period_months': months,
@@ -362,47 +265,26 @@ def get_summary():
 
     Returns compact metrics for immediate display.
     """
-    conn = get_db_connection()
-    cursor = conn.cursor()
+    agg = get_portfolio_aggregates(CONTRACTS_DB)
 
     today = datetime.now().date()
     d30 = (today + timedelta(days=30)).isoformat()
-    base_where = "(archived = 0 OR archived IS NULL)"
 
     # Quick stats
-    cursor.execute(f"SELECT COUNT(*) FROM contracts WHERE {base_where}")
-    total = cursor.fetchone()[0]
+    totals = agg.totals()
+    total = totals['count']
+    value = totals['value']
+    active = agg.totals(PortfolioFilter(status='active'))['count']
 
-    cursor.execute(f"SELECT COUNT(*) FROM contracts WHERE {base_where} AND status = 'active'")
-    active = cursor.fetchone()[0]
+    expiring_soon = agg.expiring(
+        PortfolioFilter(status_not_in=('expired', 'terminated')), today.isoformat(), d30
+    )['count']
 
-    cursor.execute(f"SELECT COALESCE(SUM(contract_value), 0) FROM contracts WHERE {base_where}")
-    value = cursor.fetchone()[0]
+    high_risk = agg.totals(
+        PortfolioFilter(risk_in=('CRITICAL', 'HIGH'), status_not_in=('expired', 'terminated', 'archived'))
+    )['count']
 
-    cursor.execute(f"""
-        SELECT COUNT(*) FROM contracts
-        WHERE {base_where}
-        AND expiration_date BETWEEN ? AND ?
-        AND status NOT IN ('expired', 'terminated')
-    """, (today.isoformat(), d30))
-    expiring_soon = cursor.fetchone()[0]
-
-    cursor.execute(f"""
-        SELECT COUNT(*) FROM contracts
-        WHERE {base_where}
-        AND risk_level IN ('CRITICAL', 'HIGH')
-        AND status NOT IN ('expired', 'terminated', 'archived')
-    """)
-    high_risk = cursor.fetchone()[0]
-
-    cursor.execute(f"""
-        SELECT COUNT(*) FROM contracts
-        WHERE {base_where}
-        AND status IN ('intake', 'review', 'negotiating')
-    """)
-    needs_attention = cursor.fetchone()[0]
-
-    conn.close()
+    needs_attention = agg.totals(PortfolioFilter(status_in=('intake', 'review', 'negotiating')))['count']
 
     return jsonify({
         'total_contracts': total,
@@ -416,6 +298,7 @@ def get_summary():
 
 
 def register_dashboard(app):
-    """Register dashboard blueprint with Flask app."""
+    """Register dashboard blueprint with Flask app and install the aggregate triggers."""
     app.register_blueprint(dashboard_bp)
+    install_aggregate_triggers(CONTRACTS_DB)
     return dashboard_bp
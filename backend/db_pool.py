@@ -0,0 +1,352 @@
+"""
+SQLite Connection Pool
+Central connection manager for backend modules, keyed by database path.
+
+Provides:
+- get_connection: pooled connection, PRAGMAs applied once per connection
+- read-only connections (mode=ro + query_only) for query endpoints
+- init_app: Flask teardown that returns connections a request left checked out
+- get_pool_stats: per-database checkout / reuse / leak counters
+
+Callers keep the existing open/close pattern. close() on a pooled
+connection rolls back any open transaction and returns it to the pool's
+idle stack instead of closing it:
+
+    conn = get_connection(CONTRACTS_DB, read_only=True)
+    try:
+        ...
+    finally:
+        conn.close()
+"""
+
+import os
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple, Union
+
+try:
+    from flask import g, has_app_context, has_request_context
+    FLASK_AVAILABLE = True
+except ImportError:
+    FLASK_AVAILABLE = False
+
+from sqlite_bulk import apply_write_pragmas
+
+# =============================================================================
+# CONFIGURATION
+# =============================================================================
+
+# Idle connections kept for each (database, mode), shared by all threads
+POOL_MAX_IDLE = 4
+
+# Seconds to wait for another writer's lock
+POOL_BUSY_TIMEOUT = 30.0
+
+# Page cache per pooled read-write connection, in KiB
+POOL_CACHE_SIZE_KB = 8192
+
+# Flask g attribute holding connections checked out during the request
+_REQUEST_ATTR = '_db_pool_connections'
+
+DbPath = Union[str, Path]
+
+
+def _file_id(db_path: str) -> Optional[Tuple[int, int]]:
+    """(device, inode) of the database file, None if missing."""
+    try:
+        st = os.stat(db_path)
+    except OSError:
+        return None
+    return (st.st_dev, st.st_ino)
+
+
+# =============================================================================
+# POOLED CONNECTION
+# =============================================================================
+
+class PooledConnection(sqlite3.Connection):
+    """sqlite3 connection whose close() returns it to its pool."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._pool: Optional['ConnectionPool'] = None
+        self._checked_out = False
+        self._file_id: Optional[Tuple[int, int]] = None
+        self._pid = os.getpid()
+
+    def close(self) -> None:
+        """Return to the pool (pooled) or close (unpooled)."""
+        if self._pool is None:
+            sqlite3.Connection.close(self)
+        elif self._checked_out:
+            self._pool._release(self)
+
+    def _close_now(self) -> None:
+        """Close the underlying connection, ignoring errors."""
+        try:
+            sqlite3.Connection.close(self)
+        except sqlite3.Error:
+            pass
+
+
+# =============================================================================
+# CONNECTION POOL
+# =============================================================================
+
+class ConnectionPool:
+    """
+    Connections to one database in one mode (read-write or read-only).
+
+    Idle connections sit on one lock-guarded stack shared by all threads,
+    so a connection opened by a short-lived request thread is reused by
+    the next one. Connections are opened with check_same_thread=False and
+    checked out by one caller at a time; nested checkouts get a second
+    connection.
+    """
+
+    def __init__(
+        self,
+        db_path: str,
+        read_only: bool = False,
+        max_idle: int = POOL_MAX_IDLE,
+        timeout: float = POOL_BUSY_TIMEOUT
+    ):
+        self.db_path = db_path
+        self.read_only = read_only
+        self.max_idle = max_idle
+        self.timeout = timeout
+        self._idle: List[PooledConnection] = []
+        self._lock = threading.Lock()
+        self._stats = {
+            'connections_opened': 0,
+            'connections_closed': 0,
+            'checkouts': 0,
+            'reused': 0,
+            'in_use': 0,
+            'idle': 0,
+            'leaked': 0,
+        }
+
+    def _count(self, **deltas: int) -> None:
+        with self._lock:
+            for key, delta in deltas.items():
+                self._stats[key] += delta
+
+    def _connect(self) -> PooledConnection:
+        """Open a connection and apply the mode's PRAGMAs."""
+        if self.read_only:
+            conn = sqlite3.connect(
+                Path(self.db_path).as_uri() + '?mode=ro',
+                uri=True, timeout=self.timeout, factory=PooledConnection,
+                check_same_thread=False
+            )
+            conn.execute("PRAGMA query_only = ON")
+        else:
+            conn = sqlite3.connect(
+                self.db_path, timeout=self.timeout, factory=PooledConnection,
+                check_same_thread=False
+            )
+            apply_write_pragmas(conn, cache_size_kb=POOL_CACHE_SIZE_KB, foreign_keys=True)
+        conn._pool = self
+        conn._file_id = _file_id(self.db_path)
+        return conn
+
+    def _usable(self, conn: PooledConnection, file_id: Optional[Tuple[int, int]]) -> bool:
+        """Idle connection still belongs to this process and this file."""
+        return conn._pid == os.getpid() and conn._file_id == file_id
+
+    def _pop_idle(self) -> Optional[PooledConnection]:
+        """Take the most recently released idle connection, if any."""
+        with self._lock:
+            if not self._idle:
+                return None
+            self._stats['idle'] -= 1
+            return self._idle.pop()
+
+    def acquire(self, row_factory=sqlite3.Row) -> PooledConnection:
+        """
+        Check out a connection.
+
+        Args:
+            row_factory: Row factory for this checkout (None for tuples)
+
+        Returns:
+            Connection; call close() to return it
+        """
+        conn = None
+        file_id = None
+        while True:
+            candidate = self._pop_idle()
+            if candidate is None:
+                break
+            if file_id is None:
+                file_id = _file_id(self.db_path)
+            if self._usable(candidate, file_id):
+                conn = candidate
+                break
+            # Database replaced or process forked since it was opened
+            if candidate._pid == os.getpid():
+                candidate._close_now()
+            self._count(connections_closed=1)
+
+        if conn is None:
+            conn = self._connect()
+            self._count(connections_opened=1, checkouts=1, in_use=1)
+        else:
+            self._count(reused=1, checkouts=1, in_use=1)
+
+        conn.row_factory = row_factory
+        conn._checked_out = True
+        _track_request(conn)
+        return conn
+
+    def _release(self, conn: PooledConnection) -> None:
+        """Roll back leftovers and keep the connection idle (or close it)."""
+        conn._checked_out = False
+        self._count(in_use=-1)
+        try:
+            if conn.in_transaction:
+                conn.rollback()
+            if conn.isolation_level != "":
+                conn.isolation_level = ""
+        except sqlite3.Error:
+            conn._close_now()
+            self._count(connections_closed=1)
+            return
+
+        with self._lock:
+            if len(self._idle) < self.max_idle:
+                self._idle.append(conn)
+                self._stats['idle'] += 1
+                return
+            self._stats['connections_closed'] += 1
+        conn._close_now()
+
+    def get_stats(self) -> Dict:
+        """Counters plus reuse ratio."""
+        with self._lock:
+            stats = dict(self._stats)
+        stats['db_path'] = self.db_path
+        stats['read_only'] = self.read_only
+        stats['reuse_ratio'] = round(stats['reused'] / stats['checkouts'], 3) if stats['checkouts'] else 0.0
+        return stats
+
+
+# =============================================================================
+# REGISTRY
+# =============================================================================
+
+_POOLS: Dict[Tuple[str, bool], ConnectionPool] = {}
+_POOLS_LOCK = threading.Lock()
+
+
+def get_pool(db_path: DbPath, read_only: bool = False) -> ConnectionPool:
+    """Get (or create) the pool for a database path and mode."""
+    key = (os.path.abspath(str(db_path)), read_only)
+    pool = _POOLS.get(key)
+    if pool is None:
+        with _POOLS_LOCK:
+            pool = _POOLS.get(key)
+            if pool is None:
+                pool = _POOLS[key] = ConnectionPool(key[0], read_only=read_only)
+    return pool
+
+
+def get_connection(
+    db_path: DbPath,
+    read_only: bool = False,
+    row_factory=sqlite3.Row
+) -> sqlite3.Connection:
+    """
+    Get a pooled connection.
+
+    Read-write connections have foreign_keys=ON, WAL and synchronous=NORMAL.
+    Read-only connections open the file with mode=ro and query_only=ON
+    (the database must exist).
+
+    Args:
+        db_path: Database file path
+        read_only: Open read-only
+        row_factory: Row factory (default sqlite3.Row, None for tuples)
+
+    Returns:
+        Connection; close() returns it to the pool
+    """
+    if str(db_path) in ('', ':memory:'):
+        # Every in-memory connection is a separate database: nothing to pool
+        conn = sqlite3.connect(':memory:')
+        conn.execute("PRAGMA foreign_keys = ON")
+        conn.row_factory = row_factory
+        return conn
+    return get_pool(db_path, read_only).acquire(row_factory=row_factory)
+
+
+def get_pool_stats() -> Dict:
+    """
+    Get metrics for every pool.
+
+    Returns:
+        Dict with per-pool stats and totals
+    """
+    with _POOLS_LOCK:
+        pools = list(_POOLS.values())
+    stats = [pool.get_stats() for pool in pools]
+    totals = {
+        key: sum(s[key] for s in stats)
+        for key in ('connections_opened', 'connections_closed', 'checkouts', 'reused', 'in_use', 'idle', 'leaked')
+    }
+    totals['reuse_ratio'] = round(totals['reused'] / totals['checkouts'], 3) if totals['checkouts'] else 0.0
+    return {'pools': stats, 'totals': totals}
+
+
+# =============================================================================
+# FLASK REQUEST SCOPE
+# =============================================================================
+
+def _track_request(conn: PooledConnection) -> None:
+    """Remember connections checked out while handling a request."""
+    if FLASK_AVAILABLE and has_request_context():
+        g.setdefault(_REQUEST_ATTR, set()).add(conn)
+
+
+def release_request_connections(exc: Optional[BaseException] = None) -> int:
+    """
+    Return connections still checked out at the end of a request.
+
+    Registered as a teardown handler by init_app(). Any open transaction
+    on a leaked connection is rolled back.
+
+    Returns:
+        Number of connections released
+    """
+    if not FLASK_AVAILABLE or not has_app_context():
+        return 0
+    released = 0
+    for conn in g.pop(_REQUEST_ATTR, ()):
+        if conn._checked_out:
+            conn._pool._count(leaked=1)
+            conn.close()
+            released += 1
+    return released
+
+
+def init_app(app) -> None:
+    """Register request-scoped cleanup on a Flask app."""
+    if 'db_pool' in app.extensions:
+        return
+    app.teardown_request(release_request_connections)
+    app.extensions['db_pool'] = True
+
+
+__all__ = [
+    'FLASK_AVAILABLE',
+    'POOL_MAX_IDLE',
+    'PooledConnection',
+    'ConnectionPool',
+    'get_pool',
+    'get_connection',
+    'get_pool_stats',
+    'release_request_connections',
+    'init_app',
+]
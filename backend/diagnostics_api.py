@@ -4,13 +4,12 @@ CIP Diagnostics API Endpoints
 Provides endpoints for system monitoring and debugging:
 - /api/diagnostics/logs - View log files
 - /api/diagnostics/api-history - Recent API call history
-- /api/diagnostics/db-stats - Database statistics
+- /api/diagnostics/db-stats - Database statistics and connection pool metrics
 - /api/diagnostics/system-resources - CPU/Memory/Disk usage
 """
 
 import os
 import re
-import sqlite3
 from pathlib import Path
 from datetime import datetime
 from typing import Dict, List, Optional
@@ -18,6 +17,9 @@ from typing import Dict, List, Optional
 import psutil
 from flask import Blueprint, request, jsonify
 
+from db_pool import get_connection, get_pool_stats
+from log_index import get_log_index, level_index, tail_lines, time_key
+
 # Create blueprint
 diagnostics_bp = Blueprint('diagnostics', __name__, url_prefix='/api/diagnostics')
 
@@ -45,6 +47,15 @@ LOG_PATTERN = re.compile(
 
 LOG_LEVELS = ["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]
 
+# API request lines in api.log
+API_REQUEST_PATTERN = re.compile(r'(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}).*?(GET|POST|PUT|DELETE)\s+(/\S+).*?(\d{3})?')
+
+# Marker patterns recorded by the log index
+LOG_MARKERS = {"request": API_REQUEST_PATTERN}
+
+# Keep an incremental index per log file (off by default: tail reads only)
+LOG_INDEX_ENABLED = os.getenv("CIP_LOG_INDEX", "false").lower() == "true"
+
 
 def parse_log_line(line: str) -> Optional[Dict]:
     """Parse a single log line."""
@@ -72,23 +83,76 @@ def parse_log_line(line: str) -> Optional[Dict]:
     }
 
 
-def parse_log_file(filepath: Path, limit: int = 100, min_level: str = "INFO") -> List[Dict]:
-    """Parse last N lines from a log file."""
+def read_log_lines(
+    filepath: Path,
+    limit: int,
+    min_level: str = "DEBUG",
+    since: Optional[str] = None,
+    until: Optional[str] = None,
+    marker: Optional[str] = None
+) -> List[str]:
+    """
+    Last `limit` lines matching the filters, oldest first.
+
+    Reads backwards from the end of the file until enough lines matched,
+    or with `since` until the first timestamped line before it (log lines
+    are written in time order). With LOG_INDEX_ENABLED the file's
+    incremental index answers instead, once its background build is done;
+    tail reads cover the build and matches older than the index's line window.
+    Lines without a timestamp never match since/until.
+    """
+    if LOG_INDEX_ENABLED:
+        index = get_log_index(filepath, LOG_PATTERN, LOG_MARKERS)
+        if index.warm():
+            lines = index.query(min_level=min_level, since=since, until=until, marker=marker, limit=limit)
+            if len(lines) >= limit or index.complete:
+                return lines
+
+    min_level_idx = level_index(min_level)
+    low = time_key(since) if since else None
+    high = time_key(until, upper=True) if until else None
+    marker_pattern = LOG_MARKERS[marker] if marker else None
+
+    def matches(line: str) -> bool:
+        if marker_pattern is not None and not marker_pattern.search(line):
+            return False
+        match = LOG_PATTERN.match(line)
+        if level_index(match.group(3) if match else None) < min_level_idx:
+            return False
+        if low is not None or high is not None:
+            if not match:
+                return False
+            t = time_key(match.group(1))
+            if (low is not None and t < low) or (high is not None and t > high):
+                return False
+        return True
+
+    def before_since(line: str) -> bool:
+        match = LOG_PATTERN.match(line)
+        return bool(match) and time_key(match.group(1)) < low
+
+    return tail_lines(filepath, limit, matches, stop=before_since if low is not None else None)
+
+
+def parse_log_file(
+    filepath: Path,
+    limit: int = 100,
+    min_level: str = "INFO",
+    since: Optional[str] = None,
+    until: Optional[str] = None
+) -> List[Dict]:
+    """Parse the last N entries at or above min_level from a log file."""
     entries = []
-    min_level_idx = LOG_LEVELS.index(min_level) if min_level in LOG_LEVELS else 1
+    min_level = LOG_LEVELS[level_index(min_level)]
 
     if not filepath.exists():
         return entries
 
     try:
-        with open(filepath, 'r', encoding='utf-8', errors='replace') as f:
-            lines = f.readlines()
-            for line in lines[-limit:]:
-                entry = parse_log_line(line)
-                if entry:
-                    level_idx = LOG_LEVELS.index(entry["level"]) if entry["level"] in LOG_LEVELS else 1
-                    if level_idx >= min_level_idx:
-                        entries.append(entry)
+        for line in read_log_lines(filepath, limit, min_level=min_level, since=since, until=until):
+            entry = parse_log_line(line)
+            if entry:
+                entries.append(entry)
     except Exception as e:
         entries.append({
             "timestamp": datetime.now().isoformat(),
@@ -109,6 +173,7 @@ def get_logs():
         - file: cip|error|api (default: cip)
         - level: DEBUG|INFO|WARNING|ERROR|CRITICAL (default: INFO)
         - limit: 1-1000 (default: 100)
+        - since, until: inclusive timestamp bounds, e.g. 2025-01-06 or 2025-01-06 14:00
 
     Returns:
         {entries: [...], total: int, file: str}
@@ -116,6 +181,8 @@ def get_logs():
     log_name = request.args.get('file', 'cip')
     level = request.args.get('level', 'INFO').upper()
     limit = min(max(int(request.args.get('limit', 100)), 1), 1000)
+    since = request.args.get('since')
+    until = request.args.get('until')
 
     log_path = LOG_FILES.get(log_name)
     if not log_path:
@@ -124,7 +191,14 @@ def get_logs():
             'available': list(LOG_FILES.keys())
         }), 400
 
-    entries = parse_log_file(log_path, limit=limit, min_level=level)
+    for bound in (since, until):
+        if bound:
+            try:
+                time_key(bound)
+            except ValueError as e:
+                return jsonify({'error': str(e)}), 400
+
+    entries = parse_log_file(log_path, limit=limit, min_level=level, since=since, until=until)
 
     return jsonify({
         'entries': entries,
@@ -151,28 +225,25 @@ def get_api_history():
     if not api_log or not api_log.exists():
         return jsonify({'calls': [], 'total': 0, 'note': 'API log not found'})
 
-    # Parse API log for request/response patterns
+    # Last `limit` request lines (indexed, or read backwards from the end)
     calls = []
-    request_pattern = re.compile(r'(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}).*?(GET|POST|PUT|DELETE)\s+(/\S+).*?(\d{3})?')
 
     try:
-        with open(api_log, 'r', encoding='utf-8', errors='replace') as f:
-            lines = f.readlines()[-limit*2:]  # Read more lines to find matches
-            for line in lines:
-                match = request_pattern.search(line)
-                if match:
-                    calls.append({
-                        'timestamp': match.group(1),
-                        'method': match.group(2),
-                        'endpoint': match.group(3),
-                        'status': int(match.group(4)) if match.group(4) else None,
-                    })
+        for line in read_log_lines(api_log, limit, marker="request"):
+            match = API_REQUEST_PATTERN.search(line)
+            if match:
+                calls.append({
+                    'timestamp': match.group(1),
+                    'method': match.group(2),
+                    'endpoint': match.group(3),
+                    'status': int(match.group(4)) if match.group(4) else None,
+                })
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
     return jsonify({
-        'calls': calls[-limit:],
-        'total': len(calls[-limit:]),
+        'calls': calls,
+        'total': len(calls),
     })
 
 
@@ -184,7 +255,8 @@ def get_db_stats():
     Returns:
         {
             contracts_db: {exists, size_bytes, tables: {name: row_count}},
-            reports_db: {exists, size_bytes, tables: {name: row_count}}
+            reports_db: {exists, size_bytes, tables: {name: row_count}},
+            connection_pool: {pools: [...], totals: {checkouts, reused, reuse_ratio, ...}}
         }
     """
     stats = {}
@@ -202,7 +274,7 @@ def get_db_stats():
             db_stats['size_human'] = format_bytes(db_stats['size_bytes'])
 
             try:
-                conn = sqlite3.connect(str(db_path))
+                conn = get_connection(db_path, read_only=True, row_factory=None)
                 cursor = conn.cursor()
 
                 # Get table list
@@ -223,6 +295,8 @@ def get_db_stats():
 
         stats[db_name] = db_stats
 
+    stats['connection_pool'] = get_pool_stats()
+
     return jsonify(stats)
 
 
@@ -7,13 +7,37 @@ Intelligence activation happens in Step 2.
 """
 
 import hashlib
+import json
 import os
 import sqlite3
+import struct
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 from phase5_flags import is_flag_enabled, get_config
+from sqlite_bulk import bulk_insert, write_transaction
+
+# NumPy for vectorized similarity (optional)
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
+
+
+# SQLite host parameter limit is 999 on older builds; chunk IN (...) lists
+SQLITE_IN_CHUNK_SIZE = 500
+
+
+def _chunked(items: List[Any], size: int):
+    """Yield successive chunks of items."""
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
 
 
 # ============================================================================
@@ -62,6 +86,10 @@ class EmbeddingCache:
         self._ensure_directory()
         self._init_schema()
 
+        # Entry count tracked in memory after first load (avoids COUNT(*) per put)
+        self._entry_count: Optional[int] = None
+        self._count_lock = threading.Lock()
+
         # Metrics counters (in-memory)
         self._metrics = {
             "hits": 0,
@@ -155,45 +183,71 @@ class EmbeddingCache:
 
         Note: Only returns data if embedding_cache_active flag is True.
         """
+        return self.get_many([clause_text])[0]
+
+    def get_many(self, clause_texts: List[str]) -> List[Optional[bytes]]:
+        """
+        Get cached embeddings for many clause texts in one transaction.
+
+        Resolves all hashes with chunked IN (...) queries and batches the
+        access tracking update, so a whole contract costs one connection
+        and one commit instead of one per clause.
+
+        Args:
+            clause_texts: Clause texts to look up
+
+        Returns:
+            List aligned with clause_texts: vector bytes or None per text
+
+        Note: Only returns data if embedding_cache_active flag is True.
+        """
+        if not clause_texts:
+            return []
+
         # Check feature flag
         if not is_flag_enabled("embedding_cache_active"):
-            self._metrics["misses"] += 1
-            return None
+            self._metrics["misses"] += len(clause_texts)
+            return [None] * len(clause_texts)
 
-        clause_hash = self.compute_hash(clause_text)
+        hashes = [self.compute_hash(text) for text in clause_texts]
+        unique_hashes = list(dict.fromkeys(hashes))
+        found: Dict[str, bytes] = {}
 
         try:
             conn = sqlite3.connect(self.db_path)
             cursor = conn.cursor()
 
-            cursor.execute("""
-                SELECT embedding_vector FROM clause_embeddings
-                WHERE clause_text_hash = ?
-            """, (clause_hash,))
-
-            row = cursor.fetchone()
+            for chunk in _chunked(unique_hashes, SQLITE_IN_CHUNK_SIZE):
+                placeholders = ",".join("?" * len(chunk))
+                cursor.execute(f"""
+                    SELECT clause_text_hash, embedding_vector FROM clause_embeddings
+                    WHERE clause_text_hash IN ({placeholders})
+                """, chunk)
+                found.update(cursor.fetchall())
 
-            if row:
+            if found:
                 # Update access tracking
-                cursor.execute("""
-                    UPDATE clause_embeddings
-                    SET access_count = access_count + 1,
-                        last_accessed_at = CURRENT_TIMESTAMP
-                    WHERE clause_text_hash = ?
-                """, (clause_hash,))
+                for chunk in _chunked(list(found.keys()), SQLITE_IN_CHUNK_SIZE):
+                    placeholders = ",".join("?" * len(chunk))
+                    cursor.execute(f"""
+                        UPDATE clause_embeddings
+                        SET access_count = access_count + 1,
+                            last_accessed_at = CURRENT_TIMESTAMP
+                        WHERE clause_text_hash IN ({placeholders})
+                    """, chunk)
                 conn.commit()
 
-                self._metrics["hits"] += 1
-                conn.close()
-                return row[0]
-            else:
-                self._metrics["misses"] += 1
-                conn.close()
-                return None
+            conn.close()
 
-        except sqlite3.Error as e:
+        except sqlite3.Error:
             self._metrics["errors"] += 1
-            return None
+            return [None] * len(clause_texts)
+
+        results = [found.get(h) for h in hashes]
+        hits = sum(1 for r in results if r is not None)
+        self._metrics["hits"] += hits
+        self._metrics["misses"] += len(results) - hits
+        return results
 
     def put(
         self,
@@ -216,49 +270,89 @@ class EmbeddingCache:
 
         Note: Only stores data if embedding_cache_active flag is True.
         """
+        return self.put_many([
+            (clause_text, embedding_vector, model_version, vector_dimensions)
+        ]) == 1
+
+    def put_many(self, items: List[Tuple[str, bytes, str, int]]) -> int:
+        """
+        Store many embeddings in one transaction.
+
+        Args:
+            items: (clause_text, embedding_vector, model_version, vector_dimensions) tuples
+
+        Returns:
+            Number of entries stored (0 on error or when flag is disabled)
+
+        Note: Only stores data if embedding_cache_active flag is True.
+        """
+        if not items:
+            return 0
+
         # Check feature flag
         if not is_flag_enabled("embedding_cache_active"):
-            return False
+            return 0
 
-        clause_hash = self.compute_hash(clause_text)
+        # Last write wins for duplicate texts within the batch
+        rows: Dict[str, Tuple[bytes, str, int]] = {}
+        for clause_text, embedding_vector, model_version, vector_dimensions in items:
+            rows[self.compute_hash(clause_text)] = (embedding_vector, model_version, vector_dimensions)
 
         try:
             # Check max entries limit
             max_entries = get_config("embedding_cache_max_entries", 10000)
-            if self._get_entry_count() >= max_entries:
-                self._evict_lru(count=100)  # Evict oldest 100 entries
-
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-
-            cursor.execute("""
-                INSERT OR REPLACE INTO clause_embeddings
-                (clause_text_hash, embedding_vector, model_version,
-                 vector_dimensions, created_at, last_accessed_at, access_count)
-                VALUES (?, ?, ?, ?, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP, 0)
-            """, (clause_hash, embedding_vector, model_version, vector_dimensions))
-
-            conn.commit()
-            conn.close()
-
-            self._metrics["writes"] += 1
-            return True
+            if self._get_entry_count() + len(rows) > max_entries:
+                self._evict_lru(count=max(100, len(rows)))  # Evict oldest entries
+
+            with write_transaction(self.db_path) as conn:
+                existing = set()
+                for chunk in _chunked(list(rows.keys()), SQLITE_IN_CHUNK_SIZE):
+                    placeholders = ",".join("?" * len(chunk))
+                    cursor = conn.execute(f"""
+                        SELECT clause_text_hash FROM clause_embeddings
+                        WHERE clause_text_hash IN ({placeholders})
+                    """, chunk)
+                    existing.update(row[0] for row in cursor.fetchall())
+
+                bulk_insert(conn, """
+                    INSERT OR REPLACE INTO clause_embeddings
+                    (clause_text_hash, embedding_vector, model_version,
+                     vector_dimensions, created_at, last_accessed_at, access_count)
+                    VALUES (?, ?, ?, ?, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP, 0)
+                """, ((h, vec, model, dims) for h, (vec, model, dims) in rows.items()))
+
+            with self._count_lock:
+                if self._entry_count is not None:
+                    self._entry_count += len(rows) - len(existing)
+
+            self._metrics["writes"] += len(rows)
+            return len(rows)
 
         except sqlite3.Error as e:
             self._metrics["errors"] += 1
-            return False
+            return 0
 
     def _get_entry_count(self) -> int:
-        """Get current number of cached entries"""
+        """
+        Get current number of cached entries.
+
+        Counted from the table once, then tracked in memory by writes,
+        evictions, invalidations and clears.
+        """
+        with self._count_lock:
+            if self._entry_count is not None:
+                return self._entry_count
         try:
             conn = sqlite3.connect(self.db_path)
             cursor = conn.cursor()
             cursor.execute("SELECT COUNT(*) FROM clause_embeddings")
             count = cursor.fetchone()[0]
             conn.close()
-            return count
         except sqlite3.Error:
             return 0
+        with self._count_lock:
+            self._entry_count = count
+        return count
 
     def _evict_lru(self, count: int = 100) -> int:
         """
@@ -284,9 +378,16 @@ class EmbeddingCache:
             """, (count,))
 
             evicted = cursor.rowcount
+
+            # Resync the in-memory counter (other processes may share the file)
+            cursor.execute("SELECT COUNT(*) FROM clause_embeddings")
+            remaining = cursor.fetchone()[0]
             conn.commit()
             conn.close()
 
+            with self._count_lock:
+                self._entry_count = remaining
+
             self._metrics["evictions"] += evicted
             return evicted
 
@@ -317,6 +418,11 @@ class EmbeddingCache:
             deleted = cursor.rowcount > 0
             conn.commit()
             conn.close()
+
+            if deleted:
+                with self._count_lock:
+                    if self._entry_count is not None:
+                        self._entry_count -= 1
             return deleted
 
         except sqlite3.Error:
@@ -340,6 +446,9 @@ class EmbeddingCache:
             conn.commit()
             conn.close()
 
+            with self._count_lock:
+                self._entry_count = 0
+
             self._metrics["evictions"] += count
             return {"deleted_entries": count}
 
@@ -382,6 +491,21 @@ class EmbeddingCache:
             """)
             date_range = cursor.fetchone()
 
+            # Storage format breakdown and savings over JSON encoding
+            cursor.execute("""
+                SELECT COUNT(*), SUM(LENGTH(embedding_vector)), SUM(vector_dimensions)
+                FROM clause_embeddings
+                WHERE substr(embedding_vector, 1, 4) = ?
+            """, (VECTOR_MAGIC,))
+            binary_count, binary_bytes, binary_dims = cursor.fetchone()
+            binary_bytes = binary_bytes or 0
+            json_equivalent = (binary_dims or 0) * JSON_BYTES_PER_FLOAT_ESTIMATE
+
+            cursor.execute("""
+                SELECT value FROM cache_metadata WHERE key = 'migration_bytes_saved'
+            """)
+            migration_row = cursor.fetchone()
+
             conn.close()
 
             # Calculate hit rate
@@ -396,6 +520,12 @@ class EmbeddingCache:
                 "total_size_bytes": total_size,
                 "total_size_mb": total_size / (1024 * 1024),
                 "model_versions": model_counts,
+                "storage_formats": {
+                    "binary": binary_count,
+                    "json": entry_count - binary_count,
+                },
+                "bytes_saved": max(0, json_equivalent - binary_bytes),
+                "migration_bytes_saved": int(migration_row[0]) if migration_row else 0,
                 "oldest_entry": date_range[0] if date_range else None,
                 "newest_entry": date_range[1] if date_range else None,
                 "metrics": self._metrics.copy(),
@@ -576,18 +706,171 @@ def truncate_for_embedding(
     return text[:max_chars].strip()
 
 
-def vectors_to_bytes(vector: list) -> bytes:
+# Binary vector storage format (v1), little-endian:
+#   magic(4s) version(B) dtype(B) model_len(H) dimensions(I) scale(f)
+#   model name (utf-8, zero-padded to a 4-byte boundary)
+#   payload: dimensions * itemsize
+# Legacy rows written before the binary format are JSON arrays and are
+# still readable.
+VECTOR_MAGIC = b"CIPV"
+VECTOR_FORMAT_VERSION = 1
+VECTOR_HEADER = struct.Struct("<4sBBHIf")
+
+VECTOR_DTYPE_CODES = {"float32": 0, "float16": 1, "int8": 2}
+VECTOR_DTYPE_NAMES = {code: name for name, code in VECTOR_DTYPE_CODES.items()}
+VECTOR_DTYPE_ITEMSIZE = {"float32": 4, "float16": 2, "int8": 1}
+
+# Average JSON bytes per float component (e.g. "-0.012345678, ") for
+# estimating savings over the legacy encoding
+JSON_BYTES_PER_FLOAT_ESTIMATE = 21
+
+
+@dataclass
+class VectorHeader:
+    """Parsed header of a binary-encoded embedding vector"""
+    version: int
+    dtype: str
+    dimensions: int
+    model_version: str
+    scale: float
+    payload_offset: int
+
+
+def parse_vector_header(data: bytes) -> Optional[VectorHeader]:
+    """
+    Parse the header of a binary-encoded vector.
+
+    Args:
+        data: Stored vector bytes
+
+    Returns:
+        VectorHeader, or None if data is not a valid binary vector
+    """
+    if not data or len(data) < VECTOR_HEADER.size or data[:4] != VECTOR_MAGIC:
+        return None
+
+    magic, version, dtype_code, model_len, dimensions, scale = VECTOR_HEADER.unpack_from(data)
+    dtype = VECTOR_DTYPE_NAMES.get(dtype_code)
+    if version != VECTOR_FORMAT_VERSION or dtype is None:
+        return None
+
+    model_end = VECTOR_HEADER.size + model_len
+    payload_offset = (model_end + 3) & ~3
+    if len(data) != payload_offset + dimensions * VECTOR_DTYPE_ITEMSIZE[dtype]:
+        return None
+
+    try:
+        model_version = bytes(data[VECTOR_HEADER.size:model_end]).decode('utf-8')
+    except UnicodeDecodeError:
+        return None
+
+    return VectorHeader(
+        version=version,
+        dtype=dtype,
+        dimensions=dimensions,
+        model_version=model_version,
+        scale=scale,
+        payload_offset=payload_offset,
+    )
+
+
+def is_binary_vector(data: bytes) -> bool:
+    """Check whether stored bytes use the binary vector format."""
+    return parse_vector_header(data) is not None
+
+
+def vectors_to_bytes(
+    vector: list,
+    model_version: str = "",
+    dtype: Optional[str] = None
+) -> bytes:
     """
     Convert embedding vector (list of floats) to bytes for storage.
 
     Args:
         vector: List of float values
+        model_version: Model name recorded in the header
+        dtype: float32, float16 or int8 (defaults to embedding_storage_dtype config)
 
     Returns:
-        Bytes representation (JSON encoded)
+        Bytes representation (versioned binary format)
     """
-    import json
-    return json.dumps(vector).encode('utf-8')
+    dtype = dtype or get_config("embedding_storage_dtype", "float32")
+    if dtype not in VECTOR_DTYPE_CODES:
+        raise ValueError(f"Unsupported embedding storage dtype: {dtype}")
+
+    dimensions = len(vector)
+    scale = 1.0
+
+    if NUMPY_AVAILABLE:
+        values = np.asarray(vector, dtype=np.float32)
+        if dtype == "int8":
+            peak = float(np.max(np.abs(values))) if dimensions else 0.0
+            scale = peak / 127.0 if peak > 0 else 1.0
+            payload = np.clip(np.rint(values / scale), -127, 127).astype('<i1').tobytes()
+        elif dtype == "float16":
+            payload = values.astype('<f2').tobytes()
+        else:
+            payload = values.astype('<f4').tobytes()
+    else:
+        if dtype == "int8":
+            peak = max((abs(v) for v in vector), default=0.0)
+            scale = peak / 127.0 if peak > 0 else 1.0
+            payload = struct.pack(
+                f"<{dimensions}b",
+                *(max(-127, min(127, round(v / scale))) for v in vector)
+            )
+        elif dtype == "float16":
+            payload = struct.pack(f"<{dimensions}e", *vector)
+        else:
+            payload = struct.pack(f"<{dimensions}f", *vector)
+
+    model_bytes = model_version.encode('utf-8')
+    header = VECTOR_HEADER.pack(
+        VECTOR_MAGIC,
+        VECTOR_FORMAT_VERSION,
+        VECTOR_DTYPE_CODES[dtype],
+        len(model_bytes),
+        dimensions,
+        scale,
+    )
+    padding = b"\x00" * (-(len(header) + len(model_bytes)) % 4)
+    return header + model_bytes + padding + payload
+
+
+def bytes_to_array(data: bytes) -> Optional[Any]:
+    """
+    Decode stored vector bytes into a float32 NumPy array.
+
+    float32 payloads are decoded zero-copy with numpy.frombuffer (the
+    returned array is read-only and shares memory with data). float16 and
+    int8 payloads are widened to float32. Legacy JSON rows are parsed.
+
+    Args:
+        data: Bytes from cache storage
+
+    Returns:
+        numpy float32 array or None on error
+
+    Raises:
+        RuntimeError: If NumPy is not installed
+    """
+    if not NUMPY_AVAILABLE:
+        raise RuntimeError("NumPy is required for bytes_to_array")
+
+    header = parse_vector_header(data)
+    if header is None:
+        legacy = _json_bytes_to_vector(data)
+        return np.asarray(legacy, dtype=np.float32) if legacy is not None else None
+
+    if header.dtype == "float32":
+        return np.frombuffer(data, dtype='<f4', count=header.dimensions, offset=header.payload_offset)
+    if header.dtype == "float16":
+        return np.frombuffer(
+            data, dtype='<f2', count=header.dimensions, offset=header.payload_offset
+        ).astype(np.float32)
+    quantized = np.frombuffer(data, dtype='<i1', count=header.dimensions, offset=header.payload_offset)
+    return quantized.astype(np.float32) * np.float32(header.scale)
 
 
 def bytes_to_vector(data: bytes) -> Optional[list]:
@@ -595,16 +878,125 @@ def bytes_to_vector(data: bytes) -> Optional[list]:
     Convert bytes back to embedding vector.
 
     Args:
-        data: Bytes from cache storage
+        data: Bytes from cache storage (binary format or legacy JSON)
 
     Returns:
         List of floats or None on error
     """
-    import json
+    header = parse_vector_header(data)
+    if header is None:
+        return _json_bytes_to_vector(data)
+
+    if NUMPY_AVAILABLE:
+        return bytes_to_array(data).tolist()
+
+    fmt = {"float32": "f", "float16": "e", "int8": "b"}[header.dtype]
+    values = struct.unpack_from(f"<{header.dimensions}{fmt}", data, header.payload_offset)
+    if header.dtype == "int8":
+        return [v * header.scale for v in values]
+    return list(values)
+
+
+def _json_bytes_to_vector(data: Union[bytes, str]) -> Optional[list]:
+    """Decode a legacy JSON-encoded vector (BLOB, or TEXT from json.dumps rows)."""
+    if isinstance(data, str):
+        data = data.encode('utf-8')
     try:
-        return json.loads(data.decode('utf-8'))
-    except (json.JSONDecodeError, UnicodeDecodeError):
+        vector = json.loads(bytes(data).decode('utf-8'))
+    except (json.JSONDecodeError, UnicodeDecodeError, TypeError):
         return None
+    return vector if isinstance(vector, list) else None
+
+
+def migrate_embedding_blobs(
+    db_path: str,
+    table: str = "clause_embeddings",
+    column: str = "embedding_vector",
+    model_column: Optional[str] = "model_version",
+    default_model: str = "",
+    dtype: Optional[str] = None,
+    batch_size: int = 500
+) -> Dict[str, int]:
+    """
+    Rewrite legacy JSON embedding BLOBs to the binary format in place.
+
+    Rows already in binary format are skipped, so the migration can be
+    re-run safely. Each batch is committed in its own transaction.
+
+    Args:
+        db_path: Path to SQLite database
+        table: Table holding embeddings
+        column: BLOB column holding the vector
+        model_column: Column holding the model name (None if absent)
+        default_model: Model name recorded when model_column is None
+        dtype: Target dtype (defaults to embedding_storage_dtype config)
+        batch_size: Rows rewritten per transaction
+
+    Returns:
+        Dict with rows_scanned, rows_migrated, rows_invalid, bytes_before,
+        bytes_after, bytes_saved
+    """
+    result = {
+        "rows_scanned": 0,
+        "rows_migrated": 0,
+        "rows_invalid": 0,
+        "bytes_before": 0,
+        "bytes_after": 0,
+        "bytes_saved": 0,
+    }
+    model_expr = model_column if model_column else "NULL"
+
+    conn = sqlite3.connect(db_path)
+    try:
+        cursor = conn.cursor()
+        last_id = 0
+        while True:
+            cursor.execute(f"""
+                SELECT id, {column}, {model_expr} FROM {table}
+                WHERE id > ? AND substr({column}, 1, 4) != ?
+                ORDER BY id
+                LIMIT ?
+            """, (last_id, VECTOR_MAGIC, batch_size))
+            rows = cursor.fetchall()
+            if not rows:
+                break
+
+            updates = []
+            for row_id, blob, model in rows:
+                last_id = row_id
+                result["rows_scanned"] += 1
+                vector = _json_bytes_to_vector(blob if isinstance(blob, (bytes, str)) else str(blob))
+                if vector is None:
+                    result["rows_invalid"] += 1
+                    continue
+                encoded = vectors_to_bytes(vector, model or default_model, dtype)
+                result["bytes_before"] += len(blob)
+                result["bytes_after"] += len(encoded)
+                updates.append((encoded, row_id))
+
+            cursor.executemany(f"UPDATE {table} SET {column} = ? WHERE id = ?", updates)
+            conn.commit()
+            result["rows_migrated"] += len(updates)
+
+        result["bytes_saved"] = result["bytes_before"] - result["bytes_after"]
+
+        # Accumulate savings in cache_metadata when the table exists
+        cursor.execute("""
+            SELECT name FROM sqlite_master WHERE type = 'table' AND name = 'cache_metadata'
+        """)
+        if cursor.fetchone() and result["bytes_saved"]:
+            cursor.execute("""
+                INSERT INTO cache_metadata (key, value, updated_at)
+                VALUES ('migration_bytes_saved', ?, CURRENT_TIMESTAMP)
+                ON CONFLICT(key) DO UPDATE SET
+                    value = CAST(value AS INTEGER) + CAST(excluded.value AS INTEGER),
+                    updated_at = CURRENT_TIMESTAMP
+            """, (str(result["bytes_saved"]),))
+            conn.commit()
+    finally:
+        conn.close()
+
+    return result
 
 
 def compute_cosine_similarity(vec1: list, vec2: list) -> float:
@@ -634,6 +1026,56 @@ def compute_cosine_similarity(vec1: list, vec2: list) -> float:
     return dot_product / (norm1 * norm2)
 
 
+def stack_normalized_vectors(vectors: List[list]) -> Any:
+    """
+    Stack embedding vectors into an L2-normalized float32 matrix.
+
+    Zero vectors are left as zero rows so they score 0.0 against
+    everything, matching compute_cosine_similarity.
+
+    Args:
+        vectors: List of equal-length embedding vectors
+
+    Returns:
+        numpy array of shape (len(vectors), dimensions)
+
+    Raises:
+        RuntimeError: If NumPy is not installed
+        ValueError: If vectors have mismatched dimensions
+    """
+    if not NUMPY_AVAILABLE:
+        raise RuntimeError("NumPy is required for matrix similarity")
+
+    matrix = np.asarray(vectors, dtype=np.float32)
+    if matrix.ndim != 2:
+        raise ValueError("Embedding vectors must share the same dimensions")
+
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return matrix / norms
+
+
+def compute_similarity_matrix(vectors1: List[list], vectors2: List[list]) -> Any:
+    """
+    Compute the full cosine similarity matrix between two vector sets.
+
+    Vectorized equivalent of calling compute_cosine_similarity for every
+    (vectors1[i], vectors2[j]) pair, done as a single float32 matmul.
+
+    Args:
+        vectors1: First set of embedding vectors (rows)
+        vectors2: Second set of embedding vectors (columns)
+
+    Returns:
+        numpy array of shape (len(vectors1), len(vectors2))
+    """
+    m1 = stack_normalized_vectors(vectors1)
+    m2 = stack_normalized_vectors(vectors2)
+    if m1.shape[1] != m2.shape[1]:
+        raise ValueError("Embedding vectors must share the same dimensions")
+    return m1 @ m2.T
+
+
 @dataclass
 class SAEEmbeddingResult:
     """Result from SAE embedding operation"""
@@ -645,6 +1087,115 @@ class SAEEmbeddingResult:
     error: Optional[str] = None
 
 
+def estimate_tokens(text: str, chars_per_token: float = 4.0) -> int:
+    """Approximate token count (4 chars ~ 1 token)."""
+    return max(1, int(len(text) / chars_per_token + 0.999))
+
+
+def plan_embedding_batches(
+    texts: List[str],
+    max_inputs: int,
+    max_tokens: int
+) -> List[List[int]]:
+    """
+    Split texts into request batches bounded by input count and tokens.
+
+    Args:
+        texts: Texts to embed
+        max_inputs: Maximum inputs per request
+        max_tokens: Maximum estimated tokens per request
+
+    Returns:
+        List of batches, each a list of indices into texts (order preserved)
+    """
+    batches: List[List[int]] = []
+    current: List[int] = []
+    current_tokens = 0
+
+    for idx, text in enumerate(texts):
+        tokens = estimate_tokens(text)
+        if current and (len(current) >= max_inputs or current_tokens + tokens > max_tokens):
+            batches.append(current)
+            current, current_tokens = [], 0
+        current.append(idx)
+        current_tokens += tokens
+
+    if current:
+        batches.append(current)
+    return batches
+
+
+def embed_texts_batched(
+    texts: List[str],
+    openai_client: Any,
+    model: str = "text-embedding-3-large",
+    batch_log: Optional[List[Dict[str, Any]]] = None
+) -> Tuple[Dict[int, list], Dict[int, str]]:
+    """
+    Embed texts with array-input requests sent concurrently.
+
+    Batches are bounded by embedding_batch_max_inputs and
+    embedding_batch_max_tokens and run on a pool of at most
+    embedding_batch_concurrency workers. A failed batch only fails its
+    own inputs.
+
+    Args:
+        texts: Texts to embed
+        openai_client: OpenAI client instance
+        model: Embedding model name
+        batch_log: Optional list that receives one stats dict per batch
+            (batch, inputs, est_tokens, latency_ms, status, error)
+
+    Returns:
+        Tuple of (vectors by text index, errors by text index)
+    """
+    vectors: Dict[int, list] = {}
+    errors: Dict[int, str] = {}
+    if not texts:
+        return vectors, errors
+
+    batches = plan_embedding_batches(
+        texts,
+        max_inputs=get_config("embedding_batch_max_inputs", 256),
+        max_tokens=get_config("embedding_batch_max_tokens", 100000),
+    )
+
+    def _send(batch_no: int, indices: List[int]) -> Dict[str, Any]:
+        inputs = [texts[i] for i in indices]
+        entry = {
+            "batch": batch_no,
+            "inputs": len(inputs),
+            "est_tokens": sum(estimate_tokens(t) for t in inputs),
+            "status": "OK",
+        }
+        start = time.time()
+        try:
+            response = openai_client.embeddings.create(model=model, input=inputs)
+            items = sorted(
+                enumerate(response.data),
+                key=lambda pair: getattr(pair[1], "index", pair[0])
+            )
+            if len(items) != len(indices):
+                raise ValueError(f"expected {len(indices)} embeddings, got {len(items)}")
+            for idx, (_, item) in zip(indices, items):
+                vectors[idx] = item.embedding
+        except Exception as e:
+            entry["status"] = "FAIL"
+            entry["error"] = str(e)
+            for idx in indices:
+                errors[idx] = str(e)
+        entry["latency_ms"] = int((time.time() - start) * 1000)
+        return entry
+
+    workers = max(1, min(get_config("embedding_batch_concurrency", 4), len(batches)))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        entries = list(executor.map(_send, range(1, len(batches) + 1), batches))
+
+    if batch_log is not None:
+        batch_log.extend(entries)
+    return vectors, errors
+
+
 def get_sae_embedding(
     clause_text: str,
     openai_client: Any,
@@ -667,30 +1218,76 @@ def get_sae_embedding(
     Returns:
         SAEEmbeddingResult with vector or error
     """
+    return get_sae_embeddings(
+        clause_texts=[clause_text],
+        openai_client=openai_client,
+        model=model,
+        max_tokens=max_tokens
+    )[0]
+
+
+def get_sae_embeddings(
+    clause_texts: List[str],
+    openai_client: Any,
+    model: str = "text-embedding-3-large",
+    max_tokens: int = 512,
+    batch_log: Optional[List[Dict[str, Any]]] = None
+) -> List[SAEEmbeddingResult]:
+    """
+    Batched sibling of get_sae_embedding.
+
+    Resolves every clause against the cache with one get_many call, sends
+    all misses through embed_texts_batched, and writes new embeddings back
+    with one put_many call. Duplicate clause texts are embedded once.
+
+    Args:
+        clause_texts: Clause texts to embed
+        openai_client: OpenAI client instance
+        model: Embedding model name
+        max_tokens: Max tokens for truncation
+        batch_log: Optional list that receives per-request batch stats
+
+    Returns:
+        List of SAEEmbeddingResult aligned with clause_texts
+    """
     cache = get_embedding_cache()
 
-    # Truncate with semantic safety
-    truncated = truncate_for_embedding(clause_text, max_tokens)
-    clause_hash = cache.compute_hash(truncated)
+    truncated_texts = [truncate_for_embedding(text, max_tokens) for text in clause_texts]
+    hashes = [cache.compute_hash(text) for text in truncated_texts]
 
-    # Check feature flag
-    if not is_flag_enabled("sae_intelligence_active"):
-        # Flag disabled - return empty result (placeholder behavior)
+    def _empty(clause_hash: str, error: str) -> SAEEmbeddingResult:
         return SAEEmbeddingResult(
             clause_hash=clause_hash,
             vector=None,
             model_version=model,
             dimensions=0,
             cached=False,
-            error="sae_intelligence_active flag is False"
+            error=error
         )
 
+    # Check feature flag
+    if not is_flag_enabled("sae_intelligence_active"):
+        return [_empty(h, "sae_intelligence_active flag is False") for h in hashes]
+
+    # One entry per unique hash: hash -> (truncated text, result)
+    unique: Dict[str, str] = {}
+    for clause_hash, text in zip(hashes, truncated_texts):
+        unique.setdefault(clause_hash, text)
+
+    resolved: Dict[str, SAEEmbeddingResult] = {}
+
     # Try cache first
-    cached_bytes = cache.get(truncated)
-    if cached_bytes is not None:
+    unique_hashes = list(unique.keys())
+    cached_rows = cache.get_many([unique[h] for h in unique_hashes])
+    for clause_hash, cached_bytes in zip(unique_hashes, cached_rows):
+        if cached_bytes is None:
+            continue
+        header = parse_vector_header(cached_bytes)
+        if header and header.model_version and header.model_version != model:
+            continue  # Embedded by a different model, re-embed
         vector = bytes_to_vector(cached_bytes)
         if vector:
-            return SAEEmbeddingResult(
+            resolved[clause_hash] = SAEEmbeddingResult(
                 clause_hash=clause_hash,
                 vector=vector,
                 model_version=model,
@@ -698,47 +1295,40 @@ def get_sae_embedding(
                 cached=True
             )
 
-    # Cache miss - call OpenAI API
-    if openai_client is None:
-        return SAEEmbeddingResult(
-            clause_hash=clause_hash,
-            vector=None,
-            model_version=model,
-            dimensions=0,
-            cached=False,
-            error="OpenAI client unavailable"
-        )
+    # Cache misses - batched OpenAI API requests
+    misses = [h for h in unique_hashes if h not in resolved]
+    to_store = []
 
-    try:
-        response = openai_client.embeddings.create(
-            model=model,
-            input=truncated
-        )
-        vector = response.data[0].embedding
-        dimensions = len(vector)
+    if misses and openai_client is None:
+        for clause_hash in misses:
+            resolved[clause_hash] = _empty(clause_hash, "OpenAI client unavailable")
+        misses = []
 
-        # Store in cache
-        cache.put(
-            clause_text=truncated,
-            embedding_vector=vectors_to_bytes(vector),
-            model_version=model,
-            vector_dimensions=dimensions
-        )
+    vectors, errors = embed_texts_batched(
+        [unique[h] for h in misses], openai_client, model, batch_log
+    )
 
-        return SAEEmbeddingResult(
+    for idx, clause_hash in enumerate(misses):
+        vector = vectors.get(idx)
+        if vector is None:
+            resolved[clause_hash] = _empty(clause_hash, errors.get(idx, "embedding missing"))
+            continue
+
+        resolved[clause_hash] = SAEEmbeddingResult(
             clause_hash=clause_hash,
             vector=vector,
             model_version=model,
-            dimensions=dimensions,
+            dimensions=len(vector),
             cached=False
         )
+        to_store.append((
+            unique[clause_hash],
+            vectors_to_bytes(vector, model_version=model),
+            model,
+            len(vector),
+        ))
 
-    except Exception as e:
-        return SAEEmbeddingResult(
-            clause_hash=clause_hash,
-            vector=None,
-            model_version=model,
-            dimensions=0,
-            cached=False,
-            error=str(e)
-        )
+    # Store in cache
+    cache.put_many(to_store)
+
+    return [resolved[h] for h in hashes]
@@ -5,6 +5,11 @@ Provides event persistence for replay and audit.
 """
 
 from .models import EventLogEntry
+from .notifier import (
+    EventNotifier,
+    EventSubscription,
+    get_event_notifier,
+)
 from .repository import (
     EventLogRepository,
     get_event_log_repository,
@@ -12,6 +17,9 @@ from .repository import (
 
 __all__ = [
     "EventLogEntry",
+    "EventNotifier",
+    "EventSubscription",
+    "get_event_notifier",
     "EventLogRepository",
     "get_event_log_repository",
 ]
@@ -0,0 +1,173 @@
+"""
+Event Notifier — P7.S2
+In-process publish/subscribe for newly appended events.
+
+Provides:
+- Per-session subscriptions that block until events arrive
+- Notification from EventLogRepository append/append_batch
+- Subscriber statistics
+
+Notifications carry no data: a woken subscriber reads the new events from
+the event log, so a missed or spurious wakeup never loses or duplicates an
+event. Appends made by other processes are not notified; SSE streams pick
+them up on their next keepalive wakeup.
+"""
+
+import logging
+import threading
+from typing import Dict, Iterable, Optional, Set
+
+logger = logging.getLogger("event_log.notifier")
+
+
+class EventSubscription:
+    """
+    Subscription to one session's appends.
+
+    The wakeup flag is level-triggered: an append between two waits makes
+    the next wait return immediately.
+    """
+
+    def __init__(self, notifier: "EventNotifier", session_id: str):
+        self.session_id = session_id
+        self._notifier = notifier
+        self._event = threading.Event()
+        self.closed = False
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """
+        Block until events are appended for the session or timeout.
+
+        Args:
+            timeout: Maximum seconds to wait (None waits indefinitely)
+
+        Returns:
+            True if woken by an append (or close), False on timeout
+        """
+        woken = self._event.wait(timeout)
+        if woken and not self.closed:
+            self._event.clear()
+        return woken
+
+    def notify(self) -> None:
+        """Wake the waiting subscriber."""
+        self._event.set()
+
+    def close(self) -> None:
+        """Unsubscribe and wake any waiter."""
+        if self.closed:
+            return
+        self.closed = True
+        self._notifier.unsubscribe(self)
+        self._event.set()
+
+    def __enter__(self) -> "EventSubscription":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+class EventNotifier:
+    """
+    Registry of subscriptions by session.
+    Thread-safe; notify is O(subscribers of the notified sessions).
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._subscriptions: Dict[str, Set[EventSubscription]] = {}
+        self._notifications = 0
+        self._wakeups = 0
+
+    def subscribe(self, session_id: str) -> EventSubscription:
+        """
+        Subscribe to appends for a session.
+
+        Subscribe before reading the log position so no append is missed.
+
+        Args:
+            session_id: Session identifier
+
+        Returns:
+            EventSubscription (close it when done)
+        """
+        subscription = EventSubscription(self, session_id)
+        with self._lock:
+            self._subscriptions.setdefault(session_id, set()).add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: EventSubscription) -> None:
+        """Remove a subscription."""
+        with self._lock:
+            subscribers = self._subscriptions.get(subscription.session_id)
+            if subscribers is None:
+                return
+            subscribers.discard(subscription)
+            if not subscribers:
+                del self._subscriptions[subscription.session_id]
+
+    def notify(self, session_ids: Iterable[str]) -> int:
+        """
+        Wake subscribers of the given sessions.
+
+        Args:
+            session_ids: Sessions that received new events
+
+        Returns:
+            Count of subscriptions woken
+        """
+        with self._lock:
+            targets = [
+                subscription
+                for session_id in set(session_ids)
+                for subscription in self._subscriptions.get(session_id, ())
+            ]
+            self._notifications += 1
+            self._wakeups += len(targets)
+
+        for subscription in targets:
+            subscription.notify()
+        return len(targets)
+
+    def subscriber_count(self, session_id: Optional[str] = None) -> int:
+        """Count subscriptions, for one session or overall."""
+        with self._lock:
+            if session_id is not None:
+                return len(self._subscriptions.get(session_id, ()))
+            return sum(len(s) for s in self._subscriptions.values())
+
+    def get_stats(self) -> dict:
+        """
+        Get notifier statistics.
+
+        Returns:
+            Dict with subscription and notification counts
+        """
+        with self._lock:
+            return {
+                "sessions_subscribed": len(self._subscriptions),
+                "subscriptions": sum(len(s) for s in self._subscriptions.values()),
+                "notifications": self._notifications,
+                "wakeups": self._wakeups,
+            }
+
+
+# Module-level singleton
+_default_notifier: Optional[EventNotifier] = None
+_default_notifier_lock = threading.Lock()
+
+
+def get_event_notifier() -> EventNotifier:
+    """
+    Get or create the process-wide event notifier.
+
+    Returns:
+        EventNotifier singleton
+    """
+    global _default_notifier
+    if _default_notifier is None:
+        with _default_notifier_lock:
+            if _default_notifier is None:
+                _default_notifier = EventNotifier()
+    return _default_notifier
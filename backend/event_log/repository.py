@@ -12,17 +12,30 @@ Provides:
 - TTL-based pruning
 - Max events per session enforcement
 - Sequence-based retrieval for replay
+- Cross-process sequence allocation (append_next_sequence)
+- Append notification for live subscribers
+- Optional write-behind batching with amortized pruning
+
+Write-behind mode queues appends and writes them in one transaction when
+flush_max_events are queued or flush_interval has passed. Every read
+flushes first, so replay never misses a queued event. Per-session counts
+are kept in memory and a session is pruned back to max_events only once it
+crosses the high-water mark. Queued events are flushed on close() and at
+interpreter exit.
 """
 
+import atexit
 import json
 import logging
 import sqlite3
 import threading
+import weakref
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import Callable, Dict, List, Optional, Set, Tuple
 
 from .models import EventLogEntry
+from .notifier import EventNotifier, EventSubscription, get_event_notifier
 
 logger = logging.getLogger("event_log.repository")
 
@@ -36,12 +49,20 @@ class EventLogRepository:
     # Defaults
     DEFAULT_TTL_HOURS = 1.0
     DEFAULT_MAX_EVENTS_PER_SESSION = 1000
+    DEFAULT_FLUSH_MAX_EVENTS = 200
+    DEFAULT_FLUSH_INTERVAL = 0.05  # seconds
+    PRUNE_HIGH_WATER_RATIO = 1.1  # write-behind prunes above max * ratio
+    SEQUENCE_RETRIES = 5  # append_next_sequence attempts on a sequence conflict
 
     def __init__(
         self,
         db_path: str = "data/cip_events.db",
         ttl_hours: float = DEFAULT_TTL_HOURS,
         max_events_per_session: int = DEFAULT_MAX_EVENTS_PER_SESSION,
+        notifier: Optional[EventNotifier] = None,
+        write_behind: bool = False,
+        flush_max_events: int = DEFAULT_FLUSH_MAX_EVENTS,
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL,
     ):
         """
         Initialize repository.
@@ -50,11 +71,42 @@ class EventLogRepository:
             db_path: Path to SQLite database file
             ttl_hours: Default time-to-live for events
             max_events_per_session: Maximum events to retain per session
+            notifier: Append notifier (defaults to the process-wide notifier)
+            write_behind: Queue appends and write them in batches
+            flush_max_events: Write-behind queue size that triggers a flush
+            flush_interval: Max seconds a queued event waits for a flush
         """
         self._db_path = db_path
         self._ttl_hours = ttl_hours
         self._max_events = max_events_per_session
+        self._notifier = notifier or get_event_notifier()
         self._lock = threading.Lock()
+
+        # Write-behind state
+        self._write_behind = write_behind
+        self._flush_max_events = max(1, flush_max_events)
+        self._flush_interval = flush_interval
+        self._high_water = max(
+            self._max_events + 1, int(self._max_events * self.PRUNE_HIGH_WATER_RATIO)
+        )
+        self._pending: List[EventLogEntry] = []
+        self._pending_ids: Set[str] = set()  # event_ids queued or in flight
+        self._pending_lock = threading.Lock()
+        self._flush_lock = threading.Lock()  # Held while a batch is in flight
+        self._pending_ready = threading.Event()
+        self._closing = threading.Event()
+        self._closed = False
+        self._flusher: Optional[threading.Thread] = None
+        self._session_counts: Dict[str, int] = {}
+        self._write_stats = {
+            "queued": 0,
+            "flushes": 0,
+            "flushed_events": 0,
+            "prunes": 0,
+            "flush_errors": 0,
+            "duplicates": 0,
+        }
+
         self._ensure_directory()
         self._ensure_schema()
 
@@ -66,12 +118,16 @@ class EventLogRepository:
         """Get database connection with row factory."""
         conn = sqlite3.connect(self._db_path, check_same_thread=False)
         conn.row_factory = sqlite3.Row
+        # WAL: one fsync per checkpoint instead of per commit
+        conn.execute("PRAGMA synchronous=NORMAL")
         return conn
 
     def _ensure_schema(self) -> None:
         """Create tables if not exist."""
         conn = self._get_connection()
         try:
+            # WAL lets SSE readers run while a batch is being written
+            conn.execute("PRAGMA journal_mode=WAL")
             conn.executescript("""
                 -- Event log table
                 CREATE TABLE IF NOT EXISTS event_log (
@@ -87,8 +143,6 @@ class EventLogRepository:
                 );
 
                 -- Indexes for common queries
-                CREATE INDEX IF NOT EXISTS idx_event_log_session_seq
-                    ON event_log(session_id, sequence);
                 CREATE INDEX IF NOT EXISTS idx_event_log_expires
                     ON event_log(expires_at);
                 CREATE INDEX IF NOT EXISTS idx_event_log_event_type
@@ -97,10 +151,98 @@ class EventLogRepository:
                     ON event_log(session_id, created_at);
             """)
             conn.commit()
+            self._ensure_unique_sequences(conn)
             logger.info(f"Event log schema initialized: {self._db_path}")
         finally:
             conn.close()
 
+    def _ensure_unique_sequences(self, conn: sqlite3.Connection) -> None:
+        """
+        One event per (session_id, sequence), so concurrent writers in
+        different processes cannot store the same sequence twice.
+
+        Replaces the earlier non-unique index; a database that already
+        holds duplicate sequences keeps the non-unique index.
+        """
+        try:
+            conn.execute("""
+                CREATE UNIQUE INDEX IF NOT EXISTS idx_event_log_session_seq_unique
+                    ON event_log(session_id, sequence)
+            """)
+            conn.execute("DROP INDEX IF EXISTS idx_event_log_session_seq")
+            conn.commit()
+        except sqlite3.IntegrityError:
+            conn.rollback()
+            logger.warning(f"Duplicate event sequences in {self._db_path}; sequence index left non-unique")
+            conn.execute("""
+                CREATE INDEX IF NOT EXISTS idx_event_log_session_seq
+                    ON event_log(session_id, sequence)
+            """)
+            conn.commit()
+
+    def append_next_sequence(
+        self,
+        session_id: str,
+        build: Callable[[int], EventLogEntry],
+        enforce_max: bool = True,
+    ) -> EventLogEntry:
+        """
+        Append an event with the session's next sequence number.
+
+        The latest sequence is read and the event inserted in one
+        BEGIN IMMEDIATE transaction, so processes sharing the database
+        allocate distinct, increasing sequences in the order their
+        events are stored. The event is always written synchronously
+        (queued write-behind events are flushed first). On a sequence
+        conflict the allocation is retried.
+
+        Args:
+            session_id: Session identifier
+            build: Returns the entry to store for a sequence number
+            enforce_max: If True, prune oldest if max exceeded
+
+        Returns:
+            The stored EventLogEntry
+
+        Raises:
+            sqlite3.IntegrityError: No free sequence after SEQUENCE_RETRIES
+        """
+        self._flush_pending()
+        with self._lock:
+            conn = self._get_connection()
+            try:
+                for attempt in range(1, self.SEQUENCE_RETRIES + 1):
+                    try:
+                        conn.execute("BEGIN IMMEDIATE")
+                        latest = conn.execute(
+                            "SELECT MAX(sequence) FROM event_log WHERE session_id = ?",
+                            (session_id,),
+                        ).fetchone()[0]
+                        entry = build((latest or 0) + 1)
+                        conn.execute("""
+                            INSERT INTO event_log (
+                                event_id, session_id, sequence, event_type,
+                                timestamp, payload, metadata, created_at, expires_at
+                            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                        """, self._entry_params(entry))
+                        conn.commit()
+                        break
+                    except sqlite3.IntegrityError:
+                        conn.rollback()
+                        if attempt == self.SEQUENCE_RETRIES:
+                            raise
+                        logger.warning(f"Sequence conflict, retrying: session={session_id}, attempt={attempt}")
+
+                if enforce_max:
+                    self._prune_excess_events(conn, session_id)
+                # Write-behind recounts this session on its next batch
+                self._session_counts.pop(session_id, None)
+            finally:
+                conn.close()
+
+        self._notifier.notify([session_id])
+        return entry
+
     def append(
         self,
         entry: EventLogEntry,
@@ -108,6 +250,12 @@ class EventLogRepository:
     ) -> bool:
         """
         Append event to log.
+        Subscribers of the session are notified after commit.
+
+        In write-behind mode the entry is queued and True is returned; an
+        event_id that is already queued or in flight returns False. A
+        duplicate of an event already written is skipped when the batch
+        is written.
         
         Args:
             entry: EventLogEntry to append
@@ -116,6 +264,16 @@ class EventLogRepository:
         Returns:
             True if appended successfully
         """
+        if self._write_behind:
+            return self._enqueue([entry]) == 1
+
+        appended = self._append_locked(entry, enforce_max)
+        if appended:
+            self._notifier.notify([entry.session_id])
+        return appended
+
+    def _append_locked(self, entry: EventLogEntry, enforce_max: bool) -> bool:
+        """Insert one event under the repository lock."""
         with self._lock:
             conn = self._get_connection()
             try:
@@ -125,17 +283,7 @@ class EventLogRepository:
                         event_id, session_id, sequence, event_type,
                         timestamp, payload, metadata, created_at, expires_at
                     ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """, (
-                    entry.event_id,
-                    entry.session_id,
-                    entry.sequence,
-                    entry.event_type,
-                    entry.timestamp,
-                    json.dumps(entry.payload) if entry.payload else None,
-                    json.dumps(entry.metadata) if entry.metadata else None,
-                    entry.created_at.isoformat(),
-                    entry.expires_at.isoformat() if entry.expires_at else None,
-                ))
+                """, self._entry_params(entry))
                 conn.commit()
 
                 # Enforce max events
@@ -154,16 +302,28 @@ class EventLogRepository:
     def append_batch(self, entries: List[EventLogEntry]) -> int:
         """
         Append multiple events atomically.
+        Subscribers of the affected sessions are notified after commit.
         
         Args:
             entries: List of EventLogEntry to append
             
         Returns:
-            Count of events appended
+            Count of events appended (queued, in write-behind mode,
+            not counting event_ids already queued)
         """
         if not entries:
             return 0
 
+        if self._write_behind:
+            return self._enqueue(entries)
+
+        count = self._append_batch_locked(entries)
+        if count:
+            self._notifier.notify(e.session_id for e in entries)
+        return count
+
+    def _append_batch_locked(self, entries: List[EventLogEntry]) -> int:
+        """Insert events in one transaction under the repository lock."""
         with self._lock:
             conn = self._get_connection()
             try:
@@ -175,17 +335,7 @@ class EventLogRepository:
                                 event_id, session_id, sequence, event_type,
                                 timestamp, payload, metadata, created_at, expires_at
                             ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-                        """, (
-                            entry.event_id,
-                            entry.session_id,
-                            entry.sequence,
-                            entry.event_type,
-                            entry.timestamp,
-                            json.dumps(entry.payload) if entry.payload else None,
-                            json.dumps(entry.metadata) if entry.metadata else None,
-                            entry.created_at.isoformat(),
-                            entry.expires_at.isoformat() if entry.expires_at else None,
-                        ))
+                        """, self._entry_params(entry))
                         count += 1
                     except sqlite3.IntegrityError:
                         continue  # Skip duplicates
@@ -201,6 +351,205 @@ class EventLogRepository:
             finally:
                 conn.close()
 
+    # ========================================================================
+    # WRITE-BEHIND
+    # ========================================================================
+
+    def _enqueue(self, entries: List[EventLogEntry]) -> int:
+        """
+        Queue entries for the next batch write.
+
+        Returns:
+            Count of entries accepted (event_ids not already queued)
+        """
+        with self._pending_lock:
+            closed = self._closed
+            if not closed:
+                accepted = []
+                for entry in entries:
+                    if entry.event_id in self._pending_ids:
+                        logger.warning(f"Duplicate event_id: {entry.event_id}")
+                        self._write_stats["duplicates"] += 1
+                        continue
+                    self._pending_ids.add(entry.event_id)
+                    accepted.append(entry)
+                self._pending.extend(accepted)
+                self._write_stats["queued"] += len(accepted)
+                flush_now = len(self._pending) >= self._flush_max_events
+                self._ensure_flusher()
+
+        if closed:
+            # After close() appends are written straight through
+            return self._write_batch_and_notify(list(entries))
+        if flush_now:
+            self.flush()
+        elif accepted:
+            self._pending_ready.set()
+        return len(accepted)
+
+    def _ensure_flusher(self) -> None:
+        """Start the background flusher (caller holds _pending_lock)."""
+        if self._flusher is not None:
+            return
+        self._flusher = threading.Thread(
+            target=self._flush_loop,
+            name="event-log-flusher",
+            daemon=True,
+        )
+        self._flusher.start()
+        _write_behind_repositories.add(self)
+
+    def _flush_loop(self) -> None:
+        """Flush queued events at most flush_interval after they arrive."""
+        while not self._closing.is_set():
+            self._pending_ready.wait()
+            if self._closing.wait(self._flush_interval):
+                return
+            self._pending_ready.clear()
+            self.flush()
+
+    def flush(self) -> int:
+        """
+        Write all queued events in one transaction.
+        No-op unless write-behind is enabled.
+        
+        Returns:
+            Count of events written
+        """
+        if not self._write_behind:
+            return 0
+
+        with self._flush_lock:
+            with self._pending_lock:
+                batch, self._pending = self._pending, []
+            if not batch:
+                return 0
+            try:
+                written = self._write_batch_and_notify(batch)
+            except sqlite3.Error as e:
+                logger.error(f"Event log flush failed: {e}", extra={"batch_size": len(batch)})
+                with self._pending_lock:
+                    self._pending[:0] = batch  # Retry on next flush
+                    self._write_stats["flush_errors"] += 1
+                return 0
+            with self._pending_lock:
+                self._pending_ids.difference_update(e.event_id for e in batch)
+            return written
+
+    def _write_batch_and_notify(self, batch: List[EventLogEntry]) -> int:
+        """Write a batch, then wake subscribers of the sessions written."""
+        count, session_ids = self._write_batch(batch)
+        if session_ids:
+            self._notifier.notify(session_ids)
+        return count
+
+    def _write_batch(self, batch: List[EventLogEntry]) -> Tuple[int, Set[str]]:
+        """
+        Insert a batch and prune sessions above the high-water mark,
+        in a single transaction.
+        
+        Returns:
+            (events inserted, session ids with inserted events)
+        """
+        by_session: Dict[str, List[EventLogEntry]] = {}
+        for entry in batch:
+            by_session.setdefault(entry.session_id, []).append(entry)
+
+        with self._lock:
+            conn = self._get_connection()
+            try:
+                total = 0
+                written: Set[str] = set()
+                for session_id, entries in by_session.items():
+                    cursor = conn.executemany("""
+                        INSERT OR IGNORE INTO event_log (
+                            event_id, session_id, sequence, event_type,
+                            timestamp, payload, metadata, created_at, expires_at
+                        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                    """, [self._entry_params(entry) for entry in entries])
+                    inserted = cursor.rowcount
+                    # Already written: dropped by INSERT OR IGNORE
+                    self._write_stats["duplicates"] += len(entries) - max(inserted, 0)
+                    if inserted <= 0:
+                        continue
+                    total += inserted
+                    written.add(session_id)
+
+                    count = self._session_counts.get(session_id)
+                    if count is None:
+                        count = conn.execute(
+                            "SELECT COUNT(*) as count FROM event_log WHERE session_id = ?",
+                            (session_id,),
+                        ).fetchone()["count"]
+                    else:
+                        count += inserted
+
+                    if count > self._high_water:
+                        count -= self._delete_oldest(conn, session_id, count - self._max_events)
+                        self._write_stats["prunes"] += 1
+                    self._session_counts[session_id] = count
+
+                conn.commit()
+                self._write_stats["flushes"] += 1
+                self._write_stats["flushed_events"] += total
+                logger.debug(f"Event log batch written: {total} events, {len(written)} sessions")
+                return total, written
+            finally:
+                conn.close()
+
+    def _flush_pending(self) -> None:
+        """Flush queued events before a read (write-behind only)."""
+        if self._write_behind:
+            self.flush()
+
+    def close(self) -> None:
+        """
+        Stop the flusher and durably write queued events.
+        Later appends are written straight through.
+        """
+        self._closing.set()
+        self._pending_ready.set()
+        if self._flusher is not None:
+            self._flusher.join(timeout=5.0)
+        with self._pending_lock:
+            self._closed = True
+        self.flush()
+        _write_behind_repositories.discard(self)
+
+    @staticmethod
+    def _entry_params(entry: EventLogEntry) -> tuple:
+        """Row values for an INSERT into event_log."""
+        return (
+            entry.event_id,
+            entry.session_id,
+            entry.sequence,
+            entry.event_type,
+            entry.timestamp,
+            json.dumps(entry.payload) if entry.payload else None,
+            json.dumps(entry.metadata) if entry.metadata else None,
+            entry.created_at.isoformat(),
+            entry.expires_at.isoformat() if entry.expires_at else None,
+        )
+
+    # ========================================================================
+    # READS
+    # ========================================================================
+
+    def subscribe(self, session_id: str) -> EventSubscription:
+        """
+        Subscribe to events appended for a session.
+
+        Subscribe before reading the latest sequence so that an append
+        in between still wakes the subscriber.
+
+        Args:
+            session_id: Session identifier
+
+        Returns:
+            EventSubscription (close it when done)
+        """
+        return self._notifier.subscribe(session_id)
+
     def get_events_from_sequence(
         self,
         session_id: str,
@@ -219,6 +568,7 @@ class EventLogRepository:
         Returns:
             List of EventLogEntry in sequence order
         """
+        self._flush_pending()
         with self._lock:
             conn = self._get_connection()
             try:
@@ -250,6 +600,7 @@ class EventLogRepository:
         Returns:
             List of EventLogEntry in sequence order
         """
+        self._flush_pending()
         with self._lock:
             conn = self._get_connection()
             try:
@@ -273,6 +624,20 @@ class EventLogRepository:
         Returns:
             Latest sequence number or None if no events
         """
+        if not self._write_behind:
+            return self._get_stored_latest_sequence(session_id)
+
+        # Queued events count without forcing a flush; holding the flush
+        # lock keeps an in-flight batch from being missed by both reads
+        with self._flush_lock:
+            with self._pending_lock:
+                queued = [e.sequence for e in self._pending if e.session_id == session_id]
+            stored = self._get_stored_latest_sequence(session_id)
+        candidates = queued + ([stored] if stored is not None else [])
+        return max(candidates) if candidates else None
+
+    def _get_stored_latest_sequence(self, session_id: str) -> Optional[int]:
+        """Latest sequence written to the database."""
         with self._lock:
             conn = self._get_connection()
             try:
@@ -295,6 +660,7 @@ class EventLogRepository:
         Returns:
             Event count
         """
+        self._flush_pending()
         with self._lock:
             conn = self._get_connection()
             try:
@@ -324,6 +690,7 @@ class EventLogRepository:
         Returns:
             List of (gap_start, gap_end) tuples
         """
+        self._flush_pending()
         with self._lock:
             conn = self._get_connection()
             try:
@@ -360,6 +727,7 @@ class EventLogRepository:
         Returns:
             Count of events pruned
         """
+        self._flush_pending()
         with self._lock:
             conn = self._get_connection()
             try:
@@ -370,6 +738,8 @@ class EventLogRepository:
                 """, (now,))
                 conn.commit()
                 count = cursor.rowcount
+                if count > 0:
+                    self._session_counts.clear()
                 if count > 0:
                     logger.info(f"Pruned {count} expired events")
                 return count
@@ -399,7 +769,22 @@ class EventLogRepository:
         if excess <= 0:
             return 0
 
-        # Delete oldest events
+        pruned = self._delete_oldest(conn, session_id, excess)
+        conn.commit()
+        return pruned
+
+    def _delete_oldest(self, conn: sqlite3.Connection, session_id: str, count: int) -> int:
+        """
+        Delete a session's oldest events (no commit).
+        
+        Args:
+            conn: Active connection
+            session_id: Session identifier
+            count: Number of events to delete
+            
+        Returns:
+            Count of events deleted
+        """
         cursor = conn.execute("""
             DELETE FROM event_log
             WHERE event_id IN (
@@ -408,8 +793,7 @@ class EventLogRepository:
                 ORDER BY sequence ASC
                 LIMIT ?
             )
-        """, (session_id, excess))
-        conn.commit()
+        """, (session_id, count))
 
         pruned = cursor.rowcount
         if pruned > 0:
@@ -426,6 +810,7 @@ class EventLogRepository:
         Returns:
             Count of events deleted
         """
+        self._flush_pending()
         with self._lock:
             conn = self._get_connection()
             try:
@@ -433,6 +818,7 @@ class EventLogRepository:
                     DELETE FROM event_log WHERE session_id = ?
                 """, (session_id,))
                 conn.commit()
+                self._session_counts.pop(session_id, None)
                 return cursor.rowcount
             finally:
                 conn.close()
@@ -458,6 +844,7 @@ class EventLogRepository:
         Returns:
             Dict with event counts and metadata
         """
+        self._flush_pending()
         with self._lock:
             conn = self._get_connection()
             try:
@@ -475,6 +862,10 @@ class EventLogRepository:
                     "max_events_per_session": self._max_events,
                     "ttl_hours": self._ttl_hours,
                     "db_path": self._db_path,
+                    "subscriptions": self._notifier.subscriber_count(),
+                    "write_behind": self._write_behind,
+                    "pending_events": len(self._pending),
+                    **self._write_stats,
                 }
             finally:
                 conn.close()
@@ -488,6 +879,7 @@ def get_event_log_repository(
     db_path: str = "data/cip_events.db",
     ttl_hours: float = 1.0,
     max_events: int = 1000,
+    write_behind: bool = False,
 ) -> EventLogRepository:
     """
     Get or create the default event log repository.
@@ -496,11 +888,30 @@ def get_event_log_repository(
         db_path: Database path (only used on first call)
         ttl_hours: Event TTL
         max_events: Max events per session
+        write_behind: Batch appends (only used on first call)
         
     Returns:
         EventLogRepository singleton
     """
     global _default_repository
     if _default_repository is None:
-        _default_repository = EventLogRepository(db_path, ttl_hours, max_events)
+        _default_repository = EventLogRepository(
+            db_path, ttl_hours, max_events, write_behind=write_behind
+        )
     return _default_repository
+
+
+# Write-behind repositories with a running flusher, flushed at exit
+_write_behind_repositories: "weakref.WeakSet[EventLogRepository]" = weakref.WeakSet()
+
+
+def _flush_write_behind_repositories() -> None:
+    """Durably write queued events before the interpreter exits."""
+    for repository in list(_write_behind_repositories):
+        try:
+            repository.close()
+        except Exception as e:
+            logger.error(f"Event log flush at exit failed: {e}")
+
+
+atexit.register(_flush_write_behind_repositories)
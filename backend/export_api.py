@@ -2,21 +2,29 @@
 CIP Data Export API
 
 Provides endpoints for exporting contract data:
-- /api/export/contracts - Export contracts as CSV, JSON, or Excel
+- /api/export/contracts - Export contracts as CSV, JSON, NDJSON, or Excel
 - /api/export/summary - Export summary report
 
 Supports filtering by status, type, risk level, and date range.
+
+Contract exports stream: the cursor is read EXPORT_FETCH_SIZE rows at a
+time and CSV/JSON/NDJSON output is yielded per chunk, so peak memory
+does not grow with the row count. Excel is written with a write-only
+workbook into a spooled temp file, then streamed from disk.
 """
 
 import csv
 import io
 import json
-import sqlite3
+import tempfile
+import textwrap
 from pathlib import Path
 from datetime import datetime
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Iterable, Iterator, Optional, Sequence, Tuple
+
+from flask import Blueprint, request, Response, jsonify, stream_with_context
 
-from flask import Blueprint, request, Response, jsonify
+from db_pool import get_connection
 
 # Create blueprint
 export_bp = Blueprint('export', __name__, url_prefix='/api/export')
@@ -48,13 +56,27 @@ DEFAULT_FIELDS = [
     'risk_level', 'contract_value', 'effective_date', 'expiration_date'
 ]
 
+# Rows fetched from the cursor per chunk
+EXPORT_FETCH_SIZE = 500
+
+# Excel files larger than this spill from memory to disk while being built
+EXPORT_SPOOL_MAX_BYTES = 8 * 1024 * 1024
+
+# Bytes per chunk when streaming a finished Excel file
+EXPORT_STREAM_CHUNK_BYTES = 64 * 1024
+
+# Rows sampled for Excel column widths
+EXCEL_WIDTH_SAMPLE_ROWS = 100
+
+XLSX_MIMETYPE = 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'
+
+# Row chunks: lists of value tuples in field order
+RowChunks = Iterable[Sequence[Tuple]]
+
 
 def get_db_connection():
-    """Get database connection with row factory."""
-    conn = sqlite3.connect(str(CONTRACTS_DB))
-    conn.row_factory = sqlite3.Row
-    conn.execute("PRAGMA foreign_keys = ON")
-    return conn
+    """Get pooled read-only database connection with row factory."""
+    return get_connection(CONTRACTS_DB, read_only=True)
 
 
 def build_export_query(
@@ -128,82 +150,201 @@ def format_value(value: Any, field: str) -> str:
     return str(value)
 
 
-def export_to_csv(rows: List[Dict], fields: List[str]) -> str:
-    """Export data to CSV string."""
+class ExportCursor:
+    """
+    Iterator over an export query's rows in chunks of tuples.
+
+    The query runs on construction, so errors surface before a response
+    is started. The pooled connection is returned when iteration ends or
+    close() is called, whichever comes first.
+    """
+
+    def __init__(self, query: str, params: List, fetch_size: Optional[int] = None):
+        self.fetch_size = fetch_size or EXPORT_FETCH_SIZE
+        self._conn = get_connection(CONTRACTS_DB, read_only=True, row_factory=None)
+        try:
+            self._cursor = self._conn.execute(query, params)
+        except Exception:
+            self.close()
+            raise
+
+    def __iter__(self) -> 'ExportCursor':
+        return self
+
+    def __next__(self) -> List[Tuple]:
+        if self._conn is None:
+            raise StopIteration
+        chunk = self._cursor.fetchmany(self.fetch_size)
+        if not chunk:
+            self.close()
+            raise StopIteration
+        return chunk
+
+    def close(self) -> None:
+        if self._conn is not None:
+            conn, self._conn = self._conn, None
+            conn.close()
+
+
+def iter_row_chunks(query: str, params: List, fetch_size: Optional[int] = None) -> ExportCursor:
+    """Execute an export query; iterate the result for row chunks."""
+    return ExportCursor(query, params, fetch_size)
+
+
+def _dict_chunks(rows: List[Dict], fields: List[str]) -> RowChunks:
+    """Adapt a list of row dicts to row chunks."""
+    return [[tuple(row.get(f) for f in fields) for row in rows]]
+
+
+def iter_csv(chunks: RowChunks, fields: List[str]) -> Iterator[str]:
+    """Yield CSV text: header, then one piece per row chunk."""
     output = io.StringIO()
     writer = csv.writer(output)
 
     # Header row with display names
-    headers = [EXPORT_FIELDS.get(f, f) for f in fields]
-    writer.writerow(headers)
+    writer.writerow([EXPORT_FIELDS.get(f, f) for f in fields])
+    yield output.getvalue()
 
-    # Data rows
-    for row in rows:
-        writer.writerow([format_value(row.get(f), f) for f in fields])
+    for chunk in chunks:
+        output.seek(0)
+        output.truncate()
+        writer.writerows([format_value(value, f) for value, f in zip(row, fields)] for row in chunk)
+        yield output.getvalue()
 
-    return output.getvalue()
 
+def iter_json(chunks: RowChunks, fields: List[str]) -> Iterator[str]:
+    """
+    Yield the JSON export document piece by piece.
 
-def export_to_json(rows: List[Dict], fields: List[str]) -> str:
-    """Export data to JSON string."""
-    # Filter to requested fields only
-    filtered_rows = [
-        {f: row.get(f) for f in fields}
-        for row in rows
-    ]
-    return json.dumps({
-        'contracts': filtered_rows,
-        'count': len(filtered_rows),
+    Output is identical to json.dumps({'contracts': [...], 'count': ...,
+    'fields': ..., 'exported_at': ...}, indent=2, default=str).
+    """
+    yield '{\n  "contracts": ['
+    count = 0
+    for chunk in chunks:
+        pieces = []
+        for row in chunk:
+            item = json.dumps(dict(zip(fields, row)), indent=2, default=str)
+            pieces.append(('\n' if count == 0 else ',\n') + textwrap.indent(item, '    '))
+            count += 1
+        yield ''.join(pieces)
+
+    tail = json.dumps({
+        'count': count,
         'fields': fields,
         'exported_at': datetime.now().isoformat()
     }, indent=2, default=str)
+    yield ('\n  ],' if count else '],') + tail[1:]
 
 
-def export_to_excel(rows: List[Dict], fields: List[str]) -> bytes:
-    """Export data to Excel bytes (using CSV as fallback if openpyxl not available)."""
+def iter_ndjson(chunks: RowChunks, fields: List[str]) -> Iterator[str]:
+    """Yield newline-delimited JSON, one contract object per line."""
+    for chunk in chunks:
+        yield ''.join(json.dumps(dict(zip(fields, row)), default=str) + '\n' for row in chunk)
+
+
+def write_excel(chunks: RowChunks, fields: List[str], fileobj) -> bool:
+    """
+    Write an Excel workbook to a binary file object.
+
+    Uses a write-only workbook, so rows are not kept in memory. Column
+    widths are sized from the first EXCEL_WIDTH_SAMPLE_ROWS rows.
+
+    Returns:
+        False if openpyxl is not installed (nothing written)
+    """
     try:
         from openpyxl import Workbook
+        from openpyxl.cell import WriteOnlyCell
         from openpyxl.styles import Font, PatternFill, Alignment
+        from openpyxl.utils import get_column_letter
+    except ImportError:
+        return False
+
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet("Contracts")
+    chunks = iter(chunks)
+    first = next(chunks, [])
+
+    # Auto-adjust column widths (must precede the first row in write-only mode)
+    for col_idx, field in enumerate(fields):
+        max_length = len(EXPORT_FIELDS.get(field, field))
+        for row in first[:EXCEL_WIDTH_SAMPLE_ROWS]:
+            max_length = max(max_length, len(str(row[col_idx])))
+        ws.column_dimensions[get_column_letter(col_idx + 1)].width = min(max_length + 2, 50)
+
+    # Header style
+    header_font = Font(bold=True, color="FFFFFF")
+    header_fill = PatternFill(start_color="4F46E5", end_color="4F46E5", fill_type="solid")
+    headers = []
+    for field in fields:
+        cell = WriteOnlyCell(ws, value=EXPORT_FIELDS.get(field, field))
+        cell.font = header_font
+        cell.fill = header_fill
+        cell.alignment = Alignment(horizontal='center')
+        headers.append(cell)
+    ws.append(headers)
 
-        wb = Workbook()
-        ws = wb.active
-        ws.title = "Contracts"
-
-        # Header style
-        header_font = Font(bold=True, color="FFFFFF")
-        header_fill = PatternFill(start_color="4F46E5", end_color="4F46E5", fill_type="solid")
-
-        # Headers
-        headers = [EXPORT_FIELDS.get(f, f) for f in fields]
-        for col, header in enumerate(headers, 1):
-            cell = ws.cell(row=1, column=col, value=header)
-            cell.font = header_font
-            cell.fill = header_fill
-            cell.alignment = Alignment(horizontal='center')
-
-        # Data rows
-        for row_idx, row in enumerate(rows, 2):
-            for col_idx, field in enumerate(fields, 1):
-                value = row.get(field)
-                ws.cell(row=row_idx, column=col_idx, value=value)
-
-        # Auto-adjust column widths
-        for col_idx, field in enumerate(fields, 1):
-            max_length = len(EXPORT_FIELDS.get(field, field))
-            for row in rows[:100]:  # Sample first 100 rows
-                val = str(row.get(field, ""))
-                max_length = max(max_length, len(val))
-            ws.column_dimensions[ws.cell(row=1, column=col_idx).column_letter].width = min(max_length + 2, 50)
-
-        # Save to bytes
-        output = io.BytesIO()
-        wb.save(output)
-        output.seek(0)
-        return output.getvalue()
+    # Data rows
+    for row in first:
+        ws.append(row)
+    for chunk in chunks:
+        for row in chunk:
+            ws.append(row)
 
-    except ImportError:
+    wb.save(fileobj)
+    return True
+
+
+def spool_excel(chunks: RowChunks, fields: List[str]) -> Optional[tempfile.SpooledTemporaryFile]:
+    """
+    Build an Excel export in a spooled temp file.
+
+    Returns:
+        Temp file positioned at 0, or None if openpyxl is not installed
+    """
+    spool = tempfile.SpooledTemporaryFile(max_size=EXPORT_SPOOL_MAX_BYTES, suffix='.xlsx')
+    try:
+        if not write_excel(chunks, fields, spool):
+            spool.close()
+            return None
+    except Exception:
+        spool.close()
+        raise
+    spool.seek(0)
+    return spool
+
+
+def iter_file(fileobj, chunk_size: Optional[int] = None) -> Iterator[bytes]:
+    """Yield a file's contents in chunks, closing it at the end."""
+    chunk_size = chunk_size or EXPORT_STREAM_CHUNK_BYTES
+    try:
+        while True:
+            data = fileobj.read(chunk_size)
+            if not data:
+                break
+            yield data
+    finally:
+        fileobj.close()
+
+
+def export_to_csv(rows: List[Dict], fields: List[str]) -> str:
+    """Export data to CSV string."""
+    return ''.join(iter_csv(_dict_chunks(rows, fields), fields))
+
+
+def export_to_json(rows: List[Dict], fields: List[str]) -> str:
+    """Export data to JSON string."""
+    return ''.join(iter_json(_dict_chunks(rows, fields), fields))
+
+
+def export_to_excel(rows: List[Dict], fields: List[str]) -> bytes:
+    """Export data to Excel bytes (using CSV as fallback if openpyxl not available)."""
+    spool = spool_excel(_dict_chunks(rows, fields), fields)
+    if spool is None:
         # Fallback to CSV if openpyxl not installed
         return export_to_csv(rows, fields).encode('utf-8')
+    return b''.join(iter_file(spool))
 
 
 @export_bp.route('/contracts', methods=['GET'])
@@ -212,7 +353,7 @@ def export_contracts():
     Export contracts data.
 
     Query params:
-        - format: csv|json|xlsx (default: csv)
+        - format: csv|json|ndjson|xlsx (default: csv)
         - status: comma-separated list (e.g., active,negotiating)
         - type: comma-separated contract types (e.g., MSA,SOW)
         - risk: comma-separated risk levels (e.g., HIGH,CRITICAL)
@@ -222,7 +363,7 @@ def export_contracts():
         - include_archived: true to include archived contracts
 
     Returns:
-        File download in requested format
+        File download in requested format, streamed in chunks
     """
     # Parse parameters
     export_format = request.args.get('format', 'csv').lower()
@@ -255,45 +396,51 @@ def export_contracts():
         include_archived=include_archived
     )
 
-    conn = get_db_connection()
-    cursor = conn.cursor()
-    cursor.execute(query, params)
-    rows = [dict(row) for row in cursor.fetchall()]
-    conn.close()
-
     # Generate filename
     timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
 
-    # Export based on format
-    if export_format == 'json':
-        content = export_to_json(rows, valid_fields)
+    def download(body, mimetype: str, extension: str) -> Response:
         return Response(
-            content,
-            mimetype='application/json',
+            body,
+            mimetype=mimetype,
             headers={
-                'Content-Disposition': f'attachment; filename=contracts_export_{timestamp}.json'
+                'Content-Disposition': f'attachment; filename=contracts_export_{timestamp}.{extension}'
             }
         )
 
+    def stream(generate):
+        chunks = iter_row_chunks(query, params)
+
+        def body():
+            try:
+                yield from generate(chunks, valid_fields)
+            finally:
+                # Also runs when the client disconnects mid-download
+                chunks.close()
+        # Keep the request context until the last chunk
+        return stream_with_context(body())
+
+    # Export based on format
+    if export_format == 'json':
+        return download(stream(iter_json), 'application/json', 'json')
+
+    elif export_format == 'ndjson':
+        return download(stream(iter_ndjson), 'application/x-ndjson', 'ndjson')
+
     elif export_format in ('xlsx', 'excel'):
-        content = export_to_excel(rows, valid_fields)
-        return Response(
-            content,
-            mimetype='application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
-            headers={
-                'Content-Disposition': f'attachment; filename=contracts_export_{timestamp}.xlsx'
-            }
-        )
+        # Zip container: built completely (on disk past the spool size) before sending
+        chunks = iter_row_chunks(query, params)
+        try:
+            spool = spool_excel(chunks, valid_fields)
+        finally:
+            chunks.close()
+        if spool is None:
+            # Fallback to CSV if openpyxl not installed
+            return download(stream(iter_csv), XLSX_MIMETYPE, 'xlsx')
+        return download(iter_file(spool), XLSX_MIMETYPE, 'xlsx')
 
     else:  # Default to CSV
-        content = export_to_csv(rows, valid_fields)
-        return Response(
-            content,
-            mimetype='text/csv',
-            headers={
-                'Content-Disposition': f'attachment; filename=contracts_export_{timestamp}.csv'
-            }
-        )
+        return download(stream(iter_csv), 'text/csv', 'csv')
 
 
 @export_bp.route('/contracts/preview', methods=['GET'])
@@ -11,15 +11,36 @@ Endpoints:
 - /api/contracts/health - Get health scores for all contracts
 - /api/contracts/<id>/health - Get health score for single contract
 - /api/dashboard/health - Get aggregated health summary
+
+The list and dashboard endpoints read from a per-contract score cache
+(HealthScoreCache). Triggers on `contracts` append changed contract ids
+to health_score_changes; a request compares the last change sequence
+(one-row lookup) and rescores only the contracts that changed, or
+everything once per day since expiration and review scores are
+date-relative. Filtering, ordering and limiting run over the cached
+scores, so only the returned rows are turned into response dicts. The
+triggers are created when the blueprint is registered (or by
+migrations/add_snapshot_triggers.py), never from a request.
 """
 
+import heapq
+import logging
+import os
 import sqlite3
+import threading
+import time
+from collections import namedtuple
 from pathlib import Path
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 from typing import Dict, List, Any, Optional, Tuple
 
 from flask import Blueprint, request, jsonify
 
+from db_pool import get_connection
+from versioned_snapshot import VersionedSnapshotCache
+
+logger = logging.getLogger(__name__)
+
 # Create blueprint
 health_bp = Blueprint('health', __name__)
 
@@ -91,19 +112,40 @@ HEALTH_GRADES = {
     'F': {'min': 0, 'color': '#EF4444', 'label': 'Critical'},
 }
 
+# Columns scored by the list and dashboard endpoints. Metadata fields not
+# selected here count as missing in those views (the detail endpoint
+# scores the full row).
+HEALTH_SCORED_COLUMNS = (
+    'id', 'title', 'counterparty', 'contract_type', 'status',
+    'risk_level', 'expiration_date', 'contract_value', 'updated_at',
+)
+
+# Change log written by triggers on `contracts`
+HEALTH_CHANGE_TABLE = 'health_score_changes'
+
+# Change log entries kept; a cache further behind than this rescans
+HEALTH_CHANGE_LOG_LIMIT = 10000
+
+# Seconds cached scores are trusted when the triggers cannot be installed
+HEALTH_FALLBACK_TTL_SECONDS = 5.0
+
+# Rows fetched per IN (...) query when refreshing changed contracts
+HEALTH_REFRESH_CHUNK = 500
+
 
 def get_db_connection():
-    """Get database connection with row factory."""
-    conn = sqlite3.connect(str(CONTRACTS_DB))
-    conn.row_factory = sqlite3.Row
-    conn.execute("PRAGMA foreign_keys = ON")
-    return conn
+    """Get pooled read-only database connection with row factory."""
+    return get_connection(CONTRACTS_DB, read_only=True)
 
 
-def calculate_expiration_score(expiration_date: Optional[str]) -> Tuple[int, str]:
+def calculate_expiration_score(expiration_date: Optional[str], today: Optional[date] = None) -> Tuple[int, str]:
     """
     Calculate expiration urgency score.
 
+    Args:
+        expiration_date: YYYY-MM-DD
+        today: Reference date (default: local today)
+
     Returns:
         Tuple of (score, reason)
     """
@@ -112,7 +154,7 @@ def calculate_expiration_score(expiration_date: Optional[str]) -> Tuple[int, str
 
     try:
         exp_date = datetime.strptime(expiration_date, '%Y-%m-%d').date()
-        today = datetime.now().date()
+        today = today or datetime.now().date()
         days_until = (exp_date - today).days
 
         if days_until < 0:
@@ -188,10 +230,14 @@ def calculate_metadata_score(contract: Dict) -> Tuple[int, str, List[str]]:
     return (score, reason, missing)
 
 
-def calculate_review_score(updated_at: Optional[str]) -> Tuple[int, str]:
+def calculate_review_score(updated_at: Optional[str], today: Optional[date] = None) -> Tuple[int, str]:
     """
     Calculate review recency score.
 
+    Args:
+        updated_at: Last update timestamp
+        today: Reference date (default: local today)
+
     Returns:
         Tuple of (score, reason)
     """
@@ -205,7 +251,7 @@ def calculate_review_score(updated_at: Optional[str]) -> Tuple[int, str]:
         else:
             update_date = datetime.strptime(updated_at[:10], '%Y-%m-%d').date()
 
-        today = datetime.now().date()
+        today = today or datetime.now().date()
         days_since = (today - update_date).days
 
         thresholds = HEALTH_CONFIG['review']['thresholds']
@@ -223,18 +269,22 @@ def calculate_review_score(updated_at: Optional[str]) -> Tuple[int, str]:
         return (0, "Invalid update date")
 
 
-def calculate_health_score(contract: Dict) -> Dict[str, Any]:
+def calculate_health_score(contract: Dict, today: Optional[date] = None) -> Dict[str, Any]:
     """
     Calculate complete health score for a contract.
 
+    Args:
+        contract: Contract row
+        today: Reference date for expiration/review (default: local today)
+
     Returns:
         Dict with total score, grade, and component breakdown
     """
     # Calculate component scores
-    exp_score, exp_reason = calculate_expiration_score(contract.get('expiration_date'))
+    exp_score, exp_reason = calculate_expiration_score(contract.get('expiration_date'), today)
     risk_score, risk_reason = calculate_risk_score(contract.get('risk_level'))
     meta_score, meta_reason, missing_fields = calculate_metadata_score(contract)
-    review_score, review_reason = calculate_review_score(contract.get('updated_at'))
+    review_score, review_reason = calculate_review_score(contract.get('updated_at'), today)
 
     # Calculate total
     total_score = exp_score + risk_score + meta_score + review_score
@@ -280,6 +330,364 @@ def calculate_health_score(contract: Dict) -> Dict[str, Any]:
     }
 
 
+# Contract ids logged on every insert, delete or update of a scored column
+_HEALTH_TRIGGER_SQL = f"""
+    CREATE TABLE IF NOT EXISTS {HEALTH_CHANGE_TABLE} (
+        seq INTEGER PRIMARY KEY AUTOINCREMENT,
+        contract_id INTEGER NOT NULL
+    );
+    CREATE TRIGGER IF NOT EXISTS trg_contracts_health_insert
+    AFTER INSERT ON contracts BEGIN
+        INSERT INTO {HEALTH_CHANGE_TABLE} (contract_id) VALUES (NEW.id);
+        DELETE FROM {HEALTH_CHANGE_TABLE}
+        WHERE seq <= (SELECT MAX(seq) FROM {HEALTH_CHANGE_TABLE}) - {HEALTH_CHANGE_LOG_LIMIT};
+    END;
+    CREATE TRIGGER IF NOT EXISTS trg_contracts_health_delete
+    AFTER DELETE ON contracts BEGIN
+        INSERT INTO {HEALTH_CHANGE_TABLE} (contract_id) VALUES (OLD.id);
+        DELETE FROM {HEALTH_CHANGE_TABLE}
+        WHERE seq <= (SELECT MAX(seq) FROM {HEALTH_CHANGE_TABLE}) - {HEALTH_CHANGE_LOG_LIMIT};
+    END;
+    CREATE TRIGGER IF NOT EXISTS trg_contracts_health_update
+    AFTER UPDATE OF {', '.join(HEALTH_SCORED_COLUMNS)}, archived ON contracts BEGIN
+        INSERT INTO {HEALTH_CHANGE_TABLE} (contract_id) SELECT OLD.id WHERE OLD.id IS NOT NEW.id;
+        INSERT INTO {HEALTH_CHANGE_TABLE} (contract_id) VALUES (NEW.id);
+        DELETE FROM {HEALTH_CHANGE_TABLE}
+        WHERE seq <= (SELECT MAX(seq) FROM {HEALTH_CHANGE_TABLE}) - {HEALTH_CHANGE_LOG_LIMIT};
+    END;
+"""
+
+_HEALTH_SCAN_SQL = f"SELECT {', '.join(HEALTH_SCORED_COLUMNS)}, archived FROM contracts"
+
+# contract: scored row; active: not archived
+ScoredContract = namedtuple('ScoredContract', ['contract', 'health', 'active'])
+
+_RISK_SORT_ORDER = {'CRITICAL': 0, 'HIGH': 1, 'MEDIUM': 2, 'LOW': 3, None: 4}
+
+
+def _score_row(row: sqlite3.Row, today: date) -> ScoredContract:
+    """Score one contracts row (archived is not part of the scored dict)."""
+    contract = {column: row[column] for column in HEALTH_SCORED_COLUMNS}
+    archived = row['archived']
+    return ScoredContract(contract, calculate_health_score(contract, today), archived is None or archived == 0)
+
+
+def _grade_for(score: float) -> str:
+    for g, info in HEALTH_GRADES.items():
+        if score >= info['min']:
+            return g
+    return 'F'
+
+
+def _distribution_bucket(score: int) -> str:
+    if score >= 90:
+        return 'excellent'
+    if score >= 75:
+        return 'good'
+    if score >= 60:
+        return 'fair'
+    if score >= 40:
+        return 'poor'
+    return 'critical'
+
+
+class HealthTally:
+    """
+    Running dashboard totals over non-archived contracts.
+
+    Snapshots refreshed for a few contracts copy the previous tally and
+    remove/add just those entries.
+    """
+
+    def __init__(self, entries=()):
+        self.count = 0
+        self.total = 0
+        self.grades = {'A': 0, 'B': 0, 'C': 0, 'D': 0, 'F': 0}
+        self.components = {'expiration': 0, 'risk': 0, 'metadata': 0, 'review': 0}
+        self.distribution = {'excellent': 0, 'good': 0, 'fair': 0, 'poor': 0, 'critical': 0}
+        # id -> entry for scores below 40 (alert candidates)
+        self.critical: Dict[int, ScoredContract] = {}
+        for entry in entries:
+            self.add(entry)
+
+    def copy(self) -> 'HealthTally':
+        tally = HealthTally()
+        tally.count = self.count
+        tally.total = self.total
+        tally.grades = dict(self.grades)
+        tally.components = dict(self.components)
+        tally.distribution = dict(self.distribution)
+        tally.critical = dict(self.critical)
+        return tally
+
+    def add(self, entry: ScoredContract, sign: int = 1) -> None:
+        """Count an entry (sign=-1 removes it)."""
+        if not entry.active:
+            return
+        health = entry.health
+        score = health['total_score']
+        self.count += sign
+        self.total += sign * score
+        self.grades[health['grade']] = self.grades.get(health['grade'], 0) + sign
+        for name in self.components:
+            self.components[name] += sign * health['components'][name]['score']
+        self.distribution[_distribution_bucket(score)] += sign
+        if score < 40:
+            if sign > 0:
+                self.critical[entry.contract['id']] = entry
+            else:
+                self.critical.pop(entry.contract['id'], None)
+
+    def remove(self, entry: ScoredContract) -> None:
+        self.add(entry, sign=-1)
+
+
+class HealthScores:
+    """
+    Health scores for every contract as of one change sequence and day.
+
+    Orderings and the dashboard summary are memoized per snapshot; treat
+    results as read-only.
+    """
+
+    def __init__(self, entries: Dict[int, ScoredContract], today: date, version: Optional[int] = None,
+                 tally: Optional[HealthTally] = None):
+        self.entries = entries
+        self.today = today
+        self.version = version
+        self.tally = tally if tally is not None else HealthTally(entries.values())
+        self.built_at = time.time()
+        self._memo: Dict[Tuple, Any] = {}
+
+    def _memoized(self, key: Tuple, compute):
+        result = self._memo.get(key)
+        if result is None:
+            result = self._memo[key] = compute()
+        return result
+
+    def ordered(self, sort_by: str = 'score', descending: bool = True) -> List[ScoredContract]:
+        """
+        All contracts in endpoint order: id order, then a stable sort on
+        score, expiration date or risk level (unknown sort keys keep id order).
+        """
+        if sort_by not in ('score', 'expiration', 'risk'):
+            sort_by, descending = None, False
+
+        def compute():
+            by_id = [self.entries[contract_id] for contract_id in sorted(self.entries)]
+            if sort_by == 'score':
+                by_id.sort(key=lambda e: e.health['total_score'], reverse=descending)
+            elif sort_by == 'expiration':
+                by_id.sort(key=lambda e: e.contract['expiration_date'] or '9999-12-31', reverse=descending)
+            elif sort_by == 'risk':
+                by_id.sort(key=lambda e: _RISK_SORT_ORDER.get(e.contract['risk_level'], 4), reverse=descending)
+            return by_id
+        return self._memoized(('ordered', sort_by, descending), compute)
+
+    def select(
+        self,
+        min_score: Optional[int] = None,
+        max_score: Optional[int] = None,
+        grade: Optional[str] = None,
+        status: Optional[str] = None,
+        include_archived: bool = False,
+        sort_by: str = 'score',
+        descending: bool = True,
+        limit: int = 100
+    ) -> List[ScoredContract]:
+        """
+        Filter, order and limit. Falsy min_score/max_score/grade/status
+        mean no filter, as in the endpoint's query params.
+        """
+        results = []
+        for entry in self.ordered(sort_by, descending):
+            if limit >= 0 and len(results) >= limit:
+                break
+            if not include_archived and not entry.active:
+                continue
+            if status and entry.contract['status'] != status:
+                continue
+            score = entry.health['total_score']
+            if min_score and score < min_score:
+                continue
+            if max_score and score > max_score:
+                continue
+            if grade and entry.health['grade'] != grade:
+                continue
+            results.append(entry)
+        return results if limit >= 0 else results[:limit]
+
+    def dashboard(self) -> Optional[Dict[str, Any]]:
+        """Portfolio summary over non-archived contracts (None when empty)."""
+        def compute():
+            tally = self.tally
+            if not tally.count:
+                return {}
+            avg_score = tally.total / tally.count
+            portfolio_grade = _grade_for(avg_score)
+
+            # Top 10 most critical (score < 40), lowest first, ties in id order
+            critical = heapq.nsmallest(
+                10, tally.critical.values(),
+                key=lambda e: (e.health['total_score'], e.contract['id'])
+            )
+            alerts = [{
+                'contract_id': e.contract['id'],
+                'title': e.contract['title'],
+                'score': e.health['total_score'],
+                'grade': e.health['grade'],
+                'primary_issue': get_primary_issue(e.health)
+            } for e in critical]
+
+            return {
+                'portfolio_score': round(avg_score, 1),
+                'portfolio_grade': portfolio_grade,
+                'portfolio_grade_label': HEALTH_GRADES[portfolio_grade]['label'],
+                'portfolio_grade_color': HEALTH_GRADES[portfolio_grade]['color'],
+                'total_contracts': tally.count,
+                'by_grade': dict(tally.grades),
+                'component_averages': {k: round(v / tally.count, 1) for k, v in tally.components.items()},
+                'critical_alerts': alerts,
+                'score_distribution': dict(tally.distribution),
+            }
+        return self._memoized(('dashboard',), compute) or None
+
+
+class HealthScoreCache(VersionedSnapshotCache):
+    """
+    Current HealthScores for one database.
+
+    get() returns the cached snapshot while the change log and the day are
+    unchanged. Otherwise it rescores, under a lock, only the contracts
+    logged since the snapshot (all of them on a new day, after log
+    pruning, or without triggers).
+    """
+
+    label = 'Health score'
+    version_table = HEALTH_CHANGE_TABLE
+    trigger_names = (
+        'trg_contracts_health_insert',
+        'trg_contracts_health_delete',
+        'trg_contracts_health_update',
+    )
+    trigger_sql = _HEALTH_TRIGGER_SQL
+    fallback_ttl_seconds = HEALTH_FALLBACK_TTL_SECONDS
+
+    def __init__(self, db_path):
+        super().__init__(db_path)
+        self._metrics.update({
+            'full_builds': 0,
+            'incremental_updates': 0,
+            'rescored': 0,
+        })
+
+    def _read_version(self, conn: sqlite3.Connection) -> Optional[int]:
+        return conn.execute(f"SELECT COALESCE(MAX(seq), 0) FROM {HEALTH_CHANGE_TABLE}").fetchone()[0]
+
+    def _matches(self, snapshot: HealthScores, today: date) -> bool:
+        return snapshot.today == today
+
+    def _row_count(self, snapshot: HealthScores) -> int:
+        return len(snapshot.entries)
+
+    def _changed_ids(self, conn: sqlite3.Connection, snapshot: Optional[HealthScores]) -> Optional[List[int]]:
+        """Contract ids logged since the snapshot; None if a full scan is needed."""
+        if snapshot is None or snapshot.version is None or not self._triggers_installed:
+            return None
+        oldest = conn.execute(f"SELECT MIN(seq) FROM {HEALTH_CHANGE_TABLE}").fetchone()[0]
+        if oldest is not None and oldest > snapshot.version + 1:
+            return None  # Entries we have not seen were pruned
+        rows = conn.execute(
+            f"SELECT DISTINCT contract_id FROM {HEALTH_CHANGE_TABLE} WHERE seq > ?", (snapshot.version,)
+        ).fetchall()
+        return [row[0] for row in rows]
+
+    def _build(self, conn: sqlite3.Connection, snapshot: Optional[HealthScores],
+               seq: Optional[int], today: date) -> HealthScores:
+        changed = self._changed_ids(conn, snapshot)
+        rescored = 0
+
+        if changed is None:
+            entries = {}
+            previous = snapshot.entries if snapshot is not None and snapshot.today == today else {}
+            for row in conn.execute(_HEALTH_SCAN_SQL):
+                cached = previous.get(row['id'])
+                archived = row['archived']
+                if cached is not None and cached.active == (archived is None or archived == 0) and \
+                        all(cached.contract[c] == row[c] for c in HEALTH_SCORED_COLUMNS):
+                    entries[row['id']] = cached
+                else:
+                    entries[row['id']] = _score_row(row, today)
+                    rescored += 1
+            self._metrics['full_builds'] += 1
+        else:
+            if snapshot.today == today:
+                entries = dict(snapshot.entries)
+                tally = snapshot.tally.copy()
+            else:
+                # Date-relative components moved: rescore cached rows
+                entries = {
+                    contract_id: ScoredContract(e.contract, calculate_health_score(e.contract, today), e.active)
+                    for contract_id, e in snapshot.entries.items()
+                }
+                tally = HealthTally(entries.values())
+                rescored += len(entries)
+            for i in range(0, len(changed), HEALTH_REFRESH_CHUNK):
+                chunk = changed[i:i + HEALTH_REFRESH_CHUNK]
+                for contract_id in chunk:
+                    removed = entries.pop(contract_id, None)
+                    if removed is not None:
+                        tally.remove(removed)
+                placeholders = ', '.join('?' * len(chunk))
+                for row in conn.execute(f"{_HEALTH_SCAN_SQL} WHERE id IN ({placeholders})", chunk):
+                    entry = entries[row['id']] = _score_row(row, today)
+                    tally.add(entry)
+                    rescored += 1
+            self._metrics['incremental_updates'] += 1
+            self._metrics['rescored'] += rescored
+            return HealthScores(entries, today, seq, tally)
+
+        self._metrics['rescored'] += rescored
+        return HealthScores(entries, today, seq)
+
+    def get(self, today: Optional[date] = None) -> HealthScores:
+        """Current scores, refreshed if contracts changed or the day rolled over."""
+        return self.get_snapshot(today or datetime.now().date())
+
+    def get_stats(self) -> Dict[str, Any]:
+        snapshot = self._snapshot
+        return {
+            **super().get_stats(),
+            'today': snapshot.today.isoformat() if snapshot else None,
+        }
+
+
+_HEALTH_CACHES: Dict[str, HealthScoreCache] = {}
+_HEALTH_CACHES_LOCK = threading.Lock()
+
+
+def get_health_score_cache(db_path=None) -> HealthScoreCache:
+    """Get (or create) the health score cache for a database (default CONTRACTS_DB)."""
+    key = os.path.abspath(str(db_path or CONTRACTS_DB))
+    cache = _HEALTH_CACHES.get(key)
+    if cache is None:
+        with _HEALTH_CACHES_LOCK:
+            cache = _HEALTH_CACHES.get(key)
+            if cache is None:
+                cache = _HEALTH_CACHES[key] = HealthScoreCache(key)
+    return cache
+
+
+def get_health_scores(db_path=None) -> HealthScores:
+    """Current health scores for a database (default CONTRACTS_DB)."""
+    return get_health_score_cache(db_path).get()
+
+
+def install_health_triggers(db_path=None) -> bool:
+    """Create the change log table and triggers (app startup / migration)."""
+    return get_health_score_cache(db_path).install_triggers()
+
+
 @health_bp.route('/api/contracts/health', methods=['GET'])
 def get_all_health_scores():
     """
@@ -308,40 +716,20 @@ def get_all_health_scores():
     limit = min(request.args.get('limit', 100, type=int), 500)
     include_archived = request.args.get('include_archived', 'false').lower() == 'true'
 
-    conn = get_db_connection()
-    cursor = conn.cursor()
-
-    # Build query
-    base_where = "(archived = 0 OR archived IS NULL)" if not include_archived else "1=1"
-    params = []
-
-    if status_filter:
-        base_where += " AND status = ?"
-        params.append(status_filter)
-
-    cursor.execute(f"""
-        SELECT id, title, counterparty, contract_type, status,
-               risk_level, expiration_date, contract_value, updated_at
-        FROM contracts
-        WHERE {base_where}
-    """, params)
-
-    contracts = [dict(row) for row in cursor.fetchall()]
-    conn.close()
+    # Filter, order and limit over cached scores
+    selected = get_health_scores(CONTRACTS_DB).select(
+        min_score=min_score,
+        max_score=max_score,
+        grade=grade_filter,
+        status=status_filter,
+        include_archived=include_archived,
+        sort_by=sort_by,
+        descending=(order == 'desc'),
+        limit=limit
+    )
 
-    # Calculate health scores
     results = []
-    for contract in contracts:
-        health = calculate_health_score(contract)
-
-        # Apply score filters
-        if min_score and health['total_score'] < min_score:
-            continue
-        if max_score and health['total_score'] > max_score:
-            continue
-        if grade_filter and health['grade'] != grade_filter:
-            continue
-
+    for contract, health, _ in selected:
         results.append({
             'id': contract['id'],
             'title': contract['title'],
@@ -357,18 +745,6 @@ def get_all_health_scores():
             'components': health['components']
         })
 
-    # Sort results
-    if sort_by == 'score':
-        results.sort(key=lambda x: x['health_score'], reverse=(order == 'desc'))
-    elif sort_by == 'expiration':
-        results.sort(key=lambda x: x['expiration_date'] or '9999-12-31', reverse=(order == 'desc'))
-    elif sort_by == 'risk':
-        risk_order = {'CRITICAL': 0, 'HIGH': 1, 'MEDIUM': 2, 'LOW': 3, None: 4}
-        results.sort(key=lambda x: risk_order.get(x['risk_level'], 4), reverse=(order == 'desc'))
-
-    # Apply limit
-    results = results[:limit]
-
     # Calculate summary
     if results:
         scores = [r['health_score'] for r in results]
@@ -489,22 +865,9 @@ def get_health_dashboard():
     Returns:
         Portfolio-wide health summary with trends and alerts
     """
-    conn = get_db_connection()
-    cursor = conn.cursor()
-
-    base_where = "(archived = 0 OR archived IS NULL)"
-
-    cursor.execute(f"""
-        SELECT id, title, counterparty, contract_type, status,
-               risk_level, expiration_date, contract_value, updated_at
-        FROM contracts
-        WHERE {base_where}
-    """)
-
-    contracts = [dict(row) for row in cursor.fetchall()]
-    conn.close()
+    summary = get_health_scores(CONTRACTS_DB).dashboard()
 
-    if not contracts:
+    if not summary:
         return jsonify({
             'portfolio_score': 0,
             'portfolio_grade': 'N/A',
@@ -514,71 +877,8 @@ def get_health_dashboard():
             'generated_at': datetime.now().isoformat()
         })
 
-    # Calculate all health scores
-    health_data = []
-    for contract in contracts:
-        health = calculate_health_score(contract)
-        health_data.append({
-            'contract': contract,
-            'health': health
-        })
-
-    # Calculate portfolio metrics
-    scores = [h['health']['total_score'] for h in health_data]
-    avg_score = sum(scores) / len(scores)
-
-    # Determine portfolio grade
-    portfolio_grade = 'F'
-    for g, info in HEALTH_GRADES.items():
-        if avg_score >= info['min']:
-            portfolio_grade = g
-            break
-
-    # Count by grade
-    grade_counts = {'A': 0, 'B': 0, 'C': 0, 'D': 0, 'F': 0}
-    for h in health_data:
-        grade_counts[h['health']['grade']] = grade_counts.get(h['health']['grade'], 0) + 1
-
-    # Identify critical alerts (score < 40)
-    alerts = []
-    for h in health_data:
-        if h['health']['total_score'] < 40:
-            alerts.append({
-                'contract_id': h['contract']['id'],
-                'title': h['contract']['title'],
-                'score': h['health']['total_score'],
-                'grade': h['health']['grade'],
-                'primary_issue': get_primary_issue(h['health'])
-            })
-
-    # Sort alerts by score (lowest first)
-    alerts.sort(key=lambda x: x['score'])
-    alerts = alerts[:10]  # Top 10 most critical
-
-    # Component averages
-    component_avgs = {
-        'expiration': sum(h['health']['components']['expiration']['score'] for h in health_data) / len(health_data),
-        'risk': sum(h['health']['components']['risk']['score'] for h in health_data) / len(health_data),
-        'metadata': sum(h['health']['components']['metadata']['score'] for h in health_data) / len(health_data),
-        'review': sum(h['health']['components']['review']['score'] for h in health_data) / len(health_data),
-    }
-
     return jsonify({
-        'portfolio_score': round(avg_score, 1),
-        'portfolio_grade': portfolio_grade,
-        'portfolio_grade_label': HEALTH_GRADES[portfolio_grade]['label'],
-        'portfolio_grade_color': HEALTH_GRADES[portfolio_grade]['color'],
-        'total_contracts': len(contracts),
-        'by_grade': grade_counts,
-        'component_averages': {k: round(v, 1) for k, v in component_avgs.items()},
-        'critical_alerts': alerts,
-        'score_distribution': {
-            'excellent': len([s for s in scores if s >= 90]),
-            'good': len([s for s in scores if 75 <= s < 90]),
-            'fair': len([s for s in scores if 60 <= s < 75]),
-            'poor': len([s for s in scores if 40 <= s < 60]),
-            'critical': len([s for s in scores if s < 40]),
-        },
+        **summary,
         'generated_at': datetime.now().isoformat()
     })
 
@@ -600,6 +900,7 @@ def get_primary_issue(health: Dict) -> str:
 
 
 def register_health(app):
-    """Register health blueprint with Flask app."""
+    """Register health blueprint with Flask app and install the score cache triggers."""
     app.register_blueprint(health_bp)
+    install_health_triggers()
     return health_bp
@@ -20,6 +20,14 @@ Usage:
         file_path='contract.docx',
         db_path='contracts.db'
     )
+
+    # New version of a stored contract (reuses unchanged clauses)
+    result = process_intake('contract_v2.docx', 'contracts.db', parent_contract_id=42)
+
+    # Legacy portfolio onboarding (parallel, resumable)
+    from intake_engine import process_intake_bulk
+
+    bulk = process_intake_bulk('legacy_contracts/', db_path='contracts.db')
 """
 
 import os
@@ -27,11 +35,15 @@ import re
 import json
 import hashlib
 import sqlite3
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, ThreadPoolExecutor, wait
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, List, Optional, Tuple, Any
+from typing import Callable, Dict, List, Optional, Tuple, Any
 from dataclasses import dataclass, field, asdict
 from config import ANTHROPIC_API_KEY
+from sqlite_bulk import bulk_insert, write_transaction
 import anthropic
 
 # =============================================================================
@@ -107,6 +119,8 @@ class IntakeResult:
     annotations: List[Dict] = field(default_factory=list)
     errors: List[str] = field(default_factory=list)
     processing_time_ms: int = 0
+    # Incremental (versioned) intake: clauses reused from the parent contract
+    reuse_stats: Dict = field(default_factory=dict)
 
 
 # =============================================================================
@@ -363,11 +377,20 @@ def chunk_document(full_text: str) -> List[Clause]:
 # STEP 4: RISK SCORING (CCE-Plus integration)
 # =============================================================================
 
-def score_clauses_batch(clauses: List[Clause]) -> List[Clause]:
+def score_clauses_batch(clauses: List[Clause], to_score: Optional[List[Clause]] = None) -> List[Clause]:
     """
     Score all clauses using CCE-Plus risk scorer.
     Batch operation for efficiency.
+
+    Args:
+        clauses: All clauses of the document
+        to_score: Clauses needing scores (default: all). Others keep the
+                  scores already set on them (incremental intake). Cascades
+                  are always detected across all clauses.
     """
+    if to_score is None:
+        to_score = clauses
+    
     try:
         # Import CCE-Plus integration
         import sys
@@ -383,7 +406,7 @@ def score_clauses_batch(clauses: List[Clause]) -> List[Clause]:
             detect_cascades = _fallback_detect_cascades
         
         # Score each clause
-        for clause in clauses:
+        for clause in to_score:
             risk_data = score_clause_risk(
                 clause.verbatim_text,
                 clause.clause_type,
@@ -418,7 +441,7 @@ def score_clauses_batch(clauses: List[Clause]) -> List[Clause]:
     except Exception as e:
         # Log error but don't fail - use fallback scores
         print(f"Warning: CCE-Plus scoring failed, using fallback: {e}")
-        for clause in clauses:
+        for clause in to_score:
             fallback = _fallback_score_clause(clause.verbatim_text, clause.clause_type)
             clause.cce_risk_score = fallback['risk_score']
             clause.cce_risk_level = fallback['risk_level']
@@ -459,6 +482,57 @@ def _fallback_detect_cascades(clauses: List[Dict]) -> List[Dict]:
     return []  # No cascades detected in fallback mode
 
 
+# =============================================================================
+# STEP 4b: INCREMENTAL RE-INTAKE (new versions of a stored contract)
+# =============================================================================
+
+def load_parent_clause_index(db_path: str, parent_contract_id: int) -> Dict[Tuple[str, str], Dict]:
+    """
+    Index a stored contract's clauses by (chunk_hash, section_number).
+    Returns key -> reusable scoring/embedding fields (first clause wins).
+    """
+    conn = sqlite3.connect(db_path)
+    try:
+        rows = conn.execute("""
+            SELECT chunk_hash, section_number, cce_risk_score, cce_risk_level, cce_statutory_flag, embedding_id
+            FROM clauses
+            WHERE contract_id = ? AND chunk_hash IS NOT NULL
+            ORDER BY id
+        """, (parent_contract_id,)).fetchall()
+    finally:
+        conn.close()
+    
+    index = {}
+    for chunk_hash, section_number, score, level, statutory_flag, embedding_id in rows:
+        index.setdefault((chunk_hash, section_number), {
+            'cce_risk_score': score,
+            'cce_risk_level': level,
+            'cce_statutory_flag': statutory_flag,
+            'embedding_id': embedding_id,
+        })
+    return index
+
+
+def reuse_parent_clauses(clauses: List[Clause], parent_index: Dict[Tuple[str, str], Dict]) -> List[Clause]:
+    """
+    Copy scores, UCC flags and embedding IDs onto clauses unchanged since the parent.
+    A clause counts as unchanged only under the same section number: scoring
+    takes the section, and the embedding ID and Chroma metadata carry it.
+    Returns the new, changed or renumbered clauses, which still need scoring.
+    """
+    changed = []
+    for clause in clauses:
+        stored = parent_index.get((clause.chunk_hash, clause.section_number))
+        if stored is None:
+            changed.append(clause)
+            continue
+        clause.cce_risk_score = stored['cce_risk_score']
+        clause.cce_risk_level = stored['cce_risk_level']
+        clause.cce_statutory_flag = stored['cce_statutory_flag']
+        clause.embedding_id = stored['embedding_id']
+    return changed
+
+
 # =============================================================================
 # STEP 5: RAG EMBEDDING
 # =============================================================================
@@ -785,6 +859,59 @@ def lookup_public_company(db_path: str, vendor_name: Optional[str]) -> Tuple[Opt
     return result if result else (None, None)
 
 
+# =============================================================================
+# ANNOTATIONS
+# =============================================================================
+
+def build_intake_annotations(clauses: List[Clause]) -> List[Dict]:
+    """Generate RISK, STATUTORY and CASCADE annotations for scored clauses."""
+    annotations = []
+    
+    for clause in clauses:
+        if clause.cce_risk_level in ('CRITICAL', 'HIGH'):
+            annotations.append({
+                'type': 'RISK',
+                'severity': clause.cce_risk_level,
+                'title': f'{clause.cce_risk_level} Risk: {clause.section_number}',
+                'content': f'{clause.section_title} scored {clause.cce_risk_score}/10.0',
+                'source': 'INTAKE'
+            })
+        
+        if clause.cce_statutory_flag:
+            annotations.append({
+                'type': 'STATUTORY',
+                'severity': 'CRITICAL',
+                'title': f'Statutory Flag: {clause.cce_statutory_flag}',
+                'content': f'{clause.section_number} may violate {clause.cce_statutory_flag}',
+                'source': 'INTAKE'
+            })
+        
+        if clause.cce_cascade_risk:
+            annotations.append({
+                'type': 'CASCADE',
+                'severity': 'HIGH',
+                'title': f'Cascade Risk: {clause.section_number}',
+                'content': f'{clause.section_title} contributes to cross-clause risk',
+                'source': 'INTAKE'
+            })
+    
+    return annotations
+
+
+def summarize_intake_risk(clauses: List[Clause]) -> Dict:
+    """Risk summary reported in IntakeResult.risk_summary."""
+    return {
+        'total_clauses': len(clauses),
+        'critical': sum(1 for c in clauses if c.cce_risk_level == 'CRITICAL'),
+        'high': sum(1 for c in clauses if c.cce_risk_level == 'HIGH'),
+        'medium': sum(1 for c in clauses if c.cce_risk_level == 'MEDIUM'),
+        'low': sum(1 for c in clauses if c.cce_risk_level == 'LOW'),
+        'avg_score': round(sum(c.cce_risk_score for c in clauses) / len(clauses), 1) if clauses else 0,
+        'statutory_flags': sum(1 for c in clauses if c.cce_statutory_flag),
+        'cascade_risks': sum(1 for c in clauses if c.cce_cascade_risk)
+    }
+
+
 # =============================================================================
 # STEP 8: STORAGE
 # =============================================================================
@@ -805,10 +932,7 @@ def store_intake(
     Args:
         original_filename: Original filename (if file_path is a temp file)
     """
-    conn = sqlite3.connect(db_path)
-    cursor = conn.cursor()
-    
-    try:
+    with write_transaction(db_path) as conn:
         # Calculate risk summary
         risk_summary = {
             'total_clauses': len(clauses),
@@ -831,7 +955,7 @@ def store_intake(
             title = Path(file_path).stem
             filename = Path(file_path).name
 
-        cursor.execute("""
+        cursor = conn.execute("""
             INSERT INTO contracts (
                 title, filename, filepath, document_hash, clause_count,
                 party_client, party_vendor, counterparty, our_entity, effective_date, expiration_date,
@@ -854,45 +978,41 @@ def store_intake(
         
         contract_id = cursor.lastrowid
         
-        # Insert clauses
-        for clause in clauses:
-            cursor.execute("""
-                INSERT INTO clauses (
-                    contract_id, text, section_number, section_title, clause_type,
-                    verbatim_text, word_count,
-                    cce_risk_score, cce_risk_level, cce_statutory_flag, cce_cascade_risk,
-                    embedding_id, chunk_hash
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
+        # Insert clauses and annotations (one prepared statement each)
+        bulk_insert(conn, """
+            INSERT INTO clauses (
+                contract_id, text, section_number, section_title, clause_type,
+                verbatim_text, word_count,
+                cce_risk_score, cce_risk_level, cce_statutory_flag, cce_cascade_risk,
+                embedding_id, chunk_hash
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """, (
+            (
                 contract_id, clause.verbatim_text, clause.section_number, clause.section_title, clause.clause_type,
                 clause.verbatim_text, clause.word_count,
                 clause.cce_risk_score, clause.cce_risk_level, clause.cce_statutory_flag,
                 1 if clause.cce_cascade_risk else 0,
                 clause.embedding_id, clause.chunk_hash
-            ))
+            )
+            for clause in clauses
+        ))
         
-        # Insert annotations
-        for annotation in annotations:
-            cursor.execute("""
-                INSERT INTO annotations (
-                    contract_id, clause_id, annotation_type, severity,
-                    title, content, source
-                ) VALUES (?, ?, ?, ?, ?, ?, ?)
-            """, (
+        bulk_insert(conn, """
+            INSERT INTO annotations (
+                contract_id, clause_id, annotation_type, severity,
+                title, content, source
+            ) VALUES (?, ?, ?, ?, ?, ?, ?)
+        """, (
+            (
                 contract_id, annotation.get('clause_id'),
                 annotation['type'], annotation.get('severity', 'INFO'),
                 annotation.get('title', ''), annotation['content'],
                 annotation.get('source', 'INTAKE')
-            ))
+            )
+            for annotation in annotations
+        ))
         
-        conn.commit()
         return contract_id
-        
-    except Exception as e:
-        conn.rollback()
-        raise e
-    finally:
-        conn.close()
 
 
 # =============================================================================
@@ -1051,7 +1171,8 @@ def process_intake(
     db_path: str = 'contracts.db',
     embed: bool = True,
     verbose: bool = False,
-    original_filename: str = None
+    original_filename: str = None,
+    parent_contract_id: Optional[int] = None
 ) -> IntakeResult:
     """
     Process complete contract intake.
@@ -1062,6 +1183,12 @@ def process_intake(
         embed: Whether to generate ChromaDB embeddings
         verbose: Print progress messages
         original_filename: Original filename (if file_path is a temp file)
+        parent_contract_id: Stored contract this document is a new version of.
+            Clauses whose chunk_hash and section number match a parent clause
+            reuse its score, UCC flag and embedding ID; only new, changed or
+            renumbered clauses are scored, embedded and annotated (reported
+            in result.reuse_stats).
+            Linking the versions stays with /api/link-contracts.
     
     Returns:
         IntakeResult with all processing outcomes
@@ -1104,14 +1231,31 @@ def process_intake(
             result.errors = ["No clauses could be extracted"]
             return result
         
-        # STEP 4: Score
-        if verbose: print("4/9 Scoring clauses...")
-        clauses = score_clauses_batch(clauses)
+        # STEP 4: Score (only new or changed clauses of a new version)
+        changed = clauses
+        if parent_contract_id:
+            if verbose: print(f"4/9 Reusing unchanged clauses of contract {parent_contract_id}...")
+            changed = reuse_parent_clauses(clauses, load_parent_clause_index(db_path, parent_contract_id))
+            reused = len(clauses) - len(changed)
+            embeddings_reused = sum(1 for c in clauses if c.embedding_id)
+            result.reuse_stats = {
+                'parent_contract_id': parent_contract_id,
+                'clauses_reused': reused,
+                'clauses_rescored': len(changed),
+                'embeddings_reused': embeddings_reused,
+                'score_reuse_ratio': round(reused / len(clauses), 3),
+                'embedding_reuse_ratio': round(embeddings_reused / len(clauses), 3),
+            }
         
-        # STEP 5: Embed
+        if verbose: print(f"4/9 Scoring {len(changed)} clauses...")
+        clauses = score_clauses_batch(clauses, to_score=changed)
+        
+        # STEP 5: Embed (clauses without a reused embedding)
         if embed:
             if verbose: print("5/9 Generating embeddings...")
-            clauses = embed_clauses_batch(clauses)
+            to_embed = [c for c in clauses if not c.embedding_id]
+            if to_embed:
+                embed_clauses_batch(to_embed)
         else:
             if verbose: print("5/9 Skipping embeddings...")
         
@@ -1126,40 +1270,10 @@ def process_intake(
         metadata.vendor_ticker = ticker
         metadata.vendor_cik = cik
         
-        # Generate annotations
-        annotations = []
-        
-        # Risk annotations
-        for clause in clauses:
-            if clause.cce_risk_level in ('CRITICAL', 'HIGH'):
-                annotations.append({
-                    'type': 'RISK',
-                    'severity': clause.cce_risk_level,
-                    'title': f'{clause.cce_risk_level} Risk: {clause.section_number}',
-                    'content': f'{clause.section_title} scored {clause.cce_risk_score}/10.0',
-                    'source': 'INTAKE'
-                })
-            
-            if clause.cce_statutory_flag:
-                annotations.append({
-                    'type': 'STATUTORY',
-                    'severity': 'CRITICAL',
-                    'title': f'Statutory Flag: {clause.cce_statutory_flag}',
-                    'content': f'{clause.section_number} may violate {clause.cce_statutory_flag}',
-                    'source': 'INTAKE'
-                })
-            
-            if clause.cce_cascade_risk:
-                annotations.append({
-                    'type': 'CASCADE',
-                    'severity': 'HIGH',
-                    'title': f'Cascade Risk: {clause.section_number}',
-                    'content': f'{clause.section_title} contributes to cross-clause risk',
-                    'source': 'INTAKE'
-                })
-        
+        # Generate annotations (reused clauses are annotated on the parent)
+        annotations = build_intake_annotations(changed)
         result.annotations = annotations
-        
+
         # STEP 8: Store
         if verbose: print("8/9 Storing data...")
         contract_id = store_intake(
@@ -1170,16 +1284,7 @@ def process_intake(
         result.contract_id = contract_id
         
         # Calculate risk summary
-        result.risk_summary = {
-            'total_clauses': len(clauses),
-            'critical': sum(1 for c in clauses if c.cce_risk_level == 'CRITICAL'),
-            'high': sum(1 for c in clauses if c.cce_risk_level == 'HIGH'),
-            'medium': sum(1 for c in clauses if c.cce_risk_level == 'MEDIUM'),
-            'low': sum(1 for c in clauses if c.cce_risk_level == 'LOW'),
-            'avg_score': round(sum(c.cce_risk_score for c in clauses) / len(clauses), 1),
-            'statutory_flags': sum(1 for c in clauses if c.cce_statutory_flag),
-            'cascade_risks': sum(1 for c in clauses if c.cce_cascade_risk)
-        }
+        result.risk_summary = summarize_intake_risk(clauses)
         
         # STEP 9: Report
         if verbose: print("9/9 Generating report...")
@@ -1203,6 +1308,439 @@ def process_intake(
     return result
 
 
+# =============================================================================
+# BULK INTAKE
+# =============================================================================
+
+# Thread pool size for hashing, embeddings and AI metadata extraction
+BULK_IO_WORKERS = 8
+
+# Resume checkpoint (one row per source file, kept in the contracts database)
+BULK_PROGRESS_TABLE = 'intake_bulk_progress'
+
+# Outcomes not retried when resuming (FAILED files are retried)
+BULK_FINAL_STATUSES = ('COMPLETE', 'DUPLICATE', 'REJECTED')
+
+
+@dataclass
+class BulkIntakeResult:
+    """Bulk intake outcome for a directory or list of documents."""
+    total_files: int = 0
+    succeeded: int = 0
+    duplicates: int = 0
+    rejected: int = 0
+    failed: int = 0
+    resumed: int = 0  # Skipped: finished by an earlier (interrupted) run
+    interrupted: bool = False
+    results: Dict[str, IntakeResult] = field(default_factory=dict)
+    stage_stats: Dict[str, Dict] = field(default_factory=dict)
+    processing_time_ms: int = 0
+
+    @property
+    def completed(self) -> int:
+        return self.succeeded + self.duplicates + self.rejected + self.failed
+
+
+class _StageTimer:
+    """Per-stage item counts and busy time (updated by the coordinating thread only)."""
+
+    def __init__(self):
+        self._stats: Dict[str, Dict] = {}
+
+    def add(self, stage: str, seconds: float, items: int = 1) -> None:
+        stats = self._stats.setdefault(stage, {'items': 0, 'seconds': 0.0})
+        stats['items'] += items
+        stats['seconds'] += seconds
+
+    def add_all(self, timings: Dict[str, float]) -> None:
+        for stage, seconds in timings.items():
+            self.add(stage, seconds)
+
+    def snapshot(self) -> Dict[str, Dict]:
+        return {
+            stage: {
+                'items': stats['items'],
+                'seconds': round(stats['seconds'], 3),
+                'avg_ms': round(stats['seconds'] * 1000 / stats['items'], 1) if stats['items'] else 0,
+                'per_second': round(stats['items'] / stats['seconds'], 1) if stats['seconds'] else 0,
+            }
+            for stage, stats in self._stats.items()
+        }
+
+
+def discover_intake_files(source) -> List[str]:
+    """
+    Resolve bulk intake input to a sorted list of document paths.
+
+    Args:
+        source: Directory (searched recursively) or iterable of file paths
+    """
+    if isinstance(source, (str, Path)):
+        root = Path(source)
+        if root.is_dir():
+            return sorted(
+                str(p) for p in root.rglob('*')
+                if p.is_file() and p.suffix.lower() in SUPPORTED_EXTENSIONS
+            )
+        return [str(root)]
+    return [str(p) for p in source]
+
+
+def _open_bulk_progress(db_path: str) -> sqlite3.Connection:
+    """Open the writer connection and ensure the checkpoint table exists."""
+    conn = sqlite3.connect(db_path)
+    conn.execute(f"""
+        CREATE TABLE IF NOT EXISTS {BULK_PROGRESS_TABLE} (
+            file_path TEXT PRIMARY KEY,
+            file_size INTEGER,
+            file_mtime REAL,
+            document_hash TEXT,
+            status TEXT NOT NULL,
+            contract_id INTEGER,
+            error TEXT,
+            updated_at TEXT
+        )
+    """)
+    conn.commit()
+    return conn
+
+
+def _load_bulk_progress(conn: sqlite3.Connection) -> Dict[str, Tuple[int, float]]:
+    """Files finished by earlier runs: file_path -> (size, mtime) at that time."""
+    placeholders = ', '.join('?' for _ in BULK_FINAL_STATUSES)
+    rows = conn.execute(
+        f"SELECT file_path, file_size, file_mtime FROM {BULK_PROGRESS_TABLE} "
+        f"WHERE status IN ({placeholders})",
+        BULK_FINAL_STATUSES
+    ).fetchall()
+    return {path: (size, mtime) for path, size, mtime in rows}
+
+
+def _load_known_hashes(conn: sqlite3.Connection) -> Dict[str, int]:
+    """document_hash -> contract_id for everything already ingested (lowest id wins)."""
+    rows = conn.execute(
+        "SELECT document_hash, id FROM contracts WHERE document_hash IS NOT NULL ORDER BY id DESC"
+    ).fetchall()
+    return dict(rows)
+
+
+def _bulk_hash_stage(file_path: str) -> Dict:
+    """Validate and hash one file (thread pool, before any parsing)."""
+    started = time.perf_counter()
+    valid, errors = validate_document(file_path)
+    document_hash = compute_document_hash(file_path) if valid else None
+    return {
+        'valid': valid,
+        'errors': errors,
+        'document_hash': document_hash,
+        'seconds': time.perf_counter() - started,
+    }
+
+
+def _bulk_cpu_stage(file_path: str) -> Dict:
+    """Parse, chunk and score one document (process pool; must stay top-level)."""
+    timings = {}
+
+    started = time.perf_counter()
+    full_text = parse_document(file_path)
+    timings['parse'] = time.perf_counter() - started
+    if not full_text or len(full_text) < 100:
+        return {'rejected': "Document appears empty or too short", 'timings': timings}
+
+    started = time.perf_counter()
+    clauses = chunk_document(full_text)
+    timings['chunk'] = time.perf_counter() - started
+    if not clauses:
+        return {'rejected': "No clauses could be extracted", 'timings': timings}
+
+    started = time.perf_counter()
+    clauses = score_clauses_batch(clauses)
+    timings['score'] = time.perf_counter() - started
+
+    return {'full_text': full_text, 'clauses': clauses, 'timings': timings}
+
+
+def _bulk_io_stage(db_path: str, full_text: str, clauses: List[Clause], embed: bool) -> Dict:
+    """Embed, extract metadata and look up the vendor (thread pool)."""
+    timings = {}
+
+    if embed:
+        started = time.perf_counter()
+        clauses = embed_clauses_batch(clauses)
+        timings['embed'] = time.perf_counter() - started
+
+    started = time.perf_counter()
+    metadata = extract_metadata(full_text, clauses)
+    metadata.vendor_ticker, metadata.vendor_cik = lookup_public_company(db_path, metadata.party_vendor)
+    timings['metadata'] = time.perf_counter() - started
+
+    return {
+        'clauses': clauses,
+        'metadata': metadata,
+        'annotations': build_intake_annotations(clauses),
+        'timings': timings,
+    }
+
+
+def process_intake_bulk(
+    source,
+    db_path: str = 'contracts.db',
+    embed: bool = True,
+    cpu_workers: Optional[int] = None,
+    io_workers: int = BULK_IO_WORKERS,
+    use_processes: bool = True,
+    resume: bool = True,
+    progress_callback: Optional[Callable[[Dict], None]] = None,
+    verbose: bool = False
+) -> BulkIntakeResult:
+    """
+    Ingest a directory (or list) of contracts in parallel.
+
+    Pipeline per file:
+        hash + validate (threads) -> duplicate check (no parsing for duplicates)
+        -> parse, chunk, score (process pool)
+        -> embed, metadata, vendor lookup (threads)
+        -> store + report (single writer: the calling thread)
+
+    Each finished file is checkpointed in the intake_bulk_progress table, so
+    a rerun after interruption skips files that are unchanged since they
+    finished. Files with the same content share one outcome.
+
+    Args:
+        source: Directory (recursive) or iterable of file paths
+        db_path: Path to SQLite database
+        embed: Whether to generate ChromaDB embeddings
+        cpu_workers: Parse/chunk/score workers (default: CPU count)
+        io_workers: Hash/embedding/metadata threads
+        use_processes: Run CPU stages in processes (threads if False)
+        resume: Skip files finished by an earlier run
+        progress_callback: Called with a progress dict after each file
+        verbose: Print one progress line per file
+
+    Returns:
+        BulkIntakeResult with per-file IntakeResults and per-stage throughput
+    """
+    started = time.perf_counter()
+    timer = _StageTimer()
+    files = discover_intake_files(source)
+    result = BulkIntakeResult(total_files=len(files))
+
+    conn = _open_bulk_progress(db_path)
+    finished = _load_bulk_progress(conn) if resume else {}
+    known_hashes = _load_known_hashes(conn)
+
+    # Skip files finished earlier and unchanged since (no hashing needed)
+    hash_backlog = deque()
+    file_stats: Dict[str, Tuple[Optional[int], Optional[float]]] = {}
+    for file_path in files:
+        try:
+            st = os.stat(file_path)
+            file_stats[file_path] = (st.st_size, st.st_mtime)
+        except OSError:
+            file_stats[file_path] = (None, None)
+        if file_path in finished and finished[file_path] == file_stats[file_path]:
+            result.resumed += 1
+        else:
+            hash_backlog.append(file_path)
+
+    to_process = len(hash_backlog)
+    cpu_backlog = deque()
+    file_started: Dict[str, float] = {}
+    file_hashes: Dict[str, str] = {}
+    # document_hash -> files with identical content waiting on the first one
+    followers: Dict[str, List[str]] = {}
+
+    def report_progress(file_path: str, status: str) -> None:
+        elapsed = time.perf_counter() - started
+        result.stage_stats = timer.snapshot()
+        if verbose:
+            print(f"[{result.completed}/{to_process}] {status:<9} {Path(file_path).name}")
+        if progress_callback:
+            progress_callback({
+                'file_path': file_path,
+                'status': status,
+                'total_files': result.total_files,
+                'to_process': to_process,
+                'completed': result.completed,
+                'succeeded': result.succeeded,
+                'duplicates': result.duplicates,
+                'rejected': result.rejected,
+                'failed': result.failed,
+                'resumed': result.resumed,
+                'elapsed_seconds': round(elapsed, 3),
+                'files_per_second': round(result.completed / elapsed, 2) if elapsed else 0,
+                'stages': result.stage_stats,
+            })
+
+    def finish(file_path: str, status: str, intake: IntakeResult) -> None:
+        """Record one file's outcome (writer thread only)."""
+        size, mtime = file_stats.get(file_path, (None, None))
+        conn.execute(f"""
+            INSERT OR REPLACE INTO {BULK_PROGRESS_TABLE} (
+                file_path, file_size, file_mtime, document_hash,
+                status, contract_id, error, updated_at
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+        """, (
+            file_path, size, mtime, intake.document_hash,
+            status, intake.contract_id, '; '.join(intake.errors) or None,
+            datetime.now().isoformat()
+        ))
+        conn.commit()
+
+        result.results[file_path] = intake
+        if status == 'COMPLETE':
+            result.succeeded += 1
+        elif status == 'DUPLICATE':
+            result.duplicates += 1
+        elif status == 'REJECTED':
+            result.rejected += 1
+        else:
+            result.failed += 1
+        report_progress(file_path, status)
+
+        # Identical files share the outcome of the first copy
+        for follower in followers.pop(intake.document_hash, []) if intake.document_hash else []:
+            if status == 'COMPLETE':
+                shared = IntakeResult(
+                    success=False, contract_id=intake.contract_id,
+                    document_hash=intake.document_hash,
+                    errors=[f"Document already ingested as contract ID {intake.contract_id}"]
+                )
+                finish(follower, 'DUPLICATE', shared)
+            else:
+                shared = IntakeResult(success=False, document_hash=intake.document_hash, errors=list(intake.errors))
+                finish(follower, status, shared)
+
+    def store(file_path: str, output: Dict) -> None:
+        """Single writer: store one document and write its report."""
+        write_started = time.perf_counter()
+        clauses = output['clauses']
+        intake = IntakeResult(
+            success=False,
+            document_hash=file_hashes[file_path],
+            clause_count=len(clauses),
+            metadata=output['metadata'],
+            annotations=output['annotations'],
+        )
+        intake.contract_id = store_intake(
+            db_path, file_path, intake.document_hash,
+            clauses, intake.metadata, intake.annotations
+        )
+        known_hashes[intake.document_hash] = intake.contract_id
+        intake.risk_summary = summarize_intake_risk(clauses)
+
+        report = generate_intake_report(
+            intake.contract_id, file_path, clauses, intake.metadata, intake.annotations
+        )
+        with open(Path(file_path).with_suffix('.intake_report.md'), 'w', encoding='utf-8') as f:
+            f.write(report)
+
+        intake.success = True
+        intake.processing_time_ms = int((time.perf_counter() - file_started[file_path]) * 1000)
+        timer.add('store', time.perf_counter() - write_started)
+        finish(file_path, 'COMPLETE', intake)
+
+    in_flight: Dict[Future, Tuple[str, str]] = {}
+    hashing = 0
+    # Parsed documents held in memory at once (CPU + I/O stages)
+    cpu_workers = cpu_workers or os.cpu_count() or 1
+    max_documents = cpu_workers + io_workers
+    documents = 0
+
+    cpu_pool = ProcessPoolExecutor(max_workers=cpu_workers) if use_processes \
+        else ThreadPoolExecutor(max_workers=cpu_workers, thread_name_prefix='intake-cpu')
+    io_pool = ThreadPoolExecutor(max_workers=io_workers, thread_name_prefix='intake-io')
+
+    try:
+        while hash_backlog or cpu_backlog or in_flight:
+            while hash_backlog and hashing < io_workers:
+                file_path = hash_backlog.popleft()
+                file_started[file_path] = time.perf_counter()
+                in_flight[io_pool.submit(_bulk_hash_stage, file_path)] = ('hash', file_path)
+                hashing += 1
+
+            while cpu_backlog and documents < max_documents:
+                file_path = cpu_backlog.popleft()
+                in_flight[cpu_pool.submit(_bulk_cpu_stage, file_path)] = ('cpu', file_path)
+                documents += 1
+
+            done, _ = wait(list(in_flight), return_when=FIRST_COMPLETED)
+
+            for future in done:
+                stage, file_path = in_flight.pop(future)
+                error = future.exception()
+
+                if stage == 'hash':
+                    hashing -= 1
+                    if error:
+                        finish(file_path, 'FAILED', IntakeResult(success=False, errors=[str(error)]))
+                        continue
+                    output = future.result()
+                    timer.add('hash', output['seconds'])
+                    document_hash = output['document_hash']
+                    if not output['valid']:
+                        finish(file_path, 'REJECTED', IntakeResult(success=False, errors=output['errors']))
+                    elif document_hash in known_hashes:
+                        existing_id = known_hashes[document_hash]
+                        finish(file_path, 'DUPLICATE', IntakeResult(
+                            success=False, contract_id=existing_id, document_hash=document_hash,
+                            errors=[f"Document already ingested as contract ID {existing_id}"]
+                        ))
+                    elif document_hash in followers:
+                        followers[document_hash].append(file_path)
+                    else:
+                        followers[document_hash] = []
+                        file_hashes[file_path] = document_hash
+                        cpu_backlog.append(file_path)
+                    continue
+
+                document_hash = file_hashes[file_path]
+                if error:
+                    documents -= 1
+                    finish(file_path, 'FAILED', IntakeResult(
+                        success=False, document_hash=document_hash, errors=[str(error)]
+                    ))
+                    continue
+
+                output = future.result()
+                timer.add_all(output['timings'])
+
+                if stage == 'cpu':
+                    if 'rejected' in output:
+                        documents -= 1
+                        finish(file_path, 'REJECTED', IntakeResult(
+                            success=False, document_hash=document_hash, errors=[output['rejected']]
+                        ))
+                    else:
+                        io_future = io_pool.submit(
+                            _bulk_io_stage, db_path, output['full_text'], output['clauses'], embed
+                        )
+                        in_flight[io_future] = ('io', file_path)
+                    continue
+
+                # stage == 'io'
+                documents -= 1
+                try:
+                    store(file_path, output)
+                except Exception as e:
+                    finish(file_path, 'FAILED', IntakeResult(
+                        success=False, document_hash=document_hash, errors=[str(e)]
+                    ))
+
+    except KeyboardInterrupt:
+        # Finished files are checkpointed; a rerun resumes from here
+        result.interrupted = True
+
+    finally:
+        cpu_pool.shutdown(wait=not result.interrupted, cancel_futures=True)
+        io_pool.shutdown(wait=not result.interrupted, cancel_futures=True)
+        conn.close()
+        result.stage_stats = timer.snapshot()
+        result.processing_time_ms = int((time.perf_counter() - started) * 1000)
+
+    return result
+
+
 # =============================================================================
 # CLI INTERFACE
 # =============================================================================
@@ -1211,21 +1749,38 @@ if __name__ == '__main__':
     import sys
     
     if len(sys.argv) < 2:
-        print("Usage: python intake_engine.py <contract_file> [db_path]")
+        print("Usage: python intake_engine.py <contract_file|directory> [db_path] [parent_contract_id]")
         print("Example: python intake_engine.py contract.docx contracts.db")
+        print("         python intake_engine.py contract_v2.docx contracts.db 42")
+        print("         python intake_engine.py legacy_contracts/ contracts.db")
         sys.exit(1)
     
     file_path = sys.argv[1]
     db_path = sys.argv[2] if len(sys.argv) > 2 else 'contracts.db'
+    parent_contract_id = int(sys.argv[3]) if len(sys.argv) > 3 else None
     
     print("=" * 60)
     print("CCE-Plus INTAKE ENGINE")
     print("=" * 60)
-    print(f"File: {file_path}")
+    print(f"{'Directory' if Path(file_path).is_dir() else 'File'}: {file_path}")
     print(f"Database: {db_path}")
     print("-" * 60)
     
-    result = process_intake(file_path, db_path, verbose=True)
+    if Path(file_path).is_dir():
+        bulk = process_intake_bulk(file_path, db_path, verbose=True)
+        
+        print("-" * 60)
+        print(f"{'⚠️ INTAKE INTERRUPTED (rerun to resume)' if bulk.interrupted else '✅ BULK INTAKE COMPLETE'}")
+        print(f"   Files: {bulk.total_files} (resumed: {bulk.resumed})")
+        print(f"   Stored: {bulk.succeeded}  Duplicates: {bulk.duplicates}  "
+              f"Rejected: {bulk.rejected}  Failed: {bulk.failed}")
+        print(f"   Processing Time: {bulk.processing_time_ms}ms")
+        for stage, stats in bulk.stage_stats.items():
+            print(f"   {stage:<9} {stats['items']:>6} items  {stats['avg_ms']:>8}ms avg  {stats['per_second']:>8}/s")
+        print("=" * 60)
+        sys.exit(1 if bulk.failed or bulk.interrupted else 0)
+    
+    result = process_intake(file_path, db_path, verbose=True, parent_contract_id=parent_contract_id)
     
     print("-" * 60)
     
@@ -1236,6 +1791,9 @@ if __name__ == '__main__':
         print(f"   Avg Risk: {result.risk_summary.get('avg_score', 0)}/10.0")
         print(f"   Critical: {result.risk_summary.get('critical', 0)}")
         print(f"   Statutory Flags: {result.risk_summary.get('statutory_flags', 0)}")
+        if result.reuse_stats:
+            print(f"   Reused: {result.reuse_stats['clauses_reused']} clauses "
+                  f"(parent {result.reuse_stats['parent_contract_id']})")
         print(f"   Processing Time: {result.processing_time_ms}ms")
     else:
         print(f"❌ INTAKE FAILED")
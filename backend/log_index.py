@@ -0,0 +1,637 @@
+"""
+Log Index
+Tail-seeking reads and an incremental line index for CIP log files.
+
+Provides:
+- read_lines_reverse / tail_lines: lines from the end of a file, one block at a time
+- LogFollower: byte offset into a growing file (appends, truncation, rotation)
+- LogIndex: per-line offset, timestamp, level, logger and marker columns
+  for the newest LOG_INDEX_MAX_LINES lines, extended from the last
+  indexed offset on every refresh
+- get_log_index: lazily created index per log file
+
+Reading the last N entries costs the blocks they span, not the file.
+The first index build reads at most LOG_INDEX_MAX_LINES lines from the
+end of the file (warm() runs it on a background thread); later refreshes
+read only the bytes appended since, so level, time-range and marker
+queries do not rescan the file.
+
+Usage:
+    from log_index import get_log_index
+
+    index = get_log_index(api_log, LOG_PATTERN)
+    lines = index.query(min_level='ERROR', since='2025-01-06', limit=100)
+"""
+
+import bisect
+import heapq
+import os
+import re
+import threading
+from array import array
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Optional, Pattern, Tuple, Union
+
+# =============================================================================
+# CONFIGURATION
+# =============================================================================
+
+# Bytes read per step when scanning backwards from the end of a file
+LOG_BLOCK_SIZE = 64 * 1024
+
+# Bytes read per step when following appended data
+LOG_READ_CHUNK = 1024 * 1024
+
+# Leading bytes compared to detect a file rewritten in place (copytruncate)
+LOG_HEAD_BYTES = 64
+
+# Newest lines kept per index (~30 bytes of columns per line)
+LOG_INDEX_MAX_LINES = 500_000
+
+LOG_LEVELS = ["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]
+
+# Level assumed for lines that do not match the log pattern
+DEFAULT_LEVEL = "INFO"
+
+# Timestamp sort keys are YYYYMMDDHHMMSSmmm integers; -1 when absent
+_NO_TIME = -1
+_TIME_DIGITS = 17
+
+PathLike = Union[str, Path]
+
+
+def time_key(value: str, upper: bool = False) -> int:
+    """
+    Sort key for a timestamp or timestamp prefix.
+
+    Accepts 'YYYY-MM-DD[ HH:MM:SS[,mmm]]' and ISO 'T' forms. Missing
+    trailing digits are filled with 0 (lower bound) or 9 (upper bound),
+    so until='2025-01-06' covers the whole day.
+
+    Raises:
+        ValueError: Fewer than 8 digits (no full date)
+    """
+    digits = re.sub(r'\D', '', value)[:_TIME_DIGITS]
+    if len(digits) < 8:
+        raise ValueError(f"Invalid timestamp: {value!r}")
+    return int(digits.ljust(_TIME_DIGITS, '9' if upper else '0'))
+
+
+def level_index(level: Optional[str]) -> int:
+    """Position in LOG_LEVELS (unknown levels rank as INFO)."""
+    level = (level or DEFAULT_LEVEL).upper()
+    return LOG_LEVELS.index(level) if level in LOG_LEVELS else LOG_LEVELS.index(DEFAULT_LEVEL)
+
+
+# =============================================================================
+# REVERSE READER
+# =============================================================================
+
+def read_lines_reverse(
+    path: PathLike,
+    end: Optional[int] = None,
+    block_size: Optional[int] = None
+) -> Iterator[Tuple[int, bytes]]:
+    """
+    Yield (offset, line) pairs from the end of a file backwards.
+
+    Lines are bytes without the newline; a final unterminated line is
+    included, a trailing newline does not produce an empty line (same
+    lines as readlines()). Only the blocks reached are read.
+
+    Args:
+        path: File path
+        end: Byte offset to start from (default: end of file)
+        block_size: Bytes per read (default LOG_BLOCK_SIZE)
+    """
+    block_size = block_size or LOG_BLOCK_SIZE
+    with open(path, 'rb') as f:
+        pos = f.seek(0, os.SEEK_END) if end is None else end
+        # Start of a line that begins before `pos`, if any
+        partial = b''
+        at_end = True
+        while pos > 0:
+            size = min(block_size, pos)
+            pos -= size
+            f.seek(pos)
+            lines = (f.read(size) + partial).split(b'\n')
+            partial = lines[0]
+            if at_end:
+                if lines[-1] == b'' and len(lines) > 1:
+                    lines.pop()
+                at_end = False
+            # lines[1:] start right after a newline inside this block
+            starts = []
+            start = pos + len(partial) + 1
+            for line in lines[1:]:
+                starts.append(start)
+                start += len(line) + 1
+            for i in range(len(starts) - 1, -1, -1):
+                yield starts[i], lines[i + 1]
+        if partial or not at_end:
+            yield 0, partial
+
+
+def tail_lines(
+    path: PathLike,
+    limit: int,
+    predicate: Optional[Callable[[str], bool]] = None,
+    skip: int = 0,
+    stop: Optional[Callable[[str], bool]] = None
+) -> List[str]:
+    """
+    Last `limit` non-blank lines accepted by `predicate`, oldest first.
+
+    Reads backwards from the end and stops once enough lines matched, or at
+    the first line `stop` accepts (that line and everything before it are
+    not returned).
+
+    Args:
+        path: File path
+        limit: Lines to return
+        predicate: Filter on the decoded, stripped line (default: all)
+        skip: Newest matching lines to skip first
+        stop: End of the scan, e.g. a line older than a since bound
+    """
+    lines: List[str] = []
+    if limit <= 0:
+        return lines
+    for _, raw in read_lines_reverse(path):
+        line = raw.decode('utf-8', errors='replace').strip()
+        if not line:
+            continue
+        if stop is not None and stop(line):
+            break
+        if predicate is not None and not predicate(line):
+            continue
+        if skip:
+            skip -= 1
+            continue
+        lines.append(line)
+        if len(lines) >= limit:
+            break
+    lines.reverse()
+    return lines
+
+
+# =============================================================================
+# FOLLOWER
+# =============================================================================
+
+class LogFollower:
+    """
+    Byte offset into a log file that only grows between rotations.
+
+    read_new() yields complete lines appended since the previous call.
+    A shorter file, a different inode, or changed leading bytes mean the
+    file was truncated or replaced: the offset restarts at 0 and `resets`
+    is incremented so callers can drop state derived from the old file.
+    """
+
+    def __init__(self, path: PathLike, from_end: bool = False):
+        self.path = Path(path)
+        self.offset = 0
+        self.resets = 0
+        self._identity: Optional[Tuple[int, int]] = None
+        self._head = b''
+        if from_end:
+            self.seek_end()
+
+    def seek_end(self) -> None:
+        """Skip existing content (lines after this are new)."""
+        try:
+            size = self.path.stat().st_size
+        except OSError:
+            return
+        self.seek(self._complete_end(size))
+
+    def seek(self, offset: int) -> None:
+        """Resume from `offset`, which must be the start of a line."""
+        try:
+            st = self.path.stat()
+        except OSError:
+            return
+        self.offset = offset
+        self._identity = (st.st_dev, st.st_ino)
+        self._read_head(st.st_size)
+
+    def _complete_end(self, size: int) -> int:
+        """Offset just after the last newline at or before `size`."""
+        if size == 0:
+            return 0
+        with open(self.path, 'rb') as f:
+            f.seek(size - 1)
+            if f.read(1) == b'\n':
+                return size
+        # Unterminated last line: resume at its start
+        for offset, _ in read_lines_reverse(self.path, end=size):
+            return offset
+        return 0
+
+    def _read_head(self, size: int) -> None:
+        with open(self.path, 'rb') as f:
+            self._head = f.read(min(LOG_HEAD_BYTES, size, self.offset))
+
+    def _replaced(self, st: os.stat_result) -> bool:
+        if self._identity is not None and self._identity != (st.st_dev, st.st_ino):
+            return True
+        if st.st_size < self.offset:
+            return True
+        if self._head:
+            with open(self.path, 'rb') as f:
+                if f.read(len(self._head)) != self._head:
+                    return True
+        return False
+
+    def poll(self) -> Optional[os.stat_result]:
+        """
+        Stat the file and restart at 0 if it was truncated or replaced.
+
+        Returns:
+            The stat result, None if the file does not exist
+        """
+        try:
+            st = self.path.stat()
+        except OSError:
+            return None
+        if self._replaced(st):
+            self.offset = 0
+            self._head = b''
+            self.resets += 1
+        self._identity = (st.st_dev, st.st_ino)
+        return st
+
+    def read_new(self) -> Iterator[Tuple[int, bytes]]:
+        """
+        Yield (offset, line) for complete lines appended since the last call.
+
+        The offset advances past each line as it is yielded, so stopping
+        early resumes at the next line. An unterminated last line is left
+        for a later call.
+        """
+        st = self.poll()
+        if st is None or st.st_size <= self.offset:
+            return
+
+        with open(self.path, 'rb') as f:
+            f.seek(self.offset)
+            remaining = st.st_size - self.offset
+            start = self.offset
+            pending = b''
+            while remaining > 0:
+                block = f.read(min(LOG_READ_CHUNK, remaining))
+                if not block:
+                    break
+                remaining -= len(block)
+                lines = (pending + block).split(b'\n')
+                pending = lines.pop()
+                for line in lines:
+                    self.offset = start + len(line) + 1
+                    if len(self._head) < LOG_HEAD_BYTES and start < LOG_HEAD_BYTES:
+                        self._read_head(st.st_size)
+                    yield start, line
+                    start = self.offset
+
+
+# =============================================================================
+# INDEX
+# =============================================================================
+
+class LogIndex:
+    """
+    Columnar index of a log file's lines.
+
+    Each non-blank line gets its byte offset, timestamp key, level,
+    logger id and a marker bitmask (one bit per named marker pattern).
+    Per-level and per-marker postings make "last N at level >= X" and
+    "last N requests" proportional to N. Lines that do not match the
+    log pattern are indexed as INFO from logger 'unknown' without a
+    timestamp, the same defaults the parsers use.
+
+    Only the newest `max_lines` lines are kept. Line numbers are global
+    (`_base` lines have been dropped); `complete` is False once the index
+    no longer starts at the beginning of the file, and callers that need
+    older lines should fall back to tail_lines.
+    """
+
+    def __init__(
+        self,
+        path: PathLike,
+        pattern: Union[str, Pattern],
+        markers: Optional[Dict[str, Union[str, Pattern]]] = None,
+        max_lines: Optional[int] = None
+    ):
+        self.path = Path(path)
+        self.max_lines = max_lines or LOG_INDEX_MAX_LINES
+        self.pattern = re.compile(pattern) if isinstance(pattern, str) else pattern
+        self.markers = {
+            name: re.compile(p) if isinstance(p, str) else p
+            for name, p in (markers or {}).items()
+        }
+        if len(self.markers) > 8:
+            raise ValueError("At most 8 markers")
+        self._marker_bits = {name: 1 << i for i, name in enumerate(self.markers)}
+        self._follower = LogFollower(self.path)
+        self._lock = threading.Lock()
+        self._warm_lock = threading.Lock()
+        self._warm_thread: Optional[threading.Thread] = None
+        self._ready = False
+        self._metrics = {
+            'refreshes': 0,
+            'lines_indexed': 0,
+            'bytes_indexed': 0,
+            'rebuilds': 0,
+            'lines_dropped': 0,
+            'queries': 0,
+        }
+        self._clear()
+
+    def _clear(self) -> None:
+        self._offsets = array('q')
+        self._times = array('q')
+        self._levels = array('b')
+        self._loggers = array('i')
+        self._marks = array('B')
+        self._by_level = [array('i') for _ in LOG_LEVELS]
+        self._by_marker = {name: array('i') for name in self.markers}
+        self._logger_names: List[str] = []
+        self._logger_ids: Dict[str, int] = {}
+        self._base = 0
+        self._complete = True
+
+    def __len__(self) -> int:
+        return len(self._offsets)
+
+    @property
+    def ready(self) -> bool:
+        """True once the first build has finished."""
+        return self._ready
+
+    @property
+    def complete(self) -> bool:
+        """True while the index holds every line from the start of the file."""
+        return self._complete
+
+    def _logger_id(self, name: str) -> int:
+        logger_id = self._logger_ids.get(name)
+        if logger_id is None:
+            logger_id = self._logger_ids[name] = len(self._logger_names)
+            self._logger_names.append(name)
+        return logger_id
+
+    def _add(self, offset: int, raw: bytes) -> None:
+        line = raw.decode('utf-8', errors='replace').strip()
+        if not line:
+            return
+        match = self.pattern.match(line)
+        if match:
+            ts, logger, level = match.group(1), match.group(2), match.group(3)
+            time = time_key(ts)
+        else:
+            time, logger, level = _NO_TIME, 'unknown', DEFAULT_LEVEL
+
+        n = self._base + len(self._offsets)
+        level_idx = level_index(level)
+        marks = 0
+        for name, marker in self.markers.items():
+            if marker.search(line):
+                marks |= self._marker_bits[name]
+                self._by_marker[name].append(n)
+
+        self._offsets.append(offset)
+        self._times.append(time)
+        self._levels.append(level_idx)
+        self._loggers.append(self._logger_id(logger))
+        self._marks.append(marks)
+        self._by_level[level_idx].append(n)
+
+    def warm(self) -> bool:
+        """
+        Start the first build on a background thread.
+
+        Returns:
+            True if the index is ready to query
+        """
+        if self._ready:
+            return True
+        with self._warm_lock:
+            if self._warm_thread is None:
+                self._warm_thread = threading.Thread(
+                    target=self.refresh, name=f"log-index-{self.path.name}", daemon=True
+                )
+                self._warm_thread.start()
+        return self._ready
+
+    def refresh(self) -> int:
+        """
+        Index lines appended since the last refresh (the newest max_lines
+        lines on the first build and after a rotation).
+
+        Returns:
+            Number of lines read
+        """
+        with self._lock:
+            return self._refresh()
+
+    def _refresh(self) -> int:
+        resets = self._follower.resets
+        self._follower.poll()
+        if self._follower.resets != resets:
+            # Truncated or replaced: the columns describe another file
+            self._clear()
+            self._metrics['rebuilds'] += 1
+        if not self._offsets and self._base == 0 and self._follower.offset == 0:
+            self._seek_window()
+        start_offset = self._follower.offset
+        count = 0
+        for offset, raw in self._follower.read_new():
+            self._add(offset, raw)
+            count += 1
+        if len(self._offsets) > self.max_lines + self.max_lines // 4:
+            self._trim(len(self._offsets) - self.max_lines)
+        self._metrics['refreshes'] += 1
+        self._metrics['lines_indexed'] += count
+        self._metrics['bytes_indexed'] += self._follower.offset - start_offset
+        self._ready = True
+        return count
+
+    def _seek_window(self) -> None:
+        """Start an empty index at the newest max_lines complete lines."""
+        try:
+            size = self.path.stat().st_size
+        except OSError:
+            return
+        end = self._follower._complete_end(size)
+        start = 0
+        count = 0
+        for offset, raw in read_lines_reverse(self.path, end=end):
+            if not raw.strip():
+                continue
+            if count >= self.max_lines:
+                self._complete = False
+                break
+            count += 1
+            start = offset
+        if start:
+            self._follower.seek(start)
+
+    def _trim(self, count: int) -> None:
+        """Drop the oldest `count` lines."""
+        self._base += count
+        for column in (self._offsets, self._times, self._levels, self._loggers, self._marks):
+            del column[:count]
+        for postings in (*self._by_level, *self._by_marker.values()):
+            del postings[:bisect.bisect_left(postings, self._base)]
+        self._complete = False
+        self._metrics['lines_dropped'] += count
+
+    def _candidates(self, min_level: int, marker: Optional[str]) -> Iterator[int]:
+        """Line numbers, newest first, narrowed by the smallest posting list."""
+        if marker is not None:
+            return reversed(self._by_marker[marker])
+        if min_level > 0:
+            return heapq.merge(*(reversed(self._by_level[i]) for i in range(min_level, len(LOG_LEVELS))),
+                               reverse=True)
+        return iter(range(self._base + len(self._offsets) - 1, self._base - 1, -1))
+
+    def query(
+        self,
+        min_level: Optional[str] = None,
+        since: Optional[str] = None,
+        until: Optional[str] = None,
+        logger: Optional[str] = None,
+        marker: Optional[str] = None,
+        limit: int = 100,
+        skip: int = 0,
+        refresh: bool = True
+    ) -> List[str]:
+        """
+        Last `limit` matching lines, oldest first.
+
+        Only indexed lines are searched: fewer than `limit` results from
+        an index that is not `complete` may leave older matches out.
+
+        Args:
+            min_level: Minimum level (default: all)
+            since / until: Inclusive timestamp bounds (prefixes allowed);
+                lines without a timestamp never match a time bound
+            logger: Exact logger name
+            marker: Only lines matching this marker pattern
+            limit: Lines to return
+            skip: Newest matching lines to skip first
+            refresh: Index appended lines before querying
+
+        Raises:
+            KeyError: Unknown marker
+            ValueError: Invalid since/until
+        """
+        if marker is not None and marker not in self.markers:
+            raise KeyError(f"Unknown marker: {marker}")
+        low = time_key(since) if since else None
+        high = time_key(until, upper=True) if until else None
+
+        with self._lock:
+            if refresh:
+                self._refresh()
+            self._metrics['queries'] += 1
+            if limit <= 0:
+                return []
+            logger_id = self._logger_ids.get(logger, -1) if logger is not None else None
+            if logger_id == -1:
+                return []
+
+            min_idx = level_index(min_level) if min_level else 0
+            times = self._times
+            base = self._base
+            matched = []
+            for n in self._candidates(min_idx, marker):
+                i = n - base
+                if marker is not None and self._levels[i] < min_idx:
+                    continue
+                if low is not None or high is not None:
+                    t = times[i]
+                    if t == _NO_TIME or (low is not None and t < low) or (high is not None and t > high):
+                        continue
+                if logger_id is not None and self._loggers[i] != logger_id:
+                    continue
+                if skip:
+                    skip -= 1
+                    continue
+                matched.append(self._offsets[i])
+                if len(matched) >= limit:
+                    break
+
+        return self.read_lines(sorted(matched))
+
+    def read_lines(self, offsets: List[int]) -> List[str]:
+        """Decoded lines (newline stripped) starting at the given offsets."""
+        lines = []
+        if not offsets:
+            return lines
+        with open(self.path, 'rb') as f:
+            for offset in offsets:
+                f.seek(offset)
+                lines.append(f.readline().decode('utf-8', errors='replace').rstrip('\r\n'))
+        return lines
+
+    def get_stats(self) -> Dict:
+        with self._lock:
+            return {
+                **self._metrics,
+                'path': str(self.path),
+                'lines': len(self._offsets),
+                'max_lines': self.max_lines,
+                'complete': self._complete,
+                'ready': self._ready,
+                'offset': self._follower.offset,
+                'loggers': len(self._logger_names),
+                'by_level': {level: len(p) for level, p in zip(LOG_LEVELS, self._by_level)},
+                'index_bytes': sum(a.itemsize * len(a) for a in (
+                    self._offsets, self._times, self._levels, self._loggers, self._marks, *self._by_level,
+                    *self._by_marker.values())),
+            }
+
+
+_INDEXES: Dict[Tuple, LogIndex] = {}
+_INDEXES_LOCK = threading.Lock()
+
+
+def get_log_index(
+    path: PathLike,
+    pattern: Union[str, Pattern],
+    markers: Optional[Dict[str, Union[str, Pattern]]] = None
+) -> LogIndex:
+    """Get (or create) the index for a log file, pattern and marker set."""
+    pattern_key = pattern if isinstance(pattern, str) else pattern.pattern
+    marker_key = tuple(sorted(
+        (name, p if isinstance(p, str) else p.pattern) for name, p in (markers or {}).items()
+    ))
+    key = (os.path.abspath(str(path)), pattern_key, marker_key)
+    index = _INDEXES.get(key)
+    if index is None:
+        with _INDEXES_LOCK:
+            index = _INDEXES.get(key)
+            if index is None:
+                index = _INDEXES[key] = LogIndex(path, pattern, markers)
+    return index
+
+
+def get_log_index_stats() -> List[Dict]:
+    """Stats for every index created in this process."""
+    with _INDEXES_LOCK:
+        indexes = list(_INDEXES.values())
+    return [index.get_stats() for index in indexes]
+
+
+__all__ = [
+    'LOG_LEVELS',
+    'LOG_INDEX_MAX_LINES',
+    'time_key',
+    'level_index',
+    'read_lines_reverse',
+    'tail_lines',
+    'LogFollower',
+    'LogIndex',
+    'get_log_index',
+    'get_log_index_stats',
+]
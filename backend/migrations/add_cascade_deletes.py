@@ -8,10 +8,14 @@ This script safely migrates data while adding ON DELETE CASCADE.
 """
 
 import sqlite3
-import shutil
+import sys
 from pathlib import Path
 from datetime import datetime
 
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sqlite_bulk import copy_database
+
 DB_PATH = Path(__file__).parent.parent.parent / "data" / "contracts.db"
 BACKUP_PATH = DB_PATH.parent / f"contracts_pre_cascade_{datetime.now().strftime('%Y%m%d_%H%M%S')}.db"
 
@@ -24,7 +28,7 @@ def migrate():
 
     # 1. Create backup
     print(f"\n[1] Creating backup: {BACKUP_PATH.name}")
-    shutil.copy(DB_PATH, BACKUP_PATH)
+    copy_database(DB_PATH, BACKUP_PATH)
     print("    Backup created")
 
     conn = sqlite3.connect(str(DB_PATH))
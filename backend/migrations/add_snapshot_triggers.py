@@ -0,0 +1,53 @@
+"""
+Migration: Install the version triggers behind the cached dashboards
+Date: 2026-10-16
+Purpose: Create the change-tracking tables/triggers on contracts outside the request path
+
+Installs (idempotent, safe to re-run):
+- portfolio_aggregate_version + trg_contracts_aggregate_* (portfolio_aggregates.py)
+- health_score_changes + trg_contracts_health_* (health_api.py)
+
+The API also installs them at startup; this script is for databases
+served read-only or prepared before deployment.
+Usage: python add_snapshot_triggers.py [path/to/contracts.db]
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from health_api import HealthScoreCache
+from portfolio_aggregates import PortfolioAggregateCache
+
+DB_PATH = Path(__file__).parent.parent.parent / "data" / "contracts.db"
+
+
+def migrate(db_path: Path = DB_PATH) -> bool:
+    """Run the snapshot trigger migration."""
+    print("=" * 60)
+    print("Snapshot Version Triggers Migration")
+    print("=" * 60)
+
+    if not db_path.exists():
+        print(f"\nDatabase not found: {db_path}")
+        return False
+
+    ok = True
+    for step, cache_class in enumerate((PortfolioAggregateCache, HealthScoreCache), start=1):
+        cache = cache_class(db_path)
+        print(f"\n[{step}] {cache.label} triggers")
+        if cache.install_triggers():
+            print(f"    Installed: {cache.version_table}, {', '.join(cache.trigger_names)}")
+        else:
+            print("    FAILED (see log); the cache falls back to a short TTL")
+            ok = False
+
+    print("\n" + "=" * 60)
+    print("Migration complete!" if ok else "Migration finished with errors")
+    print("=" * 60)
+    return ok
+
+
+if __name__ == "__main__":
+    migrate(Path(sys.argv[1]) if len(sys.argv) > 1 else DB_PATH)
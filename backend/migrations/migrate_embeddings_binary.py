@@ -0,0 +1,88 @@
+"""
+Migration: Rewrite JSON embedding BLOBs to the binary vector format
+Date: 2026-10-16
+Purpose: Cut embedding storage ~4x and remove json.loads from cache hits
+
+Rewrites rows in place in both embedding stores:
+- backend/data/clause_embeddings.db (EmbeddingCache)
+- data/contracts.db clause_embeddings (legacy compare_v3 cache)
+
+Rows already in binary format are skipped, so the script is safe to re-run.
+Usage: python migrate_embeddings_binary.py [float32|float16|int8] [--vacuum]
+"""
+
+import sqlite3
+import sys
+from pathlib import Path
+from datetime import datetime
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from embedding_cache import migrate_embedding_blobs
+from sqlite_bulk import copy_database
+
+CACHE_DB_PATH = Path(__file__).parent.parent / "data" / "clause_embeddings.db"
+CONTRACTS_DB_PATH = Path(__file__).parent.parent.parent / "data" / "contracts.db"
+LEGACY_MODEL = "text-embedding-3-large"
+
+
+def _table_columns(db_path: Path, table: str) -> list:
+    """Return column names for table, or [] if it does not exist."""
+    conn = sqlite3.connect(str(db_path))
+    try:
+        return [row[1] for row in conn.execute(f"PRAGMA table_info({table})")]
+    finally:
+        conn.close()
+
+
+def migrate(dtype: str = "float32", vacuum: bool = False):
+    """Run the binary embedding migration."""
+    print("=" * 60)
+    print(f"Binary Embedding Migration ({dtype})")
+    print("=" * 60)
+
+    targets = [
+        (CACHE_DB_PATH, "embedding_vector", "model_version"),
+        (CONTRACTS_DB_PATH, "embedding", None),
+    ]
+
+    for step, (db_path, column, model_column) in enumerate(targets, start=1):
+        print(f"\n[{step}] {db_path.name}")
+
+        if not db_path.exists():
+            print("    Database not found, skipping")
+            continue
+        if column not in _table_columns(db_path, "clause_embeddings"):
+            print("    No clause_embeddings table, skipping")
+            continue
+
+        backup_path = db_path.parent / f"{db_path.stem}_pre_binary_{datetime.now().strftime('%Y%m%d_%H%M%S')}.db"
+        copy_database(db_path, backup_path)
+        print(f"    Backup created: {backup_path.name}")
+
+        result = migrate_embedding_blobs(
+            str(db_path),
+            column=column,
+            model_column=model_column,
+            default_model=LEGACY_MODEL,
+            dtype=dtype,
+        )
+        print(f"    Rows scanned: {result['rows_scanned']}")
+        print(f"    Rows migrated: {result['rows_migrated']}")
+        print(f"    Rows invalid (left as-is): {result['rows_invalid']}")
+        print(f"    Bytes saved: {result['bytes_saved']:,}")
+
+        if vacuum and result["rows_migrated"]:
+            conn = sqlite3.connect(str(db_path))
+            conn.execute("VACUUM")
+            conn.close()
+            print("    VACUUM complete")
+
+    print("\n" + "=" * 60)
+    print("Migration complete!")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    args = [a for a in sys.argv[1:] if not a.startswith("--")]
+    migrate(dtype=args[0] if args else "float32", vacuum="--vacuum" in sys.argv)
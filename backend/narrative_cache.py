@@ -0,0 +1,303 @@
+"""
+BIRL Narrative Cache for Phase 5 Compare v3 Pipeline
+Stores Claude business impact narratives per clause pair.
+
+Narratives are keyed on hash(v1 excerpt, v2 excerpt, risk category, prompt
+version), so re-running a compare on unchanged clause pairs makes no LLM calls.
+Only narratives that passed the hallucination shield are stored; callers still
+run the shield on every cached narrative before use.
+
+Activated by birl_narrative_cache_active flag.
+"""
+
+import hashlib
+import os
+import sqlite3
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional, Tuple
+
+from phase5_flags import is_flag_enabled, get_config
+
+
+# SQLite bound-parameter limit is 999 on older builds
+SQLITE_IN_CHUNK_SIZE = 500
+
+
+# ============================================================================
+# NARRATIVE CACHE CLASS
+# ============================================================================
+
+class NarrativeCache:
+    """
+    SQLite-based cache for BIRL narratives.
+
+    Keys are content hashes, so entries never go stale for the same inputs;
+    TTL and LRU eviction only bound the table size.
+    """
+
+    def __init__(self, db_path: Optional[str] = None):
+        """
+        Initialize narrative cache.
+
+        Args:
+            db_path: Path to SQLite database (defaults to data/birl_narratives.db)
+        """
+        if db_path is None:
+            db_path = os.path.join(
+                os.path.dirname(__file__),
+                "data",
+                "birl_narratives.db"
+            )
+
+        self.db_path = os.path.abspath(db_path)
+        os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
+        self._init_schema()
+
+        # Metrics counters (in-memory)
+        self._metrics = {
+            "hits": 0,
+            "misses": 0,
+            "writes": 0,
+            "evictions": 0,
+            "errors": 0,
+        }
+
+    def _init_schema(self) -> None:
+        """Initialize database schema"""
+        conn = sqlite3.connect(self.db_path)
+        cursor = conn.cursor()
+
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS birl_narratives (
+                narrative_key TEXT PRIMARY KEY,
+                narrative TEXT NOT NULL,
+                risk_category TEXT,
+                prompt_version TEXT NOT NULL,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                last_accessed_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                access_count INTEGER DEFAULT 0
+            )
+        """)
+
+        # Index on last_accessed_at for LRU eviction
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_narrative_last_accessed
+            ON birl_narratives(last_accessed_at)
+        """)
+
+        conn.commit()
+        conn.close()
+
+    @staticmethod
+    def compute_key(
+        v1_excerpt: str,
+        v2_excerpt: str,
+        risk_category: str,
+        prompt_version: str
+    ) -> str:
+        """
+        Compute deterministic cache key for a clause pair narrative.
+
+        Args:
+            v1_excerpt: V1 clause excerpt sent to Claude
+            v2_excerpt: V2 clause excerpt sent to Claude
+            risk_category: ERCE risk category for the pair
+            prompt_version: BIRL prompt version
+
+        Returns:
+            SHA-256 hash hex string
+        """
+        combined = "\x1f".join([prompt_version, risk_category or "", v1_excerpt, v2_excerpt])
+        return hashlib.sha256(combined.encode("utf-8")).hexdigest()
+
+    def get_many(self, keys: List[str]) -> Dict[str, str]:
+        """
+        Get cached narratives for several keys in one round trip.
+
+        Args:
+            keys: Narrative keys from compute_key
+
+        Returns:
+            Dict of key -> narrative for keys found (missing keys omitted)
+
+        Note: Only returns data if birl_narrative_cache_active flag is True.
+        """
+        unique_keys = list(dict.fromkeys(keys))
+        if not is_flag_enabled("birl_narrative_cache_active") or not unique_keys:
+            self._metrics["misses"] += len(unique_keys)
+            return {}
+
+        ttl_hours = get_config("birl_narrative_cache_ttl_hours", 720)
+        cutoff = (datetime.utcnow() - timedelta(hours=ttl_hours)).strftime("%Y-%m-%d %H:%M:%S")
+        found: Dict[str, str] = {}
+
+        try:
+            conn = sqlite3.connect(self.db_path)
+            cursor = conn.cursor()
+
+            for start in range(0, len(unique_keys), SQLITE_IN_CHUNK_SIZE):
+                chunk = unique_keys[start:start + SQLITE_IN_CHUNK_SIZE]
+                placeholders = ",".join("?" * len(chunk))
+                cursor.execute(f"""
+                    SELECT narrative_key, narrative
+                    FROM birl_narratives
+                    WHERE narrative_key IN ({placeholders}) AND created_at >= ?
+                """, (*chunk, cutoff))
+                found.update(cursor.fetchall())
+
+            if found:
+                cursor.executemany("""
+                    UPDATE birl_narratives
+                    SET access_count = access_count + 1,
+                        last_accessed_at = CURRENT_TIMESTAMP
+                    WHERE narrative_key = ?
+                """, [(key,) for key in found])
+                conn.commit()
+
+            conn.close()
+
+        except sqlite3.Error:
+            self._metrics["errors"] += 1
+            self._metrics["misses"] += len(unique_keys)
+            return {}
+
+        self._metrics["hits"] += len(found)
+        self._metrics["misses"] += len(unique_keys) - len(found)
+        return found
+
+    def put_many(self, items: List[Tuple[str, str, str, str]]) -> int:
+        """
+        Store narratives in cache.
+
+        Args:
+            items: List of (key, narrative, risk_category, prompt_version)
+
+        Returns:
+            Number of narratives stored
+
+        Note: Only stores data if birl_narrative_cache_active flag is True.
+        """
+        if not is_flag_enabled("birl_narrative_cache_active") or not items:
+            return 0
+
+        try:
+            max_entries = get_config("birl_narrative_cache_max_entries", 5000)
+            if self._get_entry_count() + len(items) > max_entries:
+                self._evict_lru(count=max(50, len(items)))
+
+            conn = sqlite3.connect(self.db_path)
+            conn.executemany("""
+                INSERT OR REPLACE INTO birl_narratives
+                (narrative_key, narrative, risk_category, prompt_version,
+                 created_at, last_accessed_at, access_count)
+                VALUES (?, ?, ?, ?, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP, 0)
+            """, items)
+            conn.commit()
+            conn.close()
+
+            self._metrics["writes"] += len(items)
+            return len(items)
+
+        except sqlite3.Error:
+            self._metrics["errors"] += 1
+            return 0
+
+    def _get_entry_count(self) -> int:
+        """Get current number of cached entries"""
+        try:
+            conn = sqlite3.connect(self.db_path)
+            count = conn.execute("SELECT COUNT(*) FROM birl_narratives").fetchone()[0]
+            conn.close()
+            return count
+        except sqlite3.Error:
+            return 0
+
+    def _evict_lru(self, count: int = 50) -> int:
+        """
+        Evict least recently used entries.
+
+        Args:
+            count: Number of entries to evict
+
+        Returns:
+            Number of entries evicted
+        """
+        try:
+            conn = sqlite3.connect(self.db_path)
+            cursor = conn.cursor()
+            cursor.execute("""
+                DELETE FROM birl_narratives
+                WHERE narrative_key IN (
+                    SELECT narrative_key FROM birl_narratives
+                    ORDER BY last_accessed_at ASC
+                    LIMIT ?
+                )
+            """, (count,))
+            evicted = cursor.rowcount
+            conn.commit()
+            conn.close()
+
+            self._metrics["evictions"] += evicted
+            return evicted
+
+        except sqlite3.Error:
+            return 0
+
+    def clear(self) -> Dict[str, int]:
+        """
+        Clear all cached narratives.
+
+        Returns:
+            Statistics about cleared cache
+        """
+        try:
+            conn = sqlite3.connect(self.db_path)
+            cursor = conn.cursor()
+            cursor.execute("DELETE FROM birl_narratives")
+            count = cursor.rowcount
+            conn.commit()
+            conn.close()
+
+            self._metrics["evictions"] += count
+            return {"deleted_entries": count}
+
+        except sqlite3.Error:
+            return {"deleted_entries": 0}
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dictionary with cache statistics and metrics
+        """
+        total_requests = self._metrics["hits"] + self._metrics["misses"]
+        return {
+            "entry_count": self._get_entry_count(),
+            "metrics": self._metrics.copy(),
+            "hit_rate": self._metrics["hits"] / total_requests if total_requests > 0 else 0.0,
+            "max_entries": get_config("birl_narrative_cache_max_entries", 5000),
+            "ttl_hours": get_config("birl_narrative_cache_ttl_hours", 720),
+            "flag_enabled": is_flag_enabled("birl_narrative_cache_active"),
+            "db_path": self.db_path,
+        }
+
+
+# ============================================================================
+# GLOBAL INSTANCE
+# ============================================================================
+
+_narrative_cache: Optional[NarrativeCache] = None
+
+
+def get_narrative_cache() -> NarrativeCache:
+    """
+    Get global narrative cache instance.
+
+    Returns:
+        NarrativeCache singleton
+    """
+    global _narrative_cache
+    if _narrative_cache is None:
+        _narrative_cache = NarrativeCache()
+    return _narrative_cache
@@ -42,6 +42,12 @@ try:
 except ImportError:
     from models import AIResult, AI_ERROR_KEYS, AI_MAX_RETRIES, AI_RETRY_ALLOWED_CATEGORIES
 
+# Shared write path (WAL, synchronous=NORMAL, one transaction per write)
+try:
+    from .sqlite_bulk import write_transaction
+except ImportError:
+    from sqlite_bulk import write_transaction
+
 # Setup logging
 logging.basicConfig(
     level=logging.INFO,
@@ -1799,29 +1805,23 @@ def save_comparison_snapshot(
         comparison_id if successful, None otherwise
     """
     try:
-        conn = sqlite3.connect(db_path)
-        conn.execute("PRAGMA foreign_keys = ON")
-        cursor = conn.cursor()
-
-        cursor.execute("""
-            INSERT INTO comparison_snapshots (
-                v1_contract_id, v2_contract_id, v1_snapshot_id, v2_snapshot_id,
-                similarity_score, changed_clauses, risk_delta, created_at
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-        """, (
-            v1_contract_id,
-            v2_contract_id,
-            v1_snapshot_id,
-            v2_snapshot_id,
-            similarity_score,
-            json.dumps(changed_clauses),
-            json.dumps(risk_delta),
-            datetime.now().isoformat()
-        ))
-
-        comparison_id = cursor.lastrowid
-        conn.commit()
-        conn.close()
+        with write_transaction(db_path, foreign_keys=True) as conn:
+            cursor = conn.execute("""
+                INSERT INTO comparison_snapshots (
+                    v1_contract_id, v2_contract_id, v1_snapshot_id, v2_snapshot_id,
+                    similarity_score, changed_clauses, risk_delta, created_at
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            """, (
+                v1_contract_id,
+                v2_contract_id,
+                v1_snapshot_id,
+                v2_snapshot_id,
+                similarity_score,
+                json.dumps(changed_clauses),
+                json.dumps(risk_delta),
+                datetime.now().isoformat()
+            ))
+            comparison_id = cursor.lastrowid
 
         logger.info(f"Saved comparison snapshot {comparison_id}: V1={v1_contract_id} vs V2={v2_contract_id}")
         return comparison_id
@@ -2526,10 +2526,6 @@ def save_redline_snapshot(db_path: str, snapshot) -> int:
     Returns new redline_id.
     """
     try:
-        conn = sqlite3.connect(db_path)
-        conn.execute("PRAGMA foreign_keys = ON")
-        cursor = conn.cursor()
-
         # v4: Serialize clauses to JSON with all v4 fields
         clauses_json = json.dumps([
             {
@@ -2555,28 +2551,27 @@ def save_redline_snapshot(db_path: str, snapshot) -> int:
         ])
 
         # v4: Include status, contract_position, and dealbreakers_detected
-        cursor.execute("""
-            INSERT INTO redline_snapshots (
-                contract_id, base_version_contract_id, source_mode,
-                created_at, overall_risk_before, overall_risk_after, clauses_json,
-                status, contract_position, dealbreakers_detected
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """, (
-            snapshot.contract_id,
-            snapshot.base_version_contract_id,
-            snapshot.source_mode,
-            snapshot.created_at,
-            snapshot.overall_risk_before,
-            snapshot.overall_risk_after,
-            clauses_json,
-            getattr(snapshot, 'status', 'draft'),
-            getattr(snapshot, 'contract_position', None),
-            getattr(snapshot, 'dealbreakers_detected', 0)
-        ))
+        with write_transaction(db_path, foreign_keys=True) as conn:
+            cursor = conn.execute("""
+                INSERT INTO redline_snapshots (
+                    contract_id, base_version_contract_id, source_mode,
+                    created_at, overall_risk_before, overall_risk_after, clauses_json,
+                    status, contract_position, dealbreakers_detected
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """, (
+                snapshot.contract_id,
+                snapshot.base_version_contract_id,
+                snapshot.source_mode,
+                snapshot.created_at,
+                snapshot.overall_risk_before,
+                snapshot.overall_risk_after,
+                clauses_json,
+                getattr(snapshot, 'status', 'draft'),
+                getattr(snapshot, 'contract_position', None),
+                getattr(snapshot, 'dealbreakers_detected', 0)
+            ))
 
-        redline_id = cursor.lastrowid
-        conn.commit()
-        conn.close()
+            redline_id = cursor.lastrowid
 
         logger.info(f"Saved redline snapshot {redline_id} for contract {snapshot.contract_id}")
         return redline_id
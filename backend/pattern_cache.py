@@ -6,12 +6,16 @@ Phase 5 Step 1: Schema and metrics only.
 Pattern matching activation happens in Step 3.
 """
 
+import copy
+import hashlib
 import json
 import os
 import re
+import tempfile
+import threading
 from dataclasses import dataclass, asdict
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from phase5_flags import is_flag_enabled, get_config
 
@@ -155,14 +159,139 @@ DEFAULT_PATTERNS: List[Dict[str, Any]] = [
 ]
 
 
+# ============================================================================
+# COMPILED PATTERN INDEX
+# ============================================================================
+
+class CompiledPatternIndex:
+    """
+    Risk patterns compiled once per library version.
+
+    Regexes are precompiled and keyword lists parsed and lowercased up front,
+    with keywords shared across patterns checked once per text. Results are
+    identical to evaluating each pattern separately (leftmost match per regex,
+    first listed keyword present per keyword pattern), in pattern order.
+    """
+
+    def __init__(self, patterns: List[RiskPattern], version: Optional[str] = None):
+        """
+        Build index over enabled patterns.
+
+        Args:
+            patterns: Patterns in evaluation order (disabled ones are skipped)
+            version: Library version (content hash) this index was built from
+        """
+        self.version = version
+        self.patterns: List[RiskPattern] = []
+        self.errors = 0
+        # Position in the source list of each indexed pattern, by slot
+        self._positions: List[int] = []
+
+        # (slot, compiled) and (slot, [(keyword, keyword_lower), ...]); slot indexes self.patterns
+        self._regex_slots: List[Tuple[int, re.Pattern]] = []
+        self._keyword_slots: List[Tuple[int, List[Tuple[str, str]]]] = []
+        distinct_keywords = set()
+
+        for position, pattern in enumerate(patterns):
+            if not pattern.enabled:
+                continue
+
+            if pattern.pattern_type == "regex":
+                try:
+                    compiled = re.compile(pattern.pattern_value)
+                except re.error:
+                    self.errors += 1
+                    continue
+                self._regex_slots.append((len(self.patterns), compiled))
+                self.patterns.append(pattern)
+                self._positions.append(position)
+
+            elif pattern.pattern_type == "keyword":
+                try:
+                    keywords = json.loads(pattern.pattern_value)
+                except (json.JSONDecodeError, TypeError):
+                    keywords = None
+                if not isinstance(keywords, list) or not all(isinstance(kw, str) for kw in keywords):
+                    self.errors += 1
+                    continue
+                lowered = [(kw, kw.lower()) for kw in keywords]
+                distinct_keywords.update(kw_lower for _, kw_lower in lowered)
+                self._keyword_slots.append((len(self.patterns), lowered))
+                self.patterns.append(pattern)
+                self._positions.append(position)
+
+        self._distinct_keywords = tuple(distinct_keywords)
+
+    def match(
+        self,
+        text: str,
+        patterns: Optional[List[RiskPattern]] = None,
+    ) -> List[Tuple[RiskPattern, str, Optional[int], Optional[int]]]:
+        """
+        Match text against all indexed patterns.
+
+        Args:
+            text: Text to match
+            patterns: Source list to report hits from, for an index shared
+                across lists of the same version whose metadata (name,
+                category, probability, priority) may differ; defaults to
+                the patterns the index was built from
+
+        Returns:
+            List of (pattern, match_text, match_start, match_end) in pattern
+            order; start/end are None for keyword patterns
+        """
+        hits: Dict[int, Tuple[str, Optional[int], Optional[int]]] = {}
+
+        for slot, compiled in self._regex_slots:
+            match = compiled.search(text)
+            if match:
+                hits[slot] = (match.group(), match.start(), match.end())
+
+        if self._keyword_slots:
+            text_lower = text.lower()
+            present = {kw for kw in self._distinct_keywords if kw in text_lower}
+            if present:
+                for slot, keywords in self._keyword_slots:
+                    for keyword, keyword_lower in keywords:
+                        if keyword_lower in present:
+                            hits[slot] = (keyword, None, None)
+                            break
+
+        if patterns is None:
+            return [(self.patterns[slot], *hits[slot]) for slot in sorted(hits)]
+        return [(patterns[self._positions[slot]], *hits[slot]) for slot in sorted(hits)]
+
+    def __len__(self) -> int:
+        return len(self.patterns)
+
+
 # ============================================================================
 # PATTERN CACHE CLASS
 # ============================================================================
 
+@dataclass
+class _LibraryState:
+    """Parsed pattern library held in memory, swapped atomically on reload."""
+    data: Dict[str, Any]
+    all_patterns: List[RiskPattern]
+    enabled: List[RiskPattern]
+    by_id: Dict[str, RiskPattern]
+    by_category: Dict[str, List[RiskPattern]]
+    version: str
+
+
 class PatternCache:
     """
     JSON-based cache for ERCE risk classification patterns.
 
+    The library is parsed once into RiskPattern objects indexed by id and
+    category, and revalidated against the file's mtime/size on each read.
+    Returned RiskPattern objects are shared and must be treated as read-only;
+    change patterns through add_pattern/update_pattern/delete_pattern.
+    Writes go to a temp file that is renamed into place, so concurrent
+    readers never see a half-written file.
+
     Phase 5 Step 1: Structure and metrics only.
     Pattern matching activation happens in Step 3.
     """
@@ -186,6 +315,14 @@ class PatternCache:
         # In-memory compiled patterns (for performance)
         self._compiled_patterns: Dict[str, re.Pattern] = {}
 
+        # In-memory library, validated against (mtime_ns, size) of the file
+        self._state: Optional[_LibraryState] = None
+        self._library_stat: Optional[Tuple[int, int]] = None
+        self._lock = threading.RLock()
+
+        # Compiled index over enabled patterns, keyed on library content hash
+        self._index: Optional[CompiledPatternIndex] = None
+
         # Metrics counters (in-memory) - must be initialized before _init_cache
         self._metrics = {
             "pattern_matches": 0,
@@ -206,40 +343,141 @@ class PatternCache:
     def _init_cache(self) -> None:
         """Initialize cache file with default patterns if not exists"""
         if not os.path.exists(self.cache_path):
-            self._write_cache({
-                "schema_version": "1.0.0",
-                "created_at": datetime.now().isoformat(),
-                "updated_at": datetime.now().isoformat(),
-                "patterns": DEFAULT_PATTERNS
-            })
+            self._write_cache(self._default_data())
 
-    def _read_cache(self) -> Dict[str, Any]:
-        """Read cache from JSON file"""
+    @staticmethod
+    def _default_data() -> Dict[str, Any]:
+        """Library contents used when the file is missing or unreadable"""
+        return {
+            "schema_version": "1.0.0",
+            "created_at": datetime.now().isoformat(),
+            "updated_at": datetime.now().isoformat(),
+            "patterns": DEFAULT_PATTERNS
+        }
+
+    def _set_state(self, data: Dict[str, Any], version: str) -> None:
+        """Parse library data into RiskPattern objects and indexes."""
+        patterns = []
+        for p in data.get("patterns", []):
+            try:
+                patterns.append(RiskPattern.from_dict(p))
+            except TypeError:
+                self._metrics["errors"] += 1
+
+        all_patterns = sorted(patterns, key=lambda p: p.priority, reverse=True)
+        enabled = [p for p in all_patterns if p.enabled]
+
+        by_id: Dict[str, RiskPattern] = {}
+        for p in all_patterns:
+            by_id.setdefault(p.pattern_id, p)
+
+        by_category: Dict[str, List[RiskPattern]] = {}
+        for p in enabled:
+            by_category.setdefault(p.risk_category, []).append(p)
+
+        self._compiled_patterns.clear()
+        self._state = _LibraryState(
+            data=data,
+            all_patterns=all_patterns,
+            enabled=enabled,
+            by_id=by_id,
+            by_category=by_category,
+            version=version,
+        )
+
+    def _get_state(self) -> _LibraryState:
+        """
+        Get in-memory library, reloading only if the file changed.
+
+        Returns:
+            Current _LibraryState
+        """
         try:
-            with open(self.cache_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            stat = os.stat(self.cache_path)
+            signature = (stat.st_mtime_ns, stat.st_size)
+        except OSError:
+            signature = None
+
+        state = self._state
+        if state is not None and signature is not None and signature == self._library_stat:
+            return state
+
+        with self._lock:
+            if self._state is not None and signature is not None and signature == self._library_stat:
+                return self._state
+
+            if signature is None:
+                # Missing file: serve defaults, re-check on next read
+                if self._state is None or self._state.version != "defaults":
+                    self._metrics["errors"] += 1
+                    self._set_state(self._default_data(), "defaults")
+                self._library_stat = None
+                return self._state
+
+            try:
+                with open(self.cache_path, 'rb') as f:
+                    raw = f.read()
                 self._metrics["cache_loads"] += 1
-                return data
-        except (json.JSONDecodeError, FileNotFoundError) as e:
-            self._metrics["errors"] += 1
-            return {
-                "schema_version": "1.0.0",
-                "created_at": datetime.now().isoformat(),
-                "updated_at": datetime.now().isoformat(),
-                "patterns": DEFAULT_PATTERNS
-            }
+            except OSError:
+                self._metrics["errors"] += 1
+                if self._state is None:
+                    self._set_state(self._default_data(), "defaults")
+                return self._state
+
+            version = hashlib.sha256(raw).hexdigest()
+            if self._state is None or self._state.version != version:
+                try:
+                    data = json.loads(raw.decode('utf-8'))
+                except (ValueError, UnicodeDecodeError):
+                    self._metrics["errors"] += 1
+                    data = self._default_data()
+                self._set_state(data, version)
+
+            self._library_stat = signature
+            return self._state
+
+    def _read_cache(self) -> Dict[str, Any]:
+        """Get a mutable copy of the library data"""
+        data = copy.deepcopy(self._get_state().data)
+        data.setdefault("patterns", [])
+        return data
 
     def _write_cache(self, data: Dict[str, Any]) -> bool:
-        """Write cache to JSON file"""
+        """Write cache to JSON file atomically (temp file + rename)"""
+        tmp_path = None
         try:
             data["updated_at"] = datetime.now().isoformat()
-            with open(self.cache_path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            raw = json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+
+            fd, tmp_path = tempfile.mkstemp(
+                prefix=".pattern_library.",
+                suffix=".tmp",
+                dir=os.path.dirname(self.cache_path),
+            )
+            with os.fdopen(fd, 'wb') as f:
+                f.write(raw)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.cache_path)
+            tmp_path = None
+
+            # Prime memory from what was written (not counted as a load)
+            with self._lock:
+                stat = os.stat(self.cache_path)
+                self._set_state(copy.deepcopy(data), hashlib.sha256(raw).hexdigest())
+                self._library_stat = (stat.st_mtime_ns, stat.st_size)
+
             self._metrics["cache_writes"] += 1
             return True
-        except (IOError, json.JSONDecodeError) as e:
+        except (OSError, TypeError, ValueError):
             self._metrics["errors"] += 1
             return False
+        finally:
+            if tmp_path is not None:
+                try:
+                    os.unlink(tmp_path)
+                except OSError:
+                    pass
 
     def get_all_patterns(self) -> List[RiskPattern]:
         """
@@ -250,9 +488,7 @@ class PatternCache:
 
         Note: Returns patterns regardless of feature flag (read-only operation).
         """
-        data = self._read_cache()
-        patterns = [RiskPattern.from_dict(p) for p in data.get("patterns", [])]
-        return sorted(patterns, key=lambda p: p.priority, reverse=True)
+        return list(self._get_state().all_patterns)
 
     def get_enabled_patterns(self) -> List[RiskPattern]:
         """
@@ -261,8 +497,7 @@ class PatternCache:
         Returns:
             List of enabled RiskPattern objects, sorted by priority
         """
-        all_patterns = self.get_all_patterns()
-        return [p for p in all_patterns if p.enabled]
+        return list(self._get_state().enabled)
 
     def get_patterns_by_category(self, category: str) -> List[RiskPattern]:
         """
@@ -274,8 +509,7 @@ class PatternCache:
         Returns:
             List of matching RiskPattern objects
         """
-        all_patterns = self.get_enabled_patterns()
-        return [p for p in all_patterns if p.risk_category == category]
+        return list(self._get_state().by_category.get(category, []))
 
     def get_pattern_by_id(self, pattern_id: str) -> Optional[RiskPattern]:
         """
@@ -287,11 +521,7 @@ class PatternCache:
         Returns:
             RiskPattern or None if not found
         """
-        all_patterns = self.get_all_patterns()
-        for p in all_patterns:
-            if p.pattern_id == pattern_id:
-                return p
-        return None
+        return self._get_state().by_id.get(pattern_id)
 
     def add_pattern(self, pattern: RiskPattern) -> bool:
         """
@@ -399,6 +629,37 @@ class PatternCache:
             self._metrics["errors"] += 1
             return None
 
+    def get_library_version(self) -> str:
+        """
+        Get content hash of the pattern library file.
+
+        Returns:
+            SHA-256 hex digest of the file, or "defaults" if it cannot be read
+        """
+        return self._get_state().version
+
+    def get_compiled_index(self) -> CompiledPatternIndex:
+        """
+        Get compiled index over enabled patterns.
+
+        Rebuilt only when the library content hash changes, so a touched but
+        unchanged file does not trigger recompilation.
+
+        Returns:
+            CompiledPatternIndex for the current library version
+        """
+        state = self._get_state()
+        index = self._index
+        if index is not None and index.version == state.version:
+            return index
+
+        with self._lock:
+            if self._index is None or self._index.version != state.version:
+                index = CompiledPatternIndex(state.enabled, version=state.version)
+                self._metrics["errors"] += index.errors
+                self._index = index
+            return self._index
+
     def match_text(self, text: str) -> List[Dict[str, Any]]:
         """
         Match text against all enabled patterns.
@@ -415,48 +676,24 @@ class PatternCache:
         if not is_flag_enabled("pattern_cache_active"):
             return []
 
-        matches = []
-        patterns = self.get_enabled_patterns()
-
-        for pattern in patterns:
-            if pattern.pattern_type == "regex":
-                compiled = self.compile_pattern(pattern)
-                if compiled:
-                    match = compiled.search(text)
-                    if match:
-                        self._metrics["pattern_matches"] += 1
-                        matches.append({
-                            "pattern_id": pattern.pattern_id,
-                            "pattern_name": pattern.pattern_name,
-                            "risk_category": pattern.risk_category,
-                            "success_probability": pattern.success_probability,
-                            "match_text": match.group(),
-                            "match_start": match.start(),
-                            "match_end": match.end(),
-                        })
-                    else:
-                        self._metrics["pattern_misses"] += 1
-
-            elif pattern.pattern_type == "keyword":
-                keywords = json.loads(pattern.pattern_value)
-                text_lower = text.lower()
-                for keyword in keywords:
-                    if keyword.lower() in text_lower:
-                        self._metrics["pattern_matches"] += 1
-                        matches.append({
-                            "pattern_id": pattern.pattern_id,
-                            "pattern_name": pattern.pattern_name,
-                            "risk_category": pattern.risk_category,
-                            "success_probability": pattern.success_probability,
-                            "match_text": keyword,
-                            "match_start": None,
-                            "match_end": None,
-                        })
-                        break
-                else:
-                    self._metrics["pattern_misses"] += 1
-
-        return matches
+        index = self.get_compiled_index()
+        hits = index.match(text)
+
+        self._metrics["pattern_matches"] += len(hits)
+        self._metrics["pattern_misses"] += len(index) - len(hits)
+
+        return [
+            {
+                "pattern_id": pattern.pattern_id,
+                "pattern_name": pattern.pattern_name,
+                "risk_category": pattern.risk_category,
+                "success_probability": pattern.success_probability,
+                "match_text": match_text,
+                "match_start": match_start,
+                "match_end": match_end,
+            }
+            for pattern, match_text, match_start, match_end in hits
+        ]
 
     def reset_cache(self) -> bool:
         """
@@ -466,12 +703,8 @@ class PatternCache:
             True if reset successfully
         """
         self._compiled_patterns.clear()
-        return self._write_cache({
-            "schema_version": "1.0.0",
-            "created_at": datetime.now().isoformat(),
-            "updated_at": datetime.now().isoformat(),
-            "patterns": DEFAULT_PATTERNS
-        })
+        self._index = None
+        return self._write_cache(self._default_data())
 
     def get_stats(self) -> Dict[str, Any]:
         """
@@ -480,7 +713,7 @@ class PatternCache:
         Returns:
             Dictionary with cache statistics and metrics
         """
-        data = self._read_cache()
+        data = self._get_state().data
         patterns = data.get("patterns", [])
 
         # Count by category
@@ -627,7 +860,8 @@ class ERCEMatchResult:
 
 def match_patterns_for_erce(
     text: str,
-    patterns: List[RiskPattern]
+    patterns: List[RiskPattern],
+    index: Optional[CompiledPatternIndex] = None,
 ) -> List[Dict[str, Any]]:
     """
     Match text against patterns for ERCE classification.
@@ -638,6 +872,8 @@ def match_patterns_for_erce(
     Args:
         text: Combined clause text to analyze
         patterns: List of RiskPattern objects to match against
+        index: get_pattern_index(patterns), when matching many texts against
+            the same list (skips re-hashing the list per call)
 
     Returns:
         List of matched patterns with match details
@@ -645,48 +881,73 @@ def match_patterns_for_erce(
     if not text or not patterns:
         return []
 
-    matches = []
-    text_lower = text.lower()
+    if index is None:
+        index = get_pattern_index(patterns)
+    return [
+        {
+            "pattern_id": pattern.pattern_id,
+            "pattern_name": pattern.pattern_name,
+            "risk_category": pattern.risk_category,
+            "success_probability": pattern.success_probability,
+            "match_text": match_text,
+            "match_type": pattern.pattern_type,
+            "priority": pattern.priority,
+        }
+        for pattern, match_text, _, _ in index.match(text, patterns)
+    ]
+
 
-    for pattern in patterns:
-        if not pattern.enabled:
-            continue
+# Indexes for pattern lists passed to match_patterns_for_erce, keyed on content
+_PATTERN_INDEX_MAX_ENTRIES = 8
+_pattern_indexes: Dict[str, CompiledPatternIndex] = {}
+_pattern_indexes_lock = threading.Lock()
 
-        if pattern.pattern_type == "regex":
-            try:
-                compiled = re.compile(pattern.pattern_value)
-                match = compiled.search(text)
-                if match:
-                    matches.append({
-                        "pattern_id": pattern.pattern_id,
-                        "pattern_name": pattern.pattern_name,
-                        "risk_category": pattern.risk_category,
-                        "success_probability": pattern.success_probability,
-                        "match_text": match.group(),
-                        "match_type": "regex",
-                        "priority": pattern.priority,
-                    })
-            except re.error:
-                continue
 
-        elif pattern.pattern_type == "keyword":
-            try:
-                keywords = json.loads(pattern.pattern_value)
-                matched_keywords = [kw for kw in keywords if kw.lower() in text_lower]
-                if matched_keywords:
-                    matches.append({
-                        "pattern_id": pattern.pattern_id,
-                        "pattern_name": pattern.pattern_name,
-                        "risk_category": pattern.risk_category,
-                        "success_probability": pattern.success_probability,
-                        "match_text": matched_keywords[0],
-                        "match_type": "keyword",
-                        "priority": pattern.priority,
-                    })
-            except (json.JSONDecodeError, TypeError):
-                continue
+def compute_patterns_version(patterns: List[RiskPattern]) -> str:
+    """
+    Compute content hash over the fields that affect matching.
 
-    return matches
+    Args:
+        patterns: Patterns in evaluation order
+
+    Returns:
+        SHA-256 hex digest
+    """
+    digest = hashlib.sha256()
+    for p in patterns:
+        digest.update(
+            f"{p.pattern_id}\x1f{p.pattern_type}\x1f{p.enabled}\x1f{p.pattern_value}\x1e".encode("utf-8")
+        )
+    return digest.hexdigest()
+
+
+def get_pattern_index(patterns: List[RiskPattern]) -> CompiledPatternIndex:
+    """
+    Get compiled index for a pattern list, building it once per content version.
+
+    The version covers only the fields that affect matching, so lists that
+    differ in metadata share an index; pass the list to index.match() to
+    report the caller's own RiskPattern objects.
+
+    Args:
+        patterns: Patterns in evaluation order
+
+    Returns:
+        CompiledPatternIndex shared by all callers passing the same patterns
+    """
+    version = compute_patterns_version(patterns)
+    index = _pattern_indexes.get(version)
+    if index is not None:
+        return index
+
+    with _pattern_indexes_lock:
+        index = _pattern_indexes.get(version)
+        if index is None:
+            index = CompiledPatternIndex(patterns, version=version)
+            if len(_pattern_indexes) >= _PATTERN_INDEX_MAX_ENTRIES:
+                _pattern_indexes.pop(next(iter(_pattern_indexes)))
+            _pattern_indexes[version] = index
+    return index
 
 
 def compute_keyword_density(text: str, matched_patterns: List[Dict[str, Any]]) -> float:
@@ -46,6 +46,7 @@ PHASE_5_FLAGS: Dict[str, bool] = {
     "embedding_cache_active": False,
     "comparison_snapshot_active": False,
     "pattern_cache_active": False,
+    "birl_narrative_cache_active": False,
 }
 
 
@@ -54,9 +55,13 @@ PHASE_5_FLAGS: Dict[str, bool] = {
 # ============================================================================
 
 PHASE_5_CONFIG: Dict[str, Any] = {
+    # SAE configuration
+    "sae_alignment_mode": "matrix",  # "matrix" (global assignment) or "greedy" (legacy)
+
     # BIRL configuration
     "birl_max_narratives": 5,  # Configurable cap
     "birl_token_limit": 150,
+    "birl_concurrency": 4,  # Concurrent Claude narrative requests
 
     # Timeout configuration
     "global_hard_timeout_seconds": 120,  # Configurable
@@ -65,6 +70,10 @@ PHASE_5_CONFIG: Dict[str, Any] = {
     "birl_timeout_seconds": 45,
     "far_timeout_seconds": 15,
 
+    # Orchestrator configuration
+    "orchestrator_max_workers": 16,  # Shared stage executor (4 stages per request)
+    "compare_stream_max_workers": 4,  # Background streaming compares
+
     # Circuit breaker (in-memory only)
     "circuit_breaker_failure_threshold": 3,
     "circuit_breaker_recovery_seconds": 60,
@@ -72,9 +81,16 @@ PHASE_5_CONFIG: Dict[str, Any] = {
     # Cache configuration
     "embedding_cache_max_entries": 10000,
     "embedding_cache_ttl_hours": 168,  # 7 days
+    "embedding_storage_dtype": "float32",  # float32, float16 or int8
+    "embedding_batch_max_inputs": 256,  # Inputs per embeddings request
+    "embedding_batch_max_tokens": 100000,  # Estimated tokens per request
+    "embedding_batch_concurrency": 4,  # Concurrent embeddings requests
     "comparison_snapshot_max_entries": 1000,
     "comparison_snapshot_ttl_hours": 720,  # 30 days
+    "comparison_stage_cache_max_entries": 4000,  # Per-stage results (4 per comparison)
     "pattern_cache_ttl_hours": 24,
+    "birl_narrative_cache_max_entries": 5000,
+    "birl_narrative_cache_ttl_hours": 720,  # 30 days
 }
 
 
@@ -0,0 +1,444 @@
+"""
+Portfolio Aggregates
+Materialized rollups of non-archived contracts for dashboard and KPI endpoints.
+
+One scan of `contracts` builds in-memory rollups over
+contract_type x contract_role x status x risk_level:
+- cube: count, value sum and valued count per combination
+- expirations: per expiration_date (count, high-value count)
+- uploads: per upload day (count, value)
+- counterparties: per counterparty (count, value)
+
+Endpoints evaluate their predicates against the rollups, so page loads
+cost the same with 500 or 50k contracts. Date-relative windows (expiring
+in 90 days, last 6 months) are applied at query time, so a snapshot
+never goes stale at midnight.
+
+Invalidation: triggers on `contracts` bump a counter in
+portfolio_aggregate_version on every insert, delete or update of an
+aggregated column. Reads compare the counter (one-row lookup) and
+rebuild when it changed, which covers intake, edits, archive, delete and
+stage changes from any process. The triggers are created at app startup
+(install_aggregate_triggers) or by migrations/add_snapshot_triggers.py;
+without them snapshots are trusted for FALLBACK_TTL_SECONDS.
+
+Usage:
+    from portfolio_aggregates import PortfolioFilter, get_portfolio_aggregates
+
+    agg = get_portfolio_aggregates(CONTRACTS_DB)
+    active = agg.totals(PortfolioFilter(status='active'))['count']
+"""
+
+import bisect
+import os
+import re
+import sqlite3
+import threading
+import time
+from collections import namedtuple
+from dataclasses import dataclass, replace
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from versioned_snapshot import VersionedSnapshotCache
+
+# =============================================================================
+# CONFIGURATION
+# =============================================================================
+
+# contract_value above this counts as high value
+HIGH_VALUE_THRESHOLD = 100000
+
+# Seconds a snapshot is trusted when the version triggers cannot be installed
+FALLBACK_TTL_SECONDS = 5.0
+
+VERSION_TABLE = 'portfolio_aggregate_version'
+
+# Columns whose updates change an aggregate
+AGGREGATED_COLUMNS = (
+    'contract_type', 'contract_role', 'status', 'risk_level', 'contract_value',
+    'expiration_date', 'upload_date', 'counterparty', 'archived',
+)
+
+_TRIGGER_SQL = f"""
+    CREATE TABLE IF NOT EXISTS {VERSION_TABLE} (
+        id INTEGER PRIMARY KEY CHECK (id = 1),
+        version INTEGER NOT NULL
+    );
+    INSERT OR IGNORE INTO {VERSION_TABLE} (id, version) VALUES (1, 0);
+    CREATE TRIGGER IF NOT EXISTS trg_contracts_aggregate_insert
+    AFTER INSERT ON contracts BEGIN
+        UPDATE {VERSION_TABLE} SET version = version + 1 WHERE id = 1;
+    END;
+    CREATE TRIGGER IF NOT EXISTS trg_contracts_aggregate_delete
+    AFTER DELETE ON contracts BEGIN
+        UPDATE {VERSION_TABLE} SET version = version + 1 WHERE id = 1;
+    END;
+    CREATE TRIGGER IF NOT EXISTS trg_contracts_aggregate_update
+    AFTER UPDATE OF {', '.join(AGGREGATED_COLUMNS)} ON contracts BEGIN
+        UPDATE {VERSION_TABLE} SET version = version + 1 WHERE id = 1;
+    END;
+"""
+
+_SCAN_SQL = """
+    SELECT contract_type, contract_role, status, risk_level,
+           contract_value, expiration_date, upload_date, counterparty
+    FROM contracts
+    WHERE archived = 0 OR archived IS NULL
+"""
+
+_ISO_DATE = re.compile(r'\d{4}-\d{2}-\d{2}')
+
+Dims = namedtuple('Dims', ['contract_type', 'contract_role', 'status', 'risk_level'])
+
+DbPath = Union[str, Path]
+
+
+def _sql_sort_key(value: Any) -> Tuple[int, Any]:
+    """SQLite ordering: NULL < numbers < text < blob."""
+    if value is None:
+        return (0, 0)
+    if isinstance(value, (int, float)):
+        return (1, value)
+    if isinstance(value, str):
+        return (2, value)
+    return (3, value)
+
+
+def _month(day: str) -> Optional[str]:
+    """strftime('%Y-%m', value) for ISO dates, None otherwise."""
+    return day[:7] if _ISO_DATE.match(day) else None
+
+
+def _number(value: Any) -> Union[int, float]:
+    """Value as SUM()/AVG() see it."""
+    if isinstance(value, (int, float)):
+        return value
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return 0.0
+
+
+# =============================================================================
+# FILTERS
+# =============================================================================
+
+@dataclass(frozen=True)
+class PortfolioFilter:
+    """
+    Predicate over the rollup dimensions with SQL NULL semantics.
+
+    Equality fields match like `col = ?`; *_in like `col IN (...)`;
+    status_not_in like `status NOT IN (...)` (NULL never matches).
+    """
+    contract_type: Optional[str] = None
+    contract_role: Optional[str] = None
+    status: Optional[str] = None
+    risk_level: Optional[str] = None
+    status_in: Optional[Tuple[str, ...]] = None
+    status_not_in: Optional[Tuple[str, ...]] = None
+    risk_in: Optional[Tuple[str, ...]] = None
+    risk_not_null: bool = False
+
+    def where(self, **changes) -> 'PortfolioFilter':
+        """Copy with extra conditions."""
+        return replace(self, **changes)
+
+    def matches(self, dims: Dims) -> bool:
+        if self.contract_type is not None and dims.contract_type != self.contract_type:
+            return False
+        if self.contract_role is not None and dims.contract_role != self.contract_role:
+            return False
+        if self.status is not None and dims.status != self.status:
+            return False
+        if self.risk_level is not None and dims.risk_level != self.risk_level:
+            return False
+        if self.status_in is not None and dims.status not in self.status_in:
+            return False
+        if self.status_not_in is not None and (dims.status is None or dims.status in self.status_not_in):
+            return False
+        if self.risk_in is not None and dims.risk_level not in self.risk_in:
+            return False
+        if self.risk_not_null and dims.risk_level is None:
+            return False
+        return True
+
+
+ALL_CONTRACTS = PortfolioFilter()
+
+
+# =============================================================================
+# SNAPSHOT
+# =============================================================================
+
+class PortfolioAggregates:
+    """
+    Immutable rollups of one version of the contracts table.
+
+    Query results are memoized per snapshot; treat them as read-only.
+    """
+
+    def __init__(self, rows, version: Optional[int] = None):
+        self.version = version
+        self.built_at = time.time()
+        self.row_count = 0
+        # dims -> [count, value_sum, valued_count]
+        self._cube: Dict[Dims, List] = {}
+        # date -> dims -> [count, high_value_count]
+        self._expirations: Dict[str, Dict[Dims, List[int]]] = {}
+        # day -> dims -> [count, value_sum]
+        self._uploads: Dict[str, Dict[Dims, List]] = {}
+        # dims -> counterparty -> [count, value_sum]
+        self._counterparties: Dict[Dims, Dict[str, List]] = {}
+        self._memo: Dict[Tuple, Any] = {}
+
+        for contract_type, role, status, risk, value, expiration, upload, counterparty in rows:
+            self.row_count += 1
+            dims = Dims(contract_type, role, status, risk)
+            amount = 0 if value is None else _number(value)
+
+            cell = self._cube.get(dims)
+            if cell is None:
+                cell = self._cube[dims] = [0, 0, 0]
+            cell[0] += 1
+            cell[1] += amount
+            if value is not None:
+                cell[2] += 1
+
+            if isinstance(expiration, str):
+                cell = self._expirations.setdefault(expiration, {}).setdefault(dims, [0, 0])
+                cell[0] += 1
+                # SQLite orders TEXT after numbers, so non-numeric values compare as > threshold
+                if value is not None and (not isinstance(value, (int, float)) or value > HIGH_VALUE_THRESHOLD):
+                    cell[1] += 1
+
+            if isinstance(upload, str):
+                cell = self._uploads.setdefault(upload[:10], {}).setdefault(dims, [0, 0])
+                cell[0] += 1
+                cell[1] += amount
+
+            if counterparty is not None and counterparty != '':
+                cell = self._counterparties.setdefault(dims, {}).setdefault(counterparty, [0, 0])
+                cell[0] += 1
+                cell[1] += amount
+
+        self._expiration_dates = sorted(self._expirations)
+        self._upload_days = sorted(self._uploads)
+
+    def _memoized(self, key: Tuple, compute):
+        result = self._memo.get(key)
+        if result is None:
+            result = self._memo[key] = compute()
+        return result
+
+    def _range(self, keys: List[str], start: Optional[str], end: Optional[str]) -> List[str]:
+        lo = 0 if start is None else bisect.bisect_left(keys, start)
+        hi = len(keys) if end is None else bisect.bisect_right(keys, end)
+        return keys[lo:hi]
+
+    # -------------------------------------------------------------------------
+    # Queries
+    # -------------------------------------------------------------------------
+
+    def totals(self, where: PortfolioFilter = ALL_CONTRACTS) -> Dict[str, Any]:
+        """
+        COUNT(*), COALESCE(SUM(contract_value), 0) and COALESCE(AVG(...), 0).
+
+        Returns:
+            {count, value, avg_value}
+        """
+        def compute():
+            count = value = valued = 0
+            for dims, cell in self._cube.items():
+                if where.matches(dims):
+                    count += cell[0]
+                    value += cell[1]
+                    valued += cell[2]
+            return {'count': count, 'value': value, 'avg_value': value / valued if valued else 0}
+        return self._memoized(('totals', where), compute)
+
+    def group_by(self, field: str, where: PortfolioFilter = ALL_CONTRACTS) -> Dict[Any, Dict[str, Any]]:
+        """
+        GROUP BY one dimension (NULL is its own group).
+
+        Args:
+            field: contract_type, contract_role, status or risk_level
+
+        Returns:
+            {value: {count, value, avg_value}} in SQLite group order
+        """
+        def compute():
+            groups: Dict[Any, List] = {}
+            for dims, cell in self._cube.items():
+                if where.matches(dims):
+                    group = groups.setdefault(getattr(dims, field), [0, 0, 0])
+                    group[0] += cell[0]
+                    group[1] += cell[1]
+                    group[2] += cell[2]
+            return {
+                key: {'count': c, 'value': v, 'avg_value': v / n if n else 0}
+                for key, (c, v, n) in sorted(groups.items(), key=lambda item: _sql_sort_key(item[0]))
+            }
+        return self._memoized(('group_by', field, where), compute)
+
+    def expiring(self, where: PortfolioFilter, start: str, end: str) -> Dict[str, int]:
+        """
+        Contracts with start <= expiration_date <= end.
+
+        Returns:
+            {count, high_value}
+        """
+        def compute():
+            count = high_value = 0
+            for day in self._range(self._expiration_dates, start, end):
+                for dims, cell in self._expirations[day].items():
+                    if where.matches(dims):
+                        count += cell[0]
+                        high_value += cell[1]
+            return {'count': count, 'high_value': high_value}
+        return self._memoized(('expiring', where, start, end), compute)
+
+    def expirations_by(self, where: PortfolioFilter, start: str, end: str, month: bool = False) -> Dict[Any, int]:
+        """
+        Expiration counts per date (or per month) between start and end.
+
+        Returns:
+            {date_or_month: count} in ascending order
+        """
+        def compute():
+            counts: Dict[Any, int] = {}
+            for day in self._range(self._expiration_dates, start, end):
+                total = sum(cell[0] for dims, cell in self._expirations[day].items() if where.matches(dims))
+                if total:
+                    key = _month(day) if month else day
+                    counts[key] = counts.get(key, 0) + total
+            return dict(sorted(counts.items(), key=lambda item: _sql_sort_key(item[0])))
+        return self._memoized(('expirations_by', where, start, end, month), compute)
+
+    def uploads_by_month(self, where: PortfolioFilter = ALL_CONTRACTS, since: Optional[str] = None) -> Dict[Optional[str], Dict[str, Any]]:
+        """
+        Uploads per strftime('%Y-%m', upload_date), optionally upload_date >= since.
+
+        Non-ISO upload dates are grouped under None (NULL month).
+
+        Returns:
+            {month: {count, value}} in ascending order (None first)
+        """
+        def compute():
+            months: Dict[Optional[str], List] = {}
+            for day in self._range(self._upload_days, since, None):
+                for dims, cell in self._uploads[day].items():
+                    if where.matches(dims):
+                        group = months.setdefault(_month(day), [0, 0])
+                        group[0] += cell[0]
+                        group[1] += cell[1]
+            return {
+                key: {'count': c, 'value': v}
+                for key, (c, v) in sorted(months.items(), key=lambda item: _sql_sort_key(item[0]))
+            }
+        return self._memoized(('uploads_by_month', where, since), compute)
+
+    def counterparties(self, where: PortfolioFilter = ALL_CONTRACTS) -> Dict[str, Dict[str, Any]]:
+        """
+        Non-empty counterparties.
+
+        Returns:
+            {name: {count, value}} in name order
+        """
+        def compute():
+            merged: Dict[str, List] = {}
+            for dims, parties in self._counterparties.items():
+                if where.matches(dims):
+                    for name, (count, value) in parties.items():
+                        group = merged.setdefault(name, [0, 0])
+                        group[0] += count
+                        group[1] += value
+            return {
+                name: {'count': c, 'value': v}
+                for name, (c, v) in sorted(merged.items(), key=lambda item: _sql_sort_key(item[0]))
+            }
+        return self._memoized(('counterparties', where), compute)
+
+
+# =============================================================================
+# CACHE
+# =============================================================================
+
+class PortfolioAggregateCache(VersionedSnapshotCache):
+    """
+    Current PortfolioAggregates for one database.
+
+    get() returns the cached snapshot while the version counter is
+    unchanged and rebuilds (once, under a lock) when it moved.
+    """
+
+    label = 'Portfolio aggregate'
+    version_table = VERSION_TABLE
+    trigger_names = (
+        'trg_contracts_aggregate_insert',
+        'trg_contracts_aggregate_delete',
+        'trg_contracts_aggregate_update',
+    )
+    trigger_sql = _TRIGGER_SQL
+    fallback_ttl_seconds = FALLBACK_TTL_SECONDS
+    row_factory = None
+
+    def __init__(self, db_path: DbPath):
+        super().__init__(db_path)
+        self._metrics['rebuilds'] = 0
+
+    def _read_version(self, conn: sqlite3.Connection) -> Optional[int]:
+        row = conn.execute(f"SELECT version FROM {VERSION_TABLE} WHERE id = 1").fetchone()
+        return row[0] if row else None
+
+    def _build(self, conn: sqlite3.Connection, snapshot: Optional[PortfolioAggregates],
+               version: Optional[int], context) -> PortfolioAggregates:
+        self._metrics['rebuilds'] += 1
+        return PortfolioAggregates(conn.execute(_SCAN_SQL), version=version)
+
+    def _row_count(self, snapshot: PortfolioAggregates) -> int:
+        return snapshot.row_count
+
+    def get(self) -> PortfolioAggregates:
+        """Current snapshot, rebuilt if contracts changed."""
+        return self.get_snapshot()
+
+
+_CACHES: Dict[str, PortfolioAggregateCache] = {}
+_CACHES_LOCK = threading.Lock()
+
+
+def get_aggregate_cache(db_path: DbPath) -> PortfolioAggregateCache:
+    """Get (or create) the aggregate cache for a database."""
+    key = os.path.abspath(str(db_path))
+    cache = _CACHES.get(key)
+    if cache is None:
+        with _CACHES_LOCK:
+            cache = _CACHES.get(key)
+            if cache is None:
+                cache = _CACHES[key] = PortfolioAggregateCache(key)
+    return cache
+
+
+def get_portfolio_aggregates(db_path: DbPath) -> PortfolioAggregates:
+    """Current aggregates for a database."""
+    return get_aggregate_cache(db_path).get()
+
+
+def install_aggregate_triggers(db_path: DbPath) -> bool:
+    """Create the version table and triggers (app startup / migration)."""
+    return get_aggregate_cache(db_path).install_triggers()
+
+
+__all__ = [
+    'HIGH_VALUE_THRESHOLD',
+    'Dims',
+    'PortfolioFilter',
+    'ALL_CONTRACTS',
+    'PortfolioAggregates',
+    'PortfolioAggregateCache',
+    'get_aggregate_cache',
+    'get_portfolio_aggregates',
+    'install_aggregate_triggers',
+]
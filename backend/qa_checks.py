@@ -15,6 +15,8 @@ from datetime import datetime
 from dataclasses import dataclass, field, asdict
 from typing import Dict, List, Any, Optional, Tuple
 
+from db_pool import get_connection
+
 # Configuration
 CIP_ROOT = Path(r"C:\Users\jrudy\CIP")
 CONTRACTS_DB = CIP_ROOT / "data" / "contracts.db"
@@ -101,10 +103,7 @@ class QACheckEngine:
 
     def get_connection(self) -> sqlite3.Connection:
         """Get database connection with row factory."""
-        conn = sqlite3.connect(str(self.db_path))
-        conn.row_factory = sqlite3.Row
-        conn.execute("PRAGMA foreign_keys = ON")
-        return conn
+        return get_connection(self.db_path)
 
     def run_all_checks(self, contract_id: Optional[int] = None) -> QAReport:
         """Run all QA checks and return complete report."""
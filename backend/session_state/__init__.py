@@ -13,6 +13,10 @@ from .repository import (
     SessionStateRepository,
     get_session_repository,
 )
+from .keepalive import (
+    KeepaliveBatcher,
+    get_keepalive_batcher,
+)
 
 __all__ = [
     "SSEConnectionStatus",
@@ -20,4 +24,6 @@ __all__ = [
     "SessionSSEState",
     "SessionStateRepository",
     "get_session_repository",
+    "KeepaliveBatcher",
+    "get_keepalive_batcher",
 ]
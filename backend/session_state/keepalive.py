@@ -0,0 +1,146 @@
+"""
+Keepalive Batcher — P7.S2
+Batched persistence of SSE connection keepalives.
+
+Provides:
+- In-memory recording of keepalives per connection
+- Periodic flush of all pending keepalives in one transaction
+- Per-repository batcher registry
+
+Each open stream records a keepalive every 30 seconds. Writing them one
+session load/save at a time costs two SQLite round trips per connection;
+the batcher coalesces them so the write cost no longer grows per stream.
+"""
+
+import logging
+import threading
+import time
+import weakref
+from datetime import datetime
+from typing import Dict, Optional
+
+from .repository import SessionStateRepository
+
+logger = logging.getLogger("session_state.keepalive")
+
+# Seconds between keepalive flushes (stale cleanup uses minutes)
+DEFAULT_FLUSH_INTERVAL = 15.0
+
+
+class KeepaliveBatcher:
+    """
+    Collects keepalives and writes them in batches.
+    Thread-safe; flushes happen on the recording thread.
+    """
+
+    def __init__(
+        self,
+        session_repo: SessionStateRepository,
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL,
+    ):
+        """
+        Initialize batcher.
+
+        Args:
+            session_repo: Repository the keepalives are written to
+            flush_interval: Minimum seconds between flushes
+        """
+        self._session_repo = session_repo
+        self._flush_interval = flush_interval
+        self._lock = threading.Lock()
+        self._pending: Dict[str, datetime] = {}
+        self._last_flush = time.monotonic()
+        self._recorded = 0
+        self._flushes = 0
+        self._rows_written = 0
+
+    def record(self, connection_id: str) -> None:
+        """
+        Record a keepalive, flushing if the interval has elapsed.
+
+        Args:
+            connection_id: Connection that sent a keepalive
+        """
+        with self._lock:
+            self._pending[connection_id] = datetime.now()
+            self._recorded += 1
+            due = time.monotonic() - self._last_flush >= self._flush_interval
+
+        if due:
+            self.flush()
+
+    def discard(self, connection_id: str) -> None:
+        """Drop a pending keepalive (e.g. connection closed)."""
+        with self._lock:
+            self._pending.pop(connection_id, None)
+
+    def flush(self) -> int:
+        """
+        Write all pending keepalives.
+
+        Returns:
+            Count of connections updated
+        """
+        with self._lock:
+            pending, self._pending = self._pending, {}
+            self._last_flush = time.monotonic()
+
+        if not pending:
+            return 0
+
+        try:
+            written = self._session_repo.record_keepalives(pending)
+        except Exception as e:
+            logger.error(f"Keepalive flush failed: {e}", extra={"pending": len(pending)})
+            return 0
+
+        with self._lock:
+            self._flushes += 1
+            self._rows_written += written
+        return written
+
+    def get_stats(self) -> dict:
+        """
+        Get batcher statistics.
+
+        Returns:
+            Dict with recorded, flushed and pending counts
+        """
+        with self._lock:
+            return {
+                "recorded": self._recorded,
+                "flushes": self._flushes,
+                "rows_written": self._rows_written,
+                "pending": len(self._pending),
+                "flush_interval": self._flush_interval,
+            }
+
+
+# Batchers by repository (one per repository instance)
+_batchers: "weakref.WeakKeyDictionary[SessionStateRepository, KeepaliveBatcher]" = weakref.WeakKeyDictionary()
+_batchers_lock = threading.Lock()
+
+
+def get_keepalive_batcher(
+    session_repo: SessionStateRepository,
+    flush_interval: Optional[float] = None,
+) -> KeepaliveBatcher:
+    """
+    Get or create the keepalive batcher for a repository.
+
+    Args:
+        session_repo: Session repository
+        flush_interval: Flush interval (only used on first call)
+
+    Returns:
+        KeepaliveBatcher shared by all streams of the repository
+    """
+    with _batchers_lock:
+        batcher = _batchers.get(session_repo)
+        if batcher is None:
+            batcher = KeepaliveBatcher(
+                session_repo,
+                flush_interval if flush_interval is not None else DEFAULT_FLUSH_INTERVAL,
+            )
+            _batchers[session_repo] = batcher
+        return batcher
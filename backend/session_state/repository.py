@@ -19,7 +19,7 @@ import sqlite3
 import threading
 from datetime import datetime
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 from .models import (
     SessionSSEState,
@@ -324,6 +324,31 @@ class SessionStateRepository:
             finally:
                 conn.close()
 
+    def record_keepalives(self, keepalives: Dict[str, datetime]) -> int:
+        """
+        Update last_keepalive_at for many connections in one transaction.
+        
+        Args:
+            keepalives: connection_id -> keepalive time
+            
+        Returns:
+            Count of connections updated
+        """
+        if not keepalives:
+            return 0
+
+        with self._lock:
+            conn = self._get_connection()
+            try:
+                cursor = conn.executemany(
+                    "UPDATE sse_connections SET last_keepalive_at = ? WHERE connection_id = ?",
+                    [(at.isoformat(), connection_id) for connection_id, at in keepalives.items()]
+                )
+                conn.commit()
+                return cursor.rowcount
+            finally:
+                conn.close()
+
     def get_active_connections_count(self, session_id: str) -> int:
         """
         Count active connections for session.
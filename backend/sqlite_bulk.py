@@ -0,0 +1,278 @@
+"""
+SQLite Bulk Write Helper
+Shared multi-row write path for intake, snapshot and cache writers.
+
+Provides:
+- apply_write_pragmas: WAL, synchronous=NORMAL and a sized page cache
+- write_transaction: connection + single transaction (commit or rollback)
+- bulk_insert: chunked executemany with one prepared statement
+- bulk_write: bulk_insert with a commit per chunk for very large inputs
+- copy_database: file copy that is safe for WAL databases (backups, restores)
+
+Usage:
+    from sqlite_bulk import write_transaction, bulk_insert
+
+    with write_transaction(db_path) as conn:
+        bulk_insert(conn, "INSERT INTO clauses (...) VALUES (?, ...)", rows)
+"""
+
+import os
+import shutil
+import sqlite3
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterable, Iterator, List, Optional, Sequence, Union
+
+# =============================================================================
+# CONFIGURATION
+# =============================================================================
+
+# Rows per executemany call / per committed chunk
+BULK_CHUNK_SIZE = 1000
+
+# Page cache per write connection, in KiB (negative PRAGMA cache_size)
+WRITE_CACHE_SIZE_KB = 16384
+
+# Seconds to wait for another writer's lock
+WRITE_BUSY_TIMEOUT = 30.0
+
+# Files SQLite keeps next to a database in WAL mode
+WAL_SIDECAR_SUFFIXES = ('-wal', '-shm')
+
+
+# =============================================================================
+# CONNECTION SETUP
+# =============================================================================
+
+def apply_write_pragmas(
+    conn: sqlite3.Connection,
+    cache_size_kb: int = WRITE_CACHE_SIZE_KB,
+    foreign_keys: bool = False
+) -> sqlite3.Connection:
+    """
+    Configure a connection for bulk writes.
+
+    WAL lets readers continue during the write and, with synchronous=NORMAL,
+    a commit no longer waits for a full fsync of the main database file.
+    journal_mode=WAL is persistent: recent commits live in the -wal file
+    until a checkpoint, so copy the database with copy_database(), not
+    shutil.copy().
+
+    Args:
+        conn: Open connection (outside a transaction)
+        cache_size_kb: Page cache size in KiB
+        foreign_keys: Enable foreign key enforcement
+
+    Returns:
+        conn
+    """
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute(f"PRAGMA cache_size=-{int(cache_size_kb)}")
+    if foreign_keys:
+        conn.execute("PRAGMA foreign_keys = ON")
+    return conn
+
+
+def connect_for_write(
+    db_path: str,
+    foreign_keys: bool = False,
+    cache_size_kb: int = WRITE_CACHE_SIZE_KB,
+    timeout: float = WRITE_BUSY_TIMEOUT
+) -> sqlite3.Connection:
+    """Open a connection configured by apply_write_pragmas()."""
+    conn = sqlite3.connect(db_path, timeout=timeout)
+    return apply_write_pragmas(conn, cache_size_kb=cache_size_kb, foreign_keys=foreign_keys)
+
+
+@contextmanager
+def write_transaction(
+    db_path: str,
+    foreign_keys: bool = False,
+    cache_size_kb: int = WRITE_CACHE_SIZE_KB
+) -> Iterator[sqlite3.Connection]:
+    """
+    Open a write connection and run the block in one transaction.
+
+    Commits on success, rolls back and re-raises on error, always closes.
+    """
+    conn = connect_for_write(db_path, foreign_keys=foreign_keys, cache_size_kb=cache_size_kb)
+    try:
+        yield conn
+        conn.commit()
+    except BaseException:
+        conn.rollback()
+        raise
+    finally:
+        conn.close()
+
+
+# =============================================================================
+# BULK INSERT
+# =============================================================================
+
+def _chunks(rows: Iterable[Sequence], size: int) -> Iterator[List[Sequence]]:
+    """Yield lists of up to size rows from any iterable."""
+    chunk = []
+    for row in rows:
+        chunk.append(row)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def bulk_insert(
+    conn: sqlite3.Connection,
+    sql: str,
+    rows: Iterable[Sequence],
+    chunk_size: int = BULK_CHUNK_SIZE
+) -> int:
+    """
+    Execute one prepared statement for many rows.
+
+    Rows are fed to executemany in chunks so generators of any length
+    stay bounded in memory. The caller owns the transaction.
+
+    Args:
+        conn: Open connection
+        sql: Parameterized statement
+        rows: Parameter tuples (list or iterator)
+        chunk_size: Rows per executemany call
+
+    Returns:
+        Number of rows passed to the statement
+    """
+    cursor = conn.cursor()
+    total = 0
+    for chunk in _chunks(rows, chunk_size):
+        cursor.executemany(sql, chunk)
+        total += len(chunk)
+    return total
+
+
+def bulk_write(
+    db_path: str,
+    sql: str,
+    rows: Iterable[Sequence],
+    chunk_size: int = BULK_CHUNK_SIZE,
+    conn: Optional[sqlite3.Connection] = None
+) -> int:
+    """
+    Write many rows with a commit per chunk.
+
+    For very large, idempotent inputs (caches, logs) where holding one
+    transaction open for the whole input is not needed. Use
+    write_transaction() + bulk_insert() when the write must be atomic.
+
+    Args:
+        db_path: Database path (ignored when conn is given)
+        sql: Parameterized statement
+        rows: Parameter tuples (list or iterator)
+        chunk_size: Rows per transaction
+        conn: Existing connection to use instead of opening one
+
+    Returns:
+        Number of rows written
+    """
+    own_conn = conn is None
+    if own_conn:
+        conn = connect_for_write(db_path)
+    try:
+        total = 0
+        cursor = conn.cursor()
+        for chunk in _chunks(rows, chunk_size):
+            try:
+                cursor.executemany(sql, chunk)
+                conn.commit()
+            except BaseException:
+                conn.rollback()
+                raise
+            total += len(chunk)
+        return total
+    finally:
+        if own_conn:
+            conn.close()
+
+
+# =============================================================================
+# FILE COPIES
+# =============================================================================
+
+def checkpoint_wal(db_path: Union[str, Path], timeout: float = WRITE_BUSY_TIMEOUT) -> bool:
+    """
+    Move every WAL frame into the main database file and truncate the WAL.
+
+    A no-op for databases not in WAL mode.
+
+    Args:
+        db_path: Database file path
+        timeout: Seconds to wait for other connections
+
+    Returns:
+        True if the checkpoint completed (False if readers blocked it)
+    """
+    conn = sqlite3.connect(str(db_path), timeout=timeout)
+    try:
+        busy = conn.execute("PRAGMA wal_checkpoint(TRUNCATE)").fetchone()[0]
+    finally:
+        conn.close()
+    return busy == 0
+
+
+def remove_wal_sidecars(db_path: Union[str, Path]) -> int:
+    """Delete the -wal/-shm files next to a database. Returns files removed."""
+    removed = 0
+    for suffix in WAL_SIDECAR_SUFFIXES:
+        try:
+            os.remove(str(db_path) + suffix)
+            removed += 1
+        except FileNotFoundError:
+            pass
+    return removed
+
+
+def copy_database(src: Union[str, Path], dst: Union[str, Path]) -> Path:
+    """
+    Copy a database file, including commits still in its WAL.
+
+    The source is checkpointed first so the copied file is complete. If
+    dst is an existing database it is checkpointed too, and its -wal/-shm
+    are removed after the copy so stale frames are not replayed onto the
+    new contents. Overwriting a live database should only be done while
+    no other connection has it open.
+
+    Args:
+        src: Database to copy
+        dst: Destination file
+
+    Returns:
+        dst as a Path
+
+    Raises:
+        sqlite3.OperationalError: Checkpoint blocked by open readers
+    """
+    src, dst = Path(src), Path(dst)
+    if not checkpoint_wal(src):
+        raise sqlite3.OperationalError(f"could not checkpoint {src}: database busy")
+    if dst.exists() and not checkpoint_wal(dst):
+        raise sqlite3.OperationalError(f"could not checkpoint {dst}: database busy")
+    shutil.copy2(src, dst)
+    remove_wal_sidecars(dst)
+    return dst
+
+
+__all__ = [
+    'BULK_CHUNK_SIZE',
+    'WRITE_CACHE_SIZE_KB',
+    'WAL_SIDECAR_SUFFIXES',
+    'apply_write_pragmas',
+    'connect_for_write',
+    'write_transaction',
+    'bulk_insert',
+    'bulk_write',
+    'checkpoint_wal',
+    'remove_wal_sidecars',
+    'copy_database',
+]
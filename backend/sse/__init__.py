@@ -18,6 +18,7 @@ Components:
 - sequence: Sequence generators (memory, database, redis)
 - replay: Event buffering and replay on reconnection
 - middleware: Auth, rate limiting, version checking
+- rate_limit: Token bucket stores (sharded in-process, SQLite shared)
 - exceptions: SSE-specific error types
 
 CIP Protocol: This package is part of the P7 SSE backend.
@@ -49,6 +50,11 @@ from .middleware import (
     VersionCheckMiddleware,
     create_default_middleware_chain,
 )
+from .rate_limit import (
+    BucketStoreBase,
+    ShardedBucketStore,
+    SQLiteBucketStore,
+)
 from .replay import (
     BufferConfig,
     EventBuffer,
@@ -103,6 +109,10 @@ __all__ = [
     "RateLimitMiddleware",
     "VersionCheckMiddleware",
     "create_default_middleware_chain",
+    # Rate limit stores
+    "BucketStoreBase",
+    "ShardedBucketStore",
+    "SQLiteBucketStore",
     # Exceptions
     "SSEBaseException",
     "InvalidSessionError",
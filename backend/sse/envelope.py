@@ -60,6 +60,14 @@ class EventType(Enum):
     STAGE_ACTIVATION = "stage_activation"
     FLAG_CHANGE = "flag_change"
 
+    # Compare streaming events (one compare run per compare_id)
+    COMPARE_START = "compare_start"
+    COMPARE_STAGE_START = "compare_stage_start"
+    COMPARE_STAGE_COMPLETE = "compare_stage_complete"
+    COMPARE_NARRATIVE = "compare_narrative"
+    COMPARE_COMPLETE = "compare_complete"
+    COMPARE_ERROR = "compare_error"
+
     # Control events
     PAUSE = "pause"
     RESUME = "resume"
@@ -100,7 +108,19 @@ class EventType(Enum):
         return self in {
             EventType.ERROR,
             EventType.WARNING,
-            EventType.ENGINE_ERROR
+            EventType.ENGINE_ERROR,
+            EventType.COMPARE_ERROR
+        }
+
+    def is_compare(self) -> bool:
+        """Check if event is a compare streaming event."""
+        return self in {
+            EventType.COMPARE_START,
+            EventType.COMPARE_STAGE_START,
+            EventType.COMPARE_STAGE_COMPLETE,
+            EventType.COMPARE_NARRATIVE,
+            EventType.COMPARE_COMPLETE,
+            EventType.COMPARE_ERROR
         }
 
 
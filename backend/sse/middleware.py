@@ -15,9 +15,7 @@ Frozen surfaces (TRUST, GEM, Z7, API shapes) are NOT modified.
 """
 
 import logging
-import time
 from abc import ABC, abstractmethod
-from collections import defaultdict
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Any, Callable, Dict, List, Optional, Tuple
@@ -27,6 +25,7 @@ from .exceptions import (
     RateLimitExceededError,
     VersionMismatchError,
 )
+from .rate_limit import BucketStoreBase, ShardedBucketStore, SQLiteBucketStore
 
 # Diagnostic logging hook
 logger = logging.getLogger("sse.middleware")
@@ -231,13 +230,20 @@ class RateLimitMiddleware(MiddlewareBase):
 
     Implements token bucket algorithm for connection rate limiting.
     Tracks per-IP and per-user limits.
+
+    Buckets live in a bounded, lock-sharded in-process store by default,
+    or in a SQLite store shared by all worker processes when
+    shared_db_path is given.
     """
 
     def __init__(
         self,
         requests_per_minute: int = 60,
         burst_size: int = 10,
-        per_user_limit: Optional[int] = None
+        per_user_limit: Optional[int] = None,
+        max_keys: int = 100_000,
+        shared_db_path: Optional[str] = None,
+        store: Optional[BucketStoreBase] = None
     ) -> None:
         """
         Initialize rate limit middleware.
@@ -246,19 +252,26 @@ class RateLimitMiddleware(MiddlewareBase):
             requests_per_minute: Sustained rate limit
             burst_size: Maximum burst size
             per_user_limit: Optional per-user limit
+            max_keys: Maximum buckets held in memory
+            shared_db_path: SQLite path for limits shared across processes
+            store: Explicit bucket store (overrides max_keys/shared_db_path)
         """
         self._requests_per_minute = requests_per_minute
         self._burst_size = burst_size
         self._per_user_limit = per_user_limit
 
-        # Token buckets: key -> (tokens, last_update_time)
-        self._buckets: Dict[str, Tuple[float, float]] = defaultdict(
-            lambda: (float(burst_size), time.time())
-        )
+        refill_rate = requests_per_minute / 60.0
+        if store is not None:
+            self._store = store
+        elif shared_db_path:
+            self._store = SQLiteBucketStore(shared_db_path, refill_rate, burst_size)
+        else:
+            self._store = ShardedBucketStore(refill_rate, burst_size, max_keys=max_keys)
 
         logger.info(
             f"RateLimitMiddleware initialized: "
-            f"rpm={requests_per_minute}, burst={burst_size}"
+            f"rpm={requests_per_minute}, burst={burst_size}, "
+            f"store={type(self._store).__name__}"
         )
 
     def process(self, context: MiddlewareContext) -> MiddlewareContext:
@@ -278,7 +291,7 @@ class RateLimitMiddleware(MiddlewareBase):
         key = self._get_rate_limit_key(context)
 
         # Check and update token bucket
-        allowed, retry_after = self._check_bucket(key)
+        allowed, retry_after, remaining = self._store.consume(key)
 
         if not allowed:
             logger.warning(f"Rate limit exceeded for {key}")
@@ -290,7 +303,7 @@ class RateLimitMiddleware(MiddlewareBase):
             )
 
         context.metadata["rate_limit_key"] = key
-        context.metadata["rate_limit_remaining"] = self._get_remaining(key)
+        context.metadata["rate_limit_remaining"] = remaining
 
         logger.debug(f"Rate limit check passed for {key}")
         return context
@@ -321,27 +334,12 @@ class RateLimitMiddleware(MiddlewareBase):
         Returns:
             Tuple of (allowed, retry_after_seconds)
         """
-        now = time.time()
-        tokens, last_update = self._buckets[key]
-
-        # Refill tokens based on time elapsed
-        elapsed = now - last_update
-        refill_rate = self._requests_per_minute / 60.0
-        tokens = min(self._burst_size, tokens + (elapsed * refill_rate))
-
-        if tokens >= 1.0:
-            # Consume token
-            self._buckets[key] = (tokens - 1.0, now)
-            return True, 0.0
-        else:
-            # Calculate wait time
-            wait_time = (1.0 - tokens) / refill_rate
-            self._buckets[key] = (tokens, now)
-            return False, wait_time
+        allowed, retry_after, _ = self._store.consume(key)
+        return allowed, retry_after
 
     def _get_remaining(self, key: str) -> int:
         """
-        Get remaining tokens for key.
+        Get remaining tokens for key (does not create a bucket).
 
         Args:
             key: Rate limit key
@@ -349,8 +347,7 @@ class RateLimitMiddleware(MiddlewareBase):
         Returns:
             Remaining tokens (floored to int)
         """
-        tokens, _ = self._buckets.get(key, (self._burst_size, time.time()))
-        return int(tokens)
+        return self._store.peek(key)
 
     def get_name(self) -> str:
         """Get middleware name."""
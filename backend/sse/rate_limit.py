@@ -0,0 +1,371 @@
+"""
+Token Bucket Stores for SSE Rate Limiting.
+
+Defines:
+- BucketStoreBase: interface used by RateLimitMiddleware
+- ShardedBucketStore: in-process, lock-sharded store with LRU/TTL eviction
+- SQLiteBucketStore: shared store so limits hold across worker processes
+
+A bucket that has been idle long enough to refill completely is identical
+to a bucket that does not exist, so both stores drop such buckets freely.
+The in-process store also enforces a hard key ceiling by evicting the least
+recently used bucket; an evicted key starts again with a full burst.
+
+CIP Protocol: This module is part of the P7 SSE backend.
+Frozen surfaces (TRUST, GEM, Z7, API shapes) are NOT modified.
+"""
+
+import logging
+import sqlite3
+import threading
+import time
+import zlib
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from pathlib import Path
+from typing import Callable, Optional, Tuple
+
+from .exceptions import SSEInternalError
+
+# Diagnostic logging hook
+logger = logging.getLogger("sse.rate_limit")
+
+
+class BucketStoreBase(ABC):
+    """
+    Token bucket storage.
+
+    consume() must refill, check and spend atomically per key.
+    """
+
+    def __init__(self, rate_per_second: float, burst_size: int) -> None:
+        """
+        Initialize store.
+
+        Args:
+            rate_per_second: Token refill rate
+            burst_size: Bucket capacity
+        """
+        if rate_per_second <= 0:
+            raise ValueError(f"rate_per_second must be > 0, got {rate_per_second}")
+        self._rate = rate_per_second
+        self._burst = float(burst_size)
+        # Seconds after which an idle bucket is full again
+        self._full_refill_seconds = self._burst / self._rate
+
+    def _refill(self, tokens: float, last_update: float, now: float) -> float:
+        """Tokens after refilling for the elapsed time."""
+        return min(self._burst, tokens + max(0.0, now - last_update) * self._rate)
+
+    def _spend(self, tokens: float) -> Tuple[bool, float, float]:
+        """
+        Spend one token if available.
+
+        Returns:
+            (allowed, retry_after_seconds, tokens_left)
+        """
+        if tokens >= 1.0:
+            return True, 0.0, tokens - 1.0
+        return False, (1.0 - tokens) / self._rate, tokens
+
+    @abstractmethod
+    def consume(self, key: str) -> Tuple[bool, float, int]:
+        """
+        Refill and try to spend one token.
+
+        Args:
+            key: Rate limit key
+
+        Returns:
+            (allowed, retry_after_seconds, remaining_tokens)
+        """
+        pass
+
+    @abstractmethod
+    def peek(self, key: str) -> int:
+        """
+        Get remaining tokens without spending or creating a bucket.
+
+        Args:
+            key: Rate limit key
+
+        Returns:
+            Remaining tokens (floored); burst size for unknown keys
+        """
+        pass
+
+    @abstractmethod
+    def size(self) -> int:
+        """Get number of stored buckets."""
+        pass
+
+
+class _Shard:
+    """One lock-protected LRU partition of a ShardedBucketStore."""
+
+    __slots__ = ("lock", "buckets", "lru_evictions", "expired_evictions")
+
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        # key -> [tokens, last_update]; order = least recently used first
+        self.buckets: "OrderedDict[str, list]" = OrderedDict()
+        self.lru_evictions = 0
+        self.expired_evictions = 0
+
+
+class ShardedBucketStore(BucketStoreBase):
+    """
+    In-process bucket store.
+
+    Features:
+    - Keys hashed to shards, each with its own lock (no global lock)
+    - LRU order per shard; hard ceiling of max_keys buckets
+    - Idle buckets expire once fully refilled (or after idle_ttl)
+    """
+
+    # Expired buckets removed per consume() (amortized cleanup)
+    EXPIRE_BATCH = 4
+
+    def __init__(
+        self,
+        rate_per_second: float,
+        burst_size: int,
+        max_keys: int = 100_000,
+        shards: int = 16,
+        idle_ttl: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        Initialize sharded store.
+
+        Args:
+            rate_per_second: Token refill rate
+            burst_size: Bucket capacity
+            max_keys: Maximum buckets held (memory ceiling)
+            shards: Number of lock shards
+            idle_ttl: Seconds before an idle bucket is dropped
+                (default and minimum: time to refill completely)
+            clock: Time source
+        """
+        super().__init__(rate_per_second, burst_size)
+        if max_keys < 1:
+            raise ValueError(f"max_keys must be >= 1, got {max_keys}")
+        self._shards = [_Shard() for _ in range(max(1, min(shards, max_keys)))]
+        # Round down so the total never exceeds max_keys
+        self._shard_capacity = max_keys // len(self._shards)
+        self._idle_ttl = max(idle_ttl or 0.0, self._full_refill_seconds)
+        self._clock = clock
+
+        logger.info(
+            f"ShardedBucketStore initialized: shards={len(self._shards)}, "
+            f"max_keys={self._shard_capacity * len(self._shards)}"
+        )
+
+    def _shard_for(self, key: str) -> _Shard:
+        """Stable shard for key."""
+        return self._shards[zlib.crc32(key.encode("utf-8")) % len(self._shards)]
+
+    def consume(self, key: str) -> Tuple[bool, float, int]:
+        """Refill and try to spend one token (atomic per shard)."""
+        shard = self._shard_for(key)
+        now = self._clock()
+
+        with shard.lock:
+            bucket = shard.buckets.get(key)
+            if bucket is None:
+                tokens = self._burst
+                bucket = [tokens, now]
+                shard.buckets[key] = bucket
+                self._evict(shard, now)
+            else:
+                tokens = self._refill(bucket[0], bucket[1], now)
+                shard.buckets.move_to_end(key)
+
+            allowed, retry_after, bucket[0] = self._spend(tokens)
+            bucket[1] = now
+            return allowed, retry_after, int(bucket[0])
+
+    def peek(self, key: str) -> int:
+        """Remaining tokens; never creates a bucket."""
+        shard = self._shard_for(key)
+        with shard.lock:
+            bucket = shard.buckets.get(key)
+            if bucket is None:
+                return int(self._burst)
+            return int(self._refill(bucket[0], bucket[1], self._clock()))
+
+    def _evict(self, shard: _Shard, now: float) -> None:
+        """Drop a few expired buckets, then LRU entries above capacity."""
+        cutoff = now - self._idle_ttl
+        buckets = shard.buckets
+        for _ in range(self.EXPIRE_BATCH):
+            oldest_key = next(iter(buckets))
+            if buckets[oldest_key][1] > cutoff:
+                break
+            del buckets[oldest_key]
+            shard.expired_evictions += 1
+
+        while len(buckets) > self._shard_capacity:
+            buckets.popitem(last=False)
+            shard.lru_evictions += 1
+
+    def size(self) -> int:
+        """Number of buckets held."""
+        total = 0
+        for shard in self._shards:
+            with shard.lock:
+                total += len(shard.buckets)
+        return total
+
+    def get_stats(self) -> dict:
+        """
+        Get store statistics.
+
+        Returns:
+            Dict with bucket and eviction counts
+        """
+        return {
+            "buckets": self.size(),
+            "max_keys": self._shard_capacity * len(self._shards),
+            "shards": len(self._shards),
+            "idle_ttl": self._idle_ttl,
+            "lru_evictions": sum(s.lru_evictions for s in self._shards),
+            "expired_evictions": sum(s.expired_evictions for s in self._shards),
+        }
+
+
+class SQLiteBucketStore(BucketStoreBase):
+    """
+    Bucket store shared by worker processes through SQLite.
+
+    Each consume() is one short BEGIN IMMEDIATE transaction, so concurrent
+    workers cannot double-spend a token. Idle buckets are deleted in a
+    periodic sweep.
+    """
+
+    SWEEP_INTERVAL = 60.0  # seconds
+
+    def __init__(
+        self,
+        db_path: str,
+        rate_per_second: float,
+        burst_size: int,
+        idle_ttl: Optional[float] = None,
+        busy_timeout: float = 5.0,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        """
+        Initialize SQLite store.
+
+        Args:
+            db_path: Shared database path
+            rate_per_second: Token refill rate
+            burst_size: Bucket capacity
+            idle_ttl: Seconds before an idle bucket is deleted
+                (default and minimum: time to refill completely)
+            busy_timeout: Seconds to wait for another worker's transaction
+            clock: Wall-clock time source (shared across processes)
+        """
+        super().__init__(rate_per_second, burst_size)
+        self._db_path = db_path
+        self._idle_ttl = max(idle_ttl or 0.0, self._full_refill_seconds)
+        self._busy_timeout = busy_timeout
+        self._clock = clock
+        self._local = threading.local()
+        self._sweep_lock = threading.Lock()
+        self._next_sweep = 0.0
+
+        Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+        conn = self._get_connection()
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS rate_limit_buckets (
+                bucket_key TEXT PRIMARY KEY,
+                tokens REAL NOT NULL,
+                updated_at REAL NOT NULL
+            )
+        """)
+        conn.execute("""
+            CREATE INDEX IF NOT EXISTS idx_rate_limit_buckets_updated
+                ON rate_limit_buckets(updated_at)
+        """)
+
+        logger.info(f"SQLiteBucketStore initialized: {db_path}")
+
+    def _get_connection(self) -> sqlite3.Connection:
+        """Per-thread autocommit connection."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(
+                self._db_path,
+                timeout=self._busy_timeout,
+                isolation_level=None,
+                check_same_thread=False,
+            )
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def consume(self, key: str) -> Tuple[bool, float, int]:
+        """Refill and try to spend one token in one write transaction."""
+        now = self._clock()
+        conn = self._get_connection()
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            row = conn.execute(
+                "SELECT tokens, updated_at FROM rate_limit_buckets WHERE bucket_key = ?",
+                (key,),
+            ).fetchone()
+            tokens = self._burst if row is None else self._refill(row[0], row[1], now)
+            allowed, retry_after, tokens = self._spend(tokens)
+            conn.execute(
+                "INSERT OR REPLACE INTO rate_limit_buckets (bucket_key, tokens, updated_at) "
+                "VALUES (?, ?, ?)",
+                (key, tokens, now),
+            )
+            conn.execute("COMMIT")
+        except sqlite3.Error as e:
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+            raise SSEInternalError(
+                message="Rate limit bucket update failed",
+                component="rate_limit",
+                operation="consume",
+                original_error=e,
+            )
+
+        self._maybe_sweep(now)
+        return allowed, retry_after, int(tokens)
+
+    def peek(self, key: str) -> int:
+        """Remaining tokens; never creates a bucket."""
+        row = self._get_connection().execute(
+            "SELECT tokens, updated_at FROM rate_limit_buckets WHERE bucket_key = ?",
+            (key,),
+        ).fetchone()
+        if row is None:
+            return int(self._burst)
+        return int(self._refill(row[0], row[1], self._clock()))
+
+    def _maybe_sweep(self, now: float) -> None:
+        """Delete idle buckets at most once per SWEEP_INTERVAL."""
+        with self._sweep_lock:
+            if now < self._next_sweep:
+                return
+            self._next_sweep = now + self.SWEEP_INTERVAL
+
+        try:
+            cursor = self._get_connection().execute(
+                "DELETE FROM rate_limit_buckets WHERE updated_at < ?",
+                (now - self._idle_ttl,),
+            )
+            if cursor.rowcount > 0:
+                logger.debug(f"Swept {cursor.rowcount} idle rate limit buckets")
+        except sqlite3.Error as e:
+            logger.warning(f"Rate limit bucket sweep failed: {e}")
+
+    def size(self) -> int:
+        """Number of stored buckets."""
+        return self._get_connection().execute(
+            "SELECT COUNT(*) FROM rate_limit_buckets"
+        ).fetchone()[0]
@@ -16,10 +16,11 @@ Frozen surfaces (TRUST, GEM, Z7, API shapes) are NOT modified.
 
 import logging
 import threading
-from collections import deque
+import time
+from bisect import bisect_left, bisect_right
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
-from typing import AsyncGenerator, Deque, Dict, Iterator, List, Optional
+from typing import AsyncGenerator, Dict, Iterator, List, Optional
 
 from .envelope import EventEnvelope, EventType
 
@@ -71,9 +72,17 @@ class EventBuffer:
     - Sequence-based retrieval
     - Gap detection for missing sequences
 
+    Events are kept in sequence order in parallel lists (events, sequences)
+    with a moving head offset, so appends are amortized O(1), lookups are
+    O(log n) by bisect, and evicting from the front only advances the head.
+    The dead prefix is compacted once it outgrows the live region.
+
     Used by ReplayController to serve reconnecting clients.
     """
 
+    # Seconds between age-eviction scans (bounds eviction lag)
+    AGE_CHECK_INTERVAL = 1.0
+
     def __init__(self, config: Optional[BufferConfig] = None) -> None:
         """
         Initialize event buffer.
@@ -82,11 +91,13 @@ class EventBuffer:
             config: Buffer configuration
         """
         self._config = config or BufferConfig()
-        self._buffer: Deque[EventEnvelope] = deque(maxlen=self._config.max_events)
-        self._sequence_index: Dict[int, int] = {}  # sequence -> buffer position
+        self._events: List[EventEnvelope] = []
+        self._sequences: List[int] = []
+        self._head: int = 0  # Index of the oldest live event
         self._lock = threading.RLock()
         self._min_sequence: int = 0
         self._max_sequence: int = 0
+        self._next_age_check: float = 0.0
 
         logger.info(
             f"EventBuffer initialized: max_events={self._config.max_events}, "
@@ -97,6 +108,9 @@ class EventBuffer:
         """
         Append event to buffer.
 
+        Events normally arrive in sequence order; a late (lower) sequence is
+        inserted at its sorted position near the tail.
+
         Args:
             event: Event envelope to append
         """
@@ -104,20 +118,39 @@ class EventBuffer:
             # Check for age-based eviction before append
             self._evict_old_events()
 
-            # Append to buffer
-            self._buffer.append(event)
+            sequence = event.sequence
+            if not self._sequences or sequence >= self._sequences[-1]:
+                self._events.append(event)
+                self._sequences.append(sequence)
+            else:
+                position = bisect_right(self._sequences, sequence, self._head)
+                self._events.insert(position, event)
+                self._sequences.insert(position, sequence)
 
-            # Update sequence tracking
-            if self._min_sequence == 0 or event.sequence < self._min_sequence:
-                self._min_sequence = event.sequence
-            if event.sequence > self._max_sequence:
-                self._max_sequence = event.sequence
+            # Size-based eviction (oldest sequence first)
+            if len(self._sequences) - self._head > self._config.max_events:
+                self._advance_head(len(self._sequences) - self._config.max_events)
 
-            # Update index (position may shift due to deque rotation)
-            self._rebuild_index()
+            self._update_sequence_range()
 
         logger.debug(f"Event buffered: seq={event.sequence}, type={event.event_type.value}")
 
+    def get_event(self, sequence: int) -> Optional[EventEnvelope]:
+        """
+        Get a single event by sequence.
+
+        Args:
+            sequence: Sequence number
+
+        Returns:
+            Event envelope or None if not buffered
+        """
+        with self._lock:
+            position = bisect_left(self._sequences, sequence, self._head)
+            if position < len(self._sequences) and self._sequences[position] == sequence:
+                return self._events[position]
+            return None
+
     def get_events_from_sequence(
         self,
         from_sequence: int,
@@ -134,17 +167,11 @@ class EventBuffer:
             List of events from the specified sequence
         """
         with self._lock:
-            events = [
-                e for e in self._buffer
-                if e.sequence >= from_sequence
-            ]
-
-            # Sort by sequence
-            events.sort(key=lambda e: e.sequence)
-
-            # Apply limit
-            if max_events is not None and len(events) > max_events:
-                events = events[:max_events]
+            start = bisect_left(self._sequences, from_sequence, self._head)
+            end = len(self._events)
+            if max_events is not None:
+                end = min(end, start + max(max_events, 0))
+            events = self._events[start:end]
 
         logger.debug(
             f"Retrieved {len(events)} events from sequence {from_sequence}"
@@ -167,14 +194,8 @@ class EventBuffer:
             List of events in range
         """
         with self._lock:
-            events = [
-                e for e in self._buffer
-                if from_sequence <= e.sequence <= to_sequence
-            ]
-
-            events.sort(key=lambda e: e.sequence)
-
-        return events
+            start, end = self._range_bounds(from_sequence, to_sequence)
+            return self._events[start:end]
 
     def detect_gaps(
         self,
@@ -184,6 +205,9 @@ class EventBuffer:
         """
         Detect sequence gaps in a range.
 
+        Cost is proportional to the events present in the range, not to
+        the width of the range.
+
         Args:
             from_sequence: Start of range
             to_sequence: End of range
@@ -192,26 +216,20 @@ class EventBuffer:
             List of (gap_start, gap_end) tuples
         """
         with self._lock:
-            present_sequences = {
-                e.sequence for e in self._buffer
-                if from_sequence <= e.sequence <= to_sequence
-            }
+            start, end = self._range_bounds(from_sequence, to_sequence)
+            present = self._sequences[start:end]
 
         gaps = []
-        gap_start = None
+        expected = from_sequence
 
-        for seq in range(from_sequence, to_sequence + 1):
-            if seq not in present_sequences:
-                if gap_start is None:
-                    gap_start = seq
-            else:
-                if gap_start is not None:
-                    gaps.append((gap_start, seq - 1))
-                    gap_start = None
+        for seq in present:
+            if seq > expected:
+                gaps.append((expected, seq - 1))
+            expected = max(expected, seq + 1)
 
         # Handle trailing gap
-        if gap_start is not None:
-            gaps.append((gap_start, to_sequence))
+        if expected <= to_sequence:
+            gaps.append((expected, to_sequence))
 
         return gaps
 
@@ -233,43 +251,72 @@ class EventBuffer:
             Number of events in buffer
         """
         with self._lock:
-            return len(self._buffer)
+            return len(self._sequences) - self._head
 
     def clear(self) -> None:
         """Clear all events from buffer."""
         with self._lock:
-            self._buffer.clear()
-            self._sequence_index.clear()
+            self._events = []
+            self._sequences = []
+            self._head = 0
             self._min_sequence = 0
             self._max_sequence = 0
 
         logger.info("EventBuffer cleared")
 
+    def _range_bounds(self, from_sequence: int, to_sequence: int) -> tuple:
+        """List bounds [start, end) of live events in a sequence range."""
+        start = bisect_left(self._sequences, from_sequence, self._head)
+        end = bisect_right(self._sequences, to_sequence, start)
+        return start, end
+
+    def _advance_head(self, new_head: int) -> None:
+        """Drop live events before new_head, compacting when worthwhile."""
+        for evicted in self._events[self._head:new_head]:
+            logger.debug(f"Evicted event: seq={evicted.sequence}")
+        self._head = new_head
+
+        # Compact once the dead prefix outgrows the live region (amortized O(1))
+        if self._head > len(self._sequences) - self._head:
+            del self._events[:self._head]
+            del self._sequences[:self._head]
+            self._head = 0
+
+    def _update_sequence_range(self) -> None:
+        """Refresh min/max from the live region."""
+        if self._head < len(self._sequences):
+            self._min_sequence = self._sequences[self._head]
+            self._max_sequence = self._sequences[-1]
+        else:
+            self._min_sequence = 0
+            self._max_sequence = 0
+
     def _evict_old_events(self) -> None:
-        """Evict events older than max_age_seconds."""
+        """
+        Evict events older than max_age_seconds.
+
+        Scans at most once per AGE_CHECK_INTERVAL; each scan stops at the
+        first event that is still fresh.
+        """
         if self._config.max_age_seconds <= 0:
             return
 
+        now = time.monotonic()
+        if now < self._next_age_check:
+            return
+        self._next_age_check = now + min(self.AGE_CHECK_INTERVAL, self._config.max_age_seconds)
+
         cutoff = datetime.now() - timedelta(seconds=self._config.max_age_seconds)
         cutoff_iso = cutoff.isoformat()
 
-        # Remove old events from front of deque
-        while self._buffer and self._buffer[0].timestamp < cutoff_iso:
-            evicted = self._buffer.popleft()
-            logger.debug(f"Evicted old event: seq={evicted.sequence}")
-
-        # Update min sequence
-        if self._buffer:
-            self._min_sequence = min(e.sequence for e in self._buffer)
-        else:
-            self._min_sequence = 0
-            self._max_sequence = 0
+        # Remove old events from the front
+        new_head = self._head
+        while new_head < len(self._events) and self._events[new_head].timestamp < cutoff_iso:
+            new_head += 1
 
-    def _rebuild_index(self) -> None:
-        """Rebuild the sequence index."""
-        self._sequence_index = {
-            e.sequence: i for i, e in enumerate(self._buffer)
-        }
+        if new_head != self._head:
+            self._advance_head(new_head)
+            self._update_sequence_range()
 
 
 class ReplayController:
@@ -7,7 +7,7 @@ Directive: P7.S1_IMPLEMENT_SSE_BACKEND
 
 Defines:
 - ISequenceGenerator protocol (interface)
-- DatabaseSequenceGenerator scaffold
+- DatabaseSequenceGenerator (SQLite, hi/lo block allocation)
 - RedisSequenceGenerator scaffold
 - InMemorySequenceGenerator (for testing)
 
@@ -16,14 +16,22 @@ Frozen surfaces (TRUST, GEM, Z7, API shapes) are NOT modified.
 """
 
 import logging
+import re
+import sqlite3
 import threading
 import time
 from abc import ABC, abstractmethod
-from typing import Optional, Protocol, runtime_checkable
+from pathlib import Path
+from typing import Optional, Protocol, Tuple, runtime_checkable
+
+from .exceptions import SSEInternalError
 
 # Diagnostic logging hook
 logger = logging.getLogger("sse.sequence")
 
+# Table names are interpolated into SQL; only plain identifiers are allowed
+_IDENTIFIER_PATTERN = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
+
 
 @runtime_checkable
 class ISequenceGenerator(Protocol):
@@ -165,20 +173,33 @@ class InMemorySequenceGenerator(SequenceGeneratorBase):
 
 class DatabaseSequenceGenerator(SequenceGeneratorBase):
     """
-    Database-backed sequence generator scaffold.
+    SQLite-backed, block-allocating sequence generator.
 
     Provides persistent sequence numbers via database storage.
-    Suitable for multi-instance deployments with shared database.
-
-    NOTE: This is a scaffold - actual database implementation
-    to be completed in P7.S2.
+    Suitable for multi-process deployments sharing one database file.
+
+    Uses hi/lo allocation: the database row holds the highest value
+    reserved by any process. A generator claims the next block_size values
+    in one short write transaction and serves next() from memory until the
+    block is used up.
+
+    Guarantees:
+    - Unique sequences across processes and restarts
+    - Monotonic within one generator
+    - Gap-tolerant: values left in a block when a process exits (or after
+      another process reserved a later block) are never issued
     """
 
+    DEFAULT_DB_PATH = "data/cip_sequences.db"
+    DEFAULT_BLOCK_SIZE = 100
+
     def __init__(
         self,
         table_name: str = "sse_sequences",
         sequence_name: str = "default",
-        connection_string: Optional[str] = None
+        connection_string: Optional[str] = None,
+        block_size: int = DEFAULT_BLOCK_SIZE,
+        busy_timeout: float = 30.0,
     ) -> None:
         """
         Initialize database sequence generator.
@@ -186,93 +207,206 @@ class DatabaseSequenceGenerator(SequenceGeneratorBase):
         Args:
             table_name: Database table for sequences
             sequence_name: Name of this sequence
-            connection_string: Database connection string
+            connection_string: SQLite database path (default data/cip_sequences.db)
+            block_size: Sequence numbers reserved per database transaction
+            busy_timeout: Seconds to wait for another process's reservation
         """
+        if not _IDENTIFIER_PATTERN.match(table_name):
+            raise ValueError(f"Invalid sequence table name: {table_name!r}")
+        if block_size < 1:
+            raise ValueError(f"block_size must be >= 1, got {block_size}")
+
         self._table_name = table_name
         self._sequence_name = sequence_name
-        self._connection_string = connection_string
-        self._local_cache: Optional[int] = None
+        self._connection_string = connection_string or self.DEFAULT_DB_PATH
+        self._block_size = block_size
+        self._busy_timeout = busy_timeout
+        self._local_cache: Optional[int] = None  # Last value issued
+        self._block_end: int = 0  # Last value of the reserved block
+        self._blocks_reserved = 0
         self._lock = threading.Lock()
 
+        Path(self._connection_string).parent.mkdir(parents=True, exist_ok=True)
+        self._ensure_schema()
+
         logger.info(
             f"DatabaseSequenceGenerator initialized: "
-            f"table={table_name}, name={sequence_name}"
+            f"table={table_name}, name={sequence_name}, block_size={block_size}"
         )
 
     def next(self) -> int:
         """
-        Generate next sequence number from database.
+        Generate next sequence number.
+
+        Reserves a new block from the database only when the current
+        block is exhausted.
 
         Returns:
             Next sequence number
-
-        NOTE: Scaffold implementation - returns local increment.
-        Full database implementation in P7.S2.
         """
         with self._lock:
-            if self._local_cache is None:
-                self._local_cache = self._fetch_from_database()
+            if self._local_cache is None or self._local_cache >= self._block_end:
+                block_start, self._block_end = self._reserve_block()
+                self._local_cache = block_start - 1
 
             self._local_cache += 1
             seq = self._local_cache
 
-            # Scaffold: Would persist to database here
-            self._persist_to_database(seq)
-
         logger.debug(f"Database sequence generated: {seq}")
         return seq
 
     def current(self) -> int:
         """
-        Get current sequence from database.
+        Get the current sequence.
 
         Returns:
-            Current sequence number
+            Last value issued by this generator, or the database high-water
+            mark if it has not issued any
         """
         with self._lock:
             if self._local_cache is None:
-                self._local_cache = self._fetch_from_database()
+                return self._fetch_from_database()
             return self._local_cache
 
     def reset(self, value: int = 0) -> None:
         """
         Reset sequence in database.
 
+        Other processes keep serving their reserved blocks; only values
+        reserved after the reset start from value + 1.
+
         Args:
             value: Value to reset to
         """
         with self._lock:
-            self._local_cache = value
             self._persist_to_database(value)
+            self._local_cache = None
+            self._block_end = 0
 
         logger.info(f"Database sequence reset to {value}")
 
-    def _fetch_from_database(self) -> int:
+    def get_stats(self) -> dict:
         """
-        Fetch current sequence from database.
+        Get generator statistics.
 
         Returns:
-            Sequence value from database
+            Dict with block allocation counters
+        """
+        with self._lock:
+            return {
+                "sequence_name": self._sequence_name,
+                "block_size": self._block_size,
+                "blocks_reserved": self._blocks_reserved,
+                "last_issued": self._local_cache,
+                "block_end": self._block_end,
+            }
+
+    def _get_connection(self) -> sqlite3.Connection:
+        """Open a short-lived connection (autocommit; transactions explicit)."""
+        return sqlite3.connect(
+            self._connection_string,
+            timeout=self._busy_timeout,
+            isolation_level=None,
+        )
+
+    def _ensure_schema(self) -> None:
+        """Create the sequence table if missing."""
+        conn = self._get_connection()
+        try:
+            conn.execute(f"""
+                CREATE TABLE IF NOT EXISTS {self._table_name} (
+                    name TEXT PRIMARY KEY,
+                    sequence_value INTEGER NOT NULL,
+                    updated_at TEXT NOT NULL
+                )
+            """)
+        except sqlite3.Error as e:
+            raise SSEInternalError(
+                message="Sequence table setup failed",
+                component="sequence",
+                operation="ensure_schema",
+                original_error=e,
+            )
+        finally:
+            conn.close()
+
+    def _reserve_block(self) -> Tuple[int, int]:
+        """
+        Reserve the next block in one write transaction.
+
+        BEGIN IMMEDIATE takes the database write lock up front, so
+        concurrent reservations from other processes are serialized.
 
-        NOTE: Scaffold - returns 0. Implement in P7.S2.
+        Returns:
+            (first, last) values of the reserved block
+        """
+        conn = self._get_connection()
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            row = conn.execute(
+                f"SELECT sequence_value FROM {self._table_name} WHERE name = ?",
+                (self._sequence_name,),
+            ).fetchone()
+            high = row[0] if row else 0
+            block_end = high + self._block_size
+            conn.execute(
+                f"INSERT OR REPLACE INTO {self._table_name} (name, sequence_value, updated_at) "
+                f"VALUES (?, ?, datetime('now'))",
+                (self._sequence_name, block_end),
+            )
+            conn.execute("COMMIT")
+        except sqlite3.Error as e:
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+            raise SSEInternalError(
+                message="Sequence block reservation failed",
+                component="sequence",
+                operation="reserve_block",
+                original_error=e,
+            )
+        finally:
+            conn.close()
+
+        self._blocks_reserved += 1
+        logger.debug(
+            f"Sequence block reserved: {high + 1}-{block_end}",
+            extra={"sequence_name": self._sequence_name},
+        )
+        return high + 1, block_end
+
+    def _fetch_from_database(self) -> int:
         """
-        # Scaffold: Would execute:
-        # SELECT sequence_value FROM {table} WHERE name = {name}
-        logger.debug("Scaffold: fetch_from_database called")
-        return 0
+        Fetch the reserved high-water mark from database.
+
+        Returns:
+            Highest value reserved by any generator (0 if none)
+        """
+        conn = self._get_connection()
+        try:
+            row = conn.execute(
+                f"SELECT sequence_value FROM {self._table_name} WHERE name = ?",
+                (self._sequence_name,),
+            ).fetchone()
+            return row[0] if row else 0
+        finally:
+            conn.close()
 
     def _persist_to_database(self, value: int) -> None:
         """
-        Persist sequence value to database.
+        Persist the high-water mark to database.
 
         Args:
             value: Sequence value to persist
-
-        NOTE: Scaffold - no-op. Implement in P7.S2.
         """
-        # Scaffold: Would execute:
-        # UPDATE {table} SET sequence_value = {value} WHERE name = {name}
-        logger.debug(f"Scaffold: persist_to_database({value}) called")
+        conn = self._get_connection()
+        try:
+            conn.execute(
+                f"INSERT OR REPLACE INTO {self._table_name} (name, sequence_value, updated_at) "
+                f"VALUES (?, ?, datetime('now'))",
+                (self._sequence_name, value),
+            )
+        finally:
+            conn.close()
 
 
 class RedisSequenceGenerator(SequenceGeneratorBase):
@@ -425,6 +559,7 @@ def create_sequence_generator(
     Args:
         generator_type: Type of generator ("memory", "database", "redis", "timestamp")
         **kwargs: Additional arguments for specific generator
+            (e.g. connection_string and block_size for "database")
 
     Returns:
         Configured sequence generator instance
@@ -0,0 +1,27 @@
+"""
+Shared pytest configuration for backend tests.
+
+Timing benchmarks (wall-clock comparisons) are marked
+@pytest.mark.benchmark and skipped unless CIP_RUN_BENCHMARKS=1, so the
+default run does not depend on machine speed or load.
+"""
+
+import os
+import pytest
+
+RUN_BENCHMARKS = os.environ.get("CIP_RUN_BENCHMARKS", "").lower() in ("1", "true", "yes")
+
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers", "benchmark: wall-clock benchmark, opt-in with CIP_RUN_BENCHMARKS=1"
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    if RUN_BENCHMARKS:
+        return
+    skip = pytest.mark.skip(reason="timing benchmark (set CIP_RUN_BENCHMARKS=1 to run)")
+    for item in items:
+        if item.get_closest_marker("benchmark") is not None:
+            item.add_marker(skip)
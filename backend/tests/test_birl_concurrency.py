@@ -0,0 +1,186 @@
+"""
+BIRL Concurrency and Narrative Cache Tests
+
+Test Gates:
+- BIRL-CONC-01: Narratives are requested concurrently on a bounded pool
+- BIRL-CONC-02: Narratives stay in pair order and respect birl_max_narratives
+- BIRL-CACHE-01: Unchanged clause pairs make no LLM calls on re-run
+- BIRL-CACHE-02: The hallucination shield still runs on cached narratives
+"""
+
+import os
+import sys
+import threading
+import time
+import pytest
+from types import SimpleNamespace
+from unittest.mock import patch
+
+# Add backend to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import compare_v3_engine as engine
+from narrative_cache import NarrativeCache
+
+
+class FakeClaude:
+    """call_claude_safe stand-in that records calls and concurrency."""
+
+    def __init__(self, delay=0.0):
+        self.delay = delay
+        self.calls = 0
+        self.active = 0
+        self.max_active = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, payload, purpose, contract_id):
+        with self._lock:
+            self.calls += 1
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        time.sleep(self.delay)
+        with self._lock:
+            self.active -= 1
+
+        message = payload["messages"][0]["content"]
+        title = message.split("V1 Clause: ")[1].split("\n")[0]
+        return SimpleNamespace(
+            success=True,
+            data={"response": f"Narrative: The {title} change shifts cost to the buyer. Margin is reduced.\nDimensions: MARGIN"},
+        )
+
+
+def _pairs(count):
+    """Build clause lists, SAE matches and ERCE results for count pairs."""
+    v1 = [{"id": i, "title": f"Term{i}", "text": f"Original term {i} wording"} for i in range(count)]
+    v2 = [{"id": i, "title": f"Term{i}", "text": f"Revised term {i} wording"} for i in range(count)]
+    sae = [{"v1_clause_id": i, "v2_clause_id": i} for i in range(count)]
+    erce = [{"risk_category": "HIGH"} for _ in range(count)]
+    return erce, sae, v1, v2
+
+
+@pytest.fixture
+def cache(tmp_path):
+    """Isolated narrative cache with the cache flag on."""
+    narrative_cache = NarrativeCache(db_path=str(tmp_path / "birl_narratives.db"))
+    with patch("narrative_cache.is_flag_enabled", return_value=True), \
+         patch.object(engine, "get_narrative_cache", return_value=narrative_cache):
+        yield narrative_cache
+
+
+def _run_birl(fake, erce, sae, v1, v2, config=None):
+    """Run BIRL with the flag on and Claude replaced by fake."""
+    overrides = {"birl_max_narratives": 5, "birl_concurrency": 4}
+    overrides.update(config or {})
+    with patch.object(engine, "is_flag_enabled", return_value=True), \
+         patch.object(engine, "call_claude_safe", fake), \
+         patch.object(engine, "get_config", side_effect=lambda key, default=None: overrides.get(key, default)):
+        return engine.run_birl_real(erce, sae, v1, v2, "test-request")
+
+
+# ============================================================================
+# BIRL-CONC-01 / 02: Concurrency and ordering
+# ============================================================================
+
+class TestBirlConcurrency:
+    """Test bounded fan-out of narrative requests"""
+
+    def test_requests_overlap_within_bound(self, cache):
+        """Five pairs at 0.2s each finish well under the serial 1.0s"""
+        fake = FakeClaude(delay=0.2)
+
+        narratives, stats = _run_birl(fake, *_pairs(5), config={"birl_concurrency": 3})
+
+        assert fake.calls == 5
+        assert fake.max_active == 3
+        assert stats["narratives_count"] == 5
+        assert stats["llm_calls"] == 5
+
+    def test_pair_order_preserved(self, cache):
+        """Narratives keep clause_pair_id order and match their pair"""
+        narratives, _ = _run_birl(FakeClaude(delay=0.01), *_pairs(5))
+
+        assert [n["clause_pair_id"] for n in narratives] == [1, 2, 3, 4, 5]
+        for idx, narrative in enumerate(narratives):
+            assert f"Term{idx} " in narrative["narrative"]
+
+    def test_max_narratives_respected(self, cache):
+        """Only birl_max_narratives pairs are sent to Claude"""
+        fake = FakeClaude()
+        narratives, _ = _run_birl(fake, *_pairs(8), config={"birl_max_narratives": 3})
+
+        assert len(narratives) == 3
+        assert fake.calls == 3
+
+
+# ============================================================================
+# BIRL-CACHE-01 / 02: Narrative cache
+# ============================================================================
+
+class TestBirlNarrativeCache:
+    """Test persistent narrative cache"""
+
+    def test_rerun_makes_no_llm_calls(self, cache):
+        """Second run on unchanged pairs is served from the cache"""
+        first_fake = FakeClaude()
+        first, _ = _run_birl(first_fake, *_pairs(4))
+
+        second_fake = FakeClaude()
+        second, stats = _run_birl(second_fake, *_pairs(4))
+
+        assert first_fake.calls == 4
+        assert second_fake.calls == 0
+        assert stats["cache_hits"] == 4
+        assert second == first
+
+    def test_changed_pair_misses_cache(self, cache):
+        """Editing one clause only re-requests that pair"""
+        _run_birl(FakeClaude(), *_pairs(3))
+
+        erce, sae, v1, v2 = _pairs(3)
+        v2[1]["text"] = "Completely rewritten term"
+        fake = FakeClaude()
+        _, stats = _run_birl(fake, erce, sae, v1, v2)
+
+        assert fake.calls == 1
+        assert stats["cache_hits"] == 2
+
+    def test_key_includes_category_and_prompt_version(self):
+        """Risk category and prompt version change the key"""
+        base = NarrativeCache.compute_key("a", "b", "HIGH", "v1")
+        assert base != NarrativeCache.compute_key("a", "b", "LOW", "v1")
+        assert base != NarrativeCache.compute_key("a", "b", "HIGH", "v2")
+        assert base == NarrativeCache.compute_key("a", "b", "HIGH", "v1")
+
+    def test_shield_runs_on_cached_narratives(self, cache):
+        """A cached narrative that now fails the shield is rejected"""
+        _run_birl(FakeClaude(), *_pairs(2))
+
+        with patch.object(engine, "_validate_narrative_hallucination",
+                          return_value=(False, "legal_advice_phrase:test")) as shield:
+            narratives, stats = _run_birl(FakeClaude(), *_pairs(2))
+
+        assert shield.call_count == 2
+        assert stats["hallucination_rejections"] == 2
+        assert all(n["narrative"] == "Impact analysis unavailable." for n in narratives)
+
+    def test_rejected_narratives_not_cached(self, cache):
+        """Only shield-approved narratives are written to the cache"""
+        with patch.object(engine, "_validate_narrative_hallucination",
+                          return_value=(False, "hallucinated_date:x")):
+            _run_birl(FakeClaude(), *_pairs(2))
+
+        fake = FakeClaude()
+        _run_birl(fake, *_pairs(2))
+        assert fake.calls == 2
+
+    def test_cache_flag_off_always_calls(self, tmp_path):
+        """With birl_narrative_cache_active off every run calls Claude"""
+        narrative_cache = NarrativeCache(db_path=str(tmp_path / "birl_narratives.db"))
+        with patch("narrative_cache.is_flag_enabled", return_value=False), \
+             patch.object(engine, "get_narrative_cache", return_value=narrative_cache):
+            _run_birl(FakeClaude(), *_pairs(2))
+            fake = FakeClaude()
+            _run_birl(fake, *_pairs(2))
+
+        assert fake.calls == 2
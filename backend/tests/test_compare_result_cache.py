@@ -0,0 +1,269 @@
+"""
+Compare v3 Result Cache Tests
+
+Test Gates:
+- RESULT-CACHE-01: A repeated compare of identical texts runs no stages (_meta.cache_hit)
+- RESULT-CACHE-02: Stage keys cover text, flags and versions; unchanged stages are reused
+- RESULT-CACHE-03: Failed, fallback and downstream-of-failure stages are not cached
+- RESULT-CACHE-04: Cache is inert when comparison_snapshot_active is off
+"""
+
+import os
+import sys
+import pytest
+from unittest.mock import patch
+
+# Add backend to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import compare_v3_engine as engine
+from comparison_snapshot_cache import ComparisonSnapshotCache
+
+
+FLAGS_ON = {
+    "comparison_snapshot_active": True,
+    "sae_intelligence_active": True,
+    "erce_intelligence_active": True,
+    "birl_intelligence_active": True,
+    "far_intelligence_active": True,
+}
+
+
+class CountingStages:
+    """Stage stubs that count calls and return deterministic outputs."""
+
+    def __init__(self):
+        self.calls = {"SAE": 0, "ERCE": 0, "BIRL": 0, "FAR": 0}
+        self.fail = set()
+
+    def _run(self, stage, output):
+        self.calls[stage] += 1
+        if stage in self.fail:
+            raise RuntimeError(f"{stage} down")
+        return output, {"count": len(output)}
+
+    def sae(self, v1_clauses, v2_clauses, *args):
+        return self._run("SAE", [{"v1_clause_id": 1, "v2_clause_id": 1, "similarity": 0.93}])
+
+    def erce(self, sae_matches, *args):
+        return self._run("ERCE", [{"clause_pair_id": len(sae_matches), "risk_category": "HIGH"}])
+
+    def birl(self, erce_results, *args):
+        return self._run("BIRL", [{"clause_pair_id": 1, "narrative": erce_results[0]["risk_category"]}])
+
+    def far(self, *args):
+        return self._run("FAR", [{"gap_type": "missing"}])
+
+
+@pytest.fixture
+def flags():
+    return dict(FLAGS_ON)
+
+
+@pytest.fixture
+def cache(tmp_path, flags):
+    """Isolated snapshot cache; flags read from the mutable flags dict."""
+    snapshot_cache = ComparisonSnapshotCache(db_path=str(tmp_path / "comparison_snapshots.db"))
+    lookup = lambda name: flags.get(name, False)
+    with patch("comparison_snapshot_cache.is_flag_enabled", side_effect=lookup), \
+         patch.object(engine, "is_flag_enabled", side_effect=lookup), \
+         patch.object(engine, "get_snapshot_cache", return_value=snapshot_cache), \
+         patch.object(engine, "get_pattern_cache") as pattern_cache:
+        pattern_cache.return_value.get_library_version.return_value = "lib-1"
+        yield snapshot_cache
+
+
+def _compare(stages, v1="Supplier shall deliver.", v2="Supplier may deliver."):
+    with patch.object(engine, "run_sae_real", stages.sae), \
+         patch.object(engine, "run_erce_real", stages.erce), \
+         patch.object(engine, "run_birl_real", stages.birl), \
+         patch.object(engine, "run_far_real", stages.far):
+        return engine.run_compare_v3_orchestrator(v1, v2)
+
+
+# ============================================================================
+# RESULT-CACHE-01: Full Hit
+# ============================================================================
+
+class TestFullHit:
+    """Test repeated compares are served from the cache"""
+
+    def test_repeat_compare_runs_no_stages(self, cache):
+        """Second compare of identical texts returns the stored result"""
+        stages = CountingStages()
+        first = _compare(stages)
+        second = _compare(stages)
+
+        assert stages.calls == {"SAE": 1, "ERCE": 1, "BIRL": 1, "FAR": 1}
+        assert first["_meta"]["cache_hit"] is False
+        assert second["_meta"]["cache_hit"] is True
+        assert second["_meta"]["cached_stages"] == ["SAE", "ERCE", "BIRL", "FAR"]
+        for key in ("sae_matches", "erce_results", "birl_narratives", "flowdown_gaps"):
+            assert second[key] == first[key]
+        assert second["_meta"]["stats"]["birl"] == first["_meta"]["stats"]["birl"]
+        assert second["_meta"]["pipeline_status"] == "REAL"
+
+    def test_hit_keeps_monitor_events(self, cache):
+        """Cached stages still report start/end in the monitor timeline"""
+        stages = CountingStages()
+        _compare(stages)
+        result = _compare(stages)
+
+        assert set(result["_meta"]["monitor"]["stage_timeline"]) == {"SAE", "ERCE", "BIRL", "FAR"}
+
+    def test_metrics_count_comparison_and_stage_hits(self, cache):
+        """Comparison-level and stage-level hits are tracked separately"""
+        stages = CountingStages()
+        _compare(stages)
+        _compare(stages)
+
+        metrics = cache.get_metrics()
+        assert metrics["hits"] == 1
+        assert metrics["misses"] == 1
+        assert metrics["stage_hits"] == 4
+        assert metrics["writes"] == 4
+
+
+# ============================================================================
+# RESULT-CACHE-02: Keys and Partial Reuse
+# ============================================================================
+
+class TestPartialReuse:
+    """Test per-stage keys and partial reuse"""
+
+    def test_birl_prompt_change_reuses_other_stages(self, cache):
+        """Only BIRL reruns when BIRL_PROMPT_VERSION changes"""
+        stages = CountingStages()
+        _compare(stages)
+
+        with patch.object(engine, "BIRL_PROMPT_VERSION", "birl-test-2"):
+            result = _compare(stages)
+
+        assert stages.calls == {"SAE": 1, "ERCE": 1, "BIRL": 2, "FAR": 1}
+        assert result["_meta"]["cache_hit"] is False
+        assert result["_meta"]["cached_stages"] == ["SAE", "ERCE", "FAR"]
+
+    def test_pattern_library_change_reruns_erce_and_birl(self, cache):
+        """ERCE and its downstream BIRL rerun when the library changes"""
+        stages = CountingStages()
+        _compare(stages)
+
+        engine.get_pattern_cache.return_value.get_library_version.return_value = "lib-2"
+        result = _compare(stages)
+
+        assert stages.calls == {"SAE": 1, "ERCE": 2, "BIRL": 2, "FAR": 1}
+        assert result["_meta"]["cached_stages"] == ["SAE", "FAR"]
+
+    def test_flag_change_changes_keys(self, cache, flags):
+        """Turning a stage flag off misses that stage and its dependents"""
+        stages = CountingStages()
+        _compare(stages)
+
+        flags["sae_intelligence_active"] = False
+        result = _compare(stages)
+
+        assert result["_meta"]["cached_stages"] == ["FAR"]
+
+    def test_text_change_misses(self, cache):
+        """Different texts share no stage results"""
+        stages = CountingStages()
+        _compare(stages)
+        result = _compare(stages, v2="Supplier must deliver.")
+
+        assert result["_meta"]["cached_stages"] == []
+        assert stages.calls["SAE"] == 2
+
+    def test_engine_version_in_keys(self, cache):
+        """Engine version bump invalidates every stage"""
+        keys = engine._compute_stage_cache_keys("a", "b", [], [])
+        with patch.object(engine, "COMPARE_V3_ENGINE_VERSION", "9.9"):
+            bumped = engine._compute_stage_cache_keys("a", "b", [], [])
+
+        assert all(keys[stage] != bumped[stage] for stage in engine.STAGE_ORDER)
+
+    @pytest.mark.parametrize("name, value", [
+        ("DOWNSTREAM_WEAK_KEYWORDS", ["best efforts"]),
+        ("CONFLICT_TERM_PAIRS", [("shall", "may")]),
+    ])
+    def test_far_term_lists_change_reruns_far(self, cache, name, value):
+        """Editing a FAR term list reruns FAR and reuses the other stages"""
+        stages = CountingStages()
+        _compare(stages)
+
+        with patch.object(engine, name, value):
+            result = _compare(stages)
+
+        assert stages.calls == {"SAE": 1, "ERCE": 1, "BIRL": 1, "FAR": 2}
+        assert result["_meta"]["cached_stages"] == ["SAE", "ERCE", "BIRL"]
+
+
+# ============================================================================
+# RESULT-CACHE-03: What Is Not Cached
+# ============================================================================
+
+class TestNotCached:
+    """Test transient results are never stored"""
+
+    def test_failed_stage_and_dependents_not_cached(self, cache):
+        """ERCE failure: neither ERCE nor BIRL (run on the placeholder) is stored"""
+        stages = CountingStages()
+        stages.fail.add("ERCE")
+        first = _compare(stages)
+        assert first["_meta"]["pipeline_status"] == "PARTIAL:ERCE"
+
+        stages.fail.clear()
+        second = _compare(stages)
+
+        assert second["_meta"]["cached_stages"] == ["SAE", "FAR"]
+        assert second["birl_narratives"][0]["narrative"] == "HIGH"
+        assert second["_meta"]["pipeline_status"] == "REAL"
+
+    def test_placeholder_fallback_not_cached(self, cache):
+        """A placeholder returned with the flag on is a fallback, not a result"""
+        stages = CountingStages()
+        with patch.object(stages, "far", lambda *args: (engine._generate_far_placeholder(), {})):
+            _compare(stages)
+
+        result = _compare(stages)
+
+        assert "FAR" not in result["_meta"]["cached_stages"]
+        assert stages.calls["FAR"] == 1
+
+    def test_birl_failures_not_cached(self, cache):
+        """BIRL runs with failed narratives are rerun next time"""
+        stages = CountingStages()
+        failing = lambda *args: ([{"clause_pair_id": 1, "narrative": "x"}], {"failures_count": 1})
+        with patch.object(stages, "birl", failing):
+            _compare(stages)
+
+        result = _compare(stages)
+
+        assert result["_meta"]["cached_stages"] == ["SAE", "ERCE", "FAR"]
+
+
+# ============================================================================
+# RESULT-CACHE-04: Flag Off
+# ============================================================================
+
+class TestFlagOff:
+    """Test comparison_snapshot_active gating"""
+
+    def test_flag_off_always_runs(self, cache, flags):
+        """With the flag off nothing is read or written"""
+        flags["comparison_snapshot_active"] = False
+        stages = CountingStages()
+        _compare(stages)
+        result = _compare(stages)
+
+        assert stages.calls["SAE"] == 2
+        assert result["_meta"]["cache_hit"] is False
+        assert cache.get_stats()["stage_entry_count"] == 0
+
+    def test_invalidate_by_version_drops_stage_results(self, cache):
+        """invalidate_by_version also removes stage results"""
+        _compare(CountingStages())
+
+        deleted = cache.invalidate_by_version("Supplier shall deliver.")
+
+        assert deleted == 4
+        assert cache.get_stats()["stage_entry_count"] == 0
@@ -0,0 +1,336 @@
+"""
+Streaming Compare Tests
+
+Test Gates:
+- COMPARE-STREAM-01: Each stage emits typed start/complete events with its payload
+- COMPARE-STREAM-02: Results stream before the pipeline finishes (SAE first, BIRL per narrative)
+- COMPARE-STREAM-03: SSE frames carry the event log sequence; Last-Event-ID resumes
+- COMPARE-STREAM-04: POST /api/v1/stream/<session_id>/compare starts a run
+- COMPARE-STREAM-05: Publishers in separate processes never share a sequence
+"""
+
+import json
+import os
+import sqlite3
+import subprocess
+import sys
+import textwrap
+import time
+import pytest
+from dataclasses import replace
+from unittest.mock import patch
+
+# Add backend to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from flask import Flask
+
+import compare_v3_engine as engine
+from api.v1 import stream as stream_api
+from compare_stream import CompareEventPublisher, run_streaming_compare
+from event_log import EventLogRepository
+from session_state import SessionStateRepository
+from sse.envelope import EventType
+from test_birl_concurrency import FakeClaude, _pairs
+
+
+@pytest.fixture
+def event_repo(tmp_path):
+    return EventLogRepository(db_path=str(tmp_path / "events.db"))
+
+
+def _stage(result, seconds=0.0, check=None):
+    """Stage stub returning (result, {}) after an optional check and sleep."""
+    def stage(*args, **kwargs):
+        if check:
+            check()
+        time.sleep(seconds)
+        return result, {}
+    return stage
+
+
+def _run(event_repo, sae=None, erce=None, birl=None, far=None, session_id="sess-1"):
+    with patch.object(engine, "run_sae_real", sae or _stage([{"v1_clause_id": 1, "v2_clause_id": 1}])), \
+         patch.object(engine, "run_erce_real", erce or _stage([{"clause_pair_id": 1, "risk_category": "HIGH"}])), \
+         patch.object(engine, "run_birl_real", birl or _stage([{"clause_pair_id": 1, "narrative": "n"}])), \
+         patch.object(engine, "run_far_real", far or _stage([])):
+        return run_streaming_compare(session_id, "v1 text", "v2 text", event_repo=event_repo)
+
+
+def _events(event_repo, session_id="sess-1"):
+    return event_repo.get_events_from_sequence(session_id, from_seq=1, max_events=1000)
+
+
+def _parse_frames(chunks):
+    """Parse SSE frames into dicts with id, event and data."""
+    frames = []
+    for chunk in chunks:
+        if not chunk:
+            continue
+        frame = {}
+        for line in chunk.strip().split("\n"):
+            key, _, value = line.partition(": ")
+            frame[key] = value
+        frame["data"] = json.loads(frame["data"])
+        frames.append(frame)
+    return frames
+
+
+# ============================================================================
+# COMPARE-STREAM-01: Typed Stage Events
+# ============================================================================
+
+class TestStageEvents:
+    """Test compare events published to the event log"""
+
+    def test_event_sequence_and_types(self, event_repo):
+        """A run publishes start, per-stage start/complete and complete"""
+        result = _run(event_repo)
+        events = _events(event_repo)
+
+        assert [e.sequence for e in events] == list(range(1, len(events) + 1))
+        assert events[0].event_type == EventType.COMPARE_START.value
+        assert events[-1].event_type == EventType.COMPARE_COMPLETE.value
+        assert events[-1].payload["_meta"]["request_id"] == result["_meta"]["request_id"]
+
+        starts = [e.payload["stage"] for e in events if e.event_type == "compare_stage_start"]
+        completes = [e.payload["stage"] for e in events if e.event_type == "compare_stage_complete"]
+        assert sorted(starts) == sorted(completes) == ["BIRL", "ERCE", "FAR", "SAE"]
+        assert len({e.payload["compare_id"] for e in events}) == 1
+
+    def test_stage_complete_carries_payload(self, event_repo):
+        """stage_complete has the stage output, status and stats"""
+        _run(event_repo)
+        completes = {
+            e.payload["stage"]: e.payload
+            for e in _events(event_repo) if e.event_type == "compare_stage_complete"
+        }
+
+        assert completes["SAE"]["output"] == [{"v1_clause_id": 1, "v2_clause_id": 1}]
+        assert completes["ERCE"]["output"][0]["risk_category"] == "HIGH"
+        assert completes["SAE"]["status"] == "success"
+        assert completes["SAE"]["stats"]["status"] == "REAL"
+
+    def test_failed_stage_reports_placeholder(self, event_repo):
+        """A failing stage still completes with status failure and error_key"""
+        def boom(*args):
+            raise RuntimeError("boom")
+
+        _run(event_repo, erce=boom)
+        erce = next(
+            e.payload for e in _events(event_repo)
+            if e.event_type == "compare_stage_complete" and e.payload["stage"] == "ERCE"
+        )
+
+        assert erce["status"] == "failure"
+        assert erce["error_key"] == "erce.exception"
+        assert erce["output"] == engine._generate_erce_placeholder()
+
+    def test_orchestrator_error_publishes_compare_error(self, event_repo):
+        """An orchestrator exception ends the run with compare_error"""
+        with patch.object(engine, "run_compare_v3_orchestrator", side_effect=RuntimeError("down")):
+            result = run_streaming_compare("sess-1", "a", "b", event_repo=event_repo)
+
+        events = _events(event_repo)
+        assert result["success"] is False
+        assert events[-1].event_type == EventType.COMPARE_ERROR.value
+        assert events[-1].payload["error_message_key"] == "compare.internal_failure"
+
+    def test_sequences_continue_across_runs(self, event_repo):
+        """Publishers continue the session's sequence"""
+        CompareEventPublisher("sess-1", event_repo=event_repo).publish(EventType.COMPARE_START, {})
+        entry = CompareEventPublisher("sess-1", event_repo=event_repo).publish(EventType.COMPARE_START, {})
+
+        assert entry.sequence == 2
+
+
+# ============================================================================
+# COMPARE-STREAM-02: Incremental Delivery
+# ============================================================================
+
+class TestIncrementalDelivery:
+    """Test events are visible before the pipeline finishes"""
+
+    def test_sae_result_published_before_birl_runs(self, event_repo):
+        """SAE stage_complete is in the log while BIRL is still running"""
+        seen = {}
+
+        def check():
+            seen["types"] = [(e.event_type, e.payload.get("stage")) for e in _events(event_repo)]
+
+        _run(event_repo, birl=_stage([], check=check))
+
+        assert ("compare_stage_complete", "SAE") in seen["types"]
+        assert ("compare_complete", None) not in seen["types"]
+
+    def _run_birl(self, count, on_narrative):
+        erce, sae, v1, v2 = _pairs(count)
+        with patch.object(engine, "NARRATIVE_CACHE_AVAILABLE", False), \
+             patch.object(engine, "is_flag_enabled", return_value=True), \
+             patch.object(engine, "call_claude_safe", FakeClaude()):
+            return engine.run_birl_real(erce, sae, v1, v2, "req", on_narrative=on_narrative)
+
+    def test_birl_narratives_streamed_as_they_arrive(self):
+        """run_birl_real calls on_narrative once per pair, before returning"""
+        streamed = []
+        narratives, _ = self._run_birl(3, streamed.append)
+
+        assert sorted(n["clause_pair_id"] for n in streamed) == [1, 2, 3]
+        assert narratives == sorted(streamed, key=lambda n: n["clause_pair_id"])
+
+    def test_narrative_callback_error_does_not_fail_birl(self):
+        """A failing on_narrative callback is logged and ignored"""
+        def broken(narrative):
+            raise ValueError("client gone")
+
+        narratives, stats = self._run_birl(2, broken)
+
+        assert len(narratives) == 2
+        assert stats.get("failures_count", 0) == 0
+
+
+# ============================================================================
+# COMPARE-STREAM-03: SSE Delivery and Resume
+# ============================================================================
+
+class TestSSEResume:
+    """Test SSEStreamHandler live delivery and Last-Event-ID resume"""
+
+    @pytest.fixture
+    def session_repo(self, tmp_path):
+        return SessionStateRepository(db_path=str(tmp_path / "sessions.db"))
+
+    def _handler(self, session_repo, event_repo, last_event_id=None):
+        return stream_api.SSEStreamHandler(
+            session_id="sess-1",
+            connection_id="conn-1",
+            session_repo=session_repo,
+            event_repo=event_repo,
+            last_event_id=last_event_id,
+        )
+
+    def test_resume_replays_then_tails(self, session_repo, event_repo):
+        """Reconnect with Last-Event-ID gets missed events, then new ones live"""
+        publisher = CompareEventPublisher("sess-1", event_repo=event_repo)
+        for _ in range(5):
+            publisher.publish(EventType.COMPARE_NARRATIVE, {})
+
+        stream = self._handler(session_repo, event_repo, last_event_id=3).generate_stream()
+        chunks = [next(stream) for _ in range(5)]  # handshake, replay_start, 4, 5, replay_end
+
+        publisher.publish(EventType.COMPARE_COMPLETE, {})
+        chunks.append(next(stream))
+        stream.close()
+
+        frames = _parse_frames(chunks)
+        assert [f.get("id") for f in frames] == [None, None, "4", "5", None, "6"]
+        assert frames[2]["event"] == "replay_event"
+        assert frames[-1]["event"] == "compare_complete"
+        assert frames[-1]["data"]["payload"]["sequence"] == 6
+
+    def test_new_connection_starts_at_latest(self, session_repo, event_repo):
+        """Without Last-Event-ID only events logged after connect are sent"""
+        publisher = CompareEventPublisher("sess-1", event_repo=event_repo)
+        publisher.publish(EventType.COMPARE_START, {})
+
+        stream = self._handler(session_repo, event_repo).generate_stream()
+        next(stream)  # handshake
+        publisher.publish(EventType.COMPARE_STAGE_START, {"stage": "SAE"})
+        frames = _parse_frames([next(stream)])
+        stream.close()
+
+        assert frames[0]["id"] == "2"
+        assert frames[0]["event"] == "compare_stage_start"
+
+
+# ============================================================================
+# COMPARE-STREAM-04: Endpoint
+# ============================================================================
+
+class TestCompareEndpoint:
+    """Test POST /api/v1/stream/<session_id>/compare"""
+
+    @pytest.fixture
+    def client(self, event_repo):
+        app = Flask(__name__)
+        app.register_blueprint(stream_api.stream_bp)
+        with patch.object(stream_api, "get_event_log_repository", return_value=event_repo):
+            yield app.test_client()
+
+    def test_start_returns_202(self, client, event_repo):
+        """Endpoint starts the run and returns the resume point"""
+        CompareEventPublisher("sess-1", event_repo=event_repo).publish(EventType.COMPARE_START, {})
+
+        with patch("compare_stream.start_streaming_compare", return_value="cmp-1") as start:
+            response = client.post("/api/v1/stream/sess-1/compare", json={"v1_text": "a", "v2_text": "b"})
+
+        data = response.get_json()
+        assert response.status_code == 202
+        assert data["compare_id"] == "cmp-1"
+        assert data["last_event_id"] == 1
+        assert data["stream_url"] == "/api/v1/stream/sess-1"
+        assert start.call_args[0][:3] == ("sess-1", "a", "b")
+
+    def test_missing_text_rejected(self, client):
+        """Both texts are required"""
+        response = client.post("/api/v1/stream/sess-1/compare", json={"v1_text": "a"})
+
+        assert response.status_code == 400
+        assert response.get_json()["error_message_key"] == "compare.payload_failure"
+
+
+# ============================================================================
+# COMPARE-STREAM-05: Cross-Process Sequences
+# ============================================================================
+
+class TestCrossProcessSequences:
+    """Test sequence allocation shared through the event log database"""
+
+    def test_processes_publish_distinct_sequences(self, tmp_path):
+        """Concurrent publishers in four processes store 1..N without duplicates"""
+        db_path = str(tmp_path / "events.db")
+        EventLogRepository(db_path=db_path)
+        script = textwrap.dedent(f"""
+            import sys
+            sys.path.insert(0, {os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))!r})
+            from compare_stream import CompareEventPublisher
+            from event_log import EventLogRepository
+            from sse.envelope import EventType
+            repo = EventLogRepository(db_path={db_path!r})
+            publisher = CompareEventPublisher("sess-1", event_repo=repo)
+            for n in range(25):
+                publisher.publish(EventType.COMPARE_NARRATIVE, {{"n": n}})
+        """)
+
+        workers = [subprocess.Popen([sys.executable, "-c", script]) for _ in range(4)]
+        assert all(w.wait(timeout=120) == 0 for w in workers)
+
+        conn = sqlite3.connect(db_path)
+        sequences = [r[0] for r in conn.execute(
+            "SELECT sequence FROM event_log WHERE session_id = 'sess-1' ORDER BY sequence"
+        )]
+        conn.close()
+        assert sequences == list(range(1, 101))
+
+    def test_duplicate_sequence_rejected(self, event_repo):
+        """The (session_id, sequence) index is unique"""
+        first = CompareEventPublisher("sess-1", event_repo=event_repo).publish(EventType.COMPARE_START, {})
+
+        assert event_repo.append(replace(first, event_id="other")) is False
+        assert [e.sequence for e in _events(event_repo)] == [1]
+
+    def test_conflict_is_retried(self, event_repo):
+        """An insert that hits a stored sequence is retried with a fresh one"""
+        first = CompareEventPublisher("sess-1", event_repo=event_repo).publish(EventType.COMPARE_START, {})
+        calls = []
+
+        def build(sequence):
+            calls.append(sequence)
+            # First attempt collides with the stored event
+            return replace(first, event_id=f"e{len(calls)}", sequence=1 if len(calls) == 1 else sequence)
+
+        entry = event_repo.append_next_sequence("sess-1", build)
+
+        assert calls == [2, 2]
+        assert entry.sequence == 2
+        assert [e.sequence for e in _events(event_repo)] == [1, 2]
@@ -0,0 +1,396 @@
+"""
+SQLite Connection Pool Tests
+
+Test Gates:
+- DB-POOL-01: Connections are reused across threads with PRAGMAs applied once
+- DB-POOL-02: Checkouts are isolated (nesting, threads, rollback, replaced files)
+- DB-POOL-03: Read-only connections reject writes
+- DB-POOL-04: Flask requests share connections and return leaked ones at teardown
+- DB-POOL-05: Module helpers delegate to the pool
+"""
+
+import os
+import sqlite3
+import sys
+import threading
+import time
+import pytest
+
+# Add backend to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from db_pool import (
+    PooledConnection,
+    get_connection,
+    get_pool,
+    get_pool_stats,
+    init_app,
+)
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    path = str(tmp_path / "contracts.db")
+    conn = sqlite3.connect(path)
+    conn.executescript("""
+        CREATE TABLE contracts (id INTEGER PRIMARY KEY, title TEXT, status TEXT);
+        INSERT INTO contracts (title, status) VALUES ('MSA', 'active'), ('NDA', 'expired');
+    """)
+    conn.close()
+    return path
+
+
+# ============================================================================
+# DB-POOL-01: Reuse
+# ============================================================================
+
+class TestReuse:
+    """Test connection reuse"""
+
+    def test_close_returns_connection(self, db_path):
+        """Sequential checkouts get the same connection; one open"""
+        first = get_connection(db_path)
+        first.close()
+        second = get_connection(db_path)
+        second.close()
+
+        stats = get_pool(db_path).get_stats()
+        assert second is first
+        assert isinstance(first, PooledConnection)
+        assert (stats['connections_opened'], stats['checkouts'], stats['reused']) == (1, 2, 1)
+        assert stats['in_use'] == 0 and stats['idle'] == 1
+
+    def test_pragmas(self, db_path):
+        """Read-write connections: foreign keys, WAL, synchronous=NORMAL"""
+        conn = get_connection(db_path)
+        try:
+            assert conn.execute("PRAGMA foreign_keys").fetchone()[0] == 1
+            assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+            assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1
+        finally:
+            conn.close()
+
+    def test_row_factory_per_checkout(self, db_path):
+        """Each checkout sets its own row factory"""
+        conn = get_connection(db_path, row_factory=None)
+        assert conn.execute("SELECT title FROM contracts WHERE id = 1").fetchone() == ("MSA",)
+        conn.close()
+
+        conn = get_connection(db_path)
+        assert conn.execute("SELECT title FROM contracts WHERE id = 1").fetchone()["title"] == "MSA"
+        conn.close()
+
+    def test_path_normalized(self, db_path, monkeypatch):
+        """Relative and absolute spellings share one pool"""
+        monkeypatch.chdir(os.path.dirname(db_path))
+        assert get_pool("contracts.db") is get_pool(db_path)
+
+    def test_stats_totals(self, db_path):
+        """get_pool_stats lists the pool and sums counters"""
+        get_connection(db_path).close()
+
+        stats = get_pool_stats()
+
+        assert any(p['db_path'] == db_path for p in stats['pools'])
+        assert stats['totals']['checkouts'] >= 1
+
+
+# ============================================================================
+# DB-POOL-02: Isolation
+# ============================================================================
+
+class TestIsolation:
+    """Test that pooled connections are never shared unsafely"""
+
+    def test_nested_checkouts(self, db_path):
+        """A second checkout while the first is open gets another connection"""
+        outer = get_connection(db_path)
+        inner = get_connection(db_path)
+
+        assert inner is not outer
+        inner.close()
+        outer.close()
+        assert get_pool(db_path).get_stats()['idle'] == 2
+
+    def test_release_rolls_back(self, db_path):
+        """Uncommitted work is discarded on close, as before"""
+        conn = get_connection(db_path)
+        conn.execute("INSERT INTO contracts (title) VALUES ('uncommitted')")
+        conn.close()
+
+        conn = get_connection(db_path)
+        try:
+            assert not conn.in_transaction
+            assert conn.execute("SELECT COUNT(*) FROM contracts").fetchone()[0] == 2
+        finally:
+            conn.close()
+
+    def test_double_close(self, db_path):
+        """Closing twice does not return the connection twice"""
+        conn = get_connection(db_path)
+        conn.close()
+        conn.close()
+
+        assert get_pool(db_path).get_stats()['idle'] == 1
+
+    def test_idle_limit(self, db_path):
+        """Idle connections per pool are capped"""
+        pool = get_pool(db_path)
+        conns = [get_connection(db_path) for _ in range(pool.max_idle + 2)]
+        for conn in conns:
+            conn.close()
+
+        stats = pool.get_stats()
+        assert stats['idle'] == pool.max_idle
+        assert stats['connections_closed'] == 2
+
+    def test_idle_connection_handed_to_another_thread(self, db_path):
+        """A released connection is reused by the next thread"""
+        main = get_connection(db_path)
+        main.close()
+        seen = []
+
+        def worker():
+            conn = get_connection(db_path)
+            seen.append(conn)
+            conn.execute("SELECT COUNT(*) FROM contracts").fetchone()
+            conn.close()
+
+        thread = threading.Thread(target=worker)
+        thread.start()
+        thread.join()
+
+        assert seen[0] is main
+        assert get_pool(db_path).get_stats()['reused'] == 1
+
+    def test_short_lived_threads(self, db_path):
+        """Request-style threads reuse connections and stats stay consistent"""
+        def worker():
+            conn = get_connection(db_path)
+            conn.execute("SELECT COUNT(*) FROM contracts").fetchone()
+            conn.close()
+
+        for _ in range(20):
+            thread = threading.Thread(target=worker)
+            thread.start()
+            thread.join()
+
+        stats = get_pool(db_path).get_stats()
+        assert stats['connections_opened'] == 1
+        assert stats['reused'] == 19
+        assert stats['reuse_ratio'] == 0.95
+        assert stats['idle'] == 1
+        assert stats['in_use'] == 0
+
+    def test_concurrent_checkouts_not_shared(self, db_path):
+        """Concurrent threads never hold the same connection"""
+        barrier = threading.Barrier(8)
+        held = []
+        lock = threading.Lock()
+
+        def worker():
+            conn = get_connection(db_path)
+            with lock:
+                held.append(id(conn))
+            barrier.wait()
+            conn.execute("SELECT COUNT(*) FROM contracts").fetchone()
+            conn.close()
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        stats = get_pool(db_path).get_stats()
+        assert len(set(held)) == 8
+        assert stats['idle'] == get_pool(db_path).max_idle
+        assert stats['connections_opened'] - stats['connections_closed'] == stats['idle']
+
+    def test_replaced_database_file(self, db_path):
+        """An idle connection to a deleted/recreated file is not reused"""
+        old = get_connection(db_path)
+        old.close()
+        os.remove(db_path)
+        for suffix in ("-wal", "-shm"):
+            if os.path.exists(db_path + suffix):
+                os.remove(db_path + suffix)
+        conn = sqlite3.connect(db_path)
+        conn.execute("CREATE TABLE replaced (id INTEGER)")
+        conn.close()
+
+        new = get_connection(db_path)
+        try:
+            assert new is not old
+            assert new.execute("SELECT name FROM sqlite_master").fetchone()[0] == "replaced"
+        finally:
+            new.close()
+
+
+# ============================================================================
+# DB-POOL-03: Read-only
+# ============================================================================
+
+class TestReadOnly:
+    """Test read-only connections"""
+
+    def test_rejects_writes(self, db_path):
+        """Writes fail on a read-only connection"""
+        conn = get_connection(db_path, read_only=True)
+        try:
+            assert conn.execute("SELECT COUNT(*) FROM contracts").fetchone()[0] == 2
+            with pytest.raises(sqlite3.OperationalError):
+                conn.execute("INSERT INTO contracts (title) VALUES ('x')")
+        finally:
+            conn.close()
+
+    def test_separate_pool(self, db_path):
+        """Read-only and read-write connections are pooled separately"""
+        rw = get_connection(db_path)
+        rw.close()
+        ro = get_connection(db_path, read_only=True)
+        ro.close()
+
+        assert ro is not rw
+        assert get_pool(db_path, read_only=True) is not get_pool(db_path)
+
+    def test_missing_database(self, tmp_path):
+        """Read-only never creates a database file"""
+        path = str(tmp_path / "missing.db")
+
+        with pytest.raises(sqlite3.OperationalError):
+            get_connection(path, read_only=True)
+        assert not os.path.exists(path)
+
+
+# ============================================================================
+# DB-POOL-04: Flask Request Scope
+# ============================================================================
+
+class TestFlaskRequestScope:
+    """Test request-scoped reuse and cleanup"""
+
+    @pytest.fixture
+    def app(self, db_path):
+        flask = pytest.importorskip("flask")
+        app = flask.Flask(__name__)
+        init_app(app)
+
+        @app.route("/compare")
+        def compare():
+            # A dozen helper calls in one request
+            for _ in range(12):
+                conn = get_connection(db_path)
+                conn.execute("SELECT COUNT(*) FROM contracts").fetchone()
+                conn.close()
+            return "ok"
+
+        @app.route("/leak")
+        def leak():
+            conn = get_connection(db_path)
+            conn.execute("INSERT INTO contracts (title) VALUES ('leaked')")
+            return "ok"
+
+        return app
+
+    def test_one_connection_per_request(self, app, db_path):
+        """Sequential helper calls in a request share one connection"""
+        app.test_client().get("/compare")
+
+        stats = get_pool(db_path).get_stats()
+        assert stats['checkouts'] == 12
+        assert stats['connections_opened'] == 1
+
+    def test_leaked_connection_released(self, app, db_path):
+        """Connections not closed by the view are returned and rolled back"""
+        app.test_client().get("/leak")
+
+        stats = get_pool(db_path).get_stats()
+        assert stats['leaked'] == 1
+        assert stats['in_use'] == 0
+        conn = sqlite3.connect(db_path)
+        try:
+            assert conn.execute("SELECT COUNT(*) FROM contracts").fetchone()[0] == 2
+        finally:
+            conn.close()
+
+    def test_init_app_idempotent(self, app):
+        """Registering twice adds one teardown handler"""
+        init_app(app)
+
+        assert len(app.teardown_request_funcs[None]) == 1
+
+
+# ============================================================================
+# DB-POOL-05: Helpers
+# ============================================================================
+
+class TestHelpers:
+    """Test module helpers delegate to the pool"""
+
+    @pytest.mark.parametrize("module_name", ["dashboard_api", "export_api", "health_api"])
+    def test_query_endpoints_read_only(self, module_name, db_path, monkeypatch):
+        """Dashboard, export and health helpers hand out pooled read-only connections"""
+        pytest.importorskip("flask")
+        module = __import__(module_name)
+        monkeypatch.setattr(module, "CONTRACTS_DB", db_path)
+
+        conn = module.get_db_connection()
+        try:
+            assert isinstance(conn, PooledConnection)
+            assert conn.execute("PRAGMA query_only").fetchone()[0] == 1
+            assert conn.execute("SELECT title FROM contracts WHERE id = 1").fetchone()["title"] == "MSA"
+        finally:
+            conn.close()
+
+    def test_qa_engine(self, db_path):
+        """QACheckEngine.get_connection is pooled read-write"""
+        import qa_checks
+        engine = qa_checks.QACheckEngine(db_path)
+
+        conn = engine.get_connection()
+        conn.close()
+
+        assert engine.get_connection() is conn
+        conn.close()
+
+    def test_compare_v3_tuple_rows(self, db_path, monkeypatch):
+        """compare_v3_engine keeps tuple rows and FK enforcement"""
+        compare_v3_engine = pytest.importorskip("compare_v3_engine")
+        monkeypatch.setattr(compare_v3_engine, "CONTRACTS_DB", db_path)
+
+        conn = compare_v3_engine.get_db_connection()
+        try:
+            assert conn.execute("SELECT title FROM contracts WHERE id = 1").fetchone() == ("MSA",)
+            assert conn.execute("PRAGMA foreign_keys").fetchone()[0] == 1
+        finally:
+            conn.close()
+
+    def test_benchmark_checkout(self, db_path):
+        """Pooled checkout vs connect + PRAGMA per call"""
+        def unpooled():
+            conn = sqlite3.connect(db_path)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA foreign_keys = ON")
+            conn.execute("SELECT title FROM contracts WHERE id = 1").fetchone()
+            conn.close()
+
+        def pooled():
+            conn = get_connection(db_path)
+            conn.execute("SELECT title FROM contracts WHERE id = 1").fetchone()
+            conn.close()
+
+        timings = {}
+        for name, run in (("before", unpooled), ("after", pooled)):
+            run()
+            start = time.perf_counter()
+            for _ in range(500):
+                run()
+            timings[name] = 500 / (time.perf_counter() - start)
+
+        print(f"\nconnection + query: {timings['before']:,.0f}/s before -> {timings['after']:,.0f}/s after")
+        # Work done, not wall time: one connect + PRAGMA setup serves every checkout
+        stats = get_pool(db_path).get_stats()
+        assert stats['connections_opened'] == 1
+        assert stats['checkouts'] == 501
+        assert stats['reused'] == 500
@@ -0,0 +1,217 @@
+"""
+Batched Embedding Request Tests
+
+Test Gates:
+- EMB-REQ-01: Batches are bounded by input count and estimated tokens
+- EMB-REQ-02: Batches run concurrently on a bounded pool, order preserved
+- EMB-REQ-03: SAE cache misses go out batched and are written back
+- EMB-REQ-04: Per-batch latency is reported in MonitorMetrics
+"""
+
+import os
+import sys
+import tempfile
+import threading
+import time
+import pytest
+from types import SimpleNamespace
+from unittest.mock import patch
+
+# Add backend to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import embedding_cache
+from embedding_cache import EmbeddingCache, plan_embedding_batches, embed_texts_batched
+
+
+class StubEmbeddingsClient:
+    """Local stand-in for the OpenAI embeddings endpoint (array inputs)"""
+
+    def __init__(self, delay=0.0, fail_on=None, shuffle=False):
+        self.delay = delay
+        self.fail_on = fail_on
+        self.shuffle = shuffle
+        self.requests = []
+        self.active = 0
+        self.max_active = 0
+        self._lock = threading.Lock()
+        self.embeddings = self
+
+    def create(self, model, input):
+        with self._lock:
+            self.requests.append(list(input))
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        try:
+            time.sleep(self.delay)
+            if self.fail_on and self.fail_on in input:
+                raise RuntimeError("rate limited")
+            data = [
+                SimpleNamespace(index=i, embedding=[float(len(text)), 1.0])
+                for i, text in enumerate(input)
+            ]
+            if self.shuffle:
+                data.reverse()
+            return SimpleNamespace(data=data)
+        finally:
+            with self._lock:
+                self.active -= 1
+
+
+def _config(**overrides):
+    values = {
+        "embedding_batch_max_inputs": 256,
+        "embedding_batch_max_tokens": 100000,
+        "embedding_batch_concurrency": 4,
+    }
+    values.update(overrides)
+    return patch.object(embedding_cache, "get_config", lambda key, default=None: values.get(key, default))
+
+
+# ============================================================================
+# EMB-REQ-01: Batch Planning
+# ============================================================================
+
+class TestBatchPlanning:
+    """Test size- and token-bounded batching"""
+
+    def test_bounded_by_input_count(self):
+        """No batch exceeds max_inputs"""
+        batches = plan_embedding_batches(["x"] * 10, max_inputs=4, max_tokens=1000)
+        assert [len(b) for b in batches] == [4, 4, 2]
+        assert [i for b in batches for i in b] == list(range(10))
+
+    def test_bounded_by_tokens(self):
+        """No batch exceeds the token budget (4 chars ~ 1 token)"""
+        texts = ["a" * 400] * 5  # 100 tokens each
+        batches = plan_embedding_batches(texts, max_inputs=100, max_tokens=250)
+        assert [len(b) for b in batches] == [2, 2, 1]
+
+    def test_oversized_text_gets_own_batch(self):
+        """A single text above the budget is still sent, alone"""
+        batches = plan_embedding_batches(["a" * 4000, "b"], max_inputs=10, max_tokens=100)
+        assert batches == [[0], [1]]
+
+
+# ============================================================================
+# EMB-REQ-02: Concurrent Requests
+# ============================================================================
+
+class TestConcurrentRequests:
+    """Test the bounded request pool"""
+
+    def test_concurrency_is_bounded(self):
+        """At most embedding_batch_concurrency requests are in flight"""
+        client = StubEmbeddingsClient(delay=0.05)
+        texts = [f"clause {i}" for i in range(40)]
+
+        with _config(embedding_batch_max_inputs=4, embedding_batch_concurrency=3):
+            vectors, errors = embed_texts_batched(texts, client)
+
+        assert len(client.requests) == 10
+        assert 1 < client.max_active <= 3
+        assert not errors
+        assert all(vectors[i] == [float(len(t)), 1.0] for i, t in enumerate(texts))
+
+    def test_response_index_order_respected(self):
+        """Vectors map back by response index, not list position"""
+        client = StubEmbeddingsClient(shuffle=True)
+        texts = ["a", "bb", "ccc"]
+
+        with _config():
+            vectors, _ = embed_texts_batched(texts, client)
+
+        assert [vectors[i][0] for i in range(3)] == [1.0, 2.0, 3.0]
+
+    def test_failed_batch_only_fails_its_inputs(self):
+        """Errors are isolated to the failing batch and logged"""
+        client = StubEmbeddingsClient(fail_on="bad")
+        log = []
+
+        with _config(embedding_batch_max_inputs=2):
+            vectors, errors = embed_texts_batched(["a", "b", "bad", "c"], client, batch_log=log)
+
+        assert set(vectors) == {0, 1}
+        assert set(errors) == {2, 3}
+        assert sorted(entry["status"] for entry in log) == ["FAIL", "OK"]
+        assert all("latency_ms" in entry for entry in log)
+
+
+# ============================================================================
+# EMB-REQ-03: SAE Miss Batching
+# ============================================================================
+
+class TestSAEMissBatching:
+    """Test get_sae_embeddings with batched misses"""
+
+    @pytest.fixture
+    def cache(self):
+        with tempfile.NamedTemporaryFile(suffix='.db', delete=False) as f:
+            db_path = f.name
+        yield EmbeddingCache(db_path=db_path)
+        os.unlink(db_path)
+
+    def test_cold_misses_batched_and_written_back(self, cache):
+        """600 uncached clauses become a few array requests, then cache hits"""
+        client = StubEmbeddingsClient()
+        texts = [f"Clause {i}: the Contractor shall perform item {i}." for i in range(600)]
+
+        with patch.object(embedding_cache, "get_embedding_cache", lambda: cache), \
+             patch.object(embedding_cache, "is_flag_enabled", lambda name: True), \
+             _config(embedding_batch_max_inputs=256):
+            log = []
+            cold = embedding_cache.get_sae_embeddings(texts, client, batch_log=log)
+            warm = embedding_cache.get_sae_embeddings(texts, client)
+
+        assert len(client.requests) == 3
+        assert len(log) == 3
+        assert not any(r.cached for r in cold)
+        assert all(r.cached for r in warm)
+        assert [r.vector for r in warm] == [r.vector for r in cold]
+
+
+# ============================================================================
+# EMB-REQ-04: MonitorMetrics
+# ============================================================================
+
+class TestBatchMetrics:
+    """Test per-batch latency reporting"""
+
+    def test_embedding_batches_in_meta_monitor(self):
+        """Recorded batches appear in _meta.monitor"""
+        from compare_v3_engine import MonitorMetrics
+
+        metrics = MonitorMetrics("test-req")
+        metrics.record_embedding_batch({"batch": 1, "inputs": 256, "latency_ms": 840, "status": "OK"})
+
+        monitor = metrics.to_meta_monitor()
+        assert monitor["embedding_batches"] == [
+            {"batch": 1, "inputs": 256, "latency_ms": 840, "status": "OK"}
+        ]
+
+    def test_run_sae_real_batch_log(self):
+        """run_sae_real appends batches to the caller's log, not to stats"""
+        import compare_v3_engine
+        from embedding_cache import SAEEmbeddingResult
+
+        def fake_embeddings(clause_texts, openai_client, model, max_tokens, batch_log=None):
+            batch_log.append({"batch": 1, "inputs": len(clause_texts), "latency_ms": 5, "status": "OK"})
+            return [
+                SAEEmbeddingResult(
+                    clause_hash=text, vector=[1.0, 0.0], model_version=model, dimensions=2, cached=False
+                )
+                for text in clause_texts
+            ]
+
+        log = [{"batch": 0}]
+        with patch.object(compare_v3_engine, "PHASE5_AVAILABLE", True), \
+             patch.object(compare_v3_engine, "is_flag_enabled", lambda name: True), \
+             patch.object(compare_v3_engine, "_get_openai_client", lambda: object()), \
+             patch.object(compare_v3_engine, "get_sae_embeddings", fake_embeddings):
+            _, stats = compare_v3_engine.run_sae_real(
+                [{"id": 1, "text": "a"}], [{"id": 2, "text": "b"}], 1, 2, "test-req", batch_log=log
+            )
+
+        assert log[1] == {"batch": 1, "inputs": 2, "latency_ms": 5, "status": "OK"}
+        assert stats["embedding_batches"] == 1
+        assert not any(key.startswith("_") for key in stats)
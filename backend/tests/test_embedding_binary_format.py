@@ -0,0 +1,249 @@
+"""
+Binary Embedding Storage Tests
+
+Test Gates:
+- EMB-BIN-01: Binary format round-trips float32/float16/int8 vectors
+- EMB-BIN-02: Header records dimensions and model; legacy JSON still decodes
+- EMB-BIN-03: Migration rewrites JSON rows in place and reports savings
+"""
+
+import json
+import os
+import random
+import sqlite3
+import sys
+import tempfile
+import pytest
+from unittest.mock import patch
+
+# Add backend to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+
+@pytest.fixture
+def sample_vector():
+    rng = random.Random(42)
+    return [rng.uniform(-0.1, 0.1) for _ in range(3072)]
+
+
+@pytest.fixture
+def temp_db():
+    """Create temporary database for testing"""
+    with tempfile.NamedTemporaryFile(suffix='.db', delete=False) as f:
+        db_path = f.name
+    yield db_path
+    if os.path.exists(db_path):
+        os.unlink(db_path)
+
+
+# ============================================================================
+# EMB-BIN-01: Round Trip
+# ============================================================================
+
+class TestBinaryRoundTrip:
+    """Test binary encode/decode"""
+
+    def test_float32_round_trip(self, sample_vector):
+        """float32 storage preserves values to single precision"""
+        from embedding_cache import vectors_to_bytes, bytes_to_vector
+
+        data = vectors_to_bytes(sample_vector, "text-embedding-3-large", "float32")
+        assert bytes_to_vector(data) == pytest.approx(sample_vector, rel=1e-6)
+
+    def test_float32_is_about_4x_smaller_than_json(self, sample_vector):
+        """Binary float32 is a fraction of the JSON encoding size"""
+        from embedding_cache import vectors_to_bytes
+
+        data = vectors_to_bytes(sample_vector, "text-embedding-3-large", "float32")
+        assert len(data) < 3072 * 4 + 64
+        assert len(json.dumps(sample_vector).encode()) > 4 * len(data)
+
+    def test_float16_round_trip(self, sample_vector):
+        """float16 storage halves payload with small error"""
+        from embedding_cache import vectors_to_bytes, bytes_to_vector
+
+        data = vectors_to_bytes(sample_vector, dtype="float16")
+        assert len(data) < 3072 * 2 + 64
+        assert bytes_to_vector(data) == pytest.approx(sample_vector, abs=1e-4)
+
+    def test_int8_round_trip(self, sample_vector):
+        """int8 storage quantizes within one scale step"""
+        from embedding_cache import vectors_to_bytes, bytes_to_vector
+
+        data = vectors_to_bytes(sample_vector, dtype="int8")
+        step = max(abs(v) for v in sample_vector) / 127
+        assert len(data) < 3072 + 64
+        assert bytes_to_vector(data) == pytest.approx(sample_vector, abs=step)
+
+    def test_unknown_dtype_raises(self):
+        """Unsupported dtypes are rejected"""
+        from embedding_cache import vectors_to_bytes
+
+        with pytest.raises(ValueError):
+            vectors_to_bytes([1.0], dtype="float64")
+
+    def test_bytes_to_array_is_zero_copy(self, sample_vector):
+        """float32 payloads decode without copying"""
+        np = pytest.importorskip("numpy")
+        from embedding_cache import vectors_to_bytes, bytes_to_array
+
+        data = vectors_to_bytes(sample_vector, "m")
+        array = bytes_to_array(data)
+
+        assert array.dtype == np.float32
+        assert array.shape == (3072,)
+        assert not array.flags.owndata
+        assert not array.flags.writeable
+
+
+# ============================================================================
+# EMB-BIN-02: Header and Legacy Compatibility
+# ============================================================================
+
+class TestVectorHeader:
+    """Test header parsing and legacy decode"""
+
+    def test_header_records_dimensions_and_model(self, sample_vector):
+        """Header carries dims, dtype and model name"""
+        from embedding_cache import vectors_to_bytes, parse_vector_header
+
+        header = parse_vector_header(vectors_to_bytes(sample_vector, "text-embedding-3-large", "float16"))
+
+        assert header.dimensions == 3072
+        assert header.dtype == "float16"
+        assert header.model_version == "text-embedding-3-large"
+        assert header.payload_offset % 4 == 0
+
+    def test_truncated_data_is_rejected(self, sample_vector):
+        """Truncated payloads do not decode"""
+        from embedding_cache import vectors_to_bytes, bytes_to_vector
+
+        data = vectors_to_bytes(sample_vector)
+        assert bytes_to_vector(data[:-4]) is None
+
+    def test_legacy_json_still_decodes(self):
+        """Rows written before the binary format remain readable"""
+        from embedding_cache import bytes_to_vector, is_binary_vector
+
+        legacy = json.dumps([0.1, 0.2, 0.3]).encode('utf-8')
+
+        assert not is_binary_vector(legacy)
+        assert bytes_to_vector(legacy) == [0.1, 0.2, 0.3]
+
+    def test_legacy_text_row_is_a_cache_hit(self, temp_db, monkeypatch):
+        """json.dumps rows come back from SQLite as str and still decode"""
+        import compare_v3_engine
+        from embedding_cache import bytes_to_vector
+
+        monkeypatch.setattr(compare_v3_engine, "CONTRACTS_DB", temp_db)
+        compare_v3_engine.ensure_embedding_cache_table()
+        conn = sqlite3.connect(temp_db)
+        conn.execute("""
+            INSERT INTO clause_embeddings (contract_id, clause_id, text_hash, embedding, created_at, expires_at)
+            VALUES (1, 2, 'h', ?, '2025-01-01', '9999-12-31')
+        """, (json.dumps([0.1, 0.2]),))
+        conn.commit()
+        stored = conn.execute("SELECT embedding FROM clause_embeddings").fetchone()[0]
+        conn.close()
+
+        assert isinstance(stored, str)
+        assert bytes_to_vector(stored) == [0.1, 0.2]
+        assert compare_v3_engine.get_cached_embedding(1, 2, 'h') == [0.1, 0.2]
+
+    def test_sae_embedding_ignores_other_model(self):
+        """Cached vectors from a different model are treated as misses"""
+        import embedding_cache
+        from embedding_cache import vectors_to_bytes, get_sae_embedding
+
+        class FakeCache:
+            compute_hash = staticmethod(embedding_cache.EmbeddingCache.compute_hash)
+
+            def get_many(self, texts):
+                return [vectors_to_bytes([1.0, 0.0], "text-embedding-3-small") for _ in texts]
+
+            def put_many(self, items):
+                return len(items)
+
+        with patch.object(embedding_cache, "get_embedding_cache", lambda: FakeCache()), \
+             patch.object(embedding_cache, "is_flag_enabled", lambda name: True):
+            result = get_sae_embedding("clause", openai_client=None, model="text-embedding-3-large")
+
+        assert result.vector is None
+        assert result.error == "OpenAI client unavailable"
+
+
+# ============================================================================
+# EMB-BIN-03: Migration
+# ============================================================================
+
+class TestBinaryMigration:
+    """Test in-place migration of JSON rows"""
+
+    def test_migration_rewrites_json_rows(self, temp_db, sample_vector):
+        """JSON rows are rewritten to binary and savings are recorded"""
+        import embedding_cache
+        from embedding_cache import EmbeddingCache, migrate_embedding_blobs, bytes_to_vector, is_binary_vector
+
+        cache = EmbeddingCache(db_path=temp_db)
+        conn = sqlite3.connect(temp_db)
+        for i in range(3):
+            conn.execute("""
+                INSERT INTO clause_embeddings
+                (clause_text_hash, embedding_vector, model_version, vector_dimensions)
+                VALUES (?, ?, ?, ?)
+            """, (f"hash{i}", json.dumps(sample_vector).encode('utf-8'), "text-embedding-3-large", 3072))
+        conn.commit()
+        conn.close()
+
+        result = migrate_embedding_blobs(temp_db)
+
+        assert result["rows_migrated"] == 3
+        assert result["bytes_saved"] > 0
+
+        conn = sqlite3.connect(temp_db)
+        blobs = [row[0] for row in conn.execute("SELECT embedding_vector FROM clause_embeddings")]
+        conn.close()
+        assert all(is_binary_vector(b) for b in blobs)
+        assert bytes_to_vector(blobs[0]) == pytest.approx(sample_vector, rel=1e-6)
+
+        # Re-running is a no-op
+        assert migrate_embedding_blobs(temp_db)["rows_migrated"] == 0
+
+        with patch.object(embedding_cache, "is_flag_enabled", lambda name: True):
+            stats = cache.get_stats()
+        assert stats["storage_formats"] == {"binary": 3, "json": 0}
+        assert stats["migration_bytes_saved"] == result["bytes_saved"]
+        assert stats["bytes_saved"] > 0
+
+    def test_migration_handles_legacy_text_column(self, temp_db):
+        """Legacy compare_v3 table (TEXT JSON, no model column) migrates"""
+        from embedding_cache import migrate_embedding_blobs, parse_vector_header
+
+        conn = sqlite3.connect(temp_db)
+        conn.execute("""
+            CREATE TABLE clause_embeddings (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                contract_id INTEGER NOT NULL,
+                clause_id INTEGER NOT NULL,
+                text_hash TEXT NOT NULL,
+                embedding BLOB NOT NULL,
+                created_at TEXT NOT NULL,
+                expires_at TEXT NOT NULL
+            )
+        """)
+        conn.execute("""
+            INSERT INTO clause_embeddings (contract_id, clause_id, text_hash, embedding, created_at, expires_at)
+            VALUES (1, 1, 'h', ?, 'now', 'later')
+        """, (json.dumps([0.5, -0.5]),))
+        conn.commit()
+        conn.close()
+
+        result = migrate_embedding_blobs(
+            temp_db, column="embedding", model_column=None, default_model="text-embedding-3-large"
+        )
+
+        conn = sqlite3.connect(temp_db)
+        blob = conn.execute("SELECT embedding FROM clause_embeddings").fetchone()[0]
+        conn.close()
+        assert result["rows_migrated"] == 1
+        assert parse_vector_header(blob).model_version == "text-embedding-3-large"
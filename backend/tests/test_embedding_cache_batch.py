@@ -0,0 +1,189 @@
+"""
+Embedding Cache Batch API Tests
+
+Test Gates:
+- EMB-BATCH-01: get_many/put_many round trip with aligned results
+- EMB-BATCH-02: One connection per batch; in-memory entry counter
+- EMB-BATCH-03: get_sae_embeddings resolves hits and misses in one pass
+"""
+
+import os
+import sqlite3
+import sys
+import tempfile
+import pytest
+from types import SimpleNamespace
+from unittest.mock import patch
+
+# Add backend to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import embedding_cache
+from embedding_cache import EmbeddingCache, vectors_to_bytes, bytes_to_vector
+
+
+@pytest.fixture
+def temp_db():
+    """Create temporary database for testing"""
+    with tempfile.NamedTemporaryFile(suffix='.db', delete=False) as f:
+        db_path = f.name
+    yield db_path
+    if os.path.exists(db_path):
+        os.unlink(db_path)
+
+
+@pytest.fixture
+def flags_on():
+    """Enable cache and SAE flags"""
+    with patch.object(embedding_cache, "is_flag_enabled", lambda name: True):
+        yield
+
+
+def _items(texts):
+    return [(t, vectors_to_bytes([float(i), 1.0]), "m", 2) for i, t in enumerate(texts)]
+
+
+# ============================================================================
+# EMB-BATCH-01: Round Trip
+# ============================================================================
+
+class TestBatchRoundTrip:
+    """Test get_many/put_many"""
+
+    def test_get_many_aligned_with_input(self, temp_db, flags_on):
+        """Results align with input order, None for misses, duplicates resolved"""
+        cache = EmbeddingCache(db_path=temp_db)
+        assert cache.put_many(_items(["a", "b"])) == 2
+
+        results = cache.get_many(["b", "missing", "a", "b"])
+
+        assert bytes_to_vector(results[0]) == [1.0, 1.0]
+        assert results[1] is None
+        assert bytes_to_vector(results[2]) == [0.0, 1.0]
+        assert results[3] == results[0]
+        assert cache.get_metrics()["hits"] == 3
+        assert cache.get_metrics()["misses"] == 1
+
+    def test_get_many_updates_access_count(self, temp_db, flags_on):
+        """Access tracking is updated for every hit"""
+        cache = EmbeddingCache(db_path=temp_db)
+        cache.put_many(_items(["a", "b"]))
+        cache.get_many(["a", "b"])
+        cache.get_many(["a"])
+
+        conn = sqlite3.connect(temp_db)
+        counts = dict(conn.execute("SELECT clause_text_hash, access_count FROM clause_embeddings"))
+        conn.close()
+
+        assert counts[cache.compute_hash("a")] == 2
+        assert counts[cache.compute_hash("b")] == 1
+
+    def test_batches_respect_flag(self, temp_db):
+        """Flag off: no reads, no writes"""
+        cache = EmbeddingCache(db_path=temp_db)
+        assert cache.put_many(_items(["a"])) == 0
+        assert cache.get_many(["a", "b"]) == [None, None]
+
+    def test_large_batch_exceeds_parameter_limit(self, temp_db, flags_on):
+        """IN lists are chunked below SQLite's parameter limit"""
+        cache = EmbeddingCache(db_path=temp_db)
+        texts = [f"clause {i}" for i in range(1200)]
+        assert cache.put_many(_items(texts)) == 1200
+        assert all(r is not None for r in cache.get_many(texts))
+
+
+# ============================================================================
+# EMB-BATCH-02: Connections and Entry Counter
+# ============================================================================
+
+class TestBatchConnections:
+    """Test connection usage and entry counting"""
+
+    def test_get_many_uses_one_connection(self, temp_db, flags_on):
+        """A batch lookup opens a single connection"""
+        cache = EmbeddingCache(db_path=temp_db)
+        cache.put_many(_items([f"c{i}" for i in range(300)]))
+
+        real_connect = sqlite3.connect
+        with patch.object(embedding_cache.sqlite3, "connect", side_effect=real_connect) as connect:
+            cache.get_many([f"c{i}" for i in range(300)])
+
+        assert connect.call_count == 1
+
+    def test_entry_count_tracked_in_memory(self, temp_db, flags_on):
+        """COUNT(*) runs once; replacements do not inflate the counter"""
+        cache = EmbeddingCache(db_path=temp_db)
+        cache.put_many(_items(["a", "b"]))
+        cache.put_many(_items(["b", "c"]))
+        cache.invalidate("a")
+
+        statements = []
+        conn_factory = sqlite3.connect
+
+        def tracing_connect(*args, **kwargs):
+            conn = conn_factory(*args, **kwargs)
+            conn.set_trace_callback(statements.append)
+            return conn
+
+        with patch.object(embedding_cache.sqlite3, "connect", side_effect=tracing_connect):
+            cache.put("d", vectors_to_bytes([1.0]), "m", 1)
+
+        assert cache._get_entry_count() == 3
+        assert not any("COUNT(*)" in sql for sql in statements)
+
+    def test_eviction_when_full(self, temp_db, flags_on):
+        """Entries are evicted when a batch would exceed max entries"""
+        cache = EmbeddingCache(db_path=temp_db)
+        config = {"embedding_cache_max_entries": 150}
+        with patch.object(embedding_cache, "get_config", lambda key, default=None: config.get(key, default)):
+            cache.put_many(_items([f"a{i}" for i in range(120)]))
+            cache.put_many(_items([f"b{i}" for i in range(50)]))
+
+        assert cache._get_entry_count() == 70
+        assert cache.get_metrics()["evictions"] == 100
+
+
+# ============================================================================
+# EMB-BATCH-03: get_sae_embeddings
+# ============================================================================
+
+class FakeEmbeddingsClient:
+    """Local stand-in for the OpenAI embeddings endpoint"""
+
+    def __init__(self):
+        self.calls = []
+        self.embeddings = self
+
+    def create(self, model, input):
+        inputs = [input] if isinstance(input, str) else list(input)
+        self.calls.append(inputs)
+        return SimpleNamespace(data=[
+            SimpleNamespace(index=i, embedding=[float(len(text)), 1.0])
+            for i, text in enumerate(inputs)
+        ])
+
+
+class TestBatchedSAEEmbeddings:
+    """Test get_sae_embeddings"""
+
+    def test_hits_and_misses_resolved_together(self, temp_db, flags_on):
+        """Cached clauses skip the API; new ones are embedded and stored once"""
+        cache = EmbeddingCache(db_path=temp_db)
+        client = FakeEmbeddingsClient()
+
+        with patch.object(embedding_cache, "get_embedding_cache", lambda: cache):
+            first = embedding_cache.get_sae_embeddings(["alpha", "beta", "alpha"], client)
+            second = embedding_cache.get_sae_embeddings(["alpha", "gamma"], client)
+
+        assert client.calls == [["alpha", "beta"], ["gamma"]]
+        assert [r.cached for r in first] == [False, False, False]
+        assert first[0].vector == first[2].vector == [5.0, 1.0]
+        assert [r.cached for r in second] == [True, False]
+        assert second[0].vector == [5.0, 1.0]
+
+    def test_flag_disabled_returns_errors(self, temp_db):
+        """sae_intelligence_active off returns placeholder results"""
+        with patch.object(embedding_cache, "is_flag_enabled", lambda name: False):
+            results = embedding_cache.get_sae_embeddings(["a", "b"], openai_client=None)
+        assert all(r.vector is None for r in results)
+        assert all("flag is False" in r.error for r in results)
@@ -0,0 +1,282 @@
+"""
+Event Log Write-Behind Tests
+
+Test Gates:
+- EVENT-WB-01: Appends are queued and written in one transaction per flush
+- EVENT-WB-02: Reads flush first; latest sequence includes queued events
+- EVENT-WB-03: Pruning runs only past the high-water mark
+- EVENT-WB-04: Queued events are flushed on close and at interpreter exit
+- EVENT-WB-05: The event log database runs in WAL mode
+"""
+
+import os
+import sqlite3
+import subprocess
+import sys
+import textwrap
+import uuid
+import pytest
+
+# Add backend to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from event_log import EventLogEntry, EventLogRepository, EventNotifier
+
+BACKEND_DIR = os.path.join(os.path.dirname(__file__), '..')
+
+
+def _entry(sequence, session_id="sess-1", event_id=None):
+    return EventLogEntry(
+        event_id=event_id or str(uuid.uuid4()),
+        session_id=session_id,
+        sequence=sequence,
+        event_type="compare_narrative",
+        timestamp="2025-01-01T00:00:00+00:00",
+        payload={"n": sequence},
+    )
+
+
+def _stored(db_path, session_id="sess-1"):
+    """Sequences on disk, read without going through the repository."""
+    conn = sqlite3.connect(db_path)
+    try:
+        rows = conn.execute(
+            "SELECT sequence FROM event_log WHERE session_id = ? ORDER BY sequence",
+            (session_id,),
+        ).fetchall()
+        return [r[0] for r in rows]
+    finally:
+        conn.close()
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    return str(tmp_path / "events.db")
+
+
+@pytest.fixture
+def make_repo(db_path):
+    repos = []
+
+    def make(**kwargs):
+        options = {"write_behind": True, "flush_interval": 60.0, "notifier": EventNotifier()}
+        options.update(kwargs)
+        repo = EventLogRepository(db_path=db_path, **options)
+        repos.append(repo)
+        return repo
+
+    yield make
+    for repo in repos:
+        repo.close()
+
+
+# ============================================================================
+# EVENT-WB-01: Batching
+# ============================================================================
+
+class TestBatching:
+    """Test queued appends and batch flushes"""
+
+    def test_appends_are_queued(self, make_repo, db_path):
+        """Appends return immediately without touching the database"""
+        repo = make_repo()
+
+        assert repo.append(_entry(1)) is True
+        assert repo.append_batch([_entry(2), _entry(3)]) == 2
+
+        assert _stored(db_path) == []
+
+    def test_size_threshold_flushes_one_transaction(self, make_repo, db_path):
+        """Reaching flush_max_events writes the whole queue at once"""
+        repo = make_repo(flush_max_events=50)
+
+        for seq in range(1, 51):
+            repo.append(_entry(seq))
+
+        assert _stored(db_path) == list(range(1, 51))
+        assert repo._write_stats["flushes"] == 1
+
+    def test_time_threshold_flushes_and_notifies(self, make_repo, db_path):
+        """The flusher writes queued events after flush_interval and wakes subscribers"""
+        repo = make_repo(flush_interval=0.05)
+        subscription = repo.subscribe("sess-1")
+
+        repo.append(_entry(1))
+
+        assert subscription.wait(2.0) is True
+        assert _stored(db_path) == [1]
+
+    def test_queued_duplicate_rejected(self, make_repo, db_path):
+        """An event_id already in the queue is not reported as appended"""
+        repo = make_repo()
+
+        assert repo.append(_entry(1, event_id="dup")) is True
+        assert repo.append(_entry(2, event_id="dup")) is False
+        assert repo.append_batch([_entry(3, event_id="dup"), _entry(4)]) == 1
+
+        assert repo.flush() == 2
+        assert _stored(db_path) == [1, 4]
+        assert repo._write_stats["duplicates"] == 2
+
+    def test_written_duplicate_skipped_at_flush(self, make_repo, db_path):
+        """A duplicate of an event already written is ignored when the batch is written"""
+        repo = make_repo()
+        repo.append(_entry(1, event_id="dup"))
+        repo.flush()
+
+        assert repo.append(_entry(2, event_id="dup")) is True
+        assert repo.flush() == 0
+        assert _stored(db_path) == [1]
+        assert repo._write_stats["duplicates"] == 1
+
+    def test_off_by_default(self, db_path):
+        """Write-behind is opt-in"""
+        repo = EventLogRepository(db_path=db_path, notifier=EventNotifier())
+
+        assert repo.append(_entry(1)) is True
+        assert _stored(db_path) == [1]
+
+    def test_sync_mode_unchanged(self, make_repo, db_path):
+        """Without write_behind appends are written immediately"""
+        repo = make_repo(write_behind=False)
+
+        repo.append(_entry(1))
+
+        assert _stored(db_path) == [1]
+        assert repo.flush() == 0
+
+
+# ============================================================================
+# EVENT-WB-02: Read Consistency
+# ============================================================================
+
+class TestReadConsistency:
+    """Test flush-on-read"""
+
+    def test_reads_see_queued_events(self, make_repo):
+        """Replay, range, count and gap reads include queued events"""
+        repo = make_repo()
+        repo.append_batch([_entry(seq) for seq in (1, 2, 4)])
+
+        assert [e.sequence for e in repo.get_events_from_sequence("sess-1", 1)] == [1, 2, 4]
+        repo.append(_entry(5))
+        assert [e.sequence for e in repo.get_events_in_range("sess-1", 4, 5)] == [4, 5]
+        repo.append(_entry(6))
+        assert repo.get_event_count("sess-1") == 5
+        repo.append(_entry(8))
+        assert repo.detect_gaps("sess-1", 1, 8) == [(3, 3), (7, 7)]
+
+    def test_latest_sequence_without_flush(self, make_repo, db_path):
+        """Latest sequence counts queued events without writing them"""
+        repo = make_repo()
+        repo.append(_entry(1))
+        repo.flush()
+        repo.append(_entry(2))
+
+        assert repo.get_latest_sequence("sess-1") == 2
+        assert repo.get_latest_sequence("other") is None
+        assert _stored(db_path) == [1]
+
+    def test_delete_session_removes_queued(self, make_repo):
+        """delete_session_events also deletes queued events"""
+        repo = make_repo()
+        repo.append_batch([_entry(1), _entry(2)])
+
+        assert repo.delete_session_events("sess-1") == 2
+        assert repo.get_event_count("sess-1") == 0
+
+
+# ============================================================================
+# EVENT-WB-03: Amortized Pruning
+# ============================================================================
+
+class TestAmortizedPruning:
+    """Test high-water pruning"""
+
+    def test_prune_past_high_water(self, make_repo, db_path):
+        """A session is pruned back to max only once it passes the high-water mark"""
+        repo = make_repo(max_events_per_session=100, flush_max_events=5)
+
+        for seq in range(1, 111):
+            repo.append(_entry(seq))
+        assert len(_stored(db_path)) == 110  # At the high-water mark (110)
+        assert repo._write_stats["prunes"] == 0
+
+        for seq in range(111, 116):
+            repo.append(_entry(seq))
+        stored = _stored(db_path)
+        assert stored == list(range(16, 116))
+        assert repo._write_stats["prunes"] == 1
+
+    def test_counts_kept_in_memory(self, make_repo):
+        """Only the first batch of a session counts rows in the database"""
+        repo = make_repo(flush_max_events=5)
+        statements = []
+
+        original = repo._get_connection
+
+        def traced():
+            conn = original()
+            conn.set_trace_callback(statements.append)
+            return conn
+
+        repo._get_connection = traced
+        for seq in range(1, 21):
+            repo.append(_entry(seq))
+
+        counts = [s for s in statements if "COUNT(*)" in s]
+        assert len(counts) == 1
+
+
+# ============================================================================
+# EVENT-WB-04: Shutdown
+# ============================================================================
+
+class TestShutdown:
+    """Test durable flush on shutdown"""
+
+    def test_close_flushes_and_writes_through(self, make_repo, db_path):
+        """close() writes queued events; later appends are not queued"""
+        repo = make_repo()
+        repo.append(_entry(1))
+
+        repo.close()
+        repo.append(_entry(2))
+
+        assert _stored(db_path) == [1, 2]
+
+    def test_flush_at_interpreter_exit(self, db_path):
+        """Events queued when the process exits are written"""
+        script = textwrap.dedent(f"""
+            import sys
+            sys.path.insert(0, {os.path.abspath(BACKEND_DIR)!r})
+            from event_log import EventLogEntry, EventLogRepository
+            repo = EventLogRepository(db_path={db_path!r}, write_behind=True, flush_interval=60)
+            for seq in range(1, 4):
+                repo.append(EventLogEntry(
+                    event_id=str(seq), session_id="sess-1", sequence=seq,
+                    event_type="compare_narrative", timestamp="t", payload={{}},
+                ))
+        """)
+
+        subprocess.run([sys.executable, "-c", script], check=True, timeout=60)
+
+        assert _stored(db_path) == [1, 2, 3]
+
+
+# ============================================================================
+# EVENT-WB-05: WAL Mode
+# ============================================================================
+
+class TestWalMode:
+    """Test journal mode"""
+
+    def test_database_in_wal_mode(self, make_repo, db_path):
+        """The schema setup switches the database to WAL"""
+        make_repo()
+
+        conn = sqlite3.connect(db_path)
+        try:
+            assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        finally:
+            conn.close()
@@ -0,0 +1,323 @@
+"""
+Streaming Export Tests
+
+Test Gates:
+- EXPORT-STREAM-01: CSV and JSON downloads are byte-identical to the buffered export; NDJSON rows
+- EXPORT-STREAM-02: Responses stream chunks and return the pooled connection
+- EXPORT-STREAM-03: Excel uses a write-only workbook spooled to a temp file
+- EXPORT-STREAM-04: Peak memory stays flat as the row count grows
+"""
+
+import csv
+import importlib.util
+import io
+import json
+import os
+import re
+import sqlite3
+import sys
+import time
+import tracemalloc
+import pytest
+
+# Add backend to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+flask = pytest.importorskip("flask")
+import export_api
+from db_pool import get_pool
+
+SCHEMA = """
+    CREATE TABLE contracts (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        title TEXT, filename TEXT, counterparty TEXT, contract_type TEXT, status TEXT,
+        risk_level TEXT, contract_value REAL, effective_date TEXT, expiration_date TEXT,
+        purpose TEXT, upload_date TEXT, created_at TEXT, updated_at TEXT,
+        archived INTEGER DEFAULT 0
+    )
+"""
+
+ALL_FIELDS = ','.join(export_api.EXPORT_FIELDS)
+
+
+def _make_db(path, count):
+    conn = sqlite3.connect(path)
+    conn.execute(SCHEMA)
+    conn.executemany("""
+        INSERT INTO contracts (title, filename, counterparty, contract_type, status, risk_level,
+                               contract_value, effective_date, expiration_date, purpose,
+                               upload_date, created_at, updated_at, archived)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    """, [(
+        f'Master "Services" Agreement, No. {n}\nSchedule A' if n % 7 == 0 else f'Contract {n}',
+        f'contract_{n}.docx',
+        ['Acme Corp', 'Globex', None, 'Société Générale'][n % 4],
+        ['MSA', 'NDA', 'SOW'][n % 3],
+        ['active', 'negotiation', 'expired'][n % 3],
+        ['LOW', 'MEDIUM', 'HIGH', 'CRITICAL', None][n % 5],
+        [None, 125000.5, 0, 'TBD'][n % 4],
+        '2025-01-01', f'2027-{n % 12 + 1:02d}-15', 'Managed services ' * 5,
+        '2025-02-01 10:00:00', '2025-02-01 10:00:00', '2025-03-01 10:00:00',
+        1 if n % 11 == 0 else 0,
+    ) for n in range(count)])
+    conn.commit()
+    conn.close()
+
+
+@pytest.fixture
+def db_path(tmp_path, monkeypatch):
+    path = str(tmp_path / "contracts.db")
+    _make_db(path, 1200)
+    monkeypatch.setattr(export_api, "CONTRACTS_DB", path)
+    return path
+
+
+@pytest.fixture
+def client(db_path):
+    app = flask.Flask(__name__)
+    export_api.register_export(app)
+    return app.test_client()
+
+
+# ----------------------------------------------------------------------------
+# Previous implementation: fetch all rows as dicts, build the whole body
+# ----------------------------------------------------------------------------
+
+def _buffered_rows(path, **filters):
+    query, params, fields = export_api.build_export_query(**filters)
+    conn = sqlite3.connect(path)
+    conn.row_factory = sqlite3.Row
+    rows = [dict(row) for row in conn.execute(query, params).fetchall()]
+    conn.close()
+    return rows, fields
+
+
+def _buffered_csv(rows, fields):
+    output = io.StringIO()
+    writer = csv.writer(output)
+    writer.writerow([export_api.EXPORT_FIELDS.get(f, f) for f in fields])
+    for row in rows:
+        writer.writerow([export_api.format_value(row.get(f), f) for f in fields])
+    return output.getvalue()
+
+
+def _buffered_json(rows, fields):
+    return json.dumps({
+        'contracts': [{f: row.get(f) for f in fields} for row in rows],
+        'count': len(rows),
+        'fields': fields,
+        'exported_at': 'TIMESTAMP'
+    }, indent=2, default=str)
+
+
+def _without_timestamp(text):
+    return re.sub(r'"exported_at": "[^"]*"', '"exported_at": "TIMESTAMP"', text)
+
+
+# ============================================================================
+# EXPORT-STREAM-01: Output
+# ============================================================================
+
+class TestOutput:
+    """Test streamed bodies against the buffered export"""
+
+    @pytest.mark.parametrize("fetch_size", [1, 7, 500])
+    def test_csv_identical(self, client, db_path, monkeypatch, fetch_size):
+        """Same bytes for every chunk size"""
+        monkeypatch.setattr(export_api, "EXPORT_FETCH_SIZE", fetch_size)
+        rows, fields = _buffered_rows(db_path, fields=list(export_api.EXPORT_FIELDS))
+
+        response = client.get('/api/export/contracts', query_string={'fields': ALL_FIELDS})
+
+        assert response.mimetype == 'text/csv'
+        assert response.get_data(as_text=True) == _buffered_csv(rows, fields)
+
+    @pytest.mark.parametrize("query", [
+        {},
+        {'fields': ALL_FIELDS, 'include_archived': 'true'},
+        {'status': 'nonexistent'},
+    ])
+    def test_json_identical(self, client, db_path, monkeypatch, query):
+        """Same document (indent=2), including empty results"""
+        monkeypatch.setattr(export_api, "EXPORT_FETCH_SIZE", 50)
+        rows, fields = _buffered_rows(
+            db_path,
+            fields=query['fields'].split(',') if 'fields' in query else export_api.DEFAULT_FIELDS,
+            status=[query['status']] if 'status' in query else None,
+            include_archived='include_archived' in query,
+        )
+
+        response = client.get('/api/export/contracts', query_string={'format': 'json', **query})
+
+        assert _without_timestamp(response.get_data(as_text=True)) == _buffered_json(rows, fields)
+
+    def test_list_helpers_unchanged(self, db_path):
+        """export_to_csv / export_to_json keep their list-of-dicts API"""
+        rows, fields = _buffered_rows(db_path, fields=export_api.DEFAULT_FIELDS)
+
+        assert export_api.export_to_csv(rows, fields) == _buffered_csv(rows, fields)
+        assert _without_timestamp(export_api.export_to_json(rows, fields)) == _buffered_json(rows, fields)
+
+    def test_ndjson(self, client, db_path):
+        """One JSON object per line, in export order"""
+        rows, fields = _buffered_rows(db_path, fields=export_api.DEFAULT_FIELDS, risk_level=['HIGH'])
+
+        response = client.get('/api/export/contracts', query_string={'format': 'ndjson', 'risk': 'high'})
+        lines = response.get_data(as_text=True).splitlines()
+
+        assert response.mimetype == 'application/x-ndjson'
+        assert 'contracts_export_' in response.headers['Content-Disposition']
+        assert [json.loads(line) for line in lines] == [{f: row[f] for f in fields} for row in rows]
+
+
+# ============================================================================
+# EXPORT-STREAM-02: Streaming
+# ============================================================================
+
+class TestStreaming:
+    """Test chunked responses and connection handling"""
+
+    def test_streamed_in_chunks(self, client, db_path, monkeypatch):
+        """The body is produced chunk by chunk"""
+        monkeypatch.setattr(export_api, "EXPORT_FETCH_SIZE", 100)
+
+        response = client.get('/api/export/contracts', buffered=False)
+        pieces = list(response.response)
+        response.close()
+
+        assert response.is_streamed
+        assert len(pieces) > 5
+
+    def test_connection_returned(self, client, db_path):
+        """The pooled connection is released after the last chunk"""
+        client.get('/api/export/contracts', query_string={'format': 'json'}).get_data()
+
+        stats = get_pool(db_path, read_only=True).get_stats()
+        assert stats['in_use'] == 0
+        assert stats['leaked'] == 0
+
+    def test_abandoned_download(self, client, db_path):
+        """Closing a partially read response releases the connection"""
+        response = client.get('/api/export/contracts', buffered=False)
+        next(iter(response.response))
+        response.close()
+
+        assert get_pool(db_path, read_only=True).get_stats()['in_use'] == 0
+
+    def test_query_error_before_stream(self, client, db_path, tmp_path, monkeypatch):
+        """SQL errors fail the request instead of truncating the download"""
+        empty = str(tmp_path / "empty.db")
+        sqlite3.connect(empty).close()
+        monkeypatch.setattr(export_api, "CONTRACTS_DB", empty)
+        client.application.config['PROPAGATE_EXCEPTIONS'] = False
+
+        response = client.get('/api/export/contracts')
+
+        assert response.status_code == 500
+
+    def test_preview(self, client, db_path):
+        """Preview still returns ten rows and the full count"""
+        response = client.get('/api/export/contracts/preview', query_string={'status': 'active'})
+        data = response.get_json()
+
+        rows, _ = _buffered_rows(db_path, fields=export_api.DEFAULT_FIELDS, status=['active'])
+        assert data['total_count'] == len(rows)
+        assert [r['id'] for r in data['preview']] == [r['id'] for r in rows[:10]]
+
+
+# ============================================================================
+# EXPORT-STREAM-03: Excel
+# ============================================================================
+
+class TestExcel:
+    """Test spooled write-only workbooks"""
+
+    def test_workbook(self, client, db_path):
+        """Headers, styles, widths and every row"""
+        openpyxl = pytest.importorskip("openpyxl")
+        rows, fields = _buffered_rows(db_path, fields=list(export_api.EXPORT_FIELDS))
+
+        response = client.get('/api/export/contracts', query_string={'format': 'xlsx', 'fields': ALL_FIELDS})
+        ws = openpyxl.load_workbook(io.BytesIO(response.get_data())).active
+
+        assert response.mimetype == export_api.XLSX_MIMETYPE
+        assert ws.title == "Contracts"
+        assert [c.value for c in ws[1]] == [export_api.EXPORT_FIELDS[f] for f in fields]
+        assert ws['A1'].font.bold
+        assert ws.max_row == len(rows) + 1
+        assert [c.value for c in ws[2]] == [rows[0][f] for f in fields]
+        assert ws.column_dimensions['B'].width > len('Title') + 2
+
+    def test_spools_to_disk(self, db_path, monkeypatch):
+        """Past the spool size the workbook is built on disk"""
+        pytest.importorskip("openpyxl")
+        monkeypatch.setattr(export_api, "EXPORT_SPOOL_MAX_BYTES", 1024)
+        query, params, fields = export_api.build_export_query(fields=list(export_api.EXPORT_FIELDS))
+
+        spool = export_api.spool_excel(export_api.iter_row_chunks(query, params), fields)
+        try:
+            assert spool._rolled
+        finally:
+            spool.close()
+
+    @pytest.mark.skipif(importlib.util.find_spec("openpyxl") is not None, reason="openpyxl installed")
+    def test_csv_fallback(self, client, db_path):
+        """Without openpyxl the xlsx download is CSV, as before"""
+        rows, fields = _buffered_rows(db_path, fields=export_api.DEFAULT_FIELDS)
+
+        response = client.get('/api/export/contracts', query_string={'format': 'xlsx'})
+
+        assert response.get_data(as_text=True) == _buffered_csv(rows, fields)
+        assert get_pool(db_path, read_only=True).get_stats()['in_use'] == 0
+
+
+# ============================================================================
+# EXPORT-STREAM-04: Memory
+# ============================================================================
+
+class TestMemory:
+    """Peak memory: buffered vs streamed, 2k vs 20k contracts"""
+
+    def _peak(self, run):
+        tracemalloc.start()
+        try:
+            start = time.perf_counter()
+            run()
+            return tracemalloc.get_traced_memory()[1], time.perf_counter() - start
+        finally:
+            tracemalloc.stop()
+
+    def test_peak_memory_bounded(self, tmp_path, monkeypatch):
+        """Streaming peak does not grow with rows; the buffered one does"""
+        app = flask.Flask(__name__)
+        export_api.register_export(app)
+        client = app.test_client()
+        results = {}
+
+        for count in (2000, 20000):
+            path = str(tmp_path / f"contracts_{count}.db")
+            _make_db(path, count)
+            monkeypatch.setattr(export_api, "CONTRACTS_DB", path)
+
+            def buffered():
+                rows, fields = _buffered_rows(path, fields=list(export_api.EXPORT_FIELDS), include_archived=True)
+                _buffered_csv(rows, fields)
+
+            def streamed():
+                response = client.get('/api/export/contracts', buffered=False,
+                                      query_string={'fields': ALL_FIELDS, 'include_archived': 'true'})
+                for _ in response.response:
+                    pass
+                response.close()
+
+            results[count] = (self._peak(buffered), self._peak(streamed))
+
+        for count, ((before, t_before), (after, t_after)) in results.items():
+            print(f"\n{count:,} contracts CSV: peak {before / 1e6:.1f} MB ({t_before * 1000:.0f} ms) buffered "
+                  f"-> {after / 1e6:.1f} MB ({t_after * 1000:.0f} ms) streamed")
+
+        (small_before, _), (small_after, _) = results[2000]
+        (large_before, _), (large_after, _) = results[20000]
+        assert large_before > small_before * 5
+        assert large_after < small_after * 2
+        assert large_after < large_before / 5
@@ -0,0 +1,446 @@
+"""
+Health Score Cache Tests
+
+Test Gates:
+- HEALTH-CACHE-01: List and dashboard endpoints match full per-request scoring
+- HEALTH-CACHE-02: Only changed contracts are rescored (updated_at, any scored column, archive, delete)
+- HEALTH-CACHE-03: Day rollover, log pruning and missing triggers fall back correctly;
+  reads never create the triggers
+- HEALTH-CACHE-04: Benchmark health dashboard on a 50k-contract portfolio
+"""
+
+import os
+import random
+import sqlite3
+import sys
+import time
+from datetime import date, timedelta
+import pytest
+
+# Add backend to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+flask = pytest.importorskip("flask")
+import health_api
+from health_api import (
+    HEALTH_GRADES,
+    HealthScoreCache,
+    calculate_health_score,
+    get_health_score_cache,
+    get_primary_issue,
+)
+
+SCHEMA = """
+    CREATE TABLE contracts (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        title TEXT, counterparty TEXT, contract_type TEXT, status TEXT,
+        risk_level TEXT, expiration_date TEXT, contract_value REAL,
+        effective_date TEXT, purpose TEXT, filename TEXT,
+        updated_at TEXT, archived INTEGER DEFAULT 0
+    )
+"""
+
+INSERT = """
+    INSERT INTO contracts (title, counterparty, contract_type, status, risk_level,
+                           expiration_date, contract_value, effective_date, purpose, filename,
+                           updated_at, archived)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+
+def _contract_rows(count, seed=7):
+    rng = random.Random(seed)
+    today = date.today()
+
+    def day(offset):
+        return (today + timedelta(days=offset)).isoformat()
+
+    expirations = [None, '', 'TBD', '2026-1-5', day(-400), day(-1), day(0), day(15), day(45),
+                   day(75), day(120), day(200), day(300), day(800)]
+    risks = [None, '', 'LOW', 'medium', 'High', 'CRITICAL', 'unknown']
+    updates = [None, '', 'garbage', day(0) + ' 10:00:00', day(-1) + ' 09:00:00', day(-20),
+               day(-60) + 'T08:00:00Z', day(-150) + 'T08:00:00', day(-300), day(-1000) + ' 00:00:00']
+    return [(
+        rng.choice(['MSA', '', None, '  ', f'Contract {n}']),
+        rng.choice(['Acme', None, '', 'Globex']),
+        rng.choice(['MSA', 'NDA', None]),
+        rng.choice(['active', 'expired', 'negotiation', None]),
+        rng.choice(risks),
+        rng.choice(expirations),
+        rng.choice([None, 0, 50000.0, 250000.0]),
+        rng.choice([None, day(-100)]),
+        rng.choice([None, 'Services']),
+        rng.choice([None, 'msa.docx']),
+        rng.choice(updates),
+        rng.choice([0, 0, 0, 1, None]),
+    ) for n in range(count)]
+
+
+def _make_db(path, count, seed=7):
+    conn = sqlite3.connect(path)
+    conn.execute(SCHEMA)
+    conn.executemany(INSERT, _contract_rows(count, seed))
+    conn.commit()
+    conn.close()
+
+
+def _execute(path, sql, params=()):
+    conn = sqlite3.connect(path)
+    try:
+        conn.execute(sql, params)
+        conn.commit()
+    finally:
+        conn.close()
+
+
+@pytest.fixture
+def db_path(tmp_path, monkeypatch):
+    path = str(tmp_path / "contracts.db")
+    _make_db(path, 400)
+    monkeypatch.setattr(health_api, "CONTRACTS_DB", path)
+    return path
+
+
+@pytest.fixture
+def client(db_path):
+    app = flask.Flask(__name__)
+    health_api.register_health(app)
+    return app.test_client()
+
+
+# ----------------------------------------------------------------------------
+# Previous implementation: score every row on every request
+# ----------------------------------------------------------------------------
+
+def _scan(path, include_archived=False, status=None):
+    conn = sqlite3.connect(path)
+    conn.row_factory = sqlite3.Row
+    where = "(archived = 0 OR archived IS NULL)" if not include_archived else "1=1"
+    params = []
+    if status:
+        where += " AND status = ?"
+        params.append(status)
+    rows = conn.execute(f"""
+        SELECT id, title, counterparty, contract_type, status,
+               risk_level, expiration_date, contract_value, updated_at
+        FROM contracts WHERE {where}
+    """, params).fetchall()
+    conn.close()
+    return [dict(row) for row in rows]
+
+
+def _reference_list(path, min_score=None, max_score=None, grade='', status=None,
+                    sort_by='score', order='desc', limit=100, include_archived=False):
+    results = []
+    for contract in _scan(path, include_archived, status):
+        health = calculate_health_score(contract)
+        if min_score and health['total_score'] < min_score:
+            continue
+        if max_score and health['total_score'] > max_score:
+            continue
+        if grade and health['grade'] != grade:
+            continue
+        results.append({'id': contract['id'], 'health_score': health['total_score'],
+                        'expiration_date': contract['expiration_date'],
+                        'risk_level': contract['risk_level'], 'components': health['components']})
+    if sort_by == 'score':
+        results.sort(key=lambda x: x['health_score'], reverse=(order == 'desc'))
+    elif sort_by == 'expiration':
+        results.sort(key=lambda x: x['expiration_date'] or '9999-12-31', reverse=(order == 'desc'))
+    elif sort_by == 'risk':
+        risk_order = {'CRITICAL': 0, 'HIGH': 1, 'MEDIUM': 2, 'LOW': 3, None: 4}
+        results.sort(key=lambda x: risk_order.get(x['risk_level'], 4), reverse=(order == 'desc'))
+    return results[:limit]
+
+
+def _reference_dashboard(path):
+    health_data = [(c, calculate_health_score(c)) for c in _scan(path)]
+    scores = [h['total_score'] for _, h in health_data]
+    grade_counts = {'A': 0, 'B': 0, 'C': 0, 'D': 0, 'F': 0}
+    for _, h in health_data:
+        grade_counts[h['grade']] += 1
+    alerts = sorted(
+        ({'contract_id': c['id'], 'title': c['title'], 'score': h['total_score'], 'grade': h['grade'],
+          'primary_issue': get_primary_issue(h)} for c, h in health_data if h['total_score'] < 40),
+        key=lambda a: a['score'])[:10]
+    avg = sum(scores) / len(scores)
+    portfolio_grade = next(g for g, info in HEALTH_GRADES.items() if avg >= info['min'])
+    return {
+        'portfolio_score': round(avg, 1),
+        'portfolio_grade': portfolio_grade,
+        'total_contracts': len(scores),
+        'by_grade': grade_counts,
+        'critical_alerts': alerts,
+        'component_averages': {
+            name: round(sum(h['components'][name]['score'] for _, h in health_data) / len(scores), 1)
+            for name in ('expiration', 'risk', 'metadata', 'review')
+        },
+    }
+
+
+def _list(client, **params):
+    response = client.get('/api/contracts/health', query_string=params)
+    assert response.status_code == 200
+    return response.get_json()
+
+
+def _dashboard(client):
+    response = client.get('/api/dashboard/health')
+    assert response.status_code == 200
+    return response.get_json()
+
+
+def _assert_list_matches(client, db_path, **params):
+    data = _list(client, **params)
+    expected = _reference_list(db_path, **{('sort_by' if k == 'sort' else k): v for k, v in params.items()})
+    assert [(c['id'], c['health_score']) for c in data['contracts']] == \
+        [(c['id'], c['health_score']) for c in expected]
+    assert [c['components'] for c in data['contracts']] == [c['components'] for c in expected]
+    return data
+
+
+def _assert_dashboard_matches(client, db_path):
+    data = _dashboard(client)
+    for key, value in _reference_dashboard(db_path).items():
+        assert data[key] == value, key
+    return data
+
+
+# ============================================================================
+# HEALTH-CACHE-01: Parity
+# ============================================================================
+
+class TestParity:
+    """Test cached results against scoring every row per request"""
+
+    @pytest.mark.parametrize("params", [
+        {},
+        {'order': 'asc'},
+        {'sort': 'expiration'},
+        {'sort': 'expiration', 'order': 'asc'},
+        {'sort': 'risk', 'limit': 500},
+        {'sort': 'risk', 'order': 'asc', 'limit': 500},
+        {'sort': 'title'},
+        {'min_score': 50, 'max_score': 80},
+        {'grade': 'D', 'status': 'active'},
+        {'include_archived': 'true', 'limit': 500},
+        {'limit': 7},
+    ])
+    def test_list(self, client, db_path, params):
+        """Filters, sort orders (ties in id order) and limits"""
+        data = _assert_list_matches(client, db_path, **params)
+
+        scores = [c['health_score'] for c in data['contracts']]
+        assert data['summary']['total_contracts'] == len(scores)
+        if scores:
+            assert data['summary']['max_score'] == max(scores)
+
+    def test_dashboard(self, client, db_path):
+        """Portfolio score, grades, alerts and component averages"""
+        data = _assert_dashboard_matches(client, db_path)
+
+        assert sum(data['score_distribution'].values()) == data['total_contracts']
+        assert data['critical_alerts']
+
+    def test_scored_columns(self, client, db_path):
+        """List scoring keeps its column set; the detail endpoint scores the full row"""
+        contract_id = _list(client, limit=1)['contracts'][0]['id']
+
+        listed = _list(client, limit=500, include_archived='true')['contracts']
+        listed = next(c for c in listed if c['id'] == contract_id)
+        detail = client.get(f'/api/contracts/{contract_id}/health').get_json()['health']
+
+        assert 'filename' in listed['components']['metadata']['missing_fields']
+        assert detail['components']['risk'] == listed['components']['risk']
+
+    def test_empty_portfolio(self, client, db_path):
+        """No contracts: empty list and N/A dashboard"""
+        _execute(db_path, "DELETE FROM contracts")
+
+        assert _list(client)['contracts'] == []
+        assert _dashboard(client)['portfolio_grade'] == 'N/A'
+
+
+# ============================================================================
+# HEALTH-CACHE-02: Invalidation
+# ============================================================================
+
+class TestInvalidation:
+    """Test per-contract invalidation"""
+
+    def test_hits_between_changes(self, client, db_path):
+        """Repeated requests reuse the snapshot"""
+        _dashboard(client)
+        _list(client)
+        _list(client, sort='risk')
+
+        stats = get_health_score_cache(db_path).get_stats()
+        assert stats['full_builds'] == 1
+        assert stats['hits'] == 2
+        assert stats['triggers_installed'] is True
+
+    @pytest.mark.parametrize("sql", [
+        "UPDATE contracts SET updated_at = CURRENT_TIMESTAMP WHERE id = 5",
+        "UPDATE contracts SET risk_level = 'CRITICAL', expiration_date = NULL WHERE id = 5",
+        "UPDATE contracts SET archived = 1, updated_at = CURRENT_TIMESTAMP WHERE id = 5",
+        "UPDATE contracts SET status = 'negotiation' WHERE id = 5",
+        "DELETE FROM contracts WHERE id = 5",
+    ])
+    def test_changed_contract_rescored(self, client, db_path, sql):
+        """A write rescores that contract only"""
+        _dashboard(client)
+        cache = get_health_score_cache(db_path)
+        before = cache.get_stats()['rescored']
+
+        _execute(db_path, sql)
+
+        _assert_dashboard_matches(client, db_path)
+        _assert_list_matches(client, db_path, include_archived='true', limit=500)
+        stats = cache.get_stats()
+        assert stats['incremental_updates'] == 1
+        assert stats['rescored'] - before <= 1
+
+    def test_insert(self, client, db_path):
+        """New contracts appear"""
+        _dashboard(client)
+        conn = sqlite3.connect(db_path)
+        conn.executemany(INSERT, _contract_rows(25, seed=99))
+        conn.commit()
+        conn.close()
+
+        data = _assert_dashboard_matches(client, db_path)
+        assert get_health_score_cache(db_path).get_stats()['rescored'] == 400 + 25
+        assert data['total_contracts'] == len(_scan(db_path))
+
+    def test_unrelated_column_ignored(self, client, db_path):
+        """Writes to unscored columns do not refresh"""
+        _dashboard(client)
+
+        _execute(db_path, "UPDATE contracts SET purpose = 'Changed' WHERE id = 5")
+        _dashboard(client)
+
+        assert get_health_score_cache(db_path).get_stats()['incremental_updates'] == 0
+
+
+# ============================================================================
+# HEALTH-CACHE-03: Fallbacks
+# ============================================================================
+
+class TestFallbacks:
+    """Test day rollover, pruned logs and trigger-less databases"""
+
+    def test_day_rollover(self, db_path):
+        """Date-relative scores are recomputed for a new day"""
+        cache = HealthScoreCache(db_path)
+        today = date.today()
+        tomorrow = today + timedelta(days=30)
+
+        first = cache.get(today)
+        second = cache.get(tomorrow)
+
+        assert second is not first
+        assert second.today == tomorrow
+        for entry in list(second.entries.values())[:50]:
+            assert entry.health == calculate_health_score(entry.contract, tomorrow)
+
+    def test_pruned_log_rescans(self, db_path):
+        """A cache behind the retained change log does a full scan"""
+        cache = HealthScoreCache(db_path)
+        cache.install_triggers()
+        cache.get()
+        _execute(db_path, "DELETE FROM health_score_changes")
+        _execute(db_path, "INSERT INTO health_score_changes (contract_id) VALUES (1), (2), (3)")
+        _execute(db_path, "DELETE FROM health_score_changes WHERE seq < (SELECT MAX(seq) FROM health_score_changes)")
+
+        cache.get()
+
+        assert cache.get_stats()['full_builds'] == 2
+
+    def test_change_log_bounded(self, db_path, monkeypatch):
+        """Triggers keep at most HEALTH_CHANGE_LOG_LIMIT entries"""
+        cache = HealthScoreCache(db_path)
+        monkeypatch.setattr(cache, "trigger_sql", cache.trigger_sql.replace(
+            f"- {health_api.HEALTH_CHANGE_LOG_LIMIT};", "- 10;"))
+        cache.install_triggers()
+
+        _execute(db_path, "UPDATE contracts SET status = 'expired'")
+
+        conn = sqlite3.connect(db_path)
+        assert conn.execute("SELECT COUNT(*) FROM health_score_changes").fetchone()[0] <= 11
+        conn.close()
+
+    def test_no_triggers_ttl(self, db_path, monkeypatch):
+        """Without triggers the snapshot is trusted for the fallback TTL"""
+        cache = HealthScoreCache(db_path)
+
+        first = cache.get()
+        assert cache.get() is first
+        assert cache.get_stats()['triggers_installed'] is False
+
+        monkeypatch.setattr(cache, "fallback_ttl_seconds", 0)
+        assert cache.get() is not first
+
+    def test_reads_do_not_create_triggers(self, db_path):
+        """get() only reads; triggers installed later are picked up"""
+        cache = HealthScoreCache(db_path)
+        cache.get()
+
+        conn = sqlite3.connect(db_path)
+        assert conn.execute("SELECT COUNT(*) FROM sqlite_master WHERE type = 'trigger'").fetchone()[0] == 0
+        conn.close()
+
+        health_api.install_health_triggers(db_path)
+        _execute(db_path, "UPDATE contracts SET status = 'expired' WHERE id = 5")
+        cache.invalidate()
+        cache.get()
+        _execute(db_path, "UPDATE contracts SET status = 'active' WHERE id = 5")
+        cache.get()
+
+        assert cache.get_stats()['incremental_updates'] == 1
+
+
+# ============================================================================
+# HEALTH-CACHE-04: Benchmark
+# ============================================================================
+
+class TestBenchmark:
+    """Benchmark: health dashboard and list on 50k contracts"""
+
+    def test_50k_contracts(self, tmp_path, monkeypatch):
+        """Cached requests vs scoring every contract per request"""
+        path = str(tmp_path / "large.db")
+        _make_db(path, 50000)
+        monkeypatch.setattr(health_api, "CONTRACTS_DB", path)
+        app = flask.Flask(__name__)
+        health_api.register_health(app)
+        client = app.test_client()
+
+        start = time.perf_counter()
+        _reference_dashboard(path)
+        before = time.perf_counter() - start
+
+        start = time.perf_counter()
+        _dashboard(client)
+        build = time.perf_counter() - start
+
+        timings = []
+        for _ in range(5):
+            start = time.perf_counter()
+            _dashboard(client)
+            _list(client, min_score=50)
+            timings.append((time.perf_counter() - start) / 2)
+        after = sorted(timings)[2]
+
+        _execute(path, "UPDATE contracts SET risk_level = 'LOW', updated_at = CURRENT_TIMESTAMP WHERE id = 10")
+        start = time.perf_counter()
+        _dashboard(client)
+        refresh = time.perf_counter() - start
+
+        print(f"\nhealth dashboard (50k): {before * 1000:.0f} ms before -> {after * 1000:.1f} ms after "
+              f"(build {build * 1000:.0f} ms, refresh after edit {refresh * 1000:.1f} ms)")
+        # Work done, not wall time: one scoring pass, then hits, then one rescore
+        stats = health_api.get_health_score_cache(path).get_stats()
+        assert stats['full_builds'] == 1
+        assert stats['hits'] == 10
+        assert stats['incremental_updates'] == 1
+        assert stats['rescored'] == 50000 + 1
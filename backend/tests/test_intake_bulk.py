@@ -0,0 +1,242 @@
+"""
+Bulk Intake Tests
+
+Test Gates:
+- BULK-INTAKE-01: Every unique document is stored once; duplicates are caught before parsing
+- BULK-INTAKE-02: Bulk output matches single-file process_intake
+- BULK-INTAKE-03: Progress reporting and per-stage throughput
+- BULK-INTAKE-04: Resume after interruption
+"""
+
+import os
+import shutil
+import sqlite3
+import sys
+import pytest
+
+# Add backend to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+pytest.importorskip("dotenv")
+pytest.importorskip("anthropic")
+
+import intake_engine
+from intake_engine import process_intake, process_intake_bulk
+
+SCHEMA = """
+    CREATE TABLE contracts (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        title TEXT, filename TEXT, filepath TEXT, document_hash TEXT, clause_count INTEGER,
+        party_client TEXT, party_vendor TEXT, counterparty TEXT, our_entity TEXT,
+        effective_date TEXT, expiration_date TEXT, contract_value REAL, currency TEXT,
+        governing_law TEXT, vendor_ticker TEXT, vendor_cik TEXT,
+        contract_type TEXT, contract_purpose TEXT, party_relationship TEXT, counterparty_type TEXT,
+        intake_status TEXT, intake_completed_at TEXT, intake_risk_summary TEXT, created_at TEXT
+    );
+    CREATE TABLE clauses (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        contract_id INTEGER, text TEXT, section_number TEXT, section_title TEXT, clause_type TEXT,
+        verbatim_text TEXT, word_count INTEGER,
+        cce_risk_score REAL, cce_risk_level TEXT, cce_statutory_flag TEXT, cce_cascade_risk INTEGER,
+        embedding_id TEXT, chunk_hash TEXT
+    );
+    CREATE TABLE annotations (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        contract_id INTEGER, clause_id INTEGER, annotation_type TEXT, severity TEXT,
+        title TEXT, content TEXT, source TEXT
+    );
+    CREATE TABLE public_companies (
+        ticker TEXT, cik TEXT, company_name TEXT, aliases TEXT
+    );
+"""
+
+
+def _contract_text(n):
+    return "\n".join([
+        f"MASTER SERVICES AGREEMENT {n}",
+        "SECTION 1. Payment Terms",
+        f"Customer shall pay {n * 1000} dollars. Payment is non-refundable under any circumstances.",
+        "SECTION 2. Limitation of Liability",
+        "Vendor's sole remedy is repair or replacement. Buyer waives all claims for consequential damages.",
+        "SECTION 3. Termination",
+        f"Either party may terminate this agreement for convenience on {n + 30} days notice.",
+    ])
+
+
+def _count(db_path, table="contracts"):
+    conn = sqlite3.connect(db_path)
+    try:
+        return conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+    finally:
+        conn.close()
+
+
+@pytest.fixture(autouse=True)
+def regex_metadata(monkeypatch):
+    """Keep metadata extraction offline."""
+    monkeypatch.setattr(intake_engine, "extract_metadata", lambda text, clauses: intake_engine._extract_with_regex(text))
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    path = str(tmp_path / "contracts.db")
+    conn = sqlite3.connect(path)
+    conn.executescript(SCHEMA)
+    conn.close()
+    return path
+
+
+@pytest.fixture
+def portfolio(tmp_path):
+    """8 unique contracts, 2 copies, 1 too-short file and 1 unsupported file."""
+    root = tmp_path / "portfolio"
+    (root / "nested").mkdir(parents=True)
+    for n in range(8):
+        folder = root / "nested" if n % 2 else root
+        (folder / f"contract_{n}.txt").write_text(_contract_text(n), encoding="utf-8")
+    shutil.copy(root / "contract_0.txt", root / "copy_of_0.txt")
+    shutil.copy(root / "contract_2.txt", root / "nested" / "copy_of_2.txt")
+    (root / "short.txt").write_text("Too short.", encoding="utf-8")
+    (root / "notes.md").write_text(_contract_text(99), encoding="utf-8")
+    return root
+
+
+def _bulk(portfolio, db_path, **kwargs):
+    options = {"embed": False, "use_processes": False, "cpu_workers": 2, "io_workers": 4}
+    options.update(kwargs)
+    return process_intake_bulk(str(portfolio), db_path, **options)
+
+
+# ============================================================================
+# BULK-INTAKE-01: Dedupe and Storage
+# ============================================================================
+
+class TestBulkStorage:
+    """Test outcomes per file"""
+
+    def test_outcomes(self, portfolio, db_path):
+        """Unique files stored, copies flagged duplicate, short file rejected"""
+        result = _bulk(portfolio, db_path)
+
+        assert result.total_files == 11  # notes.md is not a supported type
+        assert (result.succeeded, result.duplicates, result.rejected, result.failed) == (8, 2, 1, 0)
+        assert _count(db_path) == 8
+        copy = result.results[str(portfolio / "copy_of_0.txt")]
+        assert copy.contract_id == result.results[str(portfolio / "contract_0.txt")].contract_id
+
+    def test_duplicates_are_not_parsed(self, portfolio, db_path, monkeypatch):
+        """Files already in the database never reach parse_document"""
+        _bulk(portfolio, db_path)
+        parsed = []
+        original = intake_engine.parse_document
+        monkeypatch.setattr(intake_engine, "parse_document", lambda path: parsed.append(path) or original(path))
+        (portfolio / "late_copy.txt").write_text(_contract_text(3), encoding="utf-8")
+
+        result = _bulk(portfolio, db_path)
+
+        assert result.duplicates == 1
+        assert parsed == []
+
+    def test_process_pool(self, portfolio, db_path):
+        """CPU stages in worker processes give the same outcomes"""
+        result = _bulk(portfolio, db_path, use_processes=True)
+
+        assert (result.succeeded, result.duplicates, result.rejected, result.failed) == (8, 2, 1, 0)
+
+
+# ============================================================================
+# BULK-INTAKE-02: Parity with process_intake
+# ============================================================================
+
+class TestParity:
+    """Test bulk rows against the single-file pipeline"""
+
+    def _clauses(self, db_path, contract_id):
+        conn = sqlite3.connect(db_path)
+        try:
+            return conn.execute(
+                "SELECT section_number, clause_type, cce_risk_score, cce_risk_level, "
+                "cce_statutory_flag, chunk_hash FROM clauses WHERE contract_id = ? ORDER BY id",
+                (contract_id,),
+            ).fetchall()
+        finally:
+            conn.close()
+
+    def test_same_clauses_and_annotations(self, portfolio, tmp_path, db_path):
+        """A document stores identical clause rows through either path"""
+        single_db = str(tmp_path / "single.db")
+        shutil.copy(db_path, single_db)
+        path = str(portfolio / "contract_4.txt")
+
+        single = process_intake(path, single_db, embed=False)
+        bulk = _bulk(portfolio, db_path).results[path]
+
+        assert bulk.success and single.success
+        assert self._clauses(db_path, bulk.contract_id) == self._clauses(single_db, single.contract_id)
+        assert bulk.risk_summary == single.risk_summary
+        assert bulk.annotations == single.annotations
+
+
+# ============================================================================
+# BULK-INTAKE-03: Progress
+# ============================================================================
+
+class TestProgress:
+    """Test progress callback and stage stats"""
+
+    def test_progress_and_throughput(self, portfolio, db_path):
+        """One callback per file with per-stage throughput"""
+        updates = []
+
+        result = _bulk(portfolio, db_path, progress_callback=updates.append)
+
+        assert [u["completed"] for u in updates] == list(range(1, 12))
+        assert updates[-1]["to_process"] == 11
+        assert set(result.stage_stats) >= {"hash", "parse", "chunk", "score", "metadata", "store"}
+        assert result.stage_stats["hash"]["items"] == 11
+        assert result.stage_stats["store"]["items"] == 8
+        assert all(stats["per_second"] > 0 for stats in result.stage_stats.values())
+
+
+# ============================================================================
+# BULK-INTAKE-04: Resume
+# ============================================================================
+
+class TestResume:
+    """Test checkpointed resume"""
+
+    def test_rerun_skips_finished(self, portfolio, db_path):
+        """A second run only reprocesses changed files"""
+        _bulk(portfolio, db_path)
+        (portfolio / "nested" / "contract_5.txt").write_text(_contract_text(55), encoding="utf-8")
+
+        result = _bulk(portfolio, db_path)
+
+        assert result.resumed == 10
+        assert result.succeeded == 1
+        assert _count(db_path) == 9
+
+    def test_resume_after_interrupt(self, portfolio, db_path):
+        """Files finished before an interrupt are not redone"""
+        def interrupt(update):
+            if update["completed"] == 4:
+                raise KeyboardInterrupt
+
+        first = _bulk(portfolio, db_path, progress_callback=interrupt, io_workers=1, cpu_workers=1)
+        second = _bulk(portfolio, db_path)
+
+        assert first.interrupted is True
+        assert first.completed == 4
+        assert second.resumed >= 4
+        assert first.succeeded + second.succeeded == 8
+        assert _count(db_path) == 8
+
+    def test_resume_disabled(self, portfolio, db_path):
+        """resume=False rechecks every file (stored ones become duplicates)"""
+        _bulk(portfolio, db_path)
+
+        result = _bulk(portfolio, db_path, resume=False)
+
+        assert result.resumed == 0
+        assert result.duplicates == 10
+        assert _count(db_path) == 8
@@ -0,0 +1,264 @@
+"""
+Incremental Re-Intake Tests
+
+Test Gates:
+- INTAKE-INCR-01: Unchanged clauses reuse the parent's scores, UCC flags and embedding IDs
+- INTAKE-INCR-02: Only new or changed clauses are scored, embedded and annotated
+- INTAKE-INCR-03: Stored clause rows match a full intake of the same version,
+  including when an inserted section renumbers the ones after it
+"""
+
+import os
+import shutil
+import sqlite3
+import sys
+import pytest
+
+# Add backend to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+pytest.importorskip("dotenv")
+pytest.importorskip("anthropic")
+
+import cce_plus_integration
+import intake_engine
+from intake_engine import process_intake
+from test_intake_bulk import SCHEMA
+
+SECTIONS = 20
+
+
+def _version_text(changed=(), insert_after=None):
+    """
+    A 20-section contract; sections in changed get amended wording.
+    insert_after adds a new section after that one, renumbering the rest.
+    """
+    bodies = []
+    for n in range(1, SECTIONS + 1):
+        wording = "as amended" if n in changed else "as agreed"
+        bodies.append(f"Vendor shall perform obligation {n} {wording}. Payment is non-refundable for item {n}.")
+        if n == insert_after:
+            bodies.append("Vendor shall maintain insurance coverage for the term.")
+    lines = ["MASTER SERVICES AGREEMENT"]
+    for number, body in enumerate(bodies, start=1):
+        lines.append(f"SECTION {number}. Term {number}")
+        lines.append(body)
+    return "\n".join(lines)
+
+
+def _clause_rows(db_path, contract_id):
+    conn = sqlite3.connect(db_path)
+    try:
+        return conn.execute(
+            "SELECT section_number, clause_type, cce_risk_score, cce_risk_level, "
+            "cce_statutory_flag, cce_cascade_risk, chunk_hash FROM clauses WHERE contract_id = ? ORDER BY id",
+            (contract_id,),
+        ).fetchall()
+    finally:
+        conn.close()
+
+
+@pytest.fixture(autouse=True)
+def regex_metadata(monkeypatch):
+    """Keep metadata extraction offline."""
+    monkeypatch.setattr(intake_engine, "extract_metadata", lambda text, clauses: intake_engine._extract_with_regex(text))
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    path = str(tmp_path / "contracts.db")
+    conn = sqlite3.connect(path)
+    conn.executescript(SCHEMA)
+    conn.close()
+    return path
+
+
+@pytest.fixture
+def versions(tmp_path):
+    """v1 and v2 (2 of 20 sections amended)."""
+    v1 = tmp_path / "msa_v1.txt"
+    v2 = tmp_path / "msa_v2.txt"
+    v1.write_text(_version_text(), encoding="utf-8")
+    v2.write_text(_version_text(changed={3, 17}), encoding="utf-8")
+    return str(v1), str(v2)
+
+
+@pytest.fixture
+def scored_texts(monkeypatch):
+    """Record which clause texts reach the CCE-Plus scorer."""
+    scored = []
+
+    def score(text, clause_type, section_number=None):
+        scored.append(text)
+        return {'risk_score': 9.5, 'risk_level': 'CRITICAL', 'statutory_flag': 'UCC-2-719'}
+
+    monkeypatch.setattr(cce_plus_integration, "score_clause_risk", score)
+    monkeypatch.setattr(cce_plus_integration, "detect_cascades", lambda entries: [])
+    return scored
+
+
+# ============================================================================
+# INTAKE-INCR-01: Reuse
+# ============================================================================
+
+class TestReuse:
+    """Test parent clause reuse"""
+
+    def test_reuse_stats(self, db_path, versions, scored_texts):
+        """v2 reuses 18 of 20 clauses"""
+        v1, v2 = versions
+        parent = process_intake(v1, db_path, embed=False)
+
+        result = process_intake(v2, db_path, embed=False, parent_contract_id=parent.contract_id)
+
+        assert result.success
+        assert result.reuse_stats == {
+            'parent_contract_id': parent.contract_id,
+            'clauses_reused': 18,
+            'clauses_rescored': 2,
+            'embeddings_reused': 0,
+            'score_reuse_ratio': 0.9,
+            'embedding_reuse_ratio': 0.0,
+        }
+
+    def test_stored_fields_are_copied(self, db_path, versions, scored_texts):
+        """Reused clauses carry the parent's stored score, flag and embedding ID"""
+        v1, v2 = versions
+        parent = process_intake(v1, db_path, embed=False)
+        conn = sqlite3.connect(db_path)
+        conn.execute(
+            "UPDATE clauses SET cce_risk_score = 4.2, cce_risk_level = 'LOW', cce_statutory_flag = NULL, "
+            "embedding_id = 'emb_' || chunk_hash WHERE contract_id = ?",
+            (parent.contract_id,),
+        )
+        conn.commit()
+        conn.close()
+
+        result = process_intake(v2, db_path, embed=False, parent_contract_id=parent.contract_id)
+        rows = _clause_rows(db_path, result.contract_id)
+
+        assert sum(1 for r in rows if r[2] == 4.2 and r[3] == 'LOW' and r[4] is None) == 18
+        assert sum(1 for r in rows if r[2] == 9.5) == 2
+        assert result.reuse_stats['embedding_reuse_ratio'] == 0.9
+
+    def test_without_parent(self, db_path, versions, scored_texts):
+        """Plain intake scores every clause and reports no reuse"""
+        result = process_intake(versions[0], db_path, embed=False)
+
+        assert result.reuse_stats == {}
+        assert len(scored_texts) == SECTIONS
+
+
+# ============================================================================
+# INTAKE-INCR-02: Work Skipped
+# ============================================================================
+
+class TestWorkSkipped:
+    """Test that unchanged clauses skip scoring, embedding and annotation"""
+
+    def test_only_changed_clauses_scored(self, db_path, versions, scored_texts):
+        """The scorer sees only the amended sections"""
+        v1, v2 = versions
+        parent = process_intake(v1, db_path, embed=False)
+        scored_texts.clear()
+
+        process_intake(v2, db_path, embed=False, parent_contract_id=parent.contract_id)
+
+        assert len(scored_texts) == 2
+        assert all("as amended" in text for text in scored_texts)
+
+    def test_only_unembedded_clauses_embedded(self, db_path, versions, scored_texts, monkeypatch):
+        """Clauses with a reused embedding ID are not re-embedded"""
+        embedded = []
+
+        def embed(clauses, collection_name='cip_contracts'):
+            for clause in clauses:
+                clause.embedding_id = f"{clause.chunk_hash}_{clause.section_number}"
+                embedded.append(clause.section_number)
+            return clauses
+
+        monkeypatch.setattr(intake_engine, "embed_clauses_batch", embed)
+        v1, v2 = versions
+        parent = process_intake(v1, db_path)
+        embedded.clear()
+
+        result = process_intake(v2, db_path, parent_contract_id=parent.contract_id)
+
+        assert sorted(embedded) == ['17', '3']
+        assert result.reuse_stats['embeddings_reused'] == 18
+
+    def test_only_changed_clauses_annotated(self, db_path, versions, scored_texts):
+        """Annotations cover only the amended clauses"""
+        v1, v2 = versions
+        parent = process_intake(v1, db_path, embed=False)
+
+        result = process_intake(v2, db_path, embed=False, parent_contract_id=parent.contract_id)
+
+        assert len(parent.annotations) == 2 * SECTIONS  # RISK + STATUTORY per clause
+        assert {a['title'] for a in result.annotations} == {
+            'CRITICAL Risk: 3', 'CRITICAL Risk: 17', 'Statutory Flag: UCC-2-719'
+        }
+
+
+# ============================================================================
+# INTAKE-INCR-03: Parity
+# ============================================================================
+
+class TestParity:
+    """Test incremental rows against a full intake"""
+
+    def test_rows_match_full_intake(self, tmp_path, db_path, versions):
+        """Incremental v2 stores the same clause rows as a full v2 intake"""
+        v1, v2 = versions
+        full_db = str(tmp_path / "full.db")
+        shutil.copy(db_path, full_db)
+
+        parent = process_intake(v1, db_path, embed=False)
+        incremental = process_intake(v2, db_path, embed=False, parent_contract_id=parent.contract_id)
+        full = process_intake(v2, full_db, embed=False)
+
+        assert _clause_rows(db_path, incremental.contract_id) == _clause_rows(full_db, full.contract_id)
+        assert incremental.risk_summary == full.risk_summary
+
+    def test_rows_match_full_intake_after_renumbering(self, tmp_path, db_path, versions):
+        """A section inserted after 5 rescores 6-21 and stores full-intake rows"""
+        v1 = versions[0]
+        v2 = tmp_path / "msa_v2_inserted.txt"
+        v2.write_text(_version_text(insert_after=5), encoding="utf-8")
+        full_db = str(tmp_path / "full.db")
+        shutil.copy(db_path, full_db)
+
+        parent = process_intake(v1, db_path, embed=False)
+        incremental = process_intake(str(v2), db_path, embed=False, parent_contract_id=parent.contract_id)
+        full = process_intake(str(v2), full_db, embed=False)
+
+        assert incremental.reuse_stats['clauses_reused'] == 5
+        assert incremental.reuse_stats['clauses_rescored'] == SECTIONS + 1 - 5
+        assert _clause_rows(db_path, incremental.contract_id) == _clause_rows(full_db, full.contract_id)
+        assert incremental.risk_summary == full.risk_summary
+
+    def test_renumbered_clauses_get_new_embedding_ids(self, tmp_path, db_path, versions, scored_texts, monkeypatch):
+        """Embedding IDs of a renumbered version carry the new section numbers"""
+        def embed(clauses, collection_name='cip_contracts'):
+            for clause in clauses:
+                clause.embedding_id = f"{clause.chunk_hash}_{clause.section_number}"
+            return clauses
+
+        monkeypatch.setattr(intake_engine, "embed_clauses_batch", embed)
+        v2 = tmp_path / "msa_v2_inserted.txt"
+        v2.write_text(_version_text(insert_after=5), encoding="utf-8")
+        parent = process_intake(versions[0], db_path)
+
+        result = process_intake(str(v2), db_path, parent_contract_id=parent.contract_id)
+
+        conn = sqlite3.connect(db_path)
+        try:
+            rows = conn.execute(
+                "SELECT section_number, chunk_hash, embedding_id FROM clauses WHERE contract_id = ?",
+                (result.contract_id,),
+            ).fetchall()
+        finally:
+            conn.close()
+        assert len(rows) == SECTIONS + 1
+        assert all(embedding_id == f"{chunk_hash}_{section}" for section, chunk_hash, embedding_id in rows)
+        assert result.reuse_stats['embeddings_reused'] == 5
@@ -0,0 +1,646 @@
+"""
+Log Index Tests
+
+Test Gates:
+- LOG-INDEX-01: Reverse reader returns the same lines as readlines()
+- LOG-INDEX-02: Follower tracks appends, partial lines, truncation and rotation
+- LOG-INDEX-03: Index queries match a full scan; refresh reads only appended bytes;
+  only the newest max_lines lines are kept; the first build can run in the background
+- LOG-INDEX-04: Diagnostics API and monitor parser return the last N matching entries;
+  a since bound ends the tail scan
+- LOG-INDEX-05: Benchmark on a large log (full read vs tail read vs index, bytes read)
+"""
+
+import os
+import random
+import re
+import sys
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+import pytest
+
+# Add backend to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from log_index import (
+    LOG_LEVELS,
+    LogFollower,
+    LogIndex,
+    get_log_index,
+    read_lines_reverse,
+    tail_lines,
+    time_key,
+)
+
+LOG_PATTERN = re.compile(
+    r'(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}(?:,\d{3})?) - '
+    r'(\S+) - '
+    r'(DEBUG|INFO|WARNING|ERROR|CRITICAL) - '
+    r'(?:\[(\S+):(\d+)\] - )?'
+    r'(.+)'
+)
+
+REQUEST_PATTERN = re.compile(r'(GET|POST|PUT|DELETE)\s+(/\S+)')
+
+LOGGERS = ['cip.api', 'cip.intake', 'cip.compare', 'werkzeug']
+LEVEL_WEIGHTS = [30, 50, 12, 6, 2]
+
+
+def _log_lines(count, seed=11):
+    rng = random.Random(seed)
+    ts = datetime(2025, 1, 6, 8, 0, 0)
+    lines = []
+    for n in range(count):
+        ts += timedelta(milliseconds=rng.randint(1, 4000))
+        roll = rng.random()
+        if roll < 0.03:
+            lines.append(f"Traceback line {n} without a header")
+            continue
+        if roll < 0.05:
+            lines.append("")
+            continue
+        level = rng.choices(LOG_LEVELS, LEVEL_WEIGHTS)[0]
+        logger = rng.choice(LOGGERS)
+        if logger == 'werkzeug':
+            message = f"{rng.choice(['GET', 'POST'])} /api/contracts/{n} {rng.choice([200, 404, 500])}"
+        else:
+            message = f"event {n} processed"
+        stamp = ts.strftime('%Y-%m-%d %H:%M:%S') + f",{ts.microsecond // 1000:03d}"
+        lines.append(f"{stamp} - {logger} - {level} - [{logger}.py:{n % 400}] - {message}")
+    return lines
+
+
+def _write(path, lines, mode='w'):
+    with open(path, mode, encoding='utf-8', newline='') as f:
+        f.write(''.join(line + '\n' for line in lines))
+    return path
+
+
+@pytest.fixture
+def log_path(tmp_path):
+    return _write(tmp_path / "cip.log", _log_lines(3000))
+
+
+def _scan(path, min_level='DEBUG', since=None, until=None, logger=None, marker=None):
+    """Every matching line, oldest first, by a full readlines() pass."""
+    low = time_key(since) if since else None
+    high = time_key(until, upper=True) if until else None
+    result = []
+    with open(path, 'r', encoding='utf-8', errors='replace') as f:
+        for raw in f.readlines():
+            line = raw.strip()
+            if not line:
+                continue
+            match = LOG_PATTERN.match(line)
+            level = match.group(3) if match else 'INFO'
+            if LOG_LEVELS.index(level) < LOG_LEVELS.index(min_level):
+                continue
+            if low is not None or high is not None:
+                if not match:
+                    continue
+                t = time_key(match.group(1))
+                if (low is not None and t < low) or (high is not None and t > high):
+                    continue
+            if logger is not None and (match.group(2) if match else 'unknown') != logger:
+                continue
+            if marker is not None and not REQUEST_PATTERN.search(line):
+                continue
+            result.append(line)
+    return result
+
+
+# ============================================================================
+# LOG-INDEX-01: Reverse reader
+# ============================================================================
+
+class TestReverseReader:
+    """Test read_lines_reverse against readlines()"""
+
+    @pytest.mark.parametrize("content", [
+        b"",
+        b"\n",
+        b"one",
+        b"one\n",
+        b"one\ntwo",
+        b"one\n\n\ntwo\n\n",
+        b"a\r\nb\r\n",
+        b"\n\nlast",
+        b"x" * 300 + b"\n" + b"y" * 10,
+    ], ids=["empty", "newline", "unterminated", "terminated", "two", "blanks", "crlf", "leading-blanks", "long-line"])
+    @pytest.mark.parametrize("block_size", [1, 3, 64, None])
+    def test_matches_readlines(self, tmp_path, content, block_size):
+        """Same lines and offsets as reading forwards, any block size"""
+        path = tmp_path / "f.log"
+        path.write_bytes(content)
+
+        expected, offset = [], 0
+        with open(path, 'rb') as f:
+            for line in f.readlines():
+                expected.append((offset, line.rstrip(b'\n')))
+                offset += len(line)
+
+        result = list(read_lines_reverse(path, block_size=block_size))
+
+        assert result[::-1] == expected
+
+    def test_end_offset(self, tmp_path):
+        """Reading from an earlier offset ignores bytes after it"""
+        path = tmp_path / "f.log"
+        path.write_bytes(b"a\nbb\nccc\n")
+
+        assert [line for _, line in read_lines_reverse(path, end=5)] == [b"bb", b"a"]
+
+    def test_tail_lines(self, log_path):
+        """Last N non-blank lines, with a predicate and skip"""
+        everything = _scan(log_path)
+        errors = _scan(log_path, min_level='ERROR')
+
+        def is_error(line):
+            match = LOG_PATTERN.match(line)
+            return bool(match) and match.group(3) in ('ERROR', 'CRITICAL')
+
+        assert tail_lines(log_path, 50) == everything[-50:]
+        assert tail_lines(log_path, 20, is_error) == errors[-20:]
+        assert tail_lines(log_path, 20, is_error, skip=5) == errors[-25:-5]
+        assert tail_lines(log_path, 10 ** 6) == everything
+        assert tail_lines(log_path, 0) == []
+
+    def test_tail_stop(self, log_path):
+        """stop ends the scan; the stopping line and older ones are dropped"""
+        everything = _scan(log_path)
+        boundary = everything[-30]
+
+        assert tail_lines(log_path, 100, stop=lambda line: line == boundary) == everything[-29:]
+        assert tail_lines(log_path, 10, stop=lambda line: line == boundary) == everything[-10:]
+
+    def test_tail_reads_only_the_end(self, tmp_path, monkeypatch):
+        """A short tail of a large file reads one block"""
+        import log_index
+        path = _write(tmp_path / "big.log", _log_lines(20000))
+        reads = []
+        real_open = open
+
+        class Counting:
+            def __init__(self, f):
+                self.f = f
+
+            def __enter__(self):
+                return self
+
+            def __exit__(self, *exc):
+                self.f.close()
+
+            def seek(self, *args):
+                return self.f.seek(*args)
+
+            def read(self, size=-1):
+                data = self.f.read(size)
+                reads.append(len(data))
+                return data
+
+        monkeypatch.setattr(log_index, "open", lambda p, m='r': Counting(real_open(p, m)), raising=False)
+
+        tail_lines(path, 100)
+
+        assert sum(reads) <= log_index.LOG_BLOCK_SIZE
+        assert os.path.getsize(path) > 10 * log_index.LOG_BLOCK_SIZE
+
+
+# ============================================================================
+# LOG-INDEX-02: Follower
+# ============================================================================
+
+class TestFollower:
+    """Test LogFollower offset tracking"""
+
+    def _new(self, follower):
+        return [line for _, line in follower.read_new()]
+
+    def test_appends_and_partial_lines(self, tmp_path):
+        """Only complete lines are returned; a partial line waits for its newline"""
+        path = tmp_path / "f.log"
+        path.write_bytes(b"old\n")
+        follower = LogFollower(path, from_end=True)
+
+        assert self._new(follower) == []
+        with open(path, 'ab') as f:
+            f.write(b"one\ntw")
+        assert self._new(follower) == [b"one"]
+        with open(path, 'ab') as f:
+            f.write(b"o\nthree\n")
+        assert self._new(follower) == [b"two", b"three"]
+        assert follower.offset == os.path.getsize(path)
+
+    def test_from_end_with_unterminated_line(self, tmp_path):
+        """Starting mid-line resumes at that line's start"""
+        path = tmp_path / "f.log"
+        path.write_bytes(b"done\nhalf")
+        follower = LogFollower(path, from_end=True)
+
+        with open(path, 'ab') as f:
+            f.write(b" written\n")
+
+        assert self._new(follower) == [b"half written"]
+
+    def test_truncation(self, tmp_path):
+        """A shorter file restarts at 0"""
+        path = tmp_path / "f.log"
+        path.write_bytes(b"first line\nsecond line\n")
+        follower = LogFollower(path)
+        self._new(follower)
+
+        path.write_bytes(b"new\n")
+
+        assert self._new(follower) == [b"new"]
+        assert follower.resets == 1
+
+    def test_rewritten_in_place(self, tmp_path):
+        """Same size or larger but different leading bytes restarts at 0"""
+        path = tmp_path / "f.log"
+        path.write_bytes(b"aaaa\n")
+        follower = LogFollower(path)
+        self._new(follower)
+
+        with open(path, 'r+b') as f:
+            f.write(b"bbbb\ncccc\n")
+
+        assert self._new(follower) == [b"bbbb", b"cccc"]
+        assert follower.resets == 1
+
+    def test_rotation(self, tmp_path):
+        """A new file at the same path (rename + create) restarts at 0"""
+        path = tmp_path / "f.log"
+        path.write_bytes(b"x" * 100 + b"\n")
+        follower = LogFollower(path)
+        self._new(follower)
+
+        os.replace(path, tmp_path / "f.log.1")
+        path.write_bytes(b"y" * 200 + b"\n")
+
+        assert self._new(follower) == [b"y" * 200]
+        assert follower.resets == 1
+
+    def test_missing_file(self, tmp_path):
+        """A missing file yields nothing until it appears"""
+        path = tmp_path / "later.log"
+        follower = LogFollower(path, from_end=True)
+
+        assert self._new(follower) == []
+        path.write_bytes(b"hello\n")
+        assert self._new(follower) == [b"hello"]
+
+
+# ============================================================================
+# LOG-INDEX-03: Index
+# ============================================================================
+
+class TestIndex:
+    """Test LogIndex queries against a full scan"""
+
+    def _index(self, path):
+        return LogIndex(path, LOG_PATTERN, {"request": REQUEST_PATTERN})
+
+    @pytest.mark.parametrize("filters", [
+        {},
+        {"min_level": "WARNING"},
+        {"min_level": "CRITICAL"},
+        {"since": "2025-01-06 09:00", "until": "2025-01-06 10:00:30"},
+        {"since": "2025-01-06 09:30:00,500", "min_level": "ERROR"},
+        {"until": "2025-01-06 08"},
+        {"logger": "cip.intake", "min_level": "INFO"},
+        {"marker": "request"},
+        {"marker": "request", "min_level": "ERROR"},
+    ])
+    @pytest.mark.parametrize("limit", [1, 25, 100000])
+    def test_query_parity(self, log_path, filters, limit):
+        """Last N matching lines, oldest first"""
+        expected = _scan(log_path, **filters)[-limit:]
+
+        assert self._index(log_path).query(limit=limit, **filters) == expected
+
+    def test_skip(self, log_path):
+        """skip pages back from the newest match"""
+        expected = _scan(log_path, min_level='WARNING')
+
+        assert self._index(log_path).query(min_level='WARNING', limit=30, skip=30) == expected[-60:-30]
+
+    def test_unknown_logger_and_marker(self, log_path):
+        """No lines for an unseen logger; an unregistered marker is an error"""
+        index = self._index(log_path)
+
+        assert index.query(logger='nobody') == []
+        with pytest.raises(KeyError):
+            index.query(marker='missing')
+        with pytest.raises(ValueError):
+            index.query(since='yesterday')
+
+    def test_incremental_refresh(self, log_path):
+        """Appended lines are indexed without rereading the file"""
+        index = self._index(log_path)
+        index.refresh()
+        size = os.path.getsize(log_path)
+
+        appended = _log_lines(200, seed=99)
+        _write(log_path, appended, mode='a')
+        stats_before = index.get_stats()
+        result = index.query(min_level='ERROR', limit=10)
+
+        stats = index.get_stats()
+        assert result == _scan(log_path, min_level='ERROR')[-10:]
+        assert stats['bytes_indexed'] - stats_before['bytes_indexed'] == os.path.getsize(log_path) - size
+        assert stats['rebuilds'] == 0
+
+    def test_rotation_rebuilds(self, log_path, tmp_path):
+        """A rotated file replaces the index contents"""
+        index = self._index(log_path)
+        index.refresh()
+
+        os.replace(log_path, tmp_path / "cip.log.1")
+        _write(log_path, _log_lines(50, seed=5))
+
+        assert index.query(limit=1000) == _scan(log_path)
+        assert index.get_stats()['rebuilds'] == 1
+
+    def test_line_window(self, log_path):
+        """A capped index keeps the newest lines and reports it is incomplete"""
+        index = LogIndex(log_path, LOG_PATTERN, {"request": REQUEST_PATTERN}, max_lines=400)
+
+        assert index.query(min_level='WARNING', limit=10) == _scan(log_path, min_level='WARNING')[-10:]
+        assert len(index) == 400 and not index.complete
+
+        _write(log_path, _log_lines(600, seed=3), mode='a')
+        everything = _scan(log_path)
+        assert index.query(limit=100) == everything[-100:]
+        assert index.query(marker='request', limit=5) == _scan(log_path, marker='request')[-5:]
+        assert len(index) <= 400 + 400 // 4
+        assert index.get_stats()['lines_dropped'] > 0
+
+    def test_small_file_is_complete(self, log_path):
+        """A file within the window is indexed from its first line"""
+        index = self._index(log_path)
+
+        assert index.query(limit=10 ** 6) == _scan(log_path)
+        assert index.complete
+
+    def test_warm_builds_in_background(self, log_path):
+        """warm() starts the build and reports ready once it finished"""
+        index = self._index(log_path)
+
+        first = index.warm()
+        index._warm_thread.join(timeout=10)
+
+        assert first is False
+        assert index.warm() and index.ready
+        assert index.get_stats()['lines'] == len([l for l in _log_lines(3000) if l])
+
+    def test_shared_instance(self, log_path):
+        """get_log_index returns one index per file and pattern"""
+        first = get_log_index(log_path, LOG_PATTERN)
+        assert get_log_index(str(log_path), LOG_PATTERN.pattern) is first
+        assert get_log_index(log_path, LOG_PATTERN, {"request": REQUEST_PATTERN}) is not first
+
+
+# ============================================================================
+# LOG-INDEX-04: Callers
+# ============================================================================
+
+@pytest.fixture(params=[True, False], ids=["indexed", "tail"])
+def diagnostics(request, monkeypatch):
+    pytest.importorskip("psutil")
+    pytest.importorskip("flask")
+    import diagnostics_api
+    monkeypatch.setattr(diagnostics_api, "LOG_INDEX_ENABLED", request.param)
+    return diagnostics_api
+
+
+def _build_index(diagnostics, path):
+    """Finish the background build so the indexed variant queries the index."""
+    if diagnostics.LOG_INDEX_ENABLED:
+        diagnostics.get_log_index(path, diagnostics.LOG_PATTERN, diagnostics.LOG_MARKERS).refresh()
+
+
+class TestDiagnostics:
+    """Test diagnostics_api log readers"""
+
+    def test_parse_log_file(self, diagnostics, log_path):
+        """Last N entries at the level, not the level among the last N lines"""
+        expected = _scan(log_path, min_level='ERROR')[-40:]
+        _build_index(diagnostics, log_path)
+
+        entries = diagnostics.parse_log_file(log_path, limit=40, min_level='ERROR')
+
+        assert [(e['timestamp'], e['message']) for e in entries] == [
+            (m.group(1), m.group(6)) for m in map(LOG_PATTERN.match, expected)
+        ]
+
+    def test_time_window(self, diagnostics, log_path):
+        """since/until bound the entries"""
+        _build_index(diagnostics, log_path)
+        lines = diagnostics.read_log_lines(log_path, 500, since='2025-01-06 09:00', until='2025-01-06 09:30')
+
+        assert lines == _scan(log_path, since='2025-01-06 09:00', until='2025-01-06 09:30')[-500:]
+
+    def test_api_history(self, diagnostics, log_path, monkeypatch):
+        """/api-history returns the last `limit` request lines"""
+        flask = pytest.importorskip("flask")
+        monkeypatch.setitem(diagnostics.LOG_FILES, "api", log_path)
+        _build_index(diagnostics, log_path)
+        app = flask.Flask(__name__)
+        app.register_blueprint(diagnostics.diagnostics_bp)
+
+        data = app.test_client().get("/api/diagnostics/api-history?limit=15").get_json()
+
+        expected = _scan(log_path, marker='request')[-15:]
+        assert data['total'] == 15
+        assert [c['endpoint'] for c in data['calls']] == [REQUEST_PATTERN.search(l).group(2) for l in expected]
+
+    def test_tail_answers_until_index_is_ready(self, log_path, monkeypatch):
+        """The first indexed read does not wait for the build"""
+        pytest.importorskip("psutil")
+        import diagnostics_api
+        monkeypatch.setattr(diagnostics_api, "LOG_INDEX_ENABLED", True)
+        index = diagnostics_api.get_log_index(log_path, diagnostics_api.LOG_PATTERN, diagnostics_api.LOG_MARKERS)
+        index._lock.acquire()
+        try:
+            lines = diagnostics_api.read_log_lines(log_path, 20, min_level='ERROR')
+        finally:
+            index._lock.release()
+
+        assert lines == _scan(log_path, min_level='ERROR')[-20:]
+
+    def test_since_stops_tail_scan(self, log_path, monkeypatch):
+        """Without the index, the reverse scan ends at the first line before since"""
+        pytest.importorskip("psutil")
+        import diagnostics_api
+        import log_index
+        monkeypatch.setattr(diagnostics_api, "LOG_INDEX_ENABLED", False)
+        scanned = []
+        real_reverse = log_index.read_lines_reverse
+
+        def counting_reverse(*args, **kwargs):
+            for item in real_reverse(*args, **kwargs):
+                scanned.append(item)
+                yield item
+
+        monkeypatch.setattr(log_index, "read_lines_reverse", counting_reverse)
+
+        lines = diagnostics_api.read_log_lines(log_path, 10 ** 6, since='2025-01-06 09:30')
+
+        assert lines == _scan(log_path, since='2025-01-06 09:30')
+        assert len(scanned) < 3000 // 4
+
+    def test_index_off_by_default(self):
+        """CIP_LOG_INDEX must be set to build indexes"""
+        pytest.importorskip("psutil")
+        import diagnostics_api
+
+        assert diagnostics_api.LOG_INDEX_ENABLED is (os.getenv("CIP_LOG_INDEX", "false").lower() == "true")
+
+    def test_invalid_bound(self, diagnostics):
+        """An unparseable since/until is a 400"""
+        flask = pytest.importorskip("flask")
+        app = flask.Flask(__name__)
+        app.register_blueprint(diagnostics.diagnostics_bp)
+
+        response = app.test_client().get("/api/diagnostics/logs?since=soon")
+
+        assert response.status_code == 400
+
+
+@pytest.fixture
+def monitor_parser():
+    root = str(Path(__file__).resolve().parents[2])
+    if root not in sys.path:
+        sys.path.append(root)
+    from tools.monitoring import log_parser
+    assert log_parser.LOG_INDEX_AVAILABLE
+    return log_parser
+
+
+class TestMonitorParser:
+    """Test tools/monitoring/log_parser on the shared reader"""
+
+    def test_parse_file(self, monitor_parser, log_path):
+        """Last N entries at the level, paged with offset"""
+        parser = monitor_parser.LogParser()
+        expected = _scan(log_path, min_level='WARNING')
+
+        entries = parser.parse_file(log_path, limit=20, min_level=monitor_parser.LogLevel.WARNING, offset=10)
+
+        assert [e.raw_line for e in entries] == expected[-30:-10]
+
+    def test_tailer(self, monitor_parser, tmp_path):
+        """Tailer emits appended complete lines once, across a rotation"""
+        path = _write(tmp_path / "cip.log", _log_lines(100))
+        seen = []
+        tailer = monitor_parser.LogTailer(path, seen.append, monitor_parser.LogParser())
+        appended = [l for l in _log_lines(5, seed=1) if l]
+        rotated = "2025-02-01 00:00:00 - cip.api - ERROR - rotated"
+
+        def wait_for(count):
+            deadline = time.time() + 5
+            while len(seen) < count and time.time() < deadline:
+                time.sleep(0.05)
+
+        tailer.start()
+        try:
+            # Wait until the tailer has positioned itself at the end
+            deadline = time.time() + 5
+            while tailer._file_pos == 0 and time.time() < deadline:
+                time.sleep(0.05)
+            _write(path, appended, mode='a')
+            wait_for(len(appended))
+
+            os.replace(path, tmp_path / "cip.log.1")
+            _write(path, [rotated])
+            wait_for(len(appended) + 1)
+            time.sleep(0.6)
+        finally:
+            tailer.stop()
+
+        assert [e.raw_line for e in seen] == appended + [rotated]
+
+
+# ============================================================================
+# LOG-INDEX-05: Benchmark
+# ============================================================================
+
+class TestBenchmark:
+    """Benchmark: last 100 ERROR entries of a 200k-line log"""
+
+    def test_200k_lines(self, tmp_path, monkeypatch):
+        """Tail and index reads touch a fraction of the file a full read does"""
+        import log_index
+        path = _write(tmp_path / "large.log", _log_lines(200_000))
+        size = os.path.getsize(path)
+
+        def is_error(line):
+            match = LOG_PATTERN.match(line)
+            return match is not None and match.group(3) in ('ERROR', 'CRITICAL')
+
+        def full():
+            with open(path, 'r', encoding='utf-8', errors='replace') as f:
+                lines = f.readlines()
+            return [l.strip() for l in lines if is_error(l.strip())][-100:]
+
+        def tail():
+            return tail_lines(path, 100, is_error)
+
+        index = LogIndex(path, LOG_PATTERN)
+        start = time.perf_counter()
+        index.refresh()
+        build = time.perf_counter() - start
+
+        def indexed():
+            return index.query(min_level='ERROR', limit=100)
+
+        timings = {}
+        results = {}
+        for name, run in (("full", full), ("tail", tail), ("index", indexed)):
+            start = time.perf_counter()
+            for _ in range(3):
+                results[name] = run()
+            timings[name] = (time.perf_counter() - start) / 3 * 1000
+
+        # Bytes each reader pulls from the file
+        reads = []
+        real_open = open
+
+        class Counting:
+            def __init__(self, f):
+                self.f = f
+
+            def __enter__(self):
+                return self
+
+            def __exit__(self, *exc):
+                self.f.close()
+
+            def seek(self, *args):
+                return self.f.seek(*args)
+
+            def read(self, size=-1):
+                data = self.f.read(size)
+                reads.append(len(data))
+                return data
+
+            def readline(self):
+                data = self.f.readline()
+                reads.append(len(data))
+                return data
+
+        monkeypatch.setattr(log_index, "open", lambda p, m='r': Counting(real_open(p, m)), raising=False)
+        tail()
+        tail_bytes = sum(reads)
+        reads.clear()
+        indexed()
+        index_bytes = sum(reads)
+
+        print(f"\nLast 100 ERROR of {size / 1e6:.0f} MB: full {timings['full']:.1f} ms, "
+              f"tail {timings['tail']:.1f} ms ({tail_bytes / 1e3:.0f} KB read), "
+              f"index {timings['index']:.2f} ms ({index_bytes / 1e3:.0f} KB read) "
+              f"(one-time index build {build * 1000:.0f} ms)")
+        assert results['tail'] == results['full'] == results['index']
+        assert tail_bytes < size / 10
+        assert index_bytes < size / 100
@@ -0,0 +1,210 @@
+"""
+Compare v3 Orchestrator Stage DAG Tests
+
+Test Gates:
+- ORCH-DAG-01: FAR runs concurrently with SAE -> ERCE -> BIRL
+- ORCH-DAG-02: Downstream stages receive upstream outputs (placeholders on failure)
+- ORCH-DAG-03: Per-stage and global timeouts are enforced
+- ORCH-DAG-04: _meta.monitor exposes the stage timeline and overlap
+"""
+
+import os
+import sys
+import time
+from unittest.mock import patch
+
+# Add backend to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import compare_v3_engine as engine
+
+
+def _sleeping_stage(seconds, result, stats=None):
+    """Build a stage stub that sleeps then returns (result, stats)."""
+    def stage(*args):
+        time.sleep(seconds)
+        return result, dict(stats or {})
+    return stage
+
+
+def _run_with_stages(sae, erce, birl, far, timeouts=None):
+    """Run the orchestrator with stubbed stage functions."""
+    with patch.object(engine, "run_sae_real", sae), \
+         patch.object(engine, "run_erce_real", erce), \
+         patch.object(engine, "run_birl_real", birl), \
+         patch.object(engine, "run_far_real", far), \
+         patch.dict(engine.ORCHESTRATOR_TIMEOUTS, timeouts or {}):
+        return engine.run_compare_v3_orchestrator("v1 text", "v2 text")
+
+
+# ============================================================================
+# ORCH-DAG-01: Concurrency
+# ============================================================================
+
+class TestStageConcurrency:
+    """Test FAR overlaps the SAE -> ERCE -> BIRL chain"""
+
+    def test_dependencies_declared(self):
+        """Stage graph only chains the stages that consume upstream output"""
+        assert engine.STAGE_DEPENDENCIES["SAE"] == ()
+        assert engine.STAGE_DEPENDENCIES["ERCE"] == ("SAE",)
+        assert set(engine.STAGE_DEPENDENCIES["BIRL"]) == {"SAE", "ERCE"}
+        assert engine.STAGE_DEPENDENCIES["FAR"] == ()
+
+    def test_far_overlaps_sae_chain(self):
+        """Wall time is the critical path, not the sum of stages"""
+        result = _run_with_stages(
+            sae=_sleeping_stage(0.3, []),
+            erce=_sleeping_stage(0.1, []),
+            birl=_sleeping_stage(0.1, []),
+            far=_sleeping_stage(0.4, []),
+        )
+
+        assert result["_meta"]["pipeline_status"] == "REAL"
+
+        # FAR starts before SAE ends; the chain stays ordered
+        timeline = result["_meta"]["monitor"]["stage_timeline"]
+        assert timeline["FAR"]["start_ms"] < timeline["SAE"]["end_ms"]
+        assert timeline["ERCE"]["start_ms"] >= timeline["SAE"]["end_ms"]
+        assert timeline["BIRL"]["start_ms"] >= timeline["ERCE"]["end_ms"]
+
+    def test_shared_executor_reused(self):
+        """Stage executor is created once and reused across requests"""
+        assert engine.get_stage_executor() is engine.get_stage_executor()
+
+
+# ============================================================================
+# ORCH-DAG-02: Data Flow
+# ============================================================================
+
+class TestStageDataFlow:
+    """Test upstream outputs feed downstream stages"""
+
+    def test_erce_and_birl_receive_upstream_outputs(self):
+        """ERCE gets SAE matches; BIRL gets ERCE results and SAE matches"""
+        sae_matches = [{"v1_clause_id": 1, "v2_clause_id": 1}]
+        erce_results = [{"clause_pair_id": 1, "risk_category": "HIGH"}]
+        seen = {}
+
+        def erce(matches, v1_clauses, v2_clauses, request_id):
+            seen["erce"] = matches
+            return erce_results, {}
+
+        def birl(results, matches, v1_clauses, v2_clauses, request_id):
+            seen["birl"] = (results, matches)
+            return [], {}
+
+        _run_with_stages(
+            sae=_sleeping_stage(0, sae_matches),
+            erce=erce,
+            birl=birl,
+            far=_sleeping_stage(0, []),
+        )
+
+        assert seen["erce"] is sae_matches
+        assert seen["birl"] == (erce_results, sae_matches)
+
+    def test_failed_stage_feeds_placeholder_downstream(self):
+        """ERCE exception does not cascade; BIRL runs on the ERCE placeholder"""
+        seen = {}
+
+        def erce(*args):
+            raise RuntimeError("boom")
+
+        def birl(results, *args):
+            seen["birl"] = results
+            return [], {}
+
+        result = _run_with_stages(
+            sae=_sleeping_stage(0, []),
+            erce=erce,
+            birl=birl,
+            far=_sleeping_stage(0, []),
+        )
+
+        meta = result["_meta"]
+        assert meta["stage_statuses"]["ERCE"] == "failure"
+        assert meta["stage_statuses"]["BIRL"] == "success"
+        assert meta["pipeline_status"] == "PARTIAL:ERCE"
+        assert meta["stats"]["erce"]["status"] == "PLACEHOLDER"
+        assert seen["birl"] == engine._generate_erce_placeholder()
+        assert meta["monitor"]["errors"][0]["error_key"] == "erce.exception"
+
+
+# ============================================================================
+# ORCH-DAG-03: Timeouts
+# ============================================================================
+
+class TestStageTimeouts:
+    """Test per-stage and global budgets"""
+
+    def test_stage_timeout_only_fails_that_stage(self):
+        """A slow FAR times out without delaying or failing the chain"""
+        result = _run_with_stages(
+            sae=_sleeping_stage(0, []),
+            erce=_sleeping_stage(0, []),
+            birl=_sleeping_stage(0, []),
+            far=_sleeping_stage(1.0, []),
+            timeouts={"FAR": 0.2},
+        )
+
+        meta = result["_meta"]
+        assert meta["stage_statuses"]["FAR"] == "failure"
+        assert meta["pipeline_status"] == "PARTIAL:FAR"
+        assert meta["stage_durations_ms"]["FAR"] < 900
+        assert meta["monitor"]["errors"][0]["error_key"] == "far.timeout"
+
+    def test_global_timeout_fails_remaining_stages(self):
+        """Stages that cannot start inside the global budget fail fast"""
+        start = time.time()
+        result = _run_with_stages(
+            sae=_sleeping_stage(1.0, []),
+            erce=_sleeping_stage(0, []),
+            birl=_sleeping_stage(0, []),
+            far=_sleeping_stage(0, []),
+            timeouts={"global": 0.2},
+        )
+        elapsed = time.time() - start
+
+        meta = result["_meta"]
+        assert elapsed < 0.9
+        assert meta["stage_statuses"]["FAR"] == "success"
+        for stage in ("SAE", "ERCE", "BIRL"):
+            assert meta["stage_statuses"][stage] == "failure"
+        error_keys = {e["stage"]: e["error_key"] for e in meta["monitor"]["errors"]}
+        assert error_keys["SAE"] == "orchestrator.global_timeout"
+        assert error_keys["BIRL"] == "orchestrator.global_timeout"
+
+
+# ============================================================================
+# ORCH-DAG-04: Monitor Output
+# ============================================================================
+
+class TestMonitorTimeline:
+    """Test stage timeline in _meta.monitor"""
+
+    def test_overlap_reported(self):
+        """overlap_ms reflects time saved versus serial execution"""
+        metrics = engine.MonitorMetrics("test")
+        metrics.total_start_ms = 1000
+        metrics.record_stage_window("SAE", 1000, 1300)
+        metrics.record_stage_window("FAR", 1000, 1200)
+        metrics.record_stage_window("ERCE", 1300, 1400)
+
+        monitor = metrics.to_meta_monitor()
+
+        assert monitor["stage_timeline"]["SAE"] == {"start_ms": 0, "end_ms": 300}
+        assert monitor["overlap_ms"] == 200
+
+    def test_monitor_events_cover_all_stages(self):
+        """Every stage still emits start and end events"""
+        result = _run_with_stages(
+            sae=_sleeping_stage(0, []),
+            erce=_sleeping_stage(0, []),
+            birl=_sleeping_stage(0, []),
+            far=_sleeping_stage(0, []),
+        )
+
+        monitor = result["_meta"]["monitor"]
+        assert monitor["events_count"] >= 10
+        assert set(monitor["stage_timeline"]) == {"SAE", "ERCE", "BIRL", "FAR"}
@@ -0,0 +1,223 @@
+"""
+In-Memory Pattern Cache Tests
+
+Test Gates:
+- PATTERN-MEM-01: Reads are served from memory; cache_loads counts disk loads only
+- PATTERN-MEM-02: External file changes are picked up via mtime/size
+- PATTERN-MEM-03: Lookups by id and category use in-memory indexes
+- PATTERN-MEM-04: Writes are atomic (temp file + rename)
+"""
+
+import json
+import os
+import sys
+import threading
+import pytest
+from unittest.mock import patch
+
+# Add backend to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from pattern_cache import DEFAULT_PATTERNS, PatternCache, RiskPattern
+
+
+@pytest.fixture
+def cache_path(tmp_path):
+    return str(tmp_path / "pattern_library.json")
+
+
+def _edit_file(path, mutate):
+    """Rewrite the library file the way another process would."""
+    with open(path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    mutate(data)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f)
+
+
+# ============================================================================
+# PATTERN-MEM-01: Memory-served reads
+# ============================================================================
+
+class TestInMemoryReads:
+    """Test reads do not touch disk when the file is unchanged"""
+
+    def test_repeated_reads_load_once(self, cache_path):
+        """An existing file is parsed once across all read methods"""
+        PatternCache(cache_path=cache_path)
+        cache = PatternCache(cache_path=cache_path)
+
+        for _ in range(20):
+            cache.get_all_patterns()
+            cache.get_enabled_patterns()
+            cache.get_patterns_by_category("HIGH")
+            cache.get_pattern_by_id("AUDIT_RIGHTS_007")
+
+        assert cache.get_metrics()["cache_loads"] == 1
+
+    def test_own_write_is_not_a_load(self, cache_path):
+        """Creating the file primes memory without a disk load"""
+        cache = PatternCache(cache_path=cache_path)
+        cache.get_all_patterns()
+
+        metrics = cache.get_metrics()
+        assert metrics["cache_writes"] == 1
+        assert metrics["cache_loads"] == 0
+
+    def test_priority_order(self, cache_path):
+        """All patterns are sorted by priority, highest first"""
+        patterns = PatternCache(cache_path=cache_path).get_all_patterns()
+
+        priorities = [p.priority for p in patterns]
+        assert priorities == sorted(priorities, reverse=True)
+
+    def test_missing_file_serves_defaults(self, cache_path):
+        """Deleted library falls back to default patterns"""
+        cache = PatternCache(cache_path=cache_path)
+        os.remove(cache_path)
+
+        assert len(cache.get_all_patterns()) == len(DEFAULT_PATTERNS)
+        assert cache.get_library_version() == "defaults"
+
+
+# ============================================================================
+# PATTERN-MEM-02: Revalidation
+# ============================================================================
+
+class TestRevalidation:
+    """Test mtime/size revalidation"""
+
+    def test_external_change_reloaded(self, cache_path):
+        """A change written by another worker is visible on next read"""
+        cache = PatternCache(cache_path=cache_path)
+        assert cache.get_pattern_by_id("AUDIT_RIGHTS_007").enabled is True
+
+        def disable(data):
+            for p in data["patterns"]:
+                if p["pattern_id"] == "AUDIT_RIGHTS_007":
+                    p["enabled"] = False
+        _edit_file(cache_path, disable)
+
+        assert cache.get_pattern_by_id("AUDIT_RIGHTS_007").enabled is False
+        assert "AUDIT_RIGHTS_007" not in [p.pattern_id for p in cache.get_enabled_patterns()]
+        assert cache.get_metrics()["cache_loads"] == 1
+
+    def test_touch_without_change_keeps_objects(self, cache_path):
+        """Same content after a touch is not re-parsed"""
+        cache = PatternCache(cache_path=cache_path)
+        before = cache.get_pattern_by_id("AUDIT_RIGHTS_007")
+
+        stat = os.stat(cache_path)
+        os.utime(cache_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 5_000_000_000))
+
+        assert cache.get_pattern_by_id("AUDIT_RIGHTS_007") is before
+
+    def test_invalid_json_falls_back_to_defaults(self, cache_path):
+        """A corrupt file serves defaults and counts one error"""
+        cache = PatternCache(cache_path=cache_path)
+        with open(cache_path, "w", encoding="utf-8") as f:
+            f.write("{not json")
+
+        for _ in range(3):
+            assert len(cache.get_all_patterns()) == len(DEFAULT_PATTERNS)
+        assert cache.get_metrics()["errors"] == 1
+
+
+# ============================================================================
+# PATTERN-MEM-03: Indexes
+# ============================================================================
+
+class TestIndexes:
+    """Test id and category indexes"""
+
+    def test_lookup_by_id(self, cache_path):
+        """get_pattern_by_id returns the pattern or None"""
+        cache = PatternCache(cache_path=cache_path)
+
+        assert cache.get_pattern_by_id("IP_ASSIGN_005").pattern_name == "IP Assignment"
+        assert cache.get_pattern_by_id("MISSING") is None
+
+    def test_lookup_by_category(self, cache_path):
+        """Category lists contain enabled patterns of that category in priority order"""
+        cache = PatternCache(cache_path=cache_path)
+
+        high = cache.get_patterns_by_category("HIGH")
+
+        assert [p.pattern_id for p in high] == [
+            "INDEM_CONSEQUENTIAL_002", "IP_ASSIGN_005", "NONCOMP_BROAD_006"
+        ]
+        assert cache.get_patterns_by_category("UNKNOWN") == []
+
+    def test_returned_lists_are_copies(self, cache_path):
+        """Mutating a returned list does not change the cache"""
+        cache = PatternCache(cache_path=cache_path)
+
+        cache.get_all_patterns().clear()
+
+        assert len(cache.get_all_patterns()) == len(DEFAULT_PATTERNS)
+
+    def test_update_reflected_in_memory(self, cache_path):
+        """update_pattern updates indexes without a disk load"""
+        cache = PatternCache(cache_path=cache_path)
+        pattern = RiskPattern.from_dict(cache.get_pattern_by_id("AUDIT_RIGHTS_007").to_dict())
+        pattern.risk_category = "HIGH"
+
+        with patch("pattern_cache.is_flag_enabled", return_value=True):
+            assert cache.update_pattern(pattern) is True
+
+        assert cache.get_pattern_by_id("AUDIT_RIGHTS_007").risk_category == "HIGH"
+        assert "AUDIT_RIGHTS_007" in [p.pattern_id for p in cache.get_patterns_by_category("HIGH")]
+        assert cache.get_metrics()["cache_loads"] == 0
+
+
+# ============================================================================
+# PATTERN-MEM-04: Atomic Writes
+# ============================================================================
+
+class TestAtomicWrites:
+    """Test temp-file-and-rename writes"""
+
+    def test_no_temp_files_left(self, cache_path):
+        """Successful writes leave only the library file"""
+        cache = PatternCache(cache_path=cache_path)
+        cache.reset_cache()
+
+        assert os.listdir(os.path.dirname(cache_path)) == ["pattern_library.json"]
+
+    def test_failed_rename_keeps_original(self, cache_path):
+        """If the rename fails the old file is intact and the temp file removed"""
+        cache = PatternCache(cache_path=cache_path)
+        with open(cache_path, "rb") as f:
+            original = f.read()
+
+        with patch("pattern_cache.os.replace", side_effect=OSError("disk full")):
+            assert cache.reset_cache() is False
+
+        with open(cache_path, "rb") as f:
+            assert f.read() == original
+        assert os.listdir(os.path.dirname(cache_path)) == ["pattern_library.json"]
+
+    def test_concurrent_readers_never_see_partial_file(self, cache_path):
+        """Readers parsing the file while another worker writes always see valid JSON"""
+        writer = PatternCache(cache_path=cache_path)
+        errors = []
+        stop = threading.Event()
+
+        def read_loop():
+            while not stop.is_set():
+                try:
+                    with open(cache_path, "r", encoding="utf-8") as f:
+                        json.load(f)
+                except (ValueError, FileNotFoundError) as e:
+                    errors.append(e)
+
+        readers = [threading.Thread(target=read_loop) for _ in range(4)]
+        for t in readers:
+            t.start()
+        for _ in range(50):
+            writer.reset_cache()
+        stop.set()
+        for t in readers:
+            t.join()
+
+        assert errors == []
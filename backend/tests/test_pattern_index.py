@@ -0,0 +1,291 @@
+"""
+Compiled Pattern Index Tests
+
+Test Gates:
+- PATTERN-INDEX-01: Index results equal per-pattern matching (regex + keyword)
+- PATTERN-INDEX-02: Keywords shared by several patterns resolve per pattern
+- PATTERN-INDEX-03: Index is rebuilt only when library content changes
+- PATTERN-INDEX-04: ERCE index is shared across calls with the same patterns
+"""
+
+import json
+import os
+import random
+import re
+import sys
+import time
+import pytest
+from unittest.mock import patch
+
+# Add backend to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from pattern_cache import (
+    DEFAULT_PATTERNS,
+    CompiledPatternIndex,
+    PatternCache,
+    RiskPattern,
+    get_pattern_index,
+    match_patterns_for_erce,
+)
+
+
+def _pattern(pattern_id, pattern_type, value, priority=50, enabled=True, category="HIGH"):
+    return RiskPattern(
+        pattern_id=pattern_id,
+        pattern_name=pattern_id,
+        risk_category=category,
+        pattern_type=pattern_type,
+        pattern_value=value,
+        success_probability=0.5,
+        description="",
+        priority=priority,
+        enabled=enabled,
+        created_at="2025-01-01T00:00:00",
+        updated_at="2025-01-01T00:00:00",
+    )
+
+
+def _reference_match(text, patterns):
+    """Per-pattern matching as done before the index existed."""
+    results = []
+    text_lower = text.lower()
+    for p in patterns:
+        if not p.enabled:
+            continue
+        if p.pattern_type == "regex":
+            try:
+                m = re.compile(p.pattern_value).search(text)
+            except re.error:
+                continue
+            if m:
+                results.append((p.pattern_id, m.group(), m.start(), m.end()))
+        elif p.pattern_type == "keyword":
+            try:
+                keywords = json.loads(p.pattern_value)
+            except (json.JSONDecodeError, TypeError):
+                continue
+            matched = [kw for kw in keywords if kw.lower() in text_lower]
+            if matched:
+                results.append((p.pattern_id, matched[0], None, None))
+    return results
+
+
+MIXED_PATTERNS = [RiskPattern.from_dict(d) for d in DEFAULT_PATTERNS] + [
+    _pattern("KW_CAP", "keyword", json.dumps(["Cap", "capped", "liability cap"])),
+    _pattern("KW_TERM", "keyword", json.dumps(["terminate", "termination for convenience"])),
+    _pattern("RX_BACKREF", "regex", r"(\b\w+\b) \1"),
+    _pattern("RX_OVERLAP", "regex", r"(?i)indemnif\w*"),  # overlaps INDEM_UNLIMITED_001
+    _pattern("RX_LOOKBEHIND", "regex", r"(?<=net )\d+"),
+    _pattern("RX_ANCHOR", "regex", r"^This"),
+    _pattern("RX_INVALID", "regex", r"(unclosed"),
+    _pattern("KW_INVALID", "keyword", "not json"),
+    _pattern("RX_DISABLED", "regex", r"audit", enabled=False),
+]
+
+VOCAB = [
+    "unlimited", "uncapped", "indemnification", "liability", "consequential", "damages",
+    "included", "automatic", "renewal", "net", "90", "60", "assign", "all", "patent",
+    "non-compete", "worldwide", "audit", "right", "notice", "30", "days", "cap", "capped",
+    "terminate", "termination", "for", "convenience", "This", "the", "the", "shall",
+]
+
+
+# ============================================================================
+# PATTERN-INDEX-01: Equivalence
+# ============================================================================
+
+class TestIndexEquivalence:
+    """Test index output equals per-pattern matching"""
+
+    def test_randomized_texts_match_reference(self):
+        """Index and per-pattern matching agree on random clause text"""
+        index = CompiledPatternIndex(MIXED_PATTERNS)
+        rng = random.Random(11)
+
+        for _ in range(500):
+            text = " ".join(rng.choice(VOCAB) for _ in range(rng.randint(0, 40)))
+            got = [(p.pattern_id, t, s, e) for p, t, s, e in index.match(text)]
+            assert got == _reference_match(text, MIXED_PATTERNS), text
+
+    def test_overlapping_regexes_all_found(self):
+        """A pattern whose match starts inside another's is still found"""
+        index = CompiledPatternIndex(MIXED_PATTERNS)
+        text = "Supplier accepts unlimited indemnification obligations"
+
+        ids = [p.pattern_id for p, _, _, _ in index.match(text)]
+
+        assert "INDEM_UNLIMITED_001" in ids
+        assert "RX_OVERLAP" in ids
+
+    def test_invalid_patterns_skipped(self):
+        """Invalid regex and keyword JSON are skipped and counted"""
+        index = CompiledPatternIndex(MIXED_PATTERNS)
+
+        ids = {p.pattern_id for p in index.patterns}
+
+        assert "RX_INVALID" not in ids
+        assert "KW_INVALID" not in ids
+        assert "RX_DISABLED" not in ids
+        assert index.errors == 2
+
+    def test_erce_output_shape_unchanged(self):
+        """match_patterns_for_erce keeps its result keys and pattern order"""
+        text = "Unlimited liability applies; this agreement will automatically renew on Net 90 terms."
+        patterns = [RiskPattern.from_dict(d) for d in DEFAULT_PATTERNS]
+
+        matches = match_patterns_for_erce(text, patterns)
+
+        assert [m["pattern_id"] for m in matches] == [r[0] for r in _reference_match(text, patterns)]
+        for m in matches:
+            assert set(m) == {
+                "pattern_id", "pattern_name", "risk_category", "success_probability",
+                "match_text", "match_type", "priority",
+            }
+
+
+# ============================================================================
+# PATTERN-INDEX-02: Keyword Patterns
+# ============================================================================
+
+class TestKeywordPatterns:
+    """Test keyword patterns in the index"""
+
+    def test_shared_keywords_resolve_per_pattern(self):
+        """Each pattern reports its own first listed keyword present"""
+        patterns = [
+            _pattern("KW_A", "keyword", json.dumps(["Liability", "cap"])),
+            _pattern("KW_B", "keyword", json.dumps(["uncapped", "CAP"])),
+            _pattern("KW_C", "keyword", json.dumps(["absent"])),
+        ]
+        index = CompiledPatternIndex(patterns)
+
+        hits = [(p.pattern_id, t) for p, t, _, _ in index.match("An uncapped liability")]
+
+        assert hits == [("KW_A", "Liability"), ("KW_B", "uncapped")]
+
+    def test_keyword_json_parsed_once(self):
+        """Matching does not re-parse keyword JSON"""
+        index = CompiledPatternIndex([_pattern("KW_A", "keyword", json.dumps(["cap"]))])
+
+        with patch("pattern_cache.json.loads", side_effect=AssertionError("re-parsed")):
+            assert len(index.match("liability cap")) == 1
+
+
+# ============================================================================
+# PATTERN-INDEX-03: Rebuild Policy
+# ============================================================================
+
+class TestIndexRebuild:
+    """Test PatternCache index is rebuilt only on content change"""
+
+    @pytest.fixture
+    def cache(self, tmp_path):
+        return PatternCache(cache_path=str(tmp_path / "pattern_library.json"))
+
+    def test_index_reused_when_unchanged(self, cache):
+        """Repeated calls return the same compiled index"""
+        assert cache.get_compiled_index() is cache.get_compiled_index()
+
+    def test_touch_without_change_keeps_index(self, cache):
+        """mtime change with identical content does not recompile"""
+        index = cache.get_compiled_index()
+        stat = os.stat(cache.cache_path)
+        os.utime(cache.cache_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 5_000_000_000))
+
+        assert cache.get_compiled_index() is index
+
+    def test_content_change_rebuilds(self, cache):
+        """Editing the library file rebuilds the index"""
+        index = cache.get_compiled_index()
+
+        with open(cache.cache_path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        data["patterns"] = data["patterns"][:2]
+        with open(cache.cache_path, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+
+        rebuilt = cache.get_compiled_index()
+        assert rebuilt is not index
+        assert len(rebuilt) == 2
+
+    def test_match_text_uses_index(self, cache):
+        """match_text returns start/end offsets and updates metrics"""
+        with patch("pattern_cache.is_flag_enabled", return_value=True):
+            matches = cache.match_text("The fee is due Net 90 after audit access.")
+
+        ids = [m["pattern_id"] for m in matches]
+        assert ids == ["PAY_NET_EXTENDED_004", "AUDIT_RIGHTS_007"]
+        assert matches[0]["match_text"] == "Net 90"
+        assert matches[0]["match_start"] == 15
+        metrics = cache.get_metrics()
+        assert metrics["pattern_matches"] == 2
+        assert metrics["pattern_misses"] == len(DEFAULT_PATTERNS) - 2
+
+
+# ============================================================================
+# PATTERN-INDEX-04: ERCE Index Sharing
+# ============================================================================
+
+class TestErceIndexSharing:
+    """Test match_patterns_for_erce compiles once per pattern version"""
+
+    def test_same_patterns_share_index(self):
+        """Equal pattern lists (even distinct objects) share one index"""
+        first = [RiskPattern.from_dict(d) for d in DEFAULT_PATTERNS]
+        second = [RiskPattern.from_dict(d) for d in DEFAULT_PATTERNS]
+
+        assert get_pattern_index(first) is get_pattern_index(second)
+
+    def test_changed_pattern_gets_new_index(self):
+        """Changing a pattern value yields a different index"""
+        patterns = [RiskPattern.from_dict(d) for d in DEFAULT_PATTERNS]
+        edited = [RiskPattern.from_dict(d) for d in DEFAULT_PATTERNS]
+        edited[0].pattern_value = r"(?i)unbounded\s+liability"
+
+        assert get_pattern_index(patterns) is not get_pattern_index(edited)
+
+    def test_metadata_edit_reported_from_current_patterns(self):
+        """Editing only name/category/probability/priority shows up in matches"""
+        text = "Vendor accepts unlimited liability for all claims."
+        patterns = [RiskPattern.from_dict(d) for d in DEFAULT_PATTERNS]
+        before = match_patterns_for_erce(text, patterns)
+        edited = [RiskPattern.from_dict(d) for d in DEFAULT_PATTERNS]
+        edited[0].pattern_name = "Renamed"
+        edited[0].risk_category = "MODERATE"
+        edited[0].success_probability = 0.9
+        edited[0].priority = 1
+
+        after = match_patterns_for_erce(text, edited)
+
+        assert before[0]["pattern_id"] == after[0]["pattern_id"] == "INDEM_UNLIMITED_001"
+        assert before[0]["risk_category"] == "CRITICAL"
+        assert (after[0]["pattern_name"], after[0]["risk_category"]) == ("Renamed", "MODERATE")
+        assert (after[0]["success_probability"], after[0]["priority"]) == (0.9, 1)
+
+    def test_prebuilt_index_skips_hashing(self):
+        """Passing the index avoids recomputing the version per clause"""
+        patterns = [RiskPattern.from_dict(d) for d in DEFAULT_PATTERNS]
+        index = get_pattern_index(patterns)
+        text = "Vendor accepts unlimited liability for all claims."
+
+        with patch("pattern_cache.compute_patterns_version") as version:
+            for _ in range(5):
+                matches = match_patterns_for_erce(text, patterns, index)
+
+        version.assert_not_called()
+        assert matches == match_patterns_for_erce(text, patterns)
+
+    @pytest.mark.benchmark
+    def test_300_clause_scan(self):
+        """300 clauses against the default library finish quickly"""
+        patterns = [RiskPattern.from_dict(d) for d in DEFAULT_PATTERNS]
+        rng = random.Random(3)
+        clauses = [" ".join(rng.choice(VOCAB) for _ in range(120)) for _ in range(300)]
+
+        start = time.time()
+        for clause in clauses:
+            match_patterns_for_erce(clause, patterns)
+        elapsed = time.time() - start
+
+        assert elapsed < 2.0
@@ -178,7 +178,8 @@ class TestCacheIntegration:
         as_bytes = vectors_to_bytes(original)
         recovered = bytes_to_vector(as_bytes)
 
-        assert recovered == original
+        # Stored as float32, so equal to single precision
+        assert recovered == pytest.approx(original, rel=1e-6)
 
     def test_bytes_to_vector_handles_invalid_data(self):
         """bytes_to_vector should handle invalid data gracefully"""
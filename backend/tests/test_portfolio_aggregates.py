@@ -0,0 +1,389 @@
+"""
+Portfolio Aggregate Tests
+
+Test Gates:
+- PORTFOLIO-AGG-01: Rollup queries match the equivalent SQL over contracts
+- PORTFOLIO-AGG-02: Contract writes invalidate the snapshot; other writes do not;
+  reads never create the triggers
+- PORTFOLIO-AGG-03: Dashboard endpoints answer from the aggregates
+- PORTFOLIO-AGG-04: Benchmark at 50k contracts (per-request SQL scans vs aggregates)
+"""
+
+import os
+import random
+import sqlite3
+import sys
+import time
+from datetime import date, timedelta
+import pytest
+
+# Add backend to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from portfolio_aggregates import (
+    ALL_CONTRACTS,
+    PortfolioFilter,
+    get_aggregate_cache,
+    get_portfolio_aggregates,
+    install_aggregate_triggers,
+)
+
+SCHEMA = """
+    CREATE TABLE contracts (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        filename TEXT, title TEXT, counterparty TEXT,
+        contract_type TEXT, contract_role TEXT, status TEXT,
+        expiration_date TEXT, contract_value REAL, risk_level TEXT,
+        narrative TEXT, upload_date TEXT, archived INTEGER DEFAULT 0
+    )
+"""
+
+INSERT = """
+    INSERT INTO contracts (
+        filename, title, counterparty, contract_type, contract_role, status,
+        expiration_date, contract_value, risk_level, upload_date, archived
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+TYPES = ['MSA', 'NDA', 'SOW', 'AMENDMENT', None]
+ROLES = ['customer_contract', 'vendor_contract', None]
+STATUSES = ['active', 'expired', 'negotiating', 'review', 'intake', 'terminated', 'archived', None]
+RISKS = ['CRITICAL', 'HIGH', 'MEDIUM', 'LOW', 'Critical', 'High', 'Moderate', 'Administrative', None]
+PARTIES = ['Acme Corp', 'Globex', 'Initech', 'Umbrella', '', None]
+
+
+def _contracts(count, seed=7):
+    rng = random.Random(seed)
+    today = date.today()
+    rows = []
+    for n in range(count):
+        expiration = rng.choice([
+            None, 'TBD',
+            (today + timedelta(days=rng.randint(-60, 400))).isoformat(),
+        ])
+        upload = rng.choice([
+            None, 'unknown',
+            (today - timedelta(days=rng.randint(0, 500))).isoformat(),
+            (today - timedelta(days=rng.randint(0, 500))).isoformat() + ' 10:30:00',
+        ])
+        rows.append((
+            f"contract_{n}.docx", f"Contract {n}", rng.choice(PARTIES),
+            rng.choice(TYPES), rng.choice(ROLES), rng.choice(STATUSES),
+            expiration, rng.choice([None, 0, 5000, 75000.5, 100000, 250000, 1200000]),
+            rng.choice(RISKS), upload, rng.choice([0, 0, 0, 1, None]),
+        ))
+    return rows
+
+
+def _make_db(path, count, triggers=True):
+    conn = sqlite3.connect(path)
+    conn.execute(SCHEMA)
+    conn.executemany(INSERT, _contracts(count))
+    conn.commit()
+    conn.close()
+    if triggers:
+        install_aggregate_triggers(path)  # Schema init
+    return path
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    return _make_db(str(tmp_path / "contracts.db"), 2000)
+
+
+def _sql(db_path, query, params=()):
+    conn = sqlite3.connect(db_path)
+    try:
+        return conn.execute(query, params).fetchall()
+    finally:
+        conn.close()
+
+
+BASE = "(archived = 0 OR archived IS NULL)"
+
+# (filter, equivalent SQL predicate, params)
+FILTERS = [
+    (ALL_CONTRACTS, "1", ()),
+    (PortfolioFilter(status='active'), "status = ?", ('active',)),
+    (PortfolioFilter(contract_type='MSA', contract_role='vendor_contract'), "contract_type = ? AND contract_role = ?", ('MSA', 'vendor_contract')),
+    (PortfolioFilter(status_not_in=('expired', 'terminated', 'archived')), "status NOT IN ('expired', 'terminated', 'archived')", ()),
+    (PortfolioFilter(status_in=('intake', 'review')), "status IN ('intake', 'review')", ()),
+    (PortfolioFilter(risk_in=('CRITICAL', 'HIGH'), status_in=('active', 'negotiating')), "risk_level IN ('CRITICAL', 'HIGH') AND status IN ('active', 'negotiating')", ()),
+    (PortfolioFilter(risk_level='High', risk_not_null=True), "risk_level = ? AND risk_level IS NOT NULL", ('High',)),
+    (PortfolioFilter(status='intake', status_not_in=('intake',)), "status = ? AND status != 'intake'", ('intake',)),
+]
+
+
+# ============================================================================
+# PORTFOLIO-AGG-01: Parity with SQL
+# ============================================================================
+
+class TestParity:
+    """Test rollup answers against direct SQL"""
+
+    @pytest.mark.parametrize("where,predicate,params", FILTERS)
+    def test_totals(self, db_path, where, predicate, params):
+        """COUNT, COALESCE(SUM), COALESCE(AVG)"""
+        expected = _sql(db_path, f"""
+            SELECT COUNT(*), COALESCE(SUM(contract_value), 0), COALESCE(AVG(contract_value), 0)
+            FROM contracts WHERE {BASE} AND {predicate}
+        """, params)[0]
+
+        totals = get_portfolio_aggregates(db_path).totals(where)
+
+        assert totals['count'] == expected[0]
+        assert totals['value'] == pytest.approx(expected[1])
+        assert totals['avg_value'] == pytest.approx(expected[2])
+
+    @pytest.mark.parametrize("where,predicate,params", FILTERS)
+    def test_expiring(self, db_path, where, predicate, params):
+        """BETWEEN window and high-value count"""
+        today = date.today()
+        start, end = today.isoformat(), (today + timedelta(days=90)).isoformat()
+        expected = _sql(db_path, f"""
+            SELECT COUNT(*), COALESCE(SUM(contract_value > 100000), 0) FROM contracts
+            WHERE {BASE} AND {predicate} AND expiration_date BETWEEN ? AND ?
+        """, params + (start, end))[0]
+
+        expiring = get_portfolio_aggregates(db_path).expiring(where, start, end)
+
+        assert (expiring['count'], expiring['high_value']) == expected
+
+    @pytest.mark.parametrize("field", ['status', 'contract_type', 'risk_level'])
+    def test_group_by(self, db_path, field):
+        """GROUP BY a dimension, NULL included"""
+        expected = _sql(db_path, f"""
+            SELECT {field}, COUNT(*), COALESCE(SUM(contract_value), 0) FROM contracts
+            WHERE {BASE} GROUP BY {field}
+        """)
+
+        groups = get_portfolio_aggregates(db_path).group_by(field)
+
+        assert [(k, g['count']) for k, g in groups.items()] == [(r[0], r[1]) for r in expected]
+        assert [g['value'] for g in groups.values()] == pytest.approx([r[2] for r in expected])
+
+    def test_expirations_by_month(self, db_path):
+        """strftime month buckets for a date window"""
+        today = date.today()
+        start, end = today.isoformat(), (today + timedelta(days=365)).isoformat()
+        expected = _sql(db_path, f"""
+            SELECT strftime('%Y-%m', expiration_date) AS month, COUNT(*) FROM contracts
+            WHERE {BASE} AND expiration_date BETWEEN ? AND ? AND status NOT IN ('expired', 'terminated')
+            GROUP BY month ORDER BY month
+        """, (start, end))
+
+        months = get_portfolio_aggregates(db_path).expirations_by(
+            PortfolioFilter(status_not_in=('expired', 'terminated')), start, end, month=True
+        )
+
+        assert list(months.items()) == expected
+
+    def test_uploads_by_month(self, db_path):
+        """Upload months since a date, non-ISO values as a NULL month"""
+        since = (date.today() - timedelta(days=180)).isoformat()
+        expected = _sql(db_path, f"""
+            SELECT strftime('%Y-%m', upload_date) AS month, COUNT(*), COALESCE(SUM(contract_value), 0)
+            FROM contracts WHERE {BASE} AND upload_date >= ? GROUP BY month ORDER BY month
+        """, (since,))
+
+        months = get_portfolio_aggregates(db_path).uploads_by_month(since=since)
+
+        assert [(m, g['count']) for m, g in months.items()] == [(r[0], r[1]) for r in expected]
+
+    def test_counterparties(self, db_path):
+        """Non-empty counterparties with count and value"""
+        expected = _sql(db_path, f"""
+            SELECT counterparty, COUNT(*), COALESCE(SUM(contract_value), 0) FROM contracts
+            WHERE {BASE} AND counterparty IS NOT NULL AND counterparty != '' AND status = 'active'
+            GROUP BY counterparty
+        """)
+
+        parties = get_portfolio_aggregates(db_path).counterparties(PortfolioFilter(status='active'))
+
+        assert [(n, g['count']) for n, g in parties.items()] == [(r[0], r[1]) for r in expected]
+        assert [g['value'] for g in parties.values()] == pytest.approx([r[2] for r in expected])
+
+
+# ============================================================================
+# PORTFOLIO-AGG-02: Invalidation
+# ============================================================================
+
+class TestInvalidation:
+    """Test version-triggered rebuilds"""
+
+    def _write(self, db_path, sql, params=()):
+        conn = sqlite3.connect(db_path)
+        conn.execute(sql, params)
+        conn.commit()
+        conn.close()
+
+    def test_cached_between_writes(self, db_path):
+        """Repeated reads reuse one snapshot"""
+        first = get_portfolio_aggregates(db_path)
+        second = get_portfolio_aggregates(db_path)
+
+        assert second is first
+        stats = get_aggregate_cache(db_path).get_stats()
+        assert stats['rebuilds'] == 1 and stats['hits'] == 1 and stats['triggers_installed']
+
+    @pytest.mark.parametrize("sql,params,delta", [
+        (INSERT, ('new.docx', 'New', 'Acme Corp', 'MSA', None, 'active', None, 10.0, 'LOW', None, 0), 1),
+        ("UPDATE contracts SET archived = 1 WHERE id = (SELECT MIN(id) FROM contracts WHERE status = 'active' AND (archived = 0 OR archived IS NULL))", (), -1),
+        ("DELETE FROM contracts WHERE id = (SELECT MIN(id) FROM contracts WHERE status = 'active' AND (archived = 0 OR archived IS NULL))", (), -1),
+        ("UPDATE contracts SET status = 'expired' WHERE id = (SELECT MIN(id) FROM contracts WHERE status = 'active' AND (archived = 0 OR archived IS NULL))", (), -1),
+    ], ids=["intake", "archive", "delete", "stage-change"])
+    def test_writes_invalidate(self, db_path, sql, params, delta):
+        """Insert, archive, delete and status change are visible on the next read"""
+        active = PortfolioFilter(status='active')
+        before = get_portfolio_aggregates(db_path).totals(active)['count']
+
+        self._write(db_path, sql, params)
+
+        assert get_portfolio_aggregates(db_path).totals(active)['count'] == before + delta
+
+    def test_unrelated_update_keeps_snapshot(self, db_path):
+        """Updating a non-aggregated column does not force a rebuild"""
+        first = get_portfolio_aggregates(db_path)
+
+        self._write(db_path, "UPDATE contracts SET narrative = 'reviewed'")
+
+        assert get_portfolio_aggregates(db_path) is first
+
+    def test_missing_triggers_fall_back_to_ttl(self, tmp_path, monkeypatch):
+        """Without triggers the snapshot is trusted for a short TTL"""
+        import portfolio_aggregates
+        path = _make_db(str(tmp_path / "plain.db"), 100, triggers=False)
+        cache = portfolio_aggregates.PortfolioAggregateCache(path)
+
+        first = cache.get()
+        assert cache.get() is first
+        assert cache.get_stats()['triggers_installed'] is False
+        monkeypatch.setattr(cache, "fallback_ttl_seconds", 0.0)
+        assert cache.get() is not first
+
+    def test_reads_do_not_create_triggers(self, tmp_path):
+        """get() only reads; triggers installed later are picked up"""
+        path = _make_db(str(tmp_path / "plain.db"), 100, triggers=False)
+        cache = get_aggregate_cache(path)
+
+        cache.get()
+        assert _sql(path, "SELECT COUNT(*) FROM sqlite_master WHERE type = 'trigger'")[0][0] == 0
+
+        install_aggregate_triggers(path)
+        cache.invalidate()
+        cache.get()
+        assert cache.get_stats()['triggers_installed'] is True
+        assert cache.get_stats()['version'] == 0
+
+
+# ============================================================================
+# PORTFOLIO-AGG-03: Endpoints
+# ============================================================================
+
+@pytest.fixture
+def dashboard_client(db_path, monkeypatch):
+    flask = pytest.importorskip("flask")
+    import dashboard_api
+    monkeypatch.setattr(dashboard_api, "CONTRACTS_DB", db_path)
+    app = flask.Flask(__name__)
+    dashboard_api.register_dashboard(app)
+    return app.test_client()
+
+
+class TestDashboardEndpoints:
+    """Test dashboard_api responses against SQL"""
+
+    def test_stats(self, dashboard_client, db_path):
+        """/stats totals and distributions"""
+        data = dashboard_client.get("/api/dashboard/stats").get_json()
+
+        count, value = _sql(db_path, f"SELECT COUNT(*), COALESCE(SUM(contract_value), 0) FROM contracts WHERE {BASE}")[0]
+        by_status = _sql(db_path, f"""
+            SELECT status, COUNT(*) FROM contracts WHERE {BASE} AND status IS NOT NULL GROUP BY status
+        """)
+        assert data['totals']['contracts'] == count
+        assert data['totals']['value'] == pytest.approx(value)
+        assert sorted(data['by_status'].items()) == sorted(by_status)
+        assert data['by_risk']['CRITICAL'] == _sql(db_path, f"SELECT COUNT(*) FROM contracts WHERE {BASE} AND risk_level = 'CRITICAL'")[0][0]
+
+    def test_alerts(self, dashboard_client, db_path):
+        """/alerts summary counts"""
+        today = date.today()
+        d30 = (today + timedelta(days=30)).isoformat()
+
+        summary = dashboard_client.get("/api/dashboard/alerts").get_json()['summary']
+
+        expected = _sql(db_path, f"""
+            SELECT COUNT(*) FROM contracts WHERE {BASE} AND expiration_date BETWEEN ? AND ?
+            AND status NOT IN ('expired', 'terminated', 'archived')
+        """, (today.isoformat(), d30))[0][0]
+        assert summary['expiring_30d'] == expected
+        assert summary['negotiating'] == _sql(db_path, f"SELECT COUNT(*) FROM contracts WHERE {BASE} AND status = 'negotiating'")[0][0]
+
+    def test_summary_and_trends(self, dashboard_client, db_path):
+        """/summary and /trends respond from the same snapshot"""
+        summary = dashboard_client.get("/api/dashboard/summary").get_json()
+        trends = dashboard_client.get("/api/dashboard/trends?months=12").get_json()
+
+        needs_attention = _sql(db_path, f"""
+            SELECT COUNT(*) FROM contracts WHERE {BASE} AND status IN ('intake', 'review', 'negotiating')
+        """)[0][0]
+        assert summary['needs_attention'] == needs_attention
+        assert all(entry['month'] for entry in trends['uploads_by_month'])
+        assert get_aggregate_cache(db_path).get_stats()['rebuilds'] == 1
+
+
+# ============================================================================
+# PORTFOLIO-AGG-04: Benchmark
+# ============================================================================
+
+class TestBenchmark:
+    """Benchmark: /api/dashboard/stats work at 50k contracts"""
+
+    def test_50k_contracts(self, tmp_path):
+        """Answering from the snapshot stays flat; per-request scans grow with the table"""
+        path = _make_db(str(tmp_path / "large.db"), 50_000)
+        queries = [
+            f"SELECT COUNT(*) FROM contracts WHERE {BASE}",
+            f"SELECT COALESCE(SUM(contract_value), 0) FROM contracts WHERE {BASE}",
+            f"SELECT COUNT(*) FROM contracts WHERE {BASE} AND status = 'active'",
+            f"SELECT COUNT(*) FROM contracts WHERE {BASE} AND status = 'expired'",
+            f"SELECT status, COUNT(*) AS c FROM contracts WHERE {BASE} AND status IS NOT NULL GROUP BY status ORDER BY c DESC",
+            f"SELECT contract_type, COUNT(*) AS c FROM contracts WHERE {BASE} AND contract_type IS NOT NULL GROUP BY contract_type ORDER BY c DESC",
+            f"SELECT risk_level, COUNT(*) FROM contracts WHERE {BASE} AND risk_level IS NOT NULL GROUP BY risk_level",
+            f"SELECT status, COALESCE(SUM(contract_value), 0) AS v FROM contracts WHERE {BASE} AND status IS NOT NULL GROUP BY status ORDER BY v DESC",
+        ]
+
+        def before():
+            conn = sqlite3.connect(path)
+            for query in queries:
+                conn.execute(query).fetchall()
+            conn.close()
+
+        def after():
+            agg = get_portfolio_aggregates(path)
+            agg.totals()
+            agg.totals(PortfolioFilter(status='active'))
+            agg.totals(PortfolioFilter(status='expired'))
+            agg.group_by('status')
+            agg.group_by('contract_type')
+            agg.group_by('risk_level')
+
+        start = time.perf_counter()
+        after()
+        build = time.perf_counter() - start
+
+        timings = {}
+        for name, run in (("before", before), ("after", after)):
+            start = time.perf_counter()
+            for _ in range(5):
+                run()
+            timings[name] = (time.perf_counter() - start) / 5 * 1000
+
+        print(f"\n/stats work at 50k contracts: {timings['before']:.1f} ms before -> "
+              f"{timings['after']:.2f} ms after (one-time build {build * 1000:.0f} ms)")
+        # Work done, not wall time: one scan of the table, then version lookups only
+        stats = get_aggregate_cache(path).get_stats()
+        assert stats['rebuilds'] == 1
+        assert stats['hits'] == 5
+        assert stats['rows'] == _sql(path, f"SELECT COUNT(*) FROM contracts WHERE {BASE}")[0][0]
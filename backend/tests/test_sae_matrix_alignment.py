@@ -0,0 +1,193 @@
+"""
+SAE Matrix Alignment Tests
+
+Test Gates:
+- SAE-MATRIX-01: Similarity matrix matches pairwise cosine similarity
+- SAE-MATRIX-02: Assignment solver finds the optimal global matching
+- SAE-MATRIX-03: run_sae_real matrix mode keeps thresholds and stats shape
+"""
+
+import itertools
+import math
+import os
+import random
+import sys
+import pytest
+from unittest.mock import patch
+
+# Add backend to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+np = pytest.importorskip("numpy")
+
+
+# ============================================================================
+# SAE-MATRIX-01: Similarity Matrix
+# ============================================================================
+
+class TestSimilarityMatrix:
+    """Test vectorized cosine similarity"""
+
+    def test_matrix_matches_pairwise_cosine(self):
+        """Matrix entries equal compute_cosine_similarity for each pair"""
+        from embedding_cache import compute_similarity_matrix, compute_cosine_similarity
+
+        rng = random.Random(7)
+        v1 = [[rng.uniform(-1, 1) for _ in range(16)] for _ in range(4)]
+        v2 = [[rng.uniform(-1, 1) for _ in range(16)] for _ in range(5)]
+
+        matrix = compute_similarity_matrix(v1, v2)
+
+        assert matrix.shape == (4, 5)
+        assert matrix.dtype == np.float32
+        for i, j in itertools.product(range(4), range(5)):
+            assert matrix[i, j] == pytest.approx(compute_cosine_similarity(v1[i], v2[j]), abs=1e-5)
+
+    def test_zero_vector_scores_zero(self):
+        """Zero vectors produce zero rows, not NaN"""
+        from embedding_cache import compute_similarity_matrix
+
+        matrix = compute_similarity_matrix([[0.0, 0.0]], [[1.0, 0.0]])
+        assert matrix[0, 0] == 0.0
+
+    def test_mismatched_dimensions_raise(self):
+        """Mismatched dimensions raise ValueError"""
+        from embedding_cache import compute_similarity_matrix
+
+        with pytest.raises(ValueError):
+            compute_similarity_matrix([[1.0, 0.0]], [[1.0, 0.0, 0.0]])
+
+
+# ============================================================================
+# SAE-MATRIX-02: Assignment Solver
+# ============================================================================
+
+def _brute_force_min(cost):
+    n, m = cost.shape
+    best = None
+    if n <= m:
+        for cols in itertools.permutations(range(m), n):
+            total = sum(cost[i, c] for i, c in enumerate(cols))
+            best = total if best is None else min(best, total)
+    else:
+        for rows in itertools.permutations(range(n), m):
+            total = sum(cost[r, j] for j, r in enumerate(rows))
+            best = total if best is None else min(best, total)
+    return best
+
+
+class TestAssignmentSolver:
+    """Test the NumPy assignment fallback"""
+
+    @pytest.mark.parametrize("shape", [(4, 4), (3, 5), (5, 3), (1, 4), (6, 6)])
+    def test_matches_brute_force(self, shape):
+        """NumPy solver finds the minimum total cost"""
+        from compare_v3_engine import _linear_sum_assignment_np
+
+        rng = np.random.default_rng(sum(shape))
+        cost = rng.random(shape)
+
+        rows, cols = _linear_sum_assignment_np(cost)
+
+        assert len(rows) == min(shape)
+        assert len(set(rows.tolist())) == len(rows)
+        assert len(set(cols.tolist())) == len(cols)
+        assert list(rows) == sorted(rows)
+        assert cost[rows, cols].sum() == pytest.approx(_brute_force_min(cost))
+
+    def test_global_assignment_beats_greedy(self):
+        """Matrix alignment avoids the greedy first-come mismatch"""
+        from compare_v3_engine import _align_clauses_matrix, _align_clauses_greedy
+
+        # Unit vectors at 0/50 degrees (v1) and 10/-30 degrees (v2): v1[1]
+        # greedily takes v2[10], leaving v1[2] with nothing matchable
+        def unit(deg):
+            return [math.cos(math.radians(deg)), math.sin(math.radians(deg))]
+
+        v1 = {1: (unit(0), {}), 2: (unit(50), {})}
+        v2 = {10: (unit(10), {}), 20: (unit(-30), {})}
+
+        greedy = _align_clauses_greedy(v1, v2)
+        matrix = _align_clauses_matrix(v1, v2)
+
+        assert len(greedy) == 1
+        assert len(matrix) == 2
+        assert [m["v1_clause_id"] for m in matrix] == [1, 2]
+
+
+# ============================================================================
+# SAE-MATRIX-03: run_sae_real Matrix Mode
+# ============================================================================
+
+class TestRunSAEMatrixMode:
+    """Test run_sae_real with matrix alignment"""
+
+    def _run(self, vectors, v1_clauses, v2_clauses, mode):
+        import compare_v3_engine
+        from embedding_cache import SAEEmbeddingResult
+
+        def fake_embeddings(clause_texts, openai_client, model, max_tokens, batch_log=None):
+            return [
+                SAEEmbeddingResult(
+                    clause_hash=text,
+                    vector=vectors[text],
+                    model_version=model,
+                    dimensions=len(vectors[text]),
+                    cached=True,
+                )
+                for text in clause_texts
+            ]
+
+        config = {"sae_alignment_mode": mode}
+        with patch.object(compare_v3_engine, "is_flag_enabled", lambda name: True), \
+             patch.object(compare_v3_engine, "get_config", lambda key, default=None: config.get(key, default)), \
+             patch.object(compare_v3_engine, "_get_openai_client", lambda: object()), \
+             patch.object(compare_v3_engine, "get_sae_embeddings", fake_embeddings):
+            return compare_v3_engine.run_sae_real(v1_clauses, v2_clauses, 1, 2, "test-req")
+
+    def test_matrix_mode_matches_greedy_on_clear_pairs(self):
+        """Both modes agree when every clause has an obvious partner"""
+        vectors = {
+            "a": [1.0, 0.0, 0.0], "b": [0.0, 1.0, 0.0], "c": [0.0, 0.0, 1.0],
+            "a2": [0.95, 0.1, 0.0], "b2": [0.0, 0.9, 0.3], "x": [-1.0, 0.0, 0.0],
+        }
+        v1 = [{"id": 1, "text": "a"}, {"id": 2, "text": "b"}, {"id": 3, "text": "c"}]
+        v2 = [{"id": 11, "text": "a2"}, {"id": 12, "text": "b2"}, {"id": 13, "text": "x"}]
+
+        matrix_matches, matrix_stats = self._run(vectors, v1, v2, "matrix")
+        greedy_matches, greedy_stats = self._run(vectors, v1, v2, "greedy")
+
+        assert matrix_matches == greedy_matches
+        assert matrix_stats["alignment_mode"] == "matrix"
+        assert greedy_stats["alignment_mode"] == "greedy"
+        for key in ("matched_count", "unmatched_v1", "unmatched_v2", "cache_hits", "cache_misses"):
+            assert matrix_stats[key] == greedy_stats[key]
+        assert matrix_stats["matched_count"] == 2
+        assert matrix_stats["unmatched_v1"] == 1
+        assert matrix_stats["unmatched_v2"] == 1
+
+    def test_matrix_mode_confidence_thresholds(self):
+        """HIGH/MEDIUM/LOW thresholds are preserved in matrix mode"""
+        vectors = {
+            "h1": [1.0, 0.0, 0.0, 0.0], "h2": [0.95, 0.3122, 0.0, 0.0],
+            "m1": [0.0, 0.0, 1.0, 0.0], "m2": [0.0, 0.0, 0.8, 0.6],
+        }
+        v1 = [{"id": 1, "text": "h1"}, {"id": 2, "text": "m1"}]
+        v2 = [{"id": 1, "text": "h2"}, {"id": 2, "text": "m2"}]
+
+        matches, _ = self._run(vectors, v1, v2, "matrix")
+
+        assert [m["match_confidence"] for m in matches] == ["HIGH", "MEDIUM"]
+        assert matches[0]["threshold_used"] == 0.90
+        assert matches[1]["threshold_used"] == 0.75
+
+    def test_dimension_mismatch_falls_back_to_greedy(self):
+        """Mixed-dimension embeddings fall back to greedy alignment"""
+        vectors = {"a": [1.0, 0.0], "b": [1.0, 0.0, 0.0]}
+        v1 = [{"id": 1, "text": "a"}]
+        v2 = [{"id": 1, "text": "b"}]
+
+        matches, stats = self._run(vectors, v1, v2, "matrix")
+
+        assert matches == []
+        assert stats["alignment_mode"] == "greedy"
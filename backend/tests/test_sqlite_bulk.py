@@ -0,0 +1,332 @@
+"""
+SQLite Bulk Write Helper Tests
+
+Test Gates:
+- SQLITE-BULK-01: Write connections use WAL, synchronous=NORMAL and a sized page cache
+- SQLITE-BULK-02: write_transaction is atomic; bulk_write commits per chunk
+- SQLITE-BULK-03: Writers (store_intake, snapshots, embedding cache) go through the helper
+- SQLITE-BULK-04: Benchmark storing a 500-clause contract (rows/sec before vs after;
+  timing comparisons run with CIP_RUN_BENCHMARKS=1)
+- SQLITE-BULK-05: Copies of WAL databases include un-checkpointed commits
+"""
+
+import os
+import sqlite3
+import sys
+import time
+from pathlib import Path
+import pytest
+
+# Add backend to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from sqlite_bulk import (
+    WRITE_CACHE_SIZE_KB,
+    bulk_insert,
+    bulk_write,
+    connect_for_write,
+    copy_database,
+    write_transaction,
+)
+
+CLAUSES_SCHEMA = """
+    CREATE TABLE clauses (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        contract_id INTEGER, text TEXT, section_number TEXT, section_title TEXT, clause_type TEXT,
+        verbatim_text TEXT, word_count INTEGER,
+        cce_risk_score REAL, cce_risk_level TEXT, cce_statutory_flag TEXT, cce_cascade_risk INTEGER,
+        embedding_id TEXT, chunk_hash TEXT NOT NULL
+    )
+"""
+
+INSERT_CLAUSE = """
+    INSERT INTO clauses (
+        contract_id, text, section_number, section_title, clause_type,
+        verbatim_text, word_count,
+        cce_risk_score, cce_risk_level, cce_statutory_flag, cce_cascade_risk,
+        embedding_id, chunk_hash
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+
+def _clause_rows(count, contract_id=1):
+    text = "Vendor shall indemnify Customer against all third-party claims. " * 8
+    return [
+        (contract_id, text, f"{n}.1", f"Section {n}", "Legal/Liability", text, 80,
+         6.5, "MEDIUM", None, 0, None, f"{n:016x}")
+        for n in range(count)
+    ]
+
+
+def _count(db_path, table="clauses"):
+    conn = sqlite3.connect(db_path)
+    try:
+        return conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+    finally:
+        conn.close()
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    path = str(tmp_path / "bulk.db")
+    conn = sqlite3.connect(path)
+    conn.execute(CLAUSES_SCHEMA)
+    conn.close()
+    return path
+
+
+# ============================================================================
+# SQLITE-BULK-01: PRAGMAs
+# ============================================================================
+
+class TestPragmas:
+    """Test per-connection write settings"""
+
+    def test_write_connection_pragmas(self, db_path):
+        """WAL, synchronous=NORMAL (1), sized cache"""
+        conn = connect_for_write(db_path, foreign_keys=True)
+        try:
+            assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+            assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1
+            assert conn.execute("PRAGMA cache_size").fetchone()[0] == -WRITE_CACHE_SIZE_KB
+            assert conn.execute("PRAGMA foreign_keys").fetchone()[0] == 1
+        finally:
+            conn.close()
+
+
+# ============================================================================
+# SQLITE-BULK-02: Transactions
+# ============================================================================
+
+class TestTransactions:
+    """Test atomic and chunked writes"""
+
+    def test_bulk_insert_generator(self, db_path):
+        """Generators are consumed in chunks inside one transaction"""
+        with write_transaction(db_path) as conn:
+            written = bulk_insert(conn, INSERT_CLAUSE, iter(_clause_rows(100)), chunk_size=7)
+
+        assert written == 100
+        assert _count(db_path) == 100
+
+    def test_write_transaction_rolls_back(self, db_path):
+        """An error anywhere in the block leaves no rows"""
+        rows = _clause_rows(10) + [(1,) + (None,) * 12]  # chunk_hash NOT NULL
+
+        with pytest.raises(sqlite3.IntegrityError):
+            with write_transaction(db_path) as conn:
+                bulk_insert(conn, INSERT_CLAUSE, rows, chunk_size=4)
+
+        assert _count(db_path) == 0
+
+    def test_bulk_write_commits_per_chunk(self, db_path):
+        """bulk_write keeps chunks committed before a failure"""
+        rows = _clause_rows(10) + [(1,) + (None,) * 12]
+
+        with pytest.raises(sqlite3.IntegrityError):
+            bulk_write(db_path, INSERT_CLAUSE, rows, chunk_size=4)
+
+        assert _count(db_path) == 8
+
+
+# ============================================================================
+# SQLITE-BULK-03: Writers
+# ============================================================================
+
+class TestWriters:
+    """Test writers on the shared path"""
+
+    def test_embedding_cache_put_many(self, tmp_path, monkeypatch):
+        """EmbeddingCache.put_many stores through a WAL write connection"""
+        import embedding_cache
+        monkeypatch.setattr(embedding_cache, "is_flag_enabled", lambda name: True)
+        cache = embedding_cache.EmbeddingCache(str(tmp_path / "emb.db"))
+
+        stored = cache.put_many([(f"clause {n}", b"\x00" * 16, "m", 4) for n in range(50)])
+
+        assert stored == 50
+        assert _count(cache.db_path, "clause_embeddings") == 50
+        conn = sqlite3.connect(cache.db_path)
+        try:
+            assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        finally:
+            conn.close()
+
+    def test_save_comparison_snapshot(self, tmp_path):
+        """save_comparison_snapshot commits and returns the new id"""
+        orchestrator = pytest.importorskip("orchestrator")
+        path = str(tmp_path / "snap.db")
+        conn = sqlite3.connect(path)
+        conn.execute("""
+            CREATE TABLE comparison_snapshots (
+                comparison_id INTEGER PRIMARY KEY AUTOINCREMENT,
+                v1_contract_id INTEGER, v2_contract_id INTEGER,
+                v1_snapshot_id INTEGER, v2_snapshot_id INTEGER,
+                similarity_score REAL, changed_clauses TEXT, risk_delta TEXT, created_at TEXT
+            )
+        """)
+        conn.close()
+
+        comparison_id = orchestrator.save_comparison_snapshot(path, 1, 2, None, None, 91.5, [{"s": 1}], [])
+
+        assert comparison_id == 1
+        assert _count(path, "comparison_snapshots") == 1
+
+
+# ============================================================================
+# SQLITE-BULK-04: Benchmark
+# ============================================================================
+
+def _store_per_row(db_path, rows):
+    """Previous write path: default connection, one execute per row."""
+    conn = sqlite3.connect(db_path)
+    cursor = conn.cursor()
+    for row in rows:
+        cursor.execute(INSERT_CLAUSE, row)
+    conn.commit()
+    conn.close()
+
+
+def _store_bulk(db_path, rows):
+    with write_transaction(db_path) as conn:
+        bulk_insert(conn, INSERT_CLAUSE, rows)
+
+
+class TestBenchmark:
+    """Benchmark: 500-clause contract, before (per-row, default journal) vs after"""
+
+    def _fresh_db(self, tmp_path, name):
+        path = str(tmp_path / f"{name}.db")
+        conn = sqlite3.connect(path)
+        conn.execute(CLAUSES_SCHEMA)
+        conn.close()
+        return path
+
+    def _rows_per_second(self, path, store, rows, runs=7):
+        """Median rows/sec over repeated stores into the same database."""
+        store(path, rows)  # Warm up (first store switches the journal mode)
+        timings = []
+        for _ in range(runs):
+            start = time.perf_counter()
+            store(path, rows)
+            timings.append(time.perf_counter() - start)
+        return len(rows) / sorted(timings)[runs // 2]
+
+    def test_500_clause_contract(self, tmp_path):
+        """One 500-row transaction: reported only, page I/O dominates both paths"""
+        rows = _clause_rows(500)
+        before_path = self._fresh_db(tmp_path, "before")
+        after_path = self._fresh_db(tmp_path, "after")
+
+        before = self._rows_per_second(before_path, _store_per_row, rows)
+        after = self._rows_per_second(after_path, _store_bulk, rows)
+
+        print(f"\n500-clause contract: {before:,.0f} rows/s before -> {after:,.0f} rows/s after")
+        assert _count(after_path) == _count(before_path) == 500 * 8
+
+    @pytest.mark.benchmark
+    def test_500_single_row_commits(self, tmp_path):
+        """Long-lived writers committing per row: WAL + NORMAL skips the journal fsyncs"""
+        rows = _clause_rows(500)
+
+        def per_commit(connect):
+            def run(path, rows):
+                conn = connect(path)
+                try:
+                    for row in rows:
+                        conn.execute(INSERT_CLAUSE, row)
+                        conn.commit()
+                finally:
+                    conn.close()
+            return run
+
+        before = self._rows_per_second(self._fresh_db(tmp_path, "before"), per_commit(sqlite3.connect), rows, runs=3)
+        after = self._rows_per_second(self._fresh_db(tmp_path, "after"), per_commit(connect_for_write), rows, runs=3)
+
+        print(f"\n500 single-row commits: {before:,.0f} rows/s before -> {after:,.0f} rows/s after")
+        assert after > before
+
+    def test_store_intake_500_clauses(self, tmp_path):
+        """store_intake writes a 500-clause contract in one transaction"""
+        pytest.importorskip("dotenv")
+        pytest.importorskip("anthropic")
+        intake_engine = pytest.importorskip("intake_engine")
+        from test_intake_bulk import SCHEMA
+
+        path = str(tmp_path / "contracts.db")
+        conn = sqlite3.connect(path)
+        conn.executescript(SCHEMA)
+        conn.close()
+        clauses = [
+            intake_engine.Clause(
+                section_number=f"{n}.1", section_title=f"Section {n}", clause_type="Legal/Liability",
+                verbatim_text=row[1], word_count=80, cce_risk_score=6.5, cce_risk_level="MEDIUM",
+                chunk_hash=row[-1],
+            )
+            for n, row in enumerate(_clause_rows(500))
+        ]
+
+        start = time.perf_counter()
+        contract_id = intake_engine.store_intake(
+            path, str(tmp_path / "msa.docx"), "hash", clauses, intake_engine.ContractMetadata(), []
+        )
+        elapsed = time.perf_counter() - start
+
+        print(f"\nstore_intake: {500 / elapsed:,.0f} clause rows/s")
+        assert _count(path) == 500
+        assert contract_id == 1
+
+
+# ============================================================================
+# SQLITE-BULK-05: WAL-safe copies
+# ============================================================================
+
+class TestCopyDatabase:
+    """Test copies and restores of databases left in WAL mode"""
+
+    def _hold_wal(self, db_path, rows):
+        """Commit rows through a WAL connection that stays open (no checkpoint on close)."""
+        conn = connect_for_write(db_path)
+        conn.execute("PRAGMA wal_autocheckpoint=0")
+        bulk_insert(conn, INSERT_CLAUSE, rows)
+        conn.commit()
+        return conn
+
+    def test_copy_includes_wal_commits(self, db_path, tmp_path):
+        """Commits still in -wal are in the copy"""
+        writer = self._hold_wal(db_path, _clause_rows(20))
+        try:
+            assert os.path.getsize(db_path + "-wal") > 0
+            backup = copy_database(db_path, tmp_path / "backup.db")
+        finally:
+            writer.close()
+
+        assert _count(str(backup)) == 20
+        assert not os.path.exists(str(backup) + "-wal")
+
+    def test_restore_discards_stale_wal(self, db_path, tmp_path):
+        """Restoring over a WAL database leaves no -wal/-shm to replay"""
+        backup = copy_database(db_path, tmp_path / "backup.db")
+        writer = self._hold_wal(db_path, _clause_rows(20))
+        writer.close()
+
+        copy_database(backup, db_path)
+
+        assert not os.path.exists(db_path + "-wal")
+        assert not os.path.exists(db_path + "-shm")
+        assert _count(db_path) == 0
+
+    def test_backup_database_restore(self, db_path, tmp_path, monkeypatch):
+        """backup_database.restore_backup uses the WAL-safe copy"""
+        backup_database = pytest.importorskip("backup_database")
+        monkeypatch.setattr(backup_database, "BACKUP_DIR", tmp_path)
+        monkeypatch.setattr(backup_database, "DATABASES", {"contracts": Path(db_path)})
+        backup = copy_database(db_path, tmp_path / "contracts_backup_20260101_000000.db")
+        self._hold_wal(db_path, _clause_rows(20)).close()
+
+        assert backup_database.restore_backup(backup, "contracts")
+
+        safety = next(tmp_path.glob("contracts_pre_restore_backup_*.db"))
+        assert _count(str(safety)) == 20
+        assert _count(db_path) == 0
+        assert not os.path.exists(db_path + "-wal")
@@ -0,0 +1,211 @@
+"""
+SSE EventBuffer Tests
+
+Test Gates:
+- EVENT-BUFFER-01: Lookups match a linear scan, including late (out-of-order) appends
+- EVENT-BUFFER-02: Size and age eviction keep the newest events
+- EVENT-BUFFER-03: Gap detection by range math
+- EVENT-BUFFER-04: Per-append cost does not grow with buffer size (benchmark, CIP_RUN_BENCHMARKS=1)
+"""
+
+import os
+import random
+import sys
+import time
+from datetime import datetime, timedelta
+from unittest.mock import patch
+import pytest
+
+# Add backend to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from sse.envelope import EventEnvelope, EventType
+from sse.replay import BufferConfig, EventBuffer, ReplayRequest, create_replay_controller
+
+
+def _event(sequence, timestamp=None):
+    envelope = EventEnvelope(
+        event_id=f"evt_{sequence}",
+        sequence=sequence,
+        event_type=EventType.COMPARE_NARRATIVE,
+        payload={"n": sequence},
+    )
+    if timestamp is not None:
+        envelope.timestamp = timestamp
+    return envelope
+
+
+def _sequences(events):
+    return [e.sequence for e in events]
+
+
+# ============================================================================
+# EVENT-BUFFER-01: Lookups
+# ============================================================================
+
+class TestLookups:
+    """Test bisect lookups against a linear scan"""
+
+    def test_randomized_against_reference(self):
+        """Random appends (with gaps and late arrivals) match a sorted scan"""
+        rng = random.Random(5)
+        buffer = EventBuffer(BufferConfig(max_events=10_000, max_age_seconds=0))
+        reference = []
+
+        sequence = 0
+        for _ in range(2000):
+            sequence += rng.choice([1, 1, 1, 2, 5])
+            late = sequence - rng.randint(1, 4) if rng.random() < 0.05 else sequence
+            if late in reference:
+                continue
+            buffer.append(_event(late))
+            reference.append(late)
+        reference.sort()
+
+        for _ in range(200):
+            start = rng.randint(0, sequence)
+            end = start + rng.randint(0, 50)
+            limit = rng.choice([None, 1, 10])
+            expected_from = [s for s in reference if s >= start][:limit] if limit else [s for s in reference if s >= start]
+            assert _sequences(buffer.get_events_from_sequence(start, limit)) == expected_from
+            assert _sequences(buffer.get_events_in_range(start, end)) == [s for s in reference if start <= s <= end]
+
+        assert buffer.get_sequence_range() == (reference[0], reference[-1])
+        assert buffer.size() == len(reference)
+
+    def test_get_event(self):
+        """get_event returns the buffered event or None"""
+        buffer = EventBuffer()
+        for seq in (1, 2, 4):
+            buffer.append(_event(seq))
+
+        assert buffer.get_event(4).event_id == "evt_4"
+        assert buffer.get_event(3) is None
+        assert buffer.get_event(99) is None
+
+    def test_replay_controller_order(self):
+        """ReplayController replays in sequence order from the buffer"""
+        buffer, controller = create_replay_controller()
+        for seq in (1, 3, 2, 4):
+            buffer.append(_event(seq))
+
+        replayed = list(controller.replay_events(ReplayRequest(session_id="s", from_sequence=2)))
+
+        assert _sequences(replayed) == [2, 3, 4]
+
+
+# ============================================================================
+# EVENT-BUFFER-02: Eviction
+# ============================================================================
+
+class TestEviction:
+    """Test size and age eviction"""
+
+    def test_size_eviction_keeps_newest(self):
+        """Only the newest max_events are kept, across compactions"""
+        buffer = EventBuffer(BufferConfig(max_events=100, max_age_seconds=0))
+        for seq in range(1, 1001):
+            buffer.append(_event(seq))
+
+        assert buffer.size() == 100
+        assert buffer.get_sequence_range() == (901, 1000)
+        assert _sequences(buffer.get_events_from_sequence(0)) == list(range(901, 1001))
+        assert buffer.get_event(900) is None
+
+    def test_dead_prefix_is_compacted(self):
+        """Evicted events do not accumulate in memory"""
+        buffer = EventBuffer(BufferConfig(max_events=50, max_age_seconds=0))
+        for seq in range(1, 10_001):
+            buffer.append(_event(seq))
+
+        assert len(buffer._events) <= 100
+
+    def test_age_eviction(self):
+        """Events older than max_age_seconds are evicted on append"""
+        buffer = EventBuffer(BufferConfig(max_events=100, max_age_seconds=60))
+        old = (datetime.now() - timedelta(seconds=120)).isoformat()
+        for seq in range(1, 6):
+            buffer.append(_event(seq, timestamp=old))
+
+        buffer._next_age_check = 0.0
+        buffer.append(_event(6))
+
+        assert _sequences(buffer.get_events_from_sequence(0)) == [6]
+        assert buffer.get_sequence_range() == (6, 6)
+
+    def test_age_scan_is_throttled(self):
+        """The age scan runs at most once per AGE_CHECK_INTERVAL"""
+        buffer = EventBuffer(BufferConfig(max_events=100, max_age_seconds=60))
+        with patch("sse.replay.datetime", wraps=datetime) as clock:
+            for seq in range(1, 101):
+                buffer.append(_event(seq))
+
+        assert clock.now.call_count == 1
+
+    def test_clear(self):
+        """clear() empties the buffer and resets the range"""
+        buffer = EventBuffer()
+        buffer.append(_event(1))
+
+        buffer.clear()
+
+        assert buffer.size() == 0
+        assert buffer.get_sequence_range() == (0, 0)
+
+
+# ============================================================================
+# EVENT-BUFFER-03: Gap Detection
+# ============================================================================
+
+class TestGapDetection:
+    """Test detect_gaps"""
+
+    def _buffer(self, sequences):
+        buffer = EventBuffer()
+        for seq in sequences:
+            buffer.append(_event(seq))
+        return buffer
+
+    def test_gaps(self):
+        """Leading, inner and trailing gaps are reported"""
+        buffer = self._buffer([3, 4, 7, 10])
+
+        assert buffer.detect_gaps(1, 12) == [(1, 2), (5, 6), (8, 9), (11, 12)]
+        assert buffer.detect_gaps(3, 4) == []
+        assert buffer.detect_gaps(20, 22) == [(20, 22)]
+
+    def test_wide_range_is_fast(self):
+        """A huge empty range does not iterate every sequence (it would never return)"""
+        buffer = self._buffer([5])
+
+        gaps = buffer.detect_gaps(1, 10 ** 12)
+
+        assert gaps == [(1, 4), (6, 10 ** 12)]
+
+
+# ============================================================================
+# EVENT-BUFFER-04: Microbenchmark
+# ============================================================================
+
+class TestAppendCost:
+    """Benchmark: per-append cost is constant in buffer size"""
+
+    def _append_cost(self, max_events, count=20_000):
+        buffer = EventBuffer(BufferConfig(max_events=max_events, max_age_seconds=300))
+        events = [_event(seq) for seq in range(1, count + 1)]
+        for event in events[:max_events]:
+            buffer.append(event)
+
+        start = time.perf_counter()
+        for event in events[max_events:]:
+            buffer.append(event)
+        return (time.perf_counter() - start) / (count - max_events)
+
+    @pytest.mark.benchmark
+    def test_append_cost_flat(self):
+        """Appending to a 10k buffer costs about the same as to a 100 buffer"""
+        small = min(self._append_cost(100) for _ in range(3))
+        large = min(self._append_cost(10_000) for _ in range(3))
+
+        assert large < small * 3
+        assert large < 50e-6
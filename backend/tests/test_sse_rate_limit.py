@@ -0,0 +1,235 @@
+"""
+SSE Rate Limit Store Tests
+
+Test Gates:
+- RATE-LIMIT-01: RateLimitMiddleware behavior (burst, retry_after, remaining)
+- RATE-LIMIT-02: Bounded memory via LRU ceiling and idle expiry; peeking never allocates
+- RATE-LIMIT-03: Concurrent consumers never double-spend
+- RATE-LIMIT-04: SQLite shared mode holds limits across processes
+- RATE-LIMIT-05: Benchmark at 10k distinct keys
+"""
+
+import multiprocessing
+import os
+import sys
+import threading
+import time
+import pytest
+
+# Add backend to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from sse.exceptions import RateLimitExceededError
+from sse.middleware import MiddlewareContext, RateLimitMiddleware
+from sse.rate_limit import ShardedBucketStore, SQLiteBucketStore
+
+
+class FakeClock:
+    def __init__(self, now=1000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+def _consume_shared(db_path, attempts, queue):
+    """Worker: try attempts consumes on one shared key."""
+    store = SQLiteBucketStore(db_path, rate_per_second=0.001, burst_size=20)
+    queue.put(sum(1 for _ in range(attempts) if store.consume("ip:shared")[0]))
+
+
+# ============================================================================
+# RATE-LIMIT-01: Middleware
+# ============================================================================
+
+class TestMiddleware:
+    """Test RateLimitMiddleware on the default store"""
+
+    def test_burst_then_rejected(self):
+        """Burst requests pass, the next raises with retry_after"""
+        middleware = RateLimitMiddleware(requests_per_minute=60, burst_size=3)
+        context = MiddlewareContext(client_ip="10.0.0.1")
+
+        remaining = [middleware.process(context).metadata["rate_limit_remaining"] for _ in range(3)]
+
+        assert remaining == [2, 1, 0]
+        with pytest.raises(RateLimitExceededError) as exc:
+            middleware.process(context)
+        assert exc.value.to_dict()["details"]["retry_after"] in (0, 1)
+
+    def test_keys_by_user_then_ip(self):
+        """User id takes precedence over IP"""
+        middleware = RateLimitMiddleware(burst_size=1)
+        context = MiddlewareContext(client_ip="10.0.0.1", user_id="u1")
+
+        assert middleware.process(context).metadata["rate_limit_key"] == "user:u1"
+        middleware.process(MiddlewareContext(client_ip="10.0.0.1"))  # Separate bucket
+
+    def test_get_remaining_does_not_allocate(self):
+        """Peeking at unknown keys creates no buckets"""
+        middleware = RateLimitMiddleware(burst_size=5)
+
+        assert all(middleware._get_remaining(f"ip:{i}") == 5 for i in range(1000))
+        assert middleware._store.size() == 0
+
+    def test_shared_db_path_selects_sqlite(self, tmp_path):
+        """shared_db_path switches to the SQLite store"""
+        middleware = RateLimitMiddleware(shared_db_path=str(tmp_path / "limits.db"))
+
+        assert isinstance(middleware._store, SQLiteBucketStore)
+
+
+# ============================================================================
+# RATE-LIMIT-02: Bounded Memory
+# ============================================================================
+
+class TestBoundedMemory:
+    """Test LRU ceiling and idle expiry"""
+
+    def test_lru_ceiling(self):
+        """A flood of distinct keys never exceeds max_keys"""
+        store = ShardedBucketStore(1.0, 5, max_keys=100, shards=4)
+
+        for i in range(10_000):
+            store.consume(f"ip:{i}")
+
+        assert store.size() <= 100
+        assert store.get_stats()["lru_evictions"] >= 9_900
+
+    def test_active_key_survives_flood(self):
+        """Recently used keys are not evicted by new ones"""
+        store = ShardedBucketStore(0.001, 2, max_keys=64, shards=1)
+        store.consume("ip:hot")
+        store.consume("ip:hot")
+
+        for i in range(1000):
+            store.consume(f"ip:{i}")
+            if i % 10 == 0:
+                assert store.consume("ip:hot")[0] is False  # Still limited
+
+    def test_idle_buckets_expire(self):
+        """Fully refilled buckets are dropped as new keys arrive"""
+        clock = FakeClock()
+        store = ShardedBucketStore(1.0, 5, shards=1, clock=clock)
+        for i in range(4):
+            store.consume(f"ip:{i}")
+
+        clock.now += 10  # > burst / rate
+        store.consume("ip:new")
+
+        assert store.size() == 1
+        assert store.get_stats()["expired_evictions"] == 4
+
+    def test_expired_bucket_equals_fresh(self):
+        """A dropped idle bucket would have been full anyway"""
+        clock = FakeClock()
+        store = ShardedBucketStore(1.0, 5, shards=1, clock=clock)
+        store.consume("ip:a")
+        clock.now += 10
+
+        assert store.peek("ip:a") == 5
+
+
+# ============================================================================
+# RATE-LIMIT-03: Concurrency
+# ============================================================================
+
+class TestConcurrency:
+    """Test atomic consume"""
+
+    def test_no_double_spend(self):
+        """16 threads on one key get exactly burst tokens"""
+        store = ShardedBucketStore(0.001, 100)
+        allowed = []
+        lock = threading.Lock()
+
+        def hammer():
+            count = sum(1 for _ in range(50) if store.consume("ip:shared")[0])
+            with lock:
+                allowed.append(count)
+
+        threads = [threading.Thread(target=hammer) for _ in range(16)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert sum(allowed) == 100
+
+
+# ============================================================================
+# RATE-LIMIT-04: Shared Mode
+# ============================================================================
+
+class TestSharedMode:
+    """Test SQLiteBucketStore"""
+
+    def test_refill(self, tmp_path):
+        """Tokens refill with time"""
+        clock = FakeClock()
+        store = SQLiteBucketStore(str(tmp_path / "limits.db"), 1.0, 2, clock=clock)
+
+        assert [store.consume("k")[0] for _ in range(3)] == [True, True, False]
+        clock.now += 1.0
+        assert store.consume("k")[0] is True
+
+    def test_peek_does_not_allocate(self, tmp_path):
+        """peek() on unknown keys inserts nothing"""
+        store = SQLiteBucketStore(str(tmp_path / "limits.db"), 1.0, 4)
+
+        assert store.peek("unknown") == 4
+        assert store.size() == 0
+
+    def test_sweep_removes_idle(self, tmp_path):
+        """The periodic sweep deletes fully refilled buckets"""
+        clock = FakeClock()
+        store = SQLiteBucketStore(str(tmp_path / "limits.db"), 1.0, 2, clock=clock)
+        store.consume("old")
+
+        clock.now += store.SWEEP_INTERVAL + 10
+        store.consume("new")
+
+        assert store.size() == 1
+
+    def test_limit_holds_across_processes(self, tmp_path):
+        """4 processes sharing one key get burst tokens in total"""
+        db_path = str(tmp_path / "limits.db")
+        SQLiteBucketStore(db_path, 0.001, 20)  # Create schema first
+        context = multiprocessing.get_context("spawn")
+        queue = context.Queue()
+        workers = [context.Process(target=_consume_shared, args=(db_path, 30, queue)) for _ in range(4)]
+        for worker in workers:
+            worker.start()
+        allowed = [queue.get(timeout=120) for _ in workers]
+        for worker in workers:
+            worker.join(timeout=30)
+
+        assert sum(allowed) == 20
+
+
+# ============================================================================
+# RATE-LIMIT-05: Benchmark
+# ============================================================================
+
+class TestBenchmark:
+    """Benchmark: 10k distinct keys from 8 threads"""
+
+    def test_10k_keys_concurrent(self):
+        """160k consumes over 10k keys stay bounded and fast"""
+        store = ShardedBucketStore(1.0, 10, max_keys=5_000)
+        keys = [f"ip:10.{i // 256}.{i % 256}.1" for i in range(10_000)]
+
+        def run(offset):
+            for i in range(20_000):
+                store.consume(keys[(i * 7 + offset) % len(keys)])
+
+        threads = [threading.Thread(target=run, args=(n * 1250,)) for n in range(8)]
+        start = time.perf_counter()
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        elapsed = time.perf_counter() - start
+
+        print(f"\n160k consumes over 10k keys (8 threads): {elapsed * 1000:.0f} ms")
+        assert store.size() <= 5_000
@@ -0,0 +1,179 @@
+"""
+Database Sequence Generator Tests
+
+Test Gates:
+- SEQ-DB-01: Sequences are served from reserved blocks (one transaction per block)
+- SEQ-DB-02: Reservations persist across generator instances and reset
+- SEQ-DB-03: Concurrent processes never receive the same sequence
+- SEQ-DB-04: create_sequence_generator selects the database generator
+"""
+
+import multiprocessing
+import os
+import sqlite3
+import sys
+import threading
+import pytest
+from unittest.mock import patch
+
+# Add backend to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from sse.sequence import DatabaseSequenceGenerator, create_sequence_generator
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    return str(tmp_path / "sequences.db")
+
+
+def _draw(db_path, count, block_size, queue):
+    """Worker: draw count sequences and report them."""
+    generator = DatabaseSequenceGenerator(connection_string=db_path, block_size=block_size)
+    queue.put([generator.next() for _ in range(count)])
+
+
+# ============================================================================
+# SEQ-DB-01: Block Allocation
+# ============================================================================
+
+class TestBlockAllocation:
+    """Test hi/lo block serving"""
+
+    def test_sequences_are_consecutive(self, db_path):
+        """A single generator issues 1..n"""
+        generator = DatabaseSequenceGenerator(connection_string=db_path, block_size=10)
+
+        assert [generator.next() for _ in range(25)] == list(range(1, 26))
+        assert generator.current() == 25
+
+    def test_one_reservation_per_block(self, db_path):
+        """The database is touched only when a block runs out"""
+        generator = DatabaseSequenceGenerator(connection_string=db_path, block_size=10)
+
+        with patch.object(generator, "_reserve_block", wraps=generator._reserve_block) as reserve:
+            for _ in range(25):
+                generator.next()
+
+        assert reserve.call_count == 3
+        assert generator.get_stats()["block_end"] == 30
+
+    def test_threads_share_generator(self, db_path):
+        """Concurrent next() calls in one process are unique"""
+        generator = DatabaseSequenceGenerator(connection_string=db_path, block_size=7)
+        results = []
+        lock = threading.Lock()
+
+        def draw():
+            values = [generator.next() for _ in range(500)]
+            with lock:
+                results.extend(values)
+
+        threads = [threading.Thread(target=draw) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert sorted(results) == list(range(1, 4001))
+
+    def test_invalid_arguments(self, db_path):
+        """Table names must be identifiers; block size must be positive"""
+        with pytest.raises(ValueError):
+            DatabaseSequenceGenerator(table_name="seq; DROP TABLE x", connection_string=db_path)
+        with pytest.raises(ValueError):
+            DatabaseSequenceGenerator(connection_string=db_path, block_size=0)
+
+
+# ============================================================================
+# SEQ-DB-02: Persistence
+# ============================================================================
+
+class TestPersistence:
+    """Test state shared through the database"""
+
+    def test_new_instance_skips_reserved_block(self, db_path):
+        """A restarted generator continues after the last reserved block"""
+        first = DatabaseSequenceGenerator(connection_string=db_path, block_size=10)
+        first.next()
+
+        second = DatabaseSequenceGenerator(connection_string=db_path, block_size=10)
+
+        assert second.current() == 10  # High-water mark before issuing
+        assert second.next() == 11
+
+    def test_two_generators_interleave_blocks(self, db_path):
+        """Generators on the same name get disjoint blocks"""
+        a = DatabaseSequenceGenerator(connection_string=db_path, block_size=5)
+        b = DatabaseSequenceGenerator(connection_string=db_path, block_size=5)
+
+        values = [a.next(), b.next(), a.next(), b.next()]
+
+        assert values == [1, 6, 2, 7]
+
+    def test_names_are_independent(self, db_path):
+        """Each sequence_name has its own counter"""
+        a = DatabaseSequenceGenerator(connection_string=db_path, sequence_name="a")
+        b = DatabaseSequenceGenerator(connection_string=db_path, sequence_name="b")
+
+        assert a.next() == 1
+        assert b.next() == 1
+
+    def test_reset(self, db_path):
+        """reset() restarts allocation after the given value"""
+        generator = DatabaseSequenceGenerator(connection_string=db_path, block_size=10)
+        generator.next()
+
+        generator.reset(500)
+
+        assert generator.next() == 501
+        conn = sqlite3.connect(db_path)
+        try:
+            stored = conn.execute("SELECT sequence_value FROM sse_sequences").fetchone()[0]
+        finally:
+            conn.close()
+        assert stored == 510
+
+
+# ============================================================================
+# SEQ-DB-03: Multi-Process Stress
+# ============================================================================
+
+class TestMultiProcess:
+    """Stress: concurrent worker processes"""
+
+    def test_processes_get_unique_sequences(self, db_path):
+        """8 processes x 2000 sequences with small blocks never collide"""
+        DatabaseSequenceGenerator(connection_string=db_path)  # Create schema first
+        context = multiprocessing.get_context("spawn")
+        queue = context.Queue()
+        workers = [
+            context.Process(target=_draw, args=(db_path, 2000, 25, queue))
+            for _ in range(8)
+        ]
+        for worker in workers:
+            worker.start()
+        results = [queue.get(timeout=120) for _ in workers]
+        for worker in workers:
+            worker.join(timeout=30)
+
+        issued = [value for values in results for value in values]
+        assert len(issued) == len(set(issued)) == 16000
+        assert all(values == sorted(values) for values in results)
+        assert max(issued) == 16000  # Every block was fully used
+
+
+# ============================================================================
+# SEQ-DB-04: Factory
+# ============================================================================
+
+class TestFactory:
+    """Test create_sequence_generator"""
+
+    def test_factory_database(self, db_path):
+        """generator_type="database" passes options through"""
+        generator = create_sequence_generator("database", connection_string=db_path, block_size=4)
+
+        assert isinstance(generator, DatabaseSequenceGenerator)
+        assert generator.get_stats()["block_size"] == 4
+        assert generator.next() == 1
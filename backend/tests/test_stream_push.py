@@ -0,0 +1,307 @@
+"""
+Push-Based Stream Delivery Tests
+
+Test Gates:
+- STREAM-PUSH-01: Appends wake subscribers of the session only
+- STREAM-PUSH-02: Idle streams block instead of polling; new events flush immediately
+- STREAM-PUSH-03: Keepalive bookkeeping is batched into one write per flush
+- STREAM-PUSH-04: Hundreds of idle streams use near-zero CPU
+"""
+
+import os
+import sys
+import threading
+import time
+import uuid
+import pytest
+from unittest.mock import patch
+
+# Add backend to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from api.v1 import stream as stream_api
+from event_log import EventLogEntry, EventLogRepository, EventNotifier
+from session_state import (
+    KeepaliveBatcher,
+    SessionStateRepository,
+    SSEConnectionInfo,
+)
+
+
+@pytest.fixture
+def notifier():
+    return EventNotifier()
+
+
+@pytest.fixture
+def event_repo(tmp_path, notifier):
+    return EventLogRepository(db_path=str(tmp_path / "events.db"), notifier=notifier)
+
+
+@pytest.fixture
+def session_repo(tmp_path):
+    return SessionStateRepository(db_path=str(tmp_path / "sessions.db"))
+
+
+def _entry(session_id, sequence, event_type="compare_narrative"):
+    return EventLogEntry(
+        event_id=str(uuid.uuid4()),
+        session_id=session_id,
+        sequence=sequence,
+        event_type=event_type,
+        timestamp="2025-01-01T00:00:00+00:00",
+        payload={"n": sequence},
+    )
+
+
+def _connect(session_repo, session_id="sess-1"):
+    """Register an active connection like the stream endpoint does."""
+    session = session_repo.get_or_create_session(session_id)
+    connection = SSEConnectionInfo()
+    connection.mark_connected()
+    session.add_connection(connection)
+    session_repo.save_session(session)
+    return connection.connection_id
+
+
+class StreamReader:
+    """Consumes a handler's stream on a background thread."""
+
+    def __init__(self, handler):
+        self.handler = handler
+        self.frames = []
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        for chunk in self.handler.generate_stream():
+            self.frames.append(chunk)
+
+    def wait_for(self, count, timeout=2.0):
+        deadline = time.monotonic() + timeout
+        while len(self.frames) < count and time.monotonic() < deadline:
+            time.sleep(0.005)
+        return len(self.frames) >= count
+
+    def stop(self):
+        self.handler.close()
+        self._thread.join(timeout=2.0)
+        return not self._thread.is_alive()
+
+
+# ============================================================================
+# STREAM-PUSH-01: Notifier
+# ============================================================================
+
+class TestNotifier:
+    """Test append notification"""
+
+    def test_append_wakes_session_subscriber(self, event_repo):
+        """append wakes subscribers of its session"""
+        subscription = event_repo.subscribe("sess-1")
+
+        event_repo.append(_entry("sess-1", 1))
+
+        assert subscription.wait(0) is True
+        assert subscription.wait(0) is False  # Flag cleared after wakeup
+
+    def test_other_sessions_not_woken(self, event_repo):
+        """Appends for another session do not wake the subscriber"""
+        subscription = event_repo.subscribe("sess-1")
+
+        event_repo.append(_entry("sess-2", 1))
+
+        assert subscription.wait(0) is False
+
+    def test_append_batch_wakes_each_session_once(self, event_repo, notifier):
+        """append_batch notifies every affected session in one call"""
+        first = event_repo.subscribe("sess-1")
+        second = event_repo.subscribe("sess-2")
+
+        event_repo.append_batch([_entry("sess-1", 1), _entry("sess-1", 2), _entry("sess-2", 1)])
+
+        assert first.wait(0) and second.wait(0)
+        assert notifier.get_stats()["notifications"] == 1
+
+    def test_duplicate_append_does_not_notify(self, event_repo):
+        """A rejected append wakes no one"""
+        entry = _entry("sess-1", 1)
+        event_repo.append(entry)
+        subscription = event_repo.subscribe("sess-1")
+
+        assert event_repo.append(entry) is False
+        assert subscription.wait(0) is False
+
+    def test_close_unsubscribes_and_wakes(self, event_repo, notifier):
+        """Closing removes the subscription and releases a waiter"""
+        subscription = event_repo.subscribe("sess-1")
+        waiter = threading.Thread(target=subscription.wait, args=(5,))
+        waiter.start()
+
+        subscription.close()
+        waiter.join(timeout=1.0)
+
+        assert not waiter.is_alive()
+        assert notifier.subscriber_count() == 0
+
+
+# ============================================================================
+# STREAM-PUSH-02: Live Delivery
+# ============================================================================
+
+class TestLiveDelivery:
+    """Test SSEStreamHandler blocks and flushes on append"""
+
+    def _handler(self, session_repo, event_repo, **kwargs):
+        return stream_api.SSEStreamHandler(
+            session_id="sess-1",
+            connection_id=_connect(session_repo),
+            session_repo=session_repo,
+            event_repo=event_repo,
+            **kwargs,
+        )
+
+    def test_event_flushed_on_append(self, session_repo, event_repo):
+        """An event appended while the stream is idle is sent at once"""
+        reader = StreamReader(self._handler(session_repo, event_repo))
+        assert reader.wait_for(1)  # handshake
+
+        start = time.monotonic()
+        event_repo.append(_entry("sess-1", 1))
+        assert reader.wait_for(2)
+        latency = time.monotonic() - start
+
+        assert reader.stop()
+        assert "id: 1\nevent: compare_narrative" in reader.frames[1]
+        assert latency < 0.5
+
+    def test_idle_stream_does_not_poll(self, session_repo, event_repo):
+        """An idle stream reads the log once, then waits"""
+        reader = StreamReader(self._handler(session_repo, event_repo))
+        assert reader.wait_for(1)
+
+        with patch.object(event_repo, "get_events_from_sequence",
+                          wraps=event_repo.get_events_from_sequence) as reads:
+            time.sleep(0.5)
+            assert reads.call_count == 0
+
+        assert reader.stop()
+        assert len(reader.frames) == 1  # No empty filler chunks
+
+    def test_large_backlog_drained_in_batches(self, session_repo, event_repo):
+        """More than one batch of new events is delivered in order"""
+        reader = StreamReader(self._handler(session_repo, event_repo))
+        assert reader.wait_for(1)
+
+        event_repo.append_batch([_entry("sess-1", seq) for seq in range(1, 251)])
+        assert reader.wait_for(251)
+        assert reader.stop()
+
+        ids = [int(f.split("\n")[0][4:]) for f in reader.frames[1:]]
+        assert ids == list(range(1, 251))
+
+    def test_close_releases_waiting_stream(self, session_repo, event_repo, notifier):
+        """close() ends a blocked stream and unsubscribes it"""
+        reader = StreamReader(self._handler(session_repo, event_repo))
+        assert reader.wait_for(1)
+
+        assert reader.stop()
+        assert notifier.subscriber_count("sess-1") == 0
+
+
+# ============================================================================
+# STREAM-PUSH-03: Keepalive Batching
+# ============================================================================
+
+class TestKeepaliveBatching:
+    """Test keepalive bookkeeping"""
+
+    def test_keepalives_do_not_load_sessions(self, session_repo, event_repo):
+        """Keepalives are recorded in memory, not via get/save_session"""
+        batcher = KeepaliveBatcher(session_repo, flush_interval=60)
+        handler = stream_api.SSEStreamHandler(
+            session_id="sess-1",
+            connection_id=_connect(session_repo),
+            session_repo=session_repo,
+            event_repo=event_repo,
+            keepalive_batcher=batcher,
+        )
+
+        with patch.object(stream_api, "SSE_KEEPALIVE_INTERVAL", 0.02), \
+             patch.object(session_repo, "get_session", side_effect=AssertionError("loaded")), \
+             patch.object(session_repo, "save_session", side_effect=AssertionError("saved")):
+            reader = StreamReader(handler)
+            assert reader.wait_for(4)  # handshake + 3 keepalives
+            assert reader.stop()
+
+        assert all("event: keepalive" in f for f in reader.frames[1:4])
+        assert batcher.get_stats()["recorded"] >= 3
+
+    def test_flush_writes_all_connections_at_once(self, session_repo):
+        """One flush updates every pending connection"""
+        ids = [_connect(session_repo, f"sess-{i}") for i in range(20)]
+        batcher = KeepaliveBatcher(session_repo, flush_interval=60)
+        for connection_id in ids:
+            batcher.record(connection_id)
+
+        with patch.object(session_repo, "record_keepalives",
+                          wraps=session_repo.record_keepalives) as writes:
+            assert batcher.flush() == 20
+
+        assert writes.call_count == 1
+        assert batcher.get_stats()["pending"] == 0
+
+    def test_record_flushes_when_interval_elapsed(self, session_repo):
+        """record() flushes once the flush interval has passed"""
+        connection_id = _connect(session_repo)
+        batcher = KeepaliveBatcher(session_repo, flush_interval=0)
+
+        batcher.record(connection_id)
+
+        stats = batcher.get_stats()
+        assert stats["flushes"] == 1
+        assert stats["rows_written"] == 1
+
+    def test_discard_drops_pending(self, session_repo):
+        """Closed connections are not written"""
+        connection_id = _connect(session_repo)
+        batcher = KeepaliveBatcher(session_repo, flush_interval=60)
+        batcher.record(connection_id)
+
+        batcher.discard(connection_id)
+
+        assert batcher.flush() == 0
+
+
+# ============================================================================
+# STREAM-PUSH-04: Idle Cost
+# ============================================================================
+
+class TestIdleCost:
+    """Benchmark: idle connections cost near-zero CPU"""
+
+    def test_200_idle_streams(self, session_repo, event_repo):
+        """200 open idle streams use under 0.2 s CPU per second"""
+        batcher = KeepaliveBatcher(session_repo, flush_interval=60)
+        readers = []
+        for i in range(200):
+            handler = stream_api.SSEStreamHandler(
+                session_id=f"sess-{i}",
+                connection_id=str(uuid.uuid4()),
+                session_repo=session_repo,
+                event_repo=event_repo,
+                keepalive_batcher=batcher,
+            )
+            readers.append(StreamReader(handler))
+        assert all(r.wait_for(1) for r in readers)
+
+        cpu_start = time.process_time()
+        time.sleep(1.0)
+        idle_cpu = time.process_time() - cpu_start
+
+        event_repo.append(_entry("sess-7", 1))
+        assert readers[7].wait_for(2)
+        assert all(r.stop() for r in readers)
+
+        assert idle_cpu < 0.2
+        assert all(len(r.frames) == 1 for i, r in enumerate(readers) if i != 7)
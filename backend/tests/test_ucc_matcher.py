@@ -15,7 +15,15 @@ backend_path = Path(__file__).resolve().parents[1]
 if str(backend_path) not in sys.path:
     sys.path.insert(0, str(backend_path))
 
+import random
+import re
+import time
+
+import pytest
+
 from ucc_statutory_matcher import (
+    CompiledUCCMatcher,
+    get_compiled_matcher,
     load_ucc_rules,
     match_ucc_violations,
     classify_ucc_severity,
@@ -322,6 +330,118 @@ class TestEdgeCases(unittest.TestCase):
             self.assertEqual(match_upper.rule_id, match_mixed.rule_id)
 
 
+def reference_match(clause_text, rules):
+    """Original per-concept regex matcher, kept as the equivalence oracle."""
+    if not clause_text or not rules:
+        return None
+    text = clause_text.lower()
+    matches = []
+    for rule in rules:
+        concepts = [
+            c for c in rule.trigger_concepts
+            if re.search(r'\b' + re.escape(c.lower()) + r'\b', text)
+        ]
+        if concepts:
+            matches.append((rule, concepts))
+    if not matches:
+        return None
+    rule, concepts = max(matches, key=lambda m: m[0].risk_multiplier)
+    return rule.rule_id, concepts
+
+
+class TestCompiledMatcher(unittest.TestCase):
+    """Test the compiled single-pass matcher against the original algorithm."""
+
+    CORPUS = [
+        "Seller's sole remedy is repair or replacement. Buyer expressly waives "
+        "all claims for consequential damages, including lost profits.",
+        "Full prepayment of $100,000 is required before work commences. "
+        "Payment is non-refundable under any circumstances.",
+        "Vendor shall not be liable for any damages whatsoever, including "
+        "those arising from gross negligence or willful misconduct.",
+        "The Parties agree to negotiate in good faith. This Agreement shall "
+        "be governed by Delaware law. Both parties shall cooperate reasonably.",
+        "Equipment is sold AS IS, WITH ALL FAULTS. Seller disclaims all "
+        "warranties of merchantability and fitness for a particular purpose.",
+        "Sole remedy is repair. No liability for consequential damages.",
+        "SOLE REMEDY IS REPAIR. EXCLUSIVE REMEDY.",
+        "Non-refundable deposits; no set-off; E&O coverage; sign-off required.",
+        "non-refundable-deposit sole-remedy E&Oinsurance won't deliver.",
+        "",
+    ]
+
+    def setUp(self):
+        self.rules = load_ucc_rules()
+
+    def _assert_same(self, text):
+        expected = reference_match(text, self.rules)
+        match = match_ucc_violations(text, None, self.rules)
+        actual = (match.rule_id, match.matched_concepts) if match else None
+        self.assertEqual(actual, expected, text)
+
+    def test_corpus_equivalence(self):
+        """Compiled matcher output equals the original on the test corpus."""
+        for text in self.CORPUS:
+            self._assert_same(text)
+
+    def test_randomized_equivalence(self):
+        """Random concept fragments, prefixes and suffixes match the original."""
+        rng = random.Random(16)
+        concepts = [c for rule in self.rules for c in rule.trigger_concepts]
+        filler = ["the", "rate", "cooperate", "-", ",", "'", "&", "x", "_", "s", "."]
+        for _ in range(500):
+            parts = []
+            for _ in range(rng.randint(1, 8)):
+                piece = rng.choice(concepts) if rng.random() < 0.5 else rng.choice(filler)
+                if rng.random() < 0.3:
+                    piece = piece[:rng.randint(1, len(piece))]
+                if rng.random() < 0.5:
+                    piece = piece.upper()
+                parts.append(piece)
+            separator = rng.choice([" ", "", "-", ". "])
+            self._assert_same(separator.join(parts))
+
+    def test_matched_concepts_keep_rule_order(self):
+        """Matched concepts are listed in the rule's trigger order."""
+        rule = UCCRule("R-1", "t", "c", "CAT", ["b concept", "a concept", "A Concept"],
+                       "HIGH", 8.0, "", "")
+
+        match = match_ucc_violations("a concept then b concept", None, [rule])
+
+        self.assertEqual(match.matched_concepts, ["b concept", "a concept", "A Concept"])
+
+    def test_non_word_concept_boundaries(self):
+        """Concepts with leading/trailing punctuation keep \\b semantics."""
+        rule = UCCRule("R-1", "t", "c", "CAT", ["-fee", "fee-"], "HIGH", 8.0, "", "")
+        for text in ["a-fee", "a -fee", "fee-x", "fee- x", "fee-"]:
+            expected = reference_match(text, [rule])
+            match = match_ucc_violations(text, None, [rule])
+            self.assertEqual((match.rule_id, match.matched_concepts) if match else None, expected, text)
+
+    def test_compiled_once_per_rule_list(self):
+        """The compiled matcher is reused for the same rule list."""
+        self.assertIs(get_compiled_matcher(self.rules), get_compiled_matcher(self.rules))
+        self.assertIsInstance(get_compiled_matcher(self.rules), CompiledUCCMatcher)
+
+    @pytest.mark.benchmark
+    def test_single_pass_faster_than_per_concept(self):
+        """Benchmark: compiled scan beats per-concept regex search."""
+        clauses = self.CORPUS[:-1] * 20
+        matcher = get_compiled_matcher(self.rules)
+
+        start = time.perf_counter()
+        for text in clauses:
+            reference_match(text, self.rules)
+        reference_elapsed = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for text in clauses:
+            matcher.match(text)
+        compiled_elapsed = time.perf_counter() - start
+
+        self.assertLess(compiled_elapsed, reference_elapsed)
+
+
 def run_tests():
     """Run all tests with verbose output."""
     loader = unittest.TestLoader()
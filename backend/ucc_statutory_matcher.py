@@ -89,6 +89,140 @@ def load_ucc_rules(json_path: str = None) -> List[UCCRule]:
     return rules
 
 
+# Leading word token of a concept / clause (what \b...\b anchors on)
+_WORD_TOKEN = re.compile(r'\w+')
+_WORD_CHAR = re.compile(r'\w')
+
+
+class CompiledUCCMatcher:
+    """UCC rule set compiled for single-pass clause scanning.
+
+    Every distinct trigger concept is indexed by its leading word token.
+    A clause is tokenized once; each token that starts a concept is checked
+    with a prefix comparison and a trailing word-boundary test. This gives
+    the same hits as searching r'\b<concept>\b' for every concept, without
+    compiling or running one regex per concept per clause.
+    """
+
+    def __init__(self, ucc_rules: List[UCCRule]):
+        """Compile rule set.
+
+        Args:
+            ucc_rules: List of UCCRule objects to match against
+        """
+        self.rules = ucc_rules
+        # leading token -> lowercased concepts starting with it
+        self._by_token: Dict[str, List[str]] = {}
+        # Concepts not starting with a word character keep a regex each
+        self._fallback: Dict[str, "re.Pattern"] = {}
+
+        for rule in ucc_rules:
+            for concept in rule.trigger_concepts:
+                concept_lower = concept.lower()
+                token = _WORD_TOKEN.match(concept_lower)
+                if token is None:
+                    if concept_lower not in self._fallback:
+                        self._fallback[concept_lower] = re.compile(
+                            r'\b' + re.escape(concept_lower) + r'\b'
+                        )
+                    continue
+                concepts = self._by_token.setdefault(token.group(), [])
+                if concept_lower not in concepts:
+                    concepts.append(concept_lower)
+
+    def scan(self, clause_text_lower: str) -> set:
+        """Find every concept present in lowercased clause text.
+
+        Args:
+            clause_text_lower: Lowercased clause text
+
+        Returns:
+            Set of matched lowercased concepts
+        """
+        found = set()
+        text_len = len(clause_text_lower)
+
+        for token in _WORD_TOKEN.finditer(clause_text_lower):
+            concepts = self._by_token.get(token.group())
+            if not concepts:
+                continue
+            start = token.start()
+            for concept in concepts:
+                if concept in found or not clause_text_lower.startswith(concept, start):
+                    continue
+                end = start + len(concept)
+                # Trailing \b: word/non-word transition (or end of text)
+                before_is_word = bool(_WORD_CHAR.match(concept[-1]))
+                after_is_word = end < text_len and bool(_WORD_CHAR.match(clause_text_lower[end]))
+                if before_is_word != after_is_word:
+                    found.add(concept)
+
+        for concept, pattern in self._fallback.items():
+            if pattern.search(clause_text_lower):
+                found.add(concept)
+
+        return found
+
+    def match(self, clause_text: str) -> Optional[UCCMatch]:
+        """Match clause text, returning the highest-severity rule hit.
+
+        Args:
+            clause_text: The contract clause text to analyze
+
+        Returns:
+            UCCMatch object if violation detected, None otherwise
+        """
+        found = self.scan(clause_text.lower())
+        if not found:
+            return None
+
+        best_rule = None
+        best_concepts: List[str] = []
+        for rule in self.rules:
+            matched_concepts = [c for c in rule.trigger_concepts if c.lower() in found]
+            # Strict ">" keeps the first rule among equal multipliers
+            if matched_concepts and (best_rule is None or rule.risk_multiplier > best_rule.risk_multiplier):
+                best_rule = rule
+                best_concepts = matched_concepts
+
+        if best_rule is None:
+            return None
+
+        return UCCMatch(
+            rule_id=best_rule.rule_id,
+            category=best_rule.category,
+            severity=best_rule.severity,
+            risk_multiplier=best_rule.risk_multiplier,
+            matched_concepts=best_concepts,
+            citation=best_rule.citation,
+            business_impact=best_rule.business_impact,
+            si_impact=best_rule.si_impact
+        )
+
+
+# Most recently compiled rule set (the get_ucc_rules() list in production)
+_COMPILED_MATCHER: Optional[CompiledUCCMatcher] = None
+
+
+def get_compiled_matcher(ucc_rules: List[UCCRule]) -> CompiledUCCMatcher:
+    """Get compiled matcher for a rule list, compiling on first use.
+
+    Args:
+        ucc_rules: List of UCCRule objects
+
+    Returns:
+        CompiledUCCMatcher for ucc_rules
+    """
+    global _COMPILED_MATCHER
+
+    matcher = _COMPILED_MATCHER
+    if matcher is None or matcher.rules is not ucc_rules:
+        matcher = CompiledUCCMatcher(ucc_rules)
+        _COMPILED_MATCHER = matcher
+
+    return matcher
+
+
 def match_ucc_violations(
     clause_text: str,
     clause_type: str,
@@ -96,8 +230,9 @@ def match_ucc_violations(
 ) -> Optional[UCCMatch]:
     """Match clause text against UCC statutory rules.
 
-    Uses case-insensitive keyword matching to detect statutory violations.
-    Returns the highest-severity match if multiple rules trigger.
+    Uses case-insensitive, word-boundary keyword matching to detect statutory
+    violations ("rate" does not match "cooperate"). Returns the highest-severity
+    match if multiple rules trigger.
 
     Args:
         clause_text: The contract clause text to analyze
@@ -110,48 +245,7 @@ def match_ucc_violations(
     if not clause_text or not ucc_rules:
         return None
 
-    # Normalize clause text for matching
-    clause_text_lower = clause_text.lower()
-
-    # Track all matches (may have multiple)
-    matches = []
-
-    for rule in ucc_rules:
-        # Check if any trigger concepts match
-        matched_concepts = []
-
-        for concept in rule.trigger_concepts:
-            concept_lower = concept.lower()
-
-            # Word-boundary matching to avoid false positives
-            # "rate" should not match "cooperate", "govern" should not match "government"
-            import re
-            # Build regex pattern with word boundaries
-            pattern = r'\b' + re.escape(concept_lower) + r'\b'
-
-            if re.search(pattern, clause_text_lower):
-                matched_concepts.append(concept)
-
-        # If any concepts matched, record this rule as a match
-        if matched_concepts:
-            match = UCCMatch(
-                rule_id=rule.rule_id,
-                category=rule.category,
-                severity=rule.severity,
-                risk_multiplier=rule.risk_multiplier,
-                matched_concepts=matched_concepts,
-                citation=rule.citation,
-                business_impact=rule.business_impact,
-                si_impact=rule.si_impact
-            )
-            matches.append(match)
-
-    if not matches:
-        return None
-
-    # Return highest-severity match (by risk_multiplier)
-    highest_match = max(matches, key=lambda m: m.risk_multiplier)
-    return highest_match
+    return get_compiled_matcher(ucc_rules).match(clause_text)
 
 
 def classify_ucc_severity(risk_multiplier: float) -> str:
@@ -238,7 +332,9 @@ def detect_ucc_violation(clause_text: str, clause_type: str = None) -> Optional[
 __all__ = [
     'UCCRule',
     'UCCMatch',
+    'CompiledUCCMatcher',
     'load_ucc_rules',
+    'get_compiled_matcher',
     'match_ucc_violations',
     'classify_ucc_severity',
     'get_ucc_rules',
@@ -0,0 +1,204 @@
+"""
+Versioned Snapshot Cache
+Shared base for in-memory snapshots of a database that are rebuilt when
+a trigger-maintained version moves.
+
+Subclasses provide the trigger DDL, a one-row version read and the
+build step; this module handles the rest:
+- install_triggers: create the version table/triggers (run at schema
+  init or from a migration, never from a request)
+- get_snapshot: double-checked refresh, version and rebuild read in one
+  read transaction
+- TTL fallback when the triggers are missing (read-only or legacy
+  databases), re-checking for them on each rebuild
+
+Usage:
+    class ContractRollupCache(VersionedSnapshotCache):
+        label = 'Contract rollup'
+        version_table = 'contract_rollup_version'
+        trigger_names = ('trg_contracts_rollup_insert', ...)
+        trigger_sql = ROLLUP_TRIGGER_SQL
+
+        def _read_version(self, conn): ...
+        def _build(self, conn, snapshot, version, context): ...
+"""
+
+import logging
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple, Union
+
+from db_pool import get_connection
+
+logger = logging.getLogger(__name__)
+
+# =============================================================================
+# CONFIGURATION
+# =============================================================================
+
+# Seconds a snapshot is trusted when the version triggers are missing
+SNAPSHOT_FALLBACK_TTL_SECONDS = 5.0
+
+DbPath = Union[str, Path]
+
+
+# =============================================================================
+# CACHE
+# =============================================================================
+
+class VersionedSnapshotCache:
+    """
+    Current snapshot of one database.
+
+    Snapshots must expose `version` (the value _read_version returned when
+    they were built, None without triggers) and `built_at` (time.time()).
+    """
+
+    # Name used in log messages
+    label = 'Snapshot'
+    # Table the triggers write to, and the triggers that must all exist
+    version_table = ''
+    trigger_names: Tuple[str, ...] = ()
+    # DDL creating version_table and trigger_names (idempotent)
+    trigger_sql = ''
+    fallback_ttl_seconds = SNAPSHOT_FALLBACK_TTL_SECONDS
+    # Row factory for the rebuild connection (None for tuples)
+    row_factory = sqlite3.Row
+
+    def __init__(self, db_path: DbPath):
+        self.db_path = os.path.abspath(str(db_path))
+        self._lock = threading.Lock()
+        self._snapshot = None
+        self._triggers_installed: Optional[bool] = None
+        self._metrics: Dict[str, Any] = {
+            'hits': 0,
+            'last_build_ms': 0.0,
+            'rows': 0,
+        }
+
+    # -------------------------------------------------------------------------
+    # Schema
+    # -------------------------------------------------------------------------
+
+    def install_triggers(self) -> bool:
+        """Create the version table and triggers (idempotent, needs write access)."""
+        try:
+            conn = get_connection(self.db_path)
+            try:
+                conn.executescript(self.trigger_sql)
+            finally:
+                conn.close()
+            self._triggers_installed = True
+        except sqlite3.Error as e:
+            logger.warning(f"{self.label} triggers unavailable, using {self.fallback_ttl_seconds}s TTL: {e}")
+            self._triggers_installed = False
+        return self._triggers_installed
+
+    def _detect_triggers(self, conn: sqlite3.Connection) -> bool:
+        """Whether the version table and every trigger exist (read-only check)."""
+        names = (self.version_table,) + tuple(self.trigger_names)
+        placeholders = ', '.join('?' * len(names))
+        found = conn.execute(
+            f"SELECT COUNT(*) FROM sqlite_master WHERE name IN ({placeholders})", names
+        ).fetchone()[0]
+        installed = found == len(names)
+        if not installed and self._triggers_installed is None:
+            logger.warning(
+                f"{self.label} triggers not installed in {self.db_path}, "
+                f"using {self.fallback_ttl_seconds}s TTL"
+            )
+        self._triggers_installed = installed
+        return installed
+
+    # -------------------------------------------------------------------------
+    # Subclass hooks
+    # -------------------------------------------------------------------------
+
+    def _read_version(self, conn: sqlite3.Connection) -> Optional[int]:
+        """Current version counter (called only when triggers are installed)."""
+        raise NotImplementedError
+
+    def _build(self, conn: sqlite3.Connection, snapshot, version: Optional[int], context):
+        """New snapshot from the previous one (may be None), inside a read transaction."""
+        raise NotImplementedError
+
+    def _matches(self, snapshot, context) -> bool:
+        """Whether a snapshot was built for this context (e.g. the same day)."""
+        return True
+
+    def _row_count(self, snapshot) -> int:
+        return 0
+
+    # -------------------------------------------------------------------------
+    # Read path
+    # -------------------------------------------------------------------------
+
+    def _version(self, conn: sqlite3.Connection) -> Optional[int]:
+        if not self._triggers_installed:
+            return None
+        return self._read_version(conn)
+
+    def _fresh(self, snapshot, version: Optional[int], context) -> bool:
+        if snapshot is None or not self._matches(snapshot, context):
+            return False
+        if version is None:
+            return time.time() - snapshot.built_at < self.fallback_ttl_seconds
+        return snapshot.version == version
+
+    def get_snapshot(self, context=None):
+        """Current snapshot, rebuilt (once, under a lock) if the version moved."""
+        conn = get_connection(self.db_path, read_only=True, row_factory=self.row_factory)
+        try:
+            if self._triggers_installed is None:
+                with self._lock:
+                    if self._triggers_installed is None:
+                        self._detect_triggers(conn)
+
+            snapshot = self._snapshot
+            if self._fresh(snapshot, self._version(conn), context):
+                self._metrics['hits'] += 1
+                return snapshot
+
+            with self._lock:
+                # Version and rows in one read transaction so they agree
+                conn.execute("BEGIN")
+                try:
+                    if not self._triggers_installed:
+                        self._detect_triggers(conn)
+                    version = self._version(conn)
+                    snapshot = self._snapshot
+                    if self._fresh(snapshot, version, context):
+                        self._metrics['hits'] += 1
+                        return snapshot
+                    start = time.perf_counter()
+                    snapshot = self._build(conn, snapshot, version, context)
+                finally:
+                    conn.rollback()
+                self._snapshot = snapshot
+                self._metrics['last_build_ms'] = round((time.perf_counter() - start) * 1000, 2)
+                self._metrics['rows'] = self._row_count(snapshot)
+                return snapshot
+        finally:
+            conn.close()
+
+    def invalidate(self) -> None:
+        """Drop the snapshot (next get rebuilds)."""
+        self._snapshot = None
+
+    def get_stats(self) -> Dict[str, Any]:
+        snapshot = self._snapshot
+        return {
+            **self._metrics,
+            'db_path': self.db_path,
+            'version': snapshot.version if snapshot else None,
+            'triggers_installed': self._triggers_installed,
+        }
+
+
+__all__ = [
+    'SNAPSHOT_FALLBACK_TTL_SECONDS',
+    'VersionedSnapshotCache',
+]
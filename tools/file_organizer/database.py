@@ -97,6 +97,16 @@ CREATE TABLE IF NOT EXISTS scan_results (
     notes TEXT
 );
 
+-- Content hash cache: a row is reused while the file's size and mtime are unchanged
+CREATE TABLE IF NOT EXISTS file_hashes (
+    path TEXT PRIMARY KEY,
+    size BIGINT NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    partial_hash TEXT,
+    full_hash TEXT,
+    hashed_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
 -- Create indexes for performance
 CREATE INDEX IF NOT EXISTS idx_file_ops_session ON file_operations(session_id);
 CREATE INDEX IF NOT EXISTS idx_file_ops_status ON file_operations(status);
@@ -393,6 +403,53 @@ def log_scan_result(
         conn.commit()
         return cursor.lastrowid
 
+def load_hash_cache() -> Dict[str, Dict]:
+    """
+    Load cached file hashes.
+
+    Returns:
+        Dictionary mapping path to {size, mtime_ns, partial_hash, full_hash}
+    """
+    with get_connection() as conn:
+        cursor = conn.execute("""
+            SELECT path, size, mtime_ns, partial_hash, full_hash
+            FROM file_hashes
+        """)
+
+        return {
+            row['path']: {
+                'size': row['size'],
+                'mtime_ns': row['mtime_ns'],
+                'partial_hash': row['partial_hash'],
+                'full_hash': row['full_hash'],
+            }
+            for row in cursor
+        }
+
+def save_hash_cache(entries: List[Tuple[str, Dict]]) -> int:
+    """
+    Insert or replace cached file hashes in one transaction.
+
+    Args:
+        entries: (path, {size, mtime_ns, partial_hash, full_hash}) pairs
+
+    Returns:
+        Number of rows written
+    """
+    if not entries:
+        return 0
+
+    with get_connection() as conn:
+        conn.executemany("""
+            INSERT OR REPLACE INTO file_hashes (path, size, mtime_ns, partial_hash, full_hash)
+            VALUES (?, ?, ?, ?, ?)
+        """, [
+            (path, e['size'], e['mtime_ns'], e['partial_hash'], e['full_hash'])
+            for path, e in entries
+        ])
+        conn.commit()
+        return len(entries)
+
 def get_latest_scan() -> Optional[Dict]:
     """
     Get most recent scan result.
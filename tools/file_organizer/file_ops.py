@@ -14,7 +14,7 @@ import json
 
 from config import (
     FileCategory, CATEGORIES, MIN_FILE_SIZE_FOR_HASH, MAX_FILE_SIZE_FOR_HASH,
-    SIMILAR_FILENAME_THRESHOLD, get_category_for_file, is_protected_file,
+    HASH_READ_BUFFER, PARTIAL_HASH_BLOCK, SIMILAR_FILENAME_THRESHOLD, get_category_for_file, is_protected_file,
     ARCHIVE_ROOT
 )
 
@@ -106,7 +106,7 @@ class SimilarGroup:
         """Total size of all files in group"""
         return sum(f.size_bytes for f in self.files)
 
-def calculate_file_hash(file_path: Path, algorithm='md5', chunk_size=8192) -> Optional[str]:
+def calculate_file_hash(file_path: Path, algorithm='md5', chunk_size=HASH_READ_BUFFER) -> Optional[str]:
     """
     Calculate hash of file for duplicate detection.
 
@@ -131,6 +131,40 @@ def calculate_file_hash(file_path: Path, algorithm='md5', chunk_size=8192) -> Op
         print(f"Error hashing {file_path}: {e}")
         return None
 
+def calculate_partial_hash(file_path: Path, block_size=PARTIAL_HASH_BLOCK, algorithm='md5') -> Optional[str]:
+    """
+    Hash the size plus the first and last blocks of a file.
+
+    Cheap pre-filter between size grouping and full hashing: files with
+    different partial hashes cannot be duplicates. Equal partial hashes
+    still need a full hash.
+
+    Args:
+        file_path: Path to file
+        block_size: Bytes read from each end
+        algorithm: Hash algorithm (md5, sha1, sha256)
+
+    Returns:
+        Hex string of hash, or None if file cannot be read
+    """
+    try:
+        hash_obj = hashlib.new(algorithm)
+
+        with open(file_path, 'rb') as f:
+            size = f.seek(0, 2)
+            hash_obj.update(str(size).encode())
+            f.seek(0)
+            hash_obj.update(f.read(block_size))
+            if size > block_size:
+                f.seek(max(block_size, size - block_size))
+                hash_obj.update(f.read(block_size))
+
+        return hash_obj.hexdigest()
+
+    except (IOError, PermissionError, OSError) as e:
+        print(f"Error hashing {file_path}: {e}")
+        return None
+
 def should_hash_file(file_info: FileInfo) -> bool:
     """
     Determine if file should be hashed based on size and other criteria.
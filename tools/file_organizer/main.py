@@ -10,7 +10,7 @@ from pathlib import Path
 # Add current directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent))
 
-from config import GDRIVE_INDEX, ONEDRIVE_INDEX, DASHBOARD_HOST, DASHBOARD_PORT
+from config import GDRIVE_INDEX, ONEDRIVE_INDEX, DASHBOARD_HOST, DASHBOARD_PORT, HASH_WORKERS
 from database import init_database, get_statistics, get_latest_scan, get_archive_sessions
 
 def cmd_scan(args):
@@ -24,7 +24,8 @@ def cmd_scan(args):
     results = scan_drive(
         index_path=index_path,
         calculate_hashes=not args.no_hash,
-        limit=args.limit
+        limit=args.limit,
+        workers=args.workers
     )
 
     if args.report:
@@ -167,6 +168,8 @@ Examples:
     scan_parser.add_argument('--no-hash', action='store_true', help='Skip hash calculation')
     scan_parser.add_argument('--limit', type=int, help='Limit number of files')
     scan_parser.add_argument('--report', action='store_true', help='Generate summary report')
+    scan_parser.add_argument('--workers', type=int, default=HASH_WORKERS,
+                             help='Hash threads (more for network/synced drives)')
     scan_parser.set_defaults(func=cmd_scan)
 
     # Stats command
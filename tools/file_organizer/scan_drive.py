@@ -4,22 +4,193 @@ Analyzes directory index, calculates hashes, detects duplicates and similar file
 """
 
 import json
+import os
 import time
 from pathlib import Path
 from datetime import datetime
-from typing import List, Dict
+from typing import List, Dict, Optional, Tuple
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
-from config import GDRIVE_INDEX, MIN_FILE_SIZE_FOR_HASH, ARCHIVE_ROOT
+from config import (
+    GDRIVE_INDEX, MIN_FILE_SIZE_FOR_HASH, ARCHIVE_ROOT,
+    PARTIAL_HASH_BLOCK, HASH_WORKERS, HASH_CACHE_BATCH
+)
 from file_ops import (
-    FileInfo, load_directory_index, calculate_file_hash, should_hash_file,
+    FileInfo, load_directory_index, calculate_file_hash, calculate_partial_hash, should_hash_file,
     find_duplicates_by_size, find_duplicates_by_hash, find_similar_files
 )
 from database import (
-    init_database, log_scan_result, add_duplicate_group, log_operation
+    init_database, log_scan_result, add_duplicate_group, log_operation,
+    load_hash_cache, save_hash_cache
 )
 
-def scan_drive(index_path: Path, calculate_hashes: bool = True, limit: int = None) -> Dict:
+def _hash_one(file_info: FileInfo, cache: Dict[str, Dict], field: str) -> Tuple[Optional[str], Optional[Dict], bool, int]:
+    """
+    Hash one file for a pass, reusing the cached value while size and mtime match.
+
+    Args:
+        file_info: File to hash
+        cache: Hash cache (path -> entry), read only here
+        field: 'partial_hash' or 'full_hash'
+
+    Returns:
+        (hash or None, entry to cache or None, cache hit, bytes read)
+    """
+    path = str(file_info.path)
+    try:
+        stat = os.stat(path)
+    except OSError as e:
+        print(f"    Error hashing {path}: {e}")
+        return None, None, False, 0
+
+    cached = cache.get(path)
+    if cached and cached['size'] == stat.st_size and cached['mtime_ns'] == stat.st_mtime_ns:
+        if cached[field]:
+            return cached[field], None, True, 0
+        entry = dict(cached)
+    else:
+        entry = {'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns, 'partial_hash': None, 'full_hash': None}
+
+    if field == 'partial_hash':
+        value = calculate_partial_hash(file_info.path)
+        bytes_read = min(stat.st_size, 2 * PARTIAL_HASH_BLOCK)
+    else:
+        value = calculate_file_hash(file_info.path)
+        bytes_read = stat.st_size
+
+    if value is None:
+        return None, None, False, bytes_read
+
+    # Don't cache a hash of a file that changed while it was read
+    try:
+        after = os.stat(path)
+        if (after.st_size, after.st_mtime_ns) != (stat.st_size, stat.st_mtime_ns):
+            return value, None, False, bytes_read
+    except OSError:
+        return value, None, False, bytes_read
+
+    entry[field] = value
+    return value, entry, False, bytes_read
+
+def _run_hash_pass(files: List[FileInfo], cache: Dict[str, Dict], field: str,
+                   workers: int, stats: Dict) -> List[Optional[str]]:
+    """
+    Hash files on a thread pool, writing new hashes to the cache in batches.
+
+    Returns:
+        Hash per file (same order as files), None where hashing failed
+    """
+    hashes: List[Optional[str]] = [None] * len(files)
+    pending = []
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = {pool.submit(_hash_one, f, cache, field): i for i, f in enumerate(files)}
+
+        for done, future in enumerate(as_completed(futures), 1):
+            if done % 100 == 0:
+                print(f"    Progress: {done}/{len(files)} ({done/len(files)*100:.1f}%)")
+
+            i = futures[future]
+            value, entry, hit, bytes_read = future.result()
+            hashes[i] = value
+            stats['bytes_read'] += bytes_read
+
+            if value is None:
+                stats['errors'] += 1
+            elif hit:
+                stats['cache_hits'] += 1
+            else:
+                stats['cache_misses'] += 1
+
+            if entry is not None:
+                path = str(files[i].path)
+                cache[path] = entry
+                pending.append((path, entry))
+                if len(pending) >= HASH_CACHE_BATCH:
+                    save_hash_cache(pending)
+                    pending = []
+
+    save_hash_cache(pending)
+    return hashes
+
+def hash_candidates(size_groups: Dict[int, List[FileInfo]], workers: int = HASH_WORKERS) -> Tuple[List[FileInfo], Dict]:
+    """
+    Hash potential duplicates: partial hash pass, then full hash of partial collisions.
+
+    The partial pass (size + first/last PARTIAL_HASH_BLOCK bytes) splits
+    size groups so only files that still collide are read in full. Both
+    passes run on a thread pool and reuse hashes cached in organizer.db
+    for files whose size and mtime are unchanged.
+
+    Args:
+        size_groups: Files grouped by size (find_duplicates_by_size)
+        workers: Hash threads
+
+    Returns:
+        (files with a full hash set, hashing statistics)
+    """
+    stats = {
+        'workers': workers,
+        'candidates': 0,
+        'partial_hashed': 0,
+        'full_hashed': 0,
+        'cache_hits': 0,
+        'cache_misses': 0,
+        'errors': 0,
+        'bytes_read': 0,
+    }
+    start_time = time.time()
+
+    # Size groups that still have >1 file after the hashing criteria
+    by_size = defaultdict(list)
+    for files in size_groups.values():
+        for file_info in files:
+            if should_hash_file(file_info):
+                by_size[file_info.size_bytes].append(file_info)
+    candidates = [f for files in by_size.values() if len(files) > 1 for f in files]
+    stats['candidates'] = len(candidates)
+    print(f"  Files to hash: {len(candidates):,}")
+
+    cache = load_hash_cache()
+    print(f"  Hash cache: {len(cache):,} entries")
+
+    # Pass 1: partial hashes
+    print(f"  Partial hash pass ({workers} workers)...")
+    partial_hashes = _run_hash_pass(candidates, cache, 'partial_hash', workers, stats)
+    stats['partial_hashed'] = sum(1 for h in partial_hashes if h)
+
+    partial_groups = defaultdict(list)
+    for file_info, partial in zip(candidates, partial_hashes):
+        if partial:
+            partial_groups[(file_info.size_bytes, partial)].append(file_info)
+    to_full_hash = [f for files in partial_groups.values() if len(files) > 1 for f in files]
+    print(f"  Partial hash collisions: {len(to_full_hash):,} files "
+          f"({stats['partial_hashed'] - len(to_full_hash):,} ruled out)")
+
+    # Pass 2: full hashes for files that still collide
+    hashed = []
+    if to_full_hash:
+        print(f"  Full hash pass ({workers} workers)...")
+        full_hashes = _run_hash_pass(to_full_hash, cache, 'full_hash', workers, stats)
+        for file_info, full in zip(to_full_hash, full_hashes):
+            file_info.hash = full
+            if full:
+                hashed.append(file_info)
+    stats['full_hashed'] = len(hashed)
+
+    duration = time.time() - start_time
+    lookups = stats['cache_hits'] + stats['cache_misses']
+    stats['duration_seconds'] = round(duration, 2)
+    stats['cache_hit_rate'] = round(stats['cache_hits'] / lookups, 4) if lookups else 0.0
+    stats['throughput_mb_s'] = round(stats['bytes_read'] / (1024**2) / duration, 1) if duration > 0 else 0.0
+    # Every candidate goes through the partial pass; full-pass files are a subset
+    stats['files_per_second'] = round(stats['candidates'] / duration, 1) if duration > 0 else 0.0
+
+    return hashed, stats
+
+def scan_drive(index_path: Path, calculate_hashes: bool = True, limit: int = None,
+               workers: int = HASH_WORKERS) -> Dict:
     """
     Scan drive using existing directory index.
 
@@ -27,6 +198,7 @@ def scan_drive(index_path: Path, calculate_hashes: bool = True, limit: int = Non
         index_path: Path to directory_index.json
         calculate_hashes: Whether to calculate file hashes
         limit: Limit number of files to process (for testing)
+        workers: Hash threads (size for the storage: more for network/synced drives)
 
     Returns:
         Dictionary with scan results
@@ -80,35 +252,19 @@ def scan_drive(index_path: Path, calculate_hashes: bool = True, limit: int = Non
 
     # Calculate hashes for potential duplicates
     duplicate_groups = {}
+    hash_stats = {}
     if calculate_hashes:
         print(f"\nCalculating hashes for duplicate detection...")
 
-        # Flatten size groups and filter by criteria
-        files_to_hash = []
-        for size, files in size_groups.items():
-            for file_info in files:
-                if should_hash_file(file_info):
-                    files_to_hash.append(file_info)
+        files_with_hashes, hash_stats = hash_candidates(size_groups, workers=workers)
 
-        print(f"  Files to hash: {len(files_to_hash):,}")
-
-        # Calculate hashes with progress
-        hashed_count = 0
-        for i, file_info in enumerate(files_to_hash):
-            if i % 100 == 0 and i > 0:
-                print(f"    Progress: {i}/{len(files_to_hash)} ({i/len(files_to_hash)*100:.1f}%)")
-
-            try:
-                file_info.hash = calculate_file_hash(file_info.path)
-                if file_info.hash:
-                    hashed_count += 1
-            except Exception as e:
-                print(f"    Error hashing {file_info.path}: {e}")
-
-        print(f"  Successfully hashed: {hashed_count:,} files")
+        print(f"  Successfully hashed: {len(files_with_hashes):,} files")
+        print(f"  Cache hit rate: {hash_stats['cache_hit_rate'] * 100:.1f}% "
+              f"({hash_stats['cache_hits']:,} hits, {hash_stats['cache_misses']:,} misses)")
+        print(f"  Hash throughput: {hash_stats['throughput_mb_s']:.1f} MB/s, "
+              f"{hash_stats['files_per_second']:.1f} files/s")
 
         # Find exact duplicates by hash
-        files_with_hashes = [f for f in files_to_hash if f.hash]
         duplicate_groups = find_duplicates_by_hash(files_with_hashes)
 
         print(f"  Found {len(duplicate_groups):,} duplicate groups")
@@ -192,6 +348,7 @@ def scan_drive(index_path: Path, calculate_hashes: bool = True, limit: int = Non
         'potential_savings_bytes': potential_savings,
         'potential_savings_mb': round(potential_savings / (1024**2), 1),
         'similar_groups': len(similar_groups),
+        'hashing': hash_stats,
         'scan_duration_seconds': round(scan_duration, 2)
     }
 
@@ -266,7 +423,22 @@ Potential Savings:  {results['potential_savings_mb']:.1f} MB
 SIMILAR FILES
 -------------
 Similar Groups:     {results['similar_groups']:,}
+"""
 
+    hashing = results.get('hashing')
+    if hashing:
+        report += f"""
+HASHING
+-------
+Candidates:         {hashing['candidates']:,}
+Partial Hashed:     {hashing['partial_hashed']:,}
+Full Hashed:        {hashing['full_hashed']:,}
+Cache Hit Rate:     {hashing['cache_hit_rate'] * 100:.1f}% ({hashing['cache_hits']:,} hits, {hashing['cache_misses']:,} misses)
+Throughput:         {hashing['throughput_mb_s']:.1f} MB/s, {hashing['files_per_second']:.1f} files/s ({hashing['workers']} workers)
+Hashing Time:       {hashing['duration_seconds']} seconds
+"""
+
+    report += f"""
 RECOMMENDATIONS
 ---------------
 1. Review duplicate groups - {results['duplicate_groups']} groups found
@@ -290,6 +462,8 @@ if __name__ == "__main__":
                         help='Limit number of files to process (for testing)')
     parser.add_argument('--report', action='store_true',
                         help='Generate summary report')
+    parser.add_argument('--workers', type=int, default=HASH_WORKERS,
+                        help=f'Hash threads (default {HASH_WORKERS}; more for network/synced drives)')
 
     args = parser.parse_args()
 
@@ -297,7 +471,8 @@ if __name__ == "__main__":
     results = scan_drive(
         index_path=Path(args.index),
         calculate_hashes=not args.no_hash,
-        limit=args.limit
+        limit=args.limit,
+        workers=args.workers
     )
 
     # Generate report if requested
@@ -0,0 +1,206 @@
+"""
+Scan Hashing Tests
+
+Test Gates:
+- SCAN-HASH-01: Partial hashes split size groups; only partial collisions are read in full
+- SCAN-HASH-02: Cached hashes are reused while size and mtime are unchanged
+- SCAN-HASH-03: Changed files are re-read; files modified while read are not cached
+- SCAN-HASH-04: Reported hit rate and throughput count each file once
+
+Run from tools/file_organizer (its config module differs from backend/config.py):
+    python -m pytest -q tests
+"""
+
+import os
+import sys
+from datetime import datetime
+from pathlib import Path
+import pytest
+
+# Add file_organizer to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import database
+import file_ops
+import scan_drive
+from file_ops import FileInfo
+
+BLOCK = 4 * 1024
+
+
+@pytest.fixture(autouse=True)
+def organizer_db(tmp_path, monkeypatch):
+    """Hash cache in a temporary organizer.db, small files eligible for hashing"""
+    monkeypatch.setattr(database, "DB_PATH", tmp_path / "organizer.db")
+    monkeypatch.setattr(file_ops, "MIN_FILE_SIZE_FOR_HASH", 1)
+    database.init_database()
+    return tmp_path / "organizer.db"
+
+
+@pytest.fixture
+def reads(monkeypatch):
+    """Count partial/full hash reads per path (block size kept small)"""
+    counts = {'partial_hash': [], 'full_hash': []}
+    partial, full = scan_drive.calculate_partial_hash, scan_drive.calculate_file_hash
+
+    def counting_partial(path):
+        counts['partial_hash'].append(Path(path).name)
+        return partial(path, block_size=BLOCK)
+
+    def counting_full(path):
+        counts['full_hash'].append(Path(path).name)
+        return full(path)
+
+    monkeypatch.setattr(scan_drive, "calculate_partial_hash", counting_partial)
+    monkeypatch.setattr(scan_drive, "calculate_file_hash", counting_full)
+    return counts
+
+
+def _write(path: Path, head: bytes, middle: bytes = b"m", tail: bytes = b"t") -> Path:
+    """File of BLOCK + 1000 + BLOCK bytes built from three repeated bytes"""
+    path.write_bytes(head * BLOCK + middle * 1000 + tail * BLOCK)
+    return path
+
+
+def _info(path: Path) -> FileInfo:
+    stat = path.stat()
+    modified = datetime.fromtimestamp(stat.st_mtime)
+    return FileInfo(path, path.name, stat.st_size, modified, modified, path.suffix)
+
+
+def _groups(*paths: Path):
+    groups = {}
+    for path in paths:
+        info = _info(path)
+        groups.setdefault(info.size_bytes, []).append(info)
+    return groups
+
+
+def _cached(path: Path):
+    return database.load_hash_cache().get(str(path))
+
+
+# ============================================================================
+# SCAN-HASH-01: Partial pass
+# ============================================================================
+
+class TestPartialPass:
+    """Test that partial hashes narrow size groups"""
+
+    def test_partial_hashes_split_size_group(self, tmp_path, reads):
+        """Same size, different head: ruled out without a full read"""
+        a = _write(tmp_path / "a.bin", b"a")
+        b = _write(tmp_path / "b.bin", b"b")
+        c = _write(tmp_path / "c.bin", b"a")
+
+        hashed, stats = scan_drive.hash_candidates(_groups(a, b, c), workers=2)
+
+        assert sorted(reads['partial_hash']) == ["a.bin", "b.bin", "c.bin"]
+        assert sorted(reads['full_hash']) == ["a.bin", "c.bin"]
+        assert sorted(f.name for f in hashed) == ["a.bin", "c.bin"]
+        assert hashed[0].hash == hashed[1].hash
+        assert stats['partial_hashed'] == 3 and stats['full_hashed'] == 2
+
+    def test_same_ends_different_middle(self, tmp_path, reads):
+        """A partial collision is settled by the full hash"""
+        a = _write(tmp_path / "a.bin", b"a", middle=b"1")
+        b = _write(tmp_path / "b.bin", b"a", middle=b"2")
+
+        hashed, _ = scan_drive.hash_candidates(_groups(a, b), workers=2)
+
+        assert sorted(reads['full_hash']) == ["a.bin", "b.bin"]
+        assert hashed[0].hash != hashed[1].hash
+
+
+# ============================================================================
+# SCAN-HASH-02 / 03: Cache
+# ============================================================================
+
+class TestHashCache:
+    """Test reuse and invalidation of cached hashes"""
+
+    def test_unchanged_file_is_cache_hit(self, tmp_path, reads):
+        """A second scan reads nothing"""
+        a = _write(tmp_path / "a.bin", b"a")
+        b = _write(tmp_path / "b.bin", b"a")
+        first, _ = scan_drive.hash_candidates(_groups(a, b), workers=2)
+        reads['partial_hash'].clear()
+        reads['full_hash'].clear()
+
+        second, stats = scan_drive.hash_candidates(_groups(a, b), workers=2)
+
+        assert reads == {'partial_hash': [], 'full_hash': []}
+        assert stats['cache_hits'] == 4 and stats['cache_misses'] == 0
+        assert stats['bytes_read'] == 0
+        assert [f.hash for f in second] == [f.hash for f in first]
+
+    def test_changed_mtime_rereads(self, tmp_path, reads):
+        """A new mtime invalidates both cached hashes for that file"""
+        a = _write(tmp_path / "a.bin", b"a")
+        b = _write(tmp_path / "b.bin", b"a")
+        scan_drive.hash_candidates(_groups(a, b), workers=2)
+        reads['partial_hash'].clear()
+        reads['full_hash'].clear()
+        stat = a.stat()
+        os.utime(a, ns=(stat.st_atime_ns, stat.st_mtime_ns + 5_000_000_000))
+
+        _, stats = scan_drive.hash_candidates(_groups(a, b), workers=2)
+
+        assert reads == {'partial_hash': ["a.bin"], 'full_hash': ["a.bin"]}
+        assert stats['cache_hits'] == 2 and stats['cache_misses'] == 2
+        assert _cached(a)['mtime_ns'] == a.stat().st_mtime_ns
+
+    def test_file_modified_while_read_not_cached(self, tmp_path, monkeypatch):
+        """A hash computed while the file changed is used but not stored"""
+        a = _write(tmp_path / "a.bin", b"a")
+        b = _write(tmp_path / "b.bin", b"a")
+        partial = scan_drive.calculate_partial_hash
+
+        def touching_partial(path):
+            value = partial(path, block_size=BLOCK)
+            if Path(path).name == "a.bin":
+                stat = os.stat(path)
+                os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+            return value
+
+        monkeypatch.setattr(scan_drive, "calculate_partial_hash", touching_partial)
+
+        _, stats = scan_drive.hash_candidates(_groups(a, b), workers=1)
+
+        assert _cached(a) is None or _cached(a)['partial_hash'] is None
+        assert _cached(b)['partial_hash'] is not None
+        assert stats['partial_hashed'] == 2
+
+
+# ============================================================================
+# SCAN-HASH-04: Statistics
+# ============================================================================
+
+class TestStats:
+    """Test reported hit rate and throughput"""
+
+    def test_hit_rate_counts_lookups(self, tmp_path, reads):
+        """Hit rate is hits / (hits + misses) over both passes"""
+        a = _write(tmp_path / "a.bin", b"a")
+        b = _write(tmp_path / "b.bin", b"a")
+        scan_drive.hash_candidates(_groups(a, b), workers=2)
+        c = _write(tmp_path / "c.bin", b"a")
+
+        _, stats = scan_drive.hash_candidates(_groups(a, b, c), workers=2)
+
+        # a, b: 2 hits each; c: partial + full miss
+        assert (stats['cache_hits'], stats['cache_misses']) == (4, 2)
+        assert stats['cache_hit_rate'] == round(4 / 6, 4)
+
+    def test_files_per_second_counts_each_file_once(self, tmp_path, reads, monkeypatch):
+        """Files hashed in both passes are not double-counted"""
+        a = _write(tmp_path / "a.bin", b"a")
+        b = _write(tmp_path / "b.bin", b"a")
+        clock = iter([100.0, 102.0])
+        monkeypatch.setattr(scan_drive.time, "time", lambda: next(clock))
+
+        _, stats = scan_drive.hash_candidates(_groups(a, b), workers=2)
+
+        assert stats['cache_misses'] == 4
+        assert stats['duration_seconds'] == 2.0
+        assert stats['files_per_second'] == 1.0
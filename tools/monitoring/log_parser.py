@@ -6,6 +6,7 @@ Shared utilities for parsing CIP log files.
 
 import re
 import os
+import sys
 import time
 import threading
 from enum import Enum
@@ -19,6 +20,17 @@ try:
 except ImportError:
     from config import LOG_PATTERN, LOG_FILES, COLORS
 
+# Tail-seeking reader shared with the backend diagnostics API
+_BACKEND_DIR = Path(__file__).resolve().parents[2] / "backend"
+if _BACKEND_DIR.is_dir() and str(_BACKEND_DIR) not in sys.path:
+    sys.path.append(str(_BACKEND_DIR))
+
+try:
+    from log_index import LogFollower, tail_lines
+    LOG_INDEX_AVAILABLE = True
+except ImportError:
+    LOG_INDEX_AVAILABLE = False
+
 
 class LogLevel(Enum):
     """Log severity levels."""
@@ -126,13 +138,28 @@ class LogParser:
         min_level: LogLevel = LogLevel.DEBUG,
         offset: int = 0,
     ) -> List[LogEntry]:
-        """Parse last N lines from a log file."""
+        """
+        Parse the last N entries at or above min_level.
+
+        offset skips the newest matching entries (for paging back).
+        Reads backwards from the end of the file when log_index is
+        available instead of loading every line.
+        """
         entries = []
 
         if not filepath.exists():
             return entries
 
         try:
+            if LOG_INDEX_AVAILABLE:
+                def matches(line: str) -> bool:
+                    entry = self.parse_line(line)
+                    return entry is not None and entry.level >= min_level
+
+                for line in tail_lines(filepath, limit, matches, skip=offset):
+                    entries.append(self.parse_line(line))
+                return entries
+
             with open(filepath, 'r', encoding='utf-8', errors='replace') as f:
                 # Read all lines and get last N
                 lines = f.readlines()
@@ -191,8 +218,17 @@ class LogTailer:
         if self._thread:
             self._thread.join(timeout=2)
 
+    def _emit(self, line: str):
+        entry = self.parser.parse_line(line)
+        if entry and entry.level >= self.min_level:
+            self.callback(entry)
+
     def _tail_loop(self):
         """Main tailing loop."""
+        if LOG_INDEX_AVAILABLE:
+            self._follow_loop()
+            return
+
         # Start from end of file
         if self.filepath.exists():
             self._file_pos = self.filepath.stat().st_size
@@ -213,9 +249,7 @@ class LogTailer:
                     with open(self.filepath, 'r', encoding='utf-8', errors='replace') as f:
                         f.seek(self._file_pos)
                         for line in f:
-                            entry = self.parser.parse_line(line)
-                            if entry and entry.level >= self.min_level:
-                                self.callback(entry)
+                            self._emit(line)
                         self._file_pos = f.tell()
 
                 time.sleep(0.5)
@@ -224,6 +258,27 @@ class LogTailer:
                 print(f"Tail error: {e}")
                 time.sleep(1)
 
+    def _follow_loop(self):
+        """Tail with LogFollower: complete lines only, rotation-aware."""
+        # Start from end of file
+        follower = LogFollower(self.filepath, from_end=True)
+
+        while self._running:
+            try:
+                if not self.filepath.exists():
+                    time.sleep(1)
+                    continue
+
+                for _, raw in follower.read_new():
+                    self._emit(raw.decode('utf-8', errors='replace'))
+                self._file_pos = follower.offset
+
+                time.sleep(0.5)
+
+            except Exception as e:
+                print(f"Tail error: {e}")
+                time.sleep(1)
+
 
 def get_recent_errors(limit: int = 20) -> List[LogEntry]:
     """Get recent ERROR and CRITICAL entries from error.log."""